@@ -0,0 +1,72 @@
+"""add_calendar_content_hashes
+
+Revision ID: a8d3f1c6e2b7
+Revises: e5c7f2a9b3d1
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d3f1c6e2b7"
+down_revision: Union[str, Sequence[str], None] = "e5c7f2a9b3d1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CALENDAR_ENTRY_HASH = (
+    "md5("
+    "coalesce(name, chr(30)) || chr(31) || "
+    "coalesce(status, chr(30)) || chr(31) || "
+    "coalesce((extract(epoch from starts_at) * 1000000)::bigint::text, chr(30)) || chr(31) || "
+    "coalesce((extract(epoch from ends_at) * 1000000)::bigint::text, chr(30)) || chr(31) || "
+    "coalesce(frequency, chr(30)) || chr(31) || "
+    "coalesce(category, chr(30)) || chr(31) || "
+    "coalesce(calendar_entry_series_id::text, chr(30)) || chr(31) || "
+    "coalesce(ical_uid, chr(30)) || chr(31) || "
+    "coalesce((extract(epoch from original_starts_at) * 1000000)::bigint::text, chr(30)) || chr(31) || "
+    "coalesce(recurring_platform_id, chr(30))"
+    ")"
+)
+
+CALENDAR_ENTRY_SERIES_HASH = (
+    "md5("
+    "coalesce(name, chr(30)) || chr(31) || "
+    "coalesce(event_category, chr(30)) || chr(31) || "
+    "coalesce(frequency, chr(30)) || chr(31) || "
+    "coalesce(recurrence::text, 'null') || chr(31) || "
+    "coalesce((extract(epoch from starts_at) * 1000000)::bigint::text, chr(30)) || chr(31) || "
+    "coalesce((extract(epoch from ends_at) * 1000000)::bigint::text, chr(30)) || chr(31) || "
+    "coalesce(ical_uid, chr(30))"
+    ")"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "calendar_entries",
+        sa.Column(
+            "content_hash",
+            sa.String(),
+            sa.Computed(CALENDAR_ENTRY_HASH, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "calendar_entry_series",
+        sa.Column(
+            "content_hash",
+            sa.String(),
+            sa.Computed(CALENDAR_ENTRY_SERIES_HASH, persisted=True),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("calendar_entry_series", "content_hash")
+    op.drop_column("calendar_entries", "content_hash")
@@ -0,0 +1,54 @@
+"""add_series_materialization_horizon
+
+Revision ID: b4e7c2a9d5f1
+Revises: f2b6d8e4a9c3
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "b4e7c2a9d5f1"
+down_revision: Union[str, Sequence[str], None] = "f2b6d8e4a9c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "calendar_entry_series",
+        sa.Column("materialized_until", sa.DateTime(), nullable=True),
+    )
+    op.add_column(
+        "calendar_entry_series",
+        sa.Column(
+            "cancelled_occurrences",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+        ),
+    )
+    # Existing series are stored up to their last synced instance.
+    op.execute(
+        """
+        UPDATE calendar_entry_series AS s
+        SET materialized_until = e.last_starts_at
+        FROM (
+            SELECT calendar_entry_series_id, max(starts_at) AS last_starts_at
+            FROM calendar_entries
+            WHERE calendar_entry_series_id IS NOT NULL
+            GROUP BY calendar_entry_series_id
+        ) AS e
+        WHERE e.calendar_entry_series_id = s.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("calendar_entry_series", "cancelled_occurrences")
+    op.drop_column("calendar_entry_series", "materialized_until")
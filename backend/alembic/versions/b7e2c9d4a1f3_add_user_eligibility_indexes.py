@@ -0,0 +1,44 @@
+"""add_user_eligibility_indexes
+
+Revision ID: b7e2c9d4a1f3
+Revises: 9a0bb64850fb
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2c9d4a1f3"
+down_revision: Union[str, Sequence[str], None] = "9a0bb64850fb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_users_llm_provider",
+        "users",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("(settings ->> 'llm_provider') IS NOT NULL"),
+    )
+    op.create_index(
+        "idx_users_morning_overview",
+        "users",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text(
+            "(settings ->> 'llm_provider') IS NOT NULL"
+            " AND (settings ->> 'morning_overview_time') IS NOT NULL"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_users_morning_overview", table_name="users")
+    op.drop_index("idx_users_llm_provider", table_name="users")
@@ -0,0 +1,50 @@
+"""add_next_transition_at
+
+Revision ID: c3f8a1d5e7b2
+Revises: b7e2c9d4a1f3
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f8a1d5e7b2"
+down_revision: Union[str, Sequence[str], None] = "b7e2c9d4a1f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ("tasks", "routines"):
+        op.add_column(
+            table, sa.Column("next_transition_at", sa.DateTime(), nullable=True)
+        )
+        op.create_index(
+            f"idx_{table}_next_transition_at",
+            table,
+            ["next_transition_at"],
+            unique=False,
+            postgresql_where=sa.text("next_transition_at IS NOT NULL"),
+        )
+
+    # Mark current rows as due so the next timing-status sweep evaluates
+    # them and stores their real next transition.
+    op.execute(
+        "UPDATE tasks SET next_transition_at = timezone('utc', now()) "
+        "WHERE date >= CURRENT_DATE - 1 AND status NOT IN ('COMPLETE', 'PUNT')"
+    )
+    op.execute(
+        "UPDATE routines SET next_transition_at = timezone('utc', now()) "
+        "WHERE date >= CURRENT_DATE - 1"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ("routines", "tasks"):
+        op.drop_index(f"idx_{table}_next_transition_at", table_name=table)
+        op.drop_column(table, "next_transition_at")
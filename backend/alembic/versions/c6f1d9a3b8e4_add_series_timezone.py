@@ -0,0 +1,75 @@
+"""add_series_timezone
+
+Revision ID: c6f1d9a3b8e4
+Revises: b4e7c2a9d5f1
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c6f1d9a3b8e4"
+down_revision: Union[str, Sequence[str], None] = "b4e7c2a9d5f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_SERIES_HASH_PARTS = (
+    "coalesce(name, chr(30)) || chr(31) || "
+    "coalesce(event_category, chr(30)) || chr(31) || "
+    "coalesce(frequency, chr(30)) || chr(31) || "
+    "coalesce(recurrence::text, 'null') || chr(31) || "
+    "coalesce((extract(epoch from starts_at) * 1000000)::bigint::text, chr(30)) || chr(31) || "
+    "coalesce((extract(epoch from ends_at) * 1000000)::bigint::text, chr(30)) || chr(31) || "
+    "coalesce(ical_uid, chr(30))"
+)
+
+PREVIOUS_SERIES_HASH = f"md5({_SERIES_HASH_PARTS})"
+
+# Series stored before these columns existed hash differently from what sync
+# computes now, so the next sync rewrites them with their timezone.
+CALENDAR_ENTRY_SERIES_HASH = (
+    f"md5({_SERIES_HASH_PARTS} || chr(31) || "
+    "coalesce(timezone, chr(30)) || chr(31) || "
+    "coalesce(is_all_day::text, chr(30)))"
+)
+
+
+def _replace_content_hash(expression: str) -> None:
+    op.drop_column("calendar_entry_series", "content_hash")
+    op.add_column(
+        "calendar_entry_series",
+        sa.Column(
+            "content_hash",
+            sa.String(),
+            sa.Computed(expression, persisted=True),
+            nullable=True,
+        ),
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "calendar_entry_series",
+        sa.Column("timezone", sa.String(), nullable=True),
+    )
+    op.add_column(
+        "calendar_entry_series",
+        sa.Column(
+            "is_all_day",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+    )
+    _replace_content_hash(CALENDAR_ENTRY_SERIES_HASH)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_content_hash(PREVIOUS_SERIES_HASH)
+    op.drop_column("calendar_entry_series", "is_all_day")
+    op.drop_column("calendar_entry_series", "timezone")
@@ -0,0 +1,69 @@
+"""add_days_next_alarm_at
+
+Revision ID: d9a4b6e2f1c8
+Revises: c3f8a1d5e7b2
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d9a4b6e2f1c8"
+down_revision: Union[str, Sequence[str], None] = "c3f8a1d5e7b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("days", sa.Column("next_alarm_at", sa.DateTime(), nullable=True))
+    op.create_index(
+        "idx_days_next_alarm_at",
+        "days",
+        ["next_alarm_at"],
+        unique=False,
+        postgresql_where=sa.text("next_alarm_at IS NOT NULL"),
+    )
+
+    # Same rule as DueScheduleService.pending_alarm_due: the earliest
+    # active alarm, or snoozed alarm at the later of its time and snooze.
+    op.execute(
+        """
+        UPDATE days
+        SET next_alarm_at = pending.next_alarm_at
+        FROM (
+            SELECT
+                days.id,
+                MIN(
+                    CASE
+                        WHEN alarm->>'status' = 'SNOOZED' THEN GREATEST(
+                            (alarm->>'datetime')::timestamptz,
+                            (alarm->>'snoozed_until')::timestamptz
+                        )
+                        ELSE (alarm->>'datetime')::timestamptz
+                    END
+                ) AT TIME ZONE 'UTC' AS next_alarm_at
+            FROM days, jsonb_array_elements(days.alarms) AS alarm
+            WHERE jsonb_typeof(days.alarms) = 'array'
+              AND alarm->>'datetime' IS NOT NULL
+              AND (
+                  COALESCE(alarm->>'status', 'ACTIVE') = 'ACTIVE'
+                  OR (
+                      alarm->>'status' = 'SNOOZED'
+                      AND alarm->>'snoozed_until' IS NOT NULL
+                  )
+              )
+            GROUP BY days.id
+        ) AS pending
+        WHERE days.id = pending.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_days_next_alarm_at", table_name="days")
+    op.drop_column("days", "next_alarm_at")
@@ -0,0 +1,32 @@
+"""add_users_timezone_index
+
+Revision ID: e5c7f2a9b3d1
+Revises: d9a4b6e2f1c8
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c7f2a9b3d1"
+down_revision: Union[str, Sequence[str], None] = "d9a4b6e2f1c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_users_timezone",
+        "users",
+        [sa.text("(settings ->> 'timezone')")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_users_timezone", table_name="users")
@@ -0,0 +1,35 @@
+"""add_calendars_sync_checkpoint
+
+Revision ID: f2b6d8e4a9c3
+Revises: a8d3f1c6e2b7
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b6d8e4a9c3"
+down_revision: Union[str, Sequence[str], None] = "a8d3f1c6e2b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "calendars",
+        sa.Column(
+            "sync_checkpoint",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("calendars", "sync_checkpoint")
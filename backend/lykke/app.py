@@ -16,9 +16,10 @@ from lykke.core.config import settings
 from lykke.core.exceptions import BaseError
 from lykke.core.observability import init_sentry_fastapi
 from lykke.core.utils import youtube
+from lykke.core.utils.templates import warm_templates
 from lykke.domain.entities import UserEntity
 from lykke.infrastructure.auth import UserCreate, UserRead, auth_backend, fastapi_users
-from lykke.infrastructure.gateways import RedisPubSubGateway
+from lykke.infrastructure.gateways import RedisDueScheduleGateway, RedisPubSubGateway
 from lykke.infrastructure.repository_factories import SqlAlchemyReadOnlyRepositoryFactory
 from lykke.infrastructure.unauthenticated import UnauthenticatedIdentityAccess
 from lykke.infrastructure.unit_of_work import SqlAlchemyUnitOfWorkFactory
@@ -46,6 +47,8 @@ async def init_lifespan(fastapi_app: FastAPI) -> AsyncIterator[Never]:
     """
     Lifespan context manager for FastAPI application.
     """
+    warm_templates()
+
     # Create Redis connection pool for shared use across all gateway instances
     redis_pool = aioredis.ConnectionPool.from_url(
         settings.REDIS_URL,
@@ -62,12 +65,14 @@ async def init_lifespan(fastapi_app: FastAPI) -> AsyncIterator[Never]:
 
     # Initialize Redis PubSub gateway with shared connection pool
     pubsub_gateway = RedisPubSubGateway(redis_pool=redis_pool)
+    due_schedule_gateway = RedisDueScheduleGateway(redis_pool=redis_pool)
 
     # Auto-register all domain event handlers
     ro_repo_factory = SqlAlchemyReadOnlyRepositoryFactory()
     uow_factory = SqlAlchemyUnitOfWorkFactory(
         pubsub_gateway=pubsub_gateway,
         workers_to_schedule_factory=lambda: WorkersToSchedule(WorkerRegistry()),
+        due_schedule_gateway=due_schedule_gateway,
     )
 
     async def _load_user(user_id: UUID) -> UserEntity | None:
@@ -90,6 +95,7 @@ async def init_lifespan(fastapi_app: FastAPI) -> AsyncIterator[Never]:
 
     # Clean up Redis connection pool on shutdown
     await pubsub_gateway.close()
+    await due_schedule_gateway.close()
     # Disconnect all connections in the pool
     redis_pool.disconnect()
     logger.info("Closed Redis connection pool")
@@ -58,7 +58,12 @@ from .task import (
     RescheduleTaskCommand,
     RescheduleTaskHandler,
 )
-from .timing_status import EvaluateTimingStatusCommand, EvaluateTimingStatusHandler
+from .timing_status import (
+    EvaluateTimingStatusBatchCommand,
+    EvaluateTimingStatusBatchHandler,
+    EvaluateTimingStatusCommand,
+    EvaluateTimingStatusHandler,
+)
 
 __all__ = [
     "CalendarEntryNotificationCommand",
@@ -71,6 +76,8 @@ __all__ = [
     "DeleteBrainDumpHandler",
     "DeleteTaskCommand",
     "DeleteTaskHandler",
+    "EvaluateTimingStatusBatchCommand",
+    "EvaluateTimingStatusBatchHandler",
     "EvaluateTimingStatusCommand",
     "EvaluateTimingStatusHandler",
     "HandleGoogleLoginCallbackCommand",
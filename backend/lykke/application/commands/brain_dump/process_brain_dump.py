@@ -26,7 +26,10 @@ from lykke.application.queries.get_llm_prompt_context import (
     GetLLMPromptContextQuery,
 )
 from lykke.application.repositories import BrainDumpRepositoryReadOnlyProtocol
-from lykke.core.utils.llm_snapshot import build_referenced_entities
+from lykke.core.utils.llm_snapshot import (
+    build_referenced_entities,
+    prompt_context_age_seconds,
+)
 from lykke.domain import value_objects
 
 if TYPE_CHECKING:
@@ -284,6 +287,9 @@ class ProcessBrainDumpHandler(
             tools=payload.get("request_tools"),
             tool_choice=payload.get("request_tool_choice"),
             model_params=payload.get("request_model_params"),
+            prompt_context_age_seconds=prompt_context_age_seconds(
+                result.prompt_context, result.current_time
+            ),
         )
 
     async def _record_llm_run_result(
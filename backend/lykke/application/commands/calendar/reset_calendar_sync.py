@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import secrets
 import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -16,11 +15,10 @@ from lykke.application.commands.calendar.sync_calendar import SyncCalendarHandle
 from lykke.application.gateways.google_protocol import GoogleCalendarGatewayProtocol
 from lykke.application.repositories import (
     AuthTokenRepositoryReadOnlyProtocol,
-    CalendarEntryRepositoryReadOnlyProtocol,
     CalendarRepositoryReadOnlyProtocol,
 )
 from lykke.core.config import settings
-from lykke.domain import value_objects
+from lykke.core.utils.channel_tokens import sign_channel_token
 from lykke.domain.entities import AuthTokenEntity, CalendarEntity
 from lykke.domain.events.calendar_events import CalendarUpdatedEvent
 from lykke.domain.value_objects import CalendarUpdateObject
@@ -44,7 +42,6 @@ class ResetCalendarSyncHandler(
     sync_calendar_handler: SyncCalendarHandler
     calendar_ro_repo: CalendarRepositoryReadOnlyProtocol
     auth_token_ro_repo: AuthTokenRepositoryReadOnlyProtocol
-    calendar_entry_ro_repo: CalendarEntryRepositoryReadOnlyProtocol
 
     async def handle(self, command: ResetCalendarSyncCommand) -> list[CalendarEntity]:
         """Reset sync for all calendars with subscriptions enabled.
@@ -110,17 +107,17 @@ class ResetCalendarSyncHandler(
                     logger.error(f"Error resubscribing calendar {calendar_id}: {e}")
                     # Continue with other calendars even if one fails
 
-        # Step 5: Perform initial sync for each calendar (using new UoW contexts)
+        # Step 5: Perform initial sync for each calendar (concurrently, one UoW each)
         synced_calendars = []
-        for calendar in updated_calendars:
-            try:
-                synced = await self.sync_calendar_handler.sync_calendar(calendar.id)
-                synced_calendars.append(synced)
-                logger.info(f"Successfully synced calendar {calendar.id}")
-            except Exception as e:
-                logger.error(f"Error syncing calendar {calendar.id}: {e}")
+        results = await self.sync_calendar_handler.sync_calendars(updated_calendars)
+        for calendar, result in zip(updated_calendars, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error syncing calendar {calendar.id}: {result}")
                 # Still return the calendar even if sync fails
                 synced_calendars.append(calendar)
+            else:
+                synced_calendars.append(result)
+                logger.info(f"Successfully synced calendar {calendar.id}")
 
         logger.info(f"Successfully reset sync for {len(synced_calendars)} calendars")
         return synced_calendars
@@ -134,26 +131,9 @@ class ResetCalendarSyncHandler(
             f"Deleting future calendar entries for {len(calendar_ids)} calendars"
         )
 
-        # Get all entries for these calendars
-        all_entries = []
-        for calendar_id in calendar_ids:
-            entries = await self.calendar_entry_ro_repo.search(
-                value_objects.CalendarEntryQuery(calendar_id=calendar_id)
-            )
-            all_entries.extend(entries)
-
-        # Filter to only future entries
-        future_entries = [
-            entry for entry in all_entries if entry.starts_at and entry.starts_at >= now
-        ]
+        deleted_ids = await uow.purge_calendar_entries_from(calendar_ids, now)
 
-        logger.info(f"Found {len(future_entries)} future calendar entries to delete")
-
-        # Delete future entries
-        for entry in future_entries:
-            await uow.delete(entry)
-
-        logger.info(f"Deleted {len(future_entries)} future calendar entries")
+        logger.info(f"Deleted {len(deleted_ids)} future calendar entries")
 
     async def _unsubscribe(
         self,
@@ -197,7 +177,7 @@ class ResetCalendarSyncHandler(
             )
 
         channel_id = str(uuid.uuid4())
-        client_state = secrets.token_urlsafe(32)
+        client_state = sign_channel_token(self.user.id, calendar.id, channel_id)
 
         base_url = settings.API_BASE_URL.rstrip("/")
         webhook_url = f"{base_url}/google/webhook/{self.user.id}/{calendar.id}"
@@ -224,7 +204,10 @@ class ResetCalendarSyncHandler(
             sync_subscription_id=subscription.channel_id,
         )
 
-        calendar = calendar.apply_update(update_data, CalendarUpdatedEvent)
+        # Drop any interrupted sync: its page token belongs to the old listing
+        calendar = calendar.clone(sync_checkpoint=None).apply_update(
+            update_data, CalendarUpdatedEvent
+        )
         calendar = uow.add(calendar)
         logger.info(f"Resubscribed calendar {calendar.id}")
         return calendar
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import secrets
 import uuid
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -15,6 +14,7 @@ from lykke.application.repositories import (
     CalendarEntryRepositoryReadOnlyProtocol,
 )
 from lykke.core.config import settings
+from lykke.core.utils.channel_tokens import sign_channel_token
 from lykke.domain import value_objects
 from lykke.domain.entities import AuthTokenEntity, CalendarEntity
 from lykke.domain.events.calendar_events import CalendarUpdatedEvent
@@ -112,7 +112,7 @@ class ResyncCalendarHandler(BaseCommandHandler[ResyncCalendarCommand, CalendarEn
             )
 
         channel_id = str(uuid.uuid4())
-        client_state = secrets.token_urlsafe(32)
+        client_state = sign_channel_token(self.user.id, calendar.id, channel_id)
 
         base_url = settings.API_BASE_URL.rstrip("/")
         webhook_url = f"{base_url}/google/webhook/{self.user.id}/{calendar.id}"
@@ -139,5 +139,8 @@ class ResyncCalendarHandler(BaseCommandHandler[ResyncCalendarCommand, CalendarEn
             sync_subscription_id=subscription.channel_id,
         )
 
-        calendar = calendar.apply_update(update_data, CalendarUpdatedEvent)
+        # Drop any interrupted sync: its page token belongs to the old listing
+        calendar = calendar.clone(sync_checkpoint=None).apply_update(
+            update_data, CalendarUpdatedEvent
+        )
         return uow.add(calendar)
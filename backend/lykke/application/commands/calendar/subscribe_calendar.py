@@ -1,6 +1,5 @@
 """Command to subscribe a calendar to push notifications for changes."""
 
-import secrets
 import uuid
 from dataclasses import dataclass
 from uuid import UUID
@@ -9,6 +8,7 @@ from lykke.application.commands.base import BaseCommandHandler, Command
 from lykke.application.gateways.google_protocol import GoogleCalendarGatewayProtocol
 from lykke.application.repositories import AuthTokenRepositoryReadOnlyProtocol
 from lykke.core.config import settings
+from lykke.core.utils.channel_tokens import sign_channel_token
 from lykke.domain.entities import CalendarEntity
 from lykke.domain.events.calendar_events import CalendarUpdatedEvent
 from lykke.domain.value_objects import CalendarUpdateObject
@@ -60,7 +60,7 @@ class SubscribeCalendarHandler(
                 channel_id = str(uuid.uuid4())
 
                 # Generate secret token for webhook verification
-                client_state = secrets.token_urlsafe(32)
+                client_state = sign_channel_token(self.user.id, calendar.id, channel_id)
 
                 # Build webhook URL with user_id and calendar_id
                 base_url = settings.API_BASE_URL.rstrip("/")
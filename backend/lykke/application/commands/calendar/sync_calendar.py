@@ -1,16 +1,21 @@
 """Command to sync calendar entries from external calendar providers."""
 
+import asyncio
 from collections import defaultdict
-from dataclasses import dataclass, replace
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, cast
 from uuid import UUID, uuid4
 
 from googleapiclient.errors import HttpError
 from loguru import logger
 
 from lykke.application.commands.base import BaseCommandHandler, Command
-from lykke.application.gateways.google_protocol import GoogleCalendarGatewayProtocol
+from lykke.application.gateways.google_protocol import (
+    CalendarEventPage,
+    GoogleCalendarGatewayProtocol,
+)
 from lykke.application.repositories import (
     AuthTokenRepositoryReadOnlyProtocol,
     CalendarEntryRepositoryReadOnlyProtocol,
@@ -18,8 +23,9 @@ from lykke.application.repositories import (
     CalendarRepositoryReadOnlyProtocol,
 )
 from lykke.application.unit_of_work import UnitOfWorkProtocol
+from lykke.core.config import settings
 from lykke.core.constants import CALENDAR_DEFAULT_LOOKBACK, CALENDAR_SYNC_LOOKBACK
-from lykke.core.exceptions import NotFoundError, TokenExpiredError
+from lykke.core.exceptions import TokenExpiredError
 from lykke.domain import value_objects
 from lykke.domain.entities import (
     AuthTokenEntity,
@@ -31,7 +37,7 @@ from lykke.domain.events.calendar_entry_series_events import (
     CalendarEntrySeriesUpdatedEvent,
 )
 from lykke.domain.events.calendar_events import CalendarUpdatedEvent
-from lykke.domain.value_objects import CalendarUpdateObject
+from lykke.domain.value_objects import CalendarSyncCheckpoint, CalendarUpdateObject
 from lykke.domain.value_objects.update import (
     CalendarEntrySeriesUpdateObject,
     CalendarEntryUpdateObject,
@@ -40,6 +46,36 @@ from lykke.domain.value_objects.update import (
 # Max lookahead for calendar events (1 year)
 MAX_EVENT_LOOKAHEAD = timedelta(days=365)
 
+_process_sync_slots: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
+
+def process_sync_slots() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent calendar syncs in this process."""
+    global _process_sync_slots
+    loop = asyncio.get_running_loop()
+    if _process_sync_slots is None or _process_sync_slots[0] is not loop:
+        _process_sync_slots = (
+            loop,
+            asyncio.Semaphore(settings.CALENDAR_SYNC_PROCESS_CONCURRENCY),
+        )
+    return _process_sync_slots[1]
+
+
+@dataclass
+class _SyncRun:
+    """State carried across the pages of one sync run."""
+
+    calendar: CalendarEntity
+    log_ctx: dict[str, str | bool]
+    started_at: datetime
+    # Series that already had a created/updated or deleted notification
+    notified_series_ids: set[UUID] = field(default_factory=set)
+    deletion_notified_series_ids: set[UUID] = field(default_factory=set)
+    # Series instances returned by the provider during this run; a series
+    # tombstone never deletes these. Pages committed before a resume are not
+    # included.
+    listed_platform_ids: set[str] = field(default_factory=set)
+
 
 @dataclass(frozen=True)
 class SyncCalendarCommand(Command):
@@ -68,58 +104,155 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
             raise ValueError("Either calendar_id or calendar must be provided")
 
     async def sync_calendar(self, calendar_id: UUID) -> CalendarEntity:
-        """Sync a calendar by ID using a fresh unit of work."""
-        uow = self.new_uow()
-        async with uow:
-            calendar = await self.calendar_ro_repo.get(calendar_id)
-            if calendar.platform == "lykke" or calendar.auth_token_id is None:
-                return calendar
-            token = await self.auth_token_ro_repo.get(calendar.auth_token_id)
-            return await self.sync_calendar_with_uow(calendar, token, uow)
+        """Sync a calendar by ID."""
+        calendar = await self.calendar_ro_repo.get(calendar_id)
+        return await self.sync_calendar_entity(calendar)
 
     async def sync_calendar_entity(self, calendar: CalendarEntity) -> CalendarEntity:
-        """Sync a provided calendar entity using a fresh unit of work."""
+        """Sync a provided calendar entity, committing one page at a time."""
         if calendar.platform == "lykke" or calendar.auth_token_id is None:
             return calendar
-        uow = self.new_uow()
-        async with uow:
-            token = await self.auth_token_ro_repo.get(calendar.auth_token_id)
-            return await self.sync_calendar_with_uow(calendar, token, uow)
+        token = await self.auth_token_ro_repo.get(calendar.auth_token_id)
+        return await self.sync_calendar_pages(calendar, token)
+
+    async def sync_calendars(
+        self, calendars: Sequence[CalendarEntity]
+    ) -> list[CalendarEntity | Exception]:
+        """Sync several calendars concurrently, each in its own units of work.
+
+        At most ``CALENDAR_SYNC_USER_CONCURRENCY`` of the given calendars and
+        ``CALENDAR_SYNC_PROCESS_CONCURRENCY`` syncs across the process run at
+        once. A failing calendar keeps the pages it already committed; its
+        exception is returned in place of the synced calendar.
+
+        Must be called outside a unit of work, otherwise the per-page units
+        of work would share its connection.
+        """
+        user_slots = asyncio.Semaphore(settings.CALENDAR_SYNC_USER_CONCURRENCY)
+        process_slots = process_sync_slots()
+
+        async def sync_one(calendar: CalendarEntity) -> CalendarEntity | Exception:
+            async with user_slots, process_slots:
+                try:
+                    return await self.sync_calendar_entity(calendar)
+                except Exception as exc:  # pylint: disable=broad-except
+                    return exc
 
-    async def sync_calendar_with_uow(
-        self,
-        calendar: CalendarEntity,
-        token: AuthTokenEntity,
-        uow: UnitOfWorkProtocol,
+        return list(await asyncio.gather(*(sync_one(c) for c in calendars)))
+
+    async def sync_calendar_pages(
+        self, calendar: CalendarEntity, token: AuthTokenEntity
     ) -> CalendarEntity:
-        """Perform the sync using an existing unit of work."""
-        sync_run_id = uuid4()
-        log_ctx: dict[str, str | bool] = {
-            "sync_run_id": str(sync_run_id),
-            "calendar_id": str(calendar.id),
-        }
+        """Stream the provider listing and persist it one page per unit of work.
+
+        After each page the calendar records a ``CalendarSyncCheckpoint`` in
+        the same transaction, so a sync that crashes or times out resumes
+        from the next page instead of starting over. The last page clears
+        the checkpoint and stores the next sync token.
+        """
+        run = _SyncRun(
+            calendar=calendar,
+            log_ctx={"sync_run_id": str(uuid4()), "calendar_id": str(calendar.id)},
+            started_at=datetime.now(UTC),
+        )
+        if calendar.platform != "google":
+            raise NotImplementedError(
+                f"Sync not implemented for platform {calendar.platform}"
+            )
 
         lookback: datetime = datetime.now(UTC) - CALENDAR_DEFAULT_LOOKBACK
         if calendar.last_sync_at:
             lookback = calendar.last_sync_at - CALENDAR_SYNC_LOOKBACK
-
         sync_token = (
             calendar.sync_subscription.sync_token
             if calendar.sync_subscription
             else None
         )
-        log_ctx["sync_token_present"] = sync_token is not None
-        user_timezone = self.user.settings.timezone if self.user.settings else None
+        page_token: str | None = None
+        checkpoint = calendar.sync_checkpoint
+        if checkpoint is not None:
+            lookback = checkpoint.lookback
+            sync_token = checkpoint.sync_token
+            page_token = checkpoint.page_token
+            run.started_at = checkpoint.started_at
+            logger.info(
+                "Calendar sync resuming from checkpoint",
+                **run.log_ctx,
+                pages_synced=checkpoint.pages_synced,
+                started_at=checkpoint.started_at.isoformat(),
+            )
 
-        (
-            fetched_entries,
-            fetched_deleted_entries,
-            fetched_series,
-            cancelled_series_ids,
-            next_sync_token,
-        ) = await self._load_calendar_events(
-            calendar, lookback, sync_token, token, user_timezone=user_timezone
+        try:
+            await self._sync_listing(run, token, lookback, sync_token, page_token)
+        except HttpError as exc:
+            if exc.resp.status != 410 or (sync_token is None and page_token is None):
+                raise
+            # The sync token or the checkpointed page expired
+            logger.info("Sync token expired, performing full sync", **run.log_ctx)
+            await self._sync_listing(run, token, lookback, None, None)
+        return run.calendar
+
+    async def _sync_listing(
+        self,
+        run: _SyncRun,
+        token: AuthTokenEntity,
+        lookback: datetime,
+        sync_token: str | None,
+        page_token: str | None,
+    ) -> None:
+        """Apply each page of one listing in its own unit of work."""
+        run.log_ctx["sync_token_present"] = sync_token is not None
+        user_timezone = self.user.settings.timezone if self.user.settings else None
+        pages_synced = (
+            run.calendar.sync_checkpoint.pages_synced
+            if page_token is not None and run.calendar.sync_checkpoint
+            else 0
         )
+        pages = self.google_gateway.iter_calendar_event_pages(
+            run.calendar,
+            lookback,
+            token,
+            user_timezone=user_timezone,
+            sync_token=sync_token,
+            page_token=page_token,
+        )
+        async for page in pages:
+            pages_synced += 1
+            async with self.new_uow() as uow:
+                await self._apply_page(run, page, uow)
+                if page.next_page_token is None:
+                    calendar = self._apply_calendar_update(
+                        run.calendar.clone(sync_checkpoint=None),
+                        page.next_sync_token,
+                    )
+                else:
+                    calendar = run.calendar.apply_update(
+                        CalendarUpdateObject(
+                            sync_checkpoint=CalendarSyncCheckpoint(
+                                page_token=page.next_page_token,
+                                sync_token=sync_token,
+                                lookback=lookback,
+                                started_at=run.started_at,
+                                pages_synced=pages_synced,
+                            )
+                        ),
+                        CalendarUpdatedEvent,
+                    )
+                run.calendar = uow.add(calendar)
+
+    async def _apply_page(
+        self,
+        run: _SyncRun,
+        page: CalendarEventPage,
+        uow: UnitOfWorkProtocol,
+    ) -> None:
+        """Persist one page of provider changes using ``uow``."""
+        log_ctx = run.log_ctx
+        calendar = run.calendar
+        fetched_entries = page.entries
+        fetched_deleted_entries = page.deleted_entries
+        fetched_series = page.series
+        cancelled_series_ids = page.cancelled_series_ids
         logger.info(
             "Calendar sync fetch completed",
             **log_ctx,
@@ -130,9 +263,34 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
         )
 
         max_date = datetime.now(UTC) + MAX_EVENT_LOOKAHEAD
+        # Plain series instances past the horizon are expanded on read rather
+        # than stored; moved instances are always stored as exceptions.
+        series_horizon = datetime.now(UTC) + timedelta(
+            days=settings.CALENDAR_SERIES_MATERIALIZE_DAYS
+        )
         filtered_entries = [
-            entry for entry in fetched_entries if entry.starts_at <= max_date
+            entry
+            for entry in fetched_entries
+            if entry.starts_at <= max_date
+            and (
+                entry.calendar_entry_series_id is None
+                or entry.is_instance_exception
+                or entry.starts_at <= series_horizon
+            )
         ]
+        # Cancelled instances past the horizon have no row to delete; the
+        # series records them so expansion skips them.
+        cancelled_occurrences: dict[UUID, set[datetime]] = defaultdict(set)
+        for entry in [*fetched_entries, *fetched_deleted_entries]:
+            original_starts_at = entry.original_starts_at or entry.starts_at
+            if (
+                entry.status == "cancelled"
+                and entry.calendar_entry_series_id is not None
+                and original_starts_at > series_horizon
+            ):
+                cancelled_occurrences[entry.calendar_entry_series_id].add(
+                    original_starts_at
+                )
 
         cancelled_platform_ids = [
             entry.platform_id
@@ -171,9 +329,10 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
             if sid is not None
             and any(not is_true_instance_exception(e) for e in entries)
         }
-        # One representative per series for series-level changes: earliest non-exception.
+        # One representative per series for series-level changes: earliest
+        # non-exception. Series notified on an earlier page stay silent.
         representative_entry_platform_ids: set[str] = set()
-        for sid in series_with_non_exception:
+        for sid in series_with_non_exception - run.notified_series_ids:
             group = entries_by_series[sid]
             non_exceptions = [e for e in group if not is_true_instance_exception(e)]
             rep = min(
@@ -181,6 +340,7 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
                 key=lambda e: (e.starts_at, e.platform_id),
             )
             representative_entry_platform_ids.add(rep.platform_id)
+        run.notified_series_ids |= series_with_non_exception
 
         def should_emit_entry_notification(entry: CalendarEntryEntity) -> bool:
             """True instance exception => one per entry; else one per series."""
@@ -193,15 +353,38 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
             return True
 
         # One notification per series when deleting (used in both delete loops).
-        series_delete_notification_emitted: set[UUID] = set()
+        series_delete_notification_emitted = run.deletion_notified_series_ids
 
-        # Process series
+        # Process series - skip those stored with identical content
+        unchanged_series_ids: set[UUID] = set()
+        if fetched_series:
+            unchanged_series_ids = (
+                await self.calendar_entry_series_ro_repo.unchanged_ids(fetched_series)
+            )
         series_by_id: dict[UUID, CalendarEntrySeriesEntity] = {}
         series_changed_ids: set[UUID] = set()
-        for series in fetched_series:
-            try:
-                existing_series = await self.calendar_entry_series_ro_repo.get(series.id)
-            except NotFoundError:
+        changed_series = [
+            series for series in fetched_series if series.id not in unchanged_series_ids
+        ]
+        existing_series_map: dict[UUID, CalendarEntrySeriesEntity] = {}
+        if changed_series:
+            existing_series_map = {
+                series.id: series
+                for series in await self.calendar_entry_series_ro_repo.search(
+                    value_objects.CalendarEntrySeriesQuery(
+                        ids=[series.id for series in changed_series]
+                    )
+                )
+            }
+        for series in changed_series:
+            existing_series = existing_series_map.get(series.id)
+            if existing_series is None:
+                series = series.clone(
+                    materialized_until=series_horizon,
+                    cancelled_occurrences=sorted(
+                        cancelled_occurrences.pop(series.id, set())
+                    ),
+                )
                 series.create()
                 uow.add(series)
                 series_by_id[series.id] = series
@@ -220,8 +403,20 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
                     series_update_fields["starts_at"] = series.starts_at
                 if existing_series.ends_at != series.ends_at:
                     series_update_fields["ends_at"] = series.ends_at
+                if existing_series.timezone != series.timezone:
+                    series_update_fields["timezone"] = series.timezone
+                if existing_series.is_all_day != series.is_all_day:
+                    series_update_fields["is_all_day"] = series.is_all_day
                 if existing_series.ical_uid != series.ical_uid:
                     series_update_fields["ical_uid"] = series.ical_uid
+                if series_update_fields:
+                    # The provider re-lists instances of a changed series.
+                    series_update_fields["materialized_until"] = series_horizon
+                cancelled = self._merge_cancelled_occurrences(
+                    existing_series, cancelled_occurrences.pop(series.id, set())
+                )
+                if cancelled is not None:
+                    series_update_fields["cancelled_occurrences"] = cancelled
 
                 if series_update_fields:
                     series_update_object = CalendarEntrySeriesUpdateObject(
@@ -236,8 +431,52 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
                 else:
                     series_by_id[series.id] = existing_series
 
-        # Preload existing entries to determine create vs update
-        platform_ids_to_check = [entry.platform_id for entry in entries_to_upsert]
+        # Cancellations past the horizon for series not otherwise changed
+        if cancelled_occurrences:
+            missing_ids = [
+                series_id
+                for series_id in cancelled_occurrences
+                if series_id not in series_by_id
+            ]
+            if missing_ids:
+                for series in await self.calendar_entry_series_ro_repo.search(
+                    value_objects.CalendarEntrySeriesQuery(ids=missing_ids)
+                ):
+                    series_by_id[series.id] = series
+            for series_id, starts in cancelled_occurrences.items():
+                stored_series = series_by_id.get(series_id)
+                if stored_series is None or stored_series.deleted_at is not None:
+                    continue
+                cancelled = self._merge_cancelled_occurrences(stored_series, starts)
+                if cancelled is None:
+                    continue
+                updated_series = stored_series.apply_update(
+                    CalendarEntrySeriesUpdateObject(cancelled_occurrences=cancelled),
+                    CalendarEntrySeriesUpdatedEvent,
+                )
+                uow.add(updated_series)
+                series_by_id[series_id] = updated_series
+
+        # Skip entries stored with identical content, then preload the rest
+        # to determine create vs update
+        unchanged_platform_ids: set[str] = set()
+        if entries_to_upsert:
+            unchanged_platform_ids = (
+                await self.calendar_entry_ro_repo.unchanged_platform_ids(
+                    entries_to_upsert
+                )
+            )
+        platform_ids_to_check = [
+            entry.platform_id
+            for entry in entries_to_upsert
+            if entry.platform_id not in unchanged_platform_ids
+        ]
+        logger.info(
+            "Calendar sync skipping unchanged content",
+            **log_ctx,
+            unchanged_entries_count=len(unchanged_platform_ids),
+            unchanged_series_count=len(unchanged_series_ids),
+        )
         existing_entries_map: dict[str, CalendarEntryEntity] = {}
         if platform_ids_to_check:
             existing_entries = await self.calendar_entry_ro_repo.search(
@@ -248,12 +487,11 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
             }
 
         # Process entries - create new or update existing
-        upsert_platform_ids_by_series: dict[UUID, set[str]] = {}
         for entry in entries_to_upsert:
             if entry.calendar_entry_series_id:
-                upsert_platform_ids_by_series.setdefault(
-                    entry.calendar_entry_series_id, set()
-                ).add(entry.platform_id)
+                run.listed_platform_ids.add(entry.platform_id)
+            if entry.platform_id in unchanged_platform_ids:
+                continue
             existing_entry = existing_entries_map.get(entry.platform_id)
             if existing_entry is None:
                 # Single→series conversion: attach existing standalone entry if same event
@@ -283,9 +521,7 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
                             attach_update
                         )
                         uow.add(updated_attached)
-                        upsert_platform_ids_by_series.setdefault(
-                            entry.calendar_entry_series_id, set()
-                        ).add(to_attach.platform_id)
+                        run.listed_platform_ids.add(to_attach.platform_id)
                         attached = True
                         logger.info(
                             "Single→series attach: linked standalone entry to series",
@@ -350,59 +586,43 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
                     uow.add(updated_entry)
                 # If no changes, skip (entry already exists and is up to date)
 
-        # Apply series updates to all associated entries (one notification per series when cascading).
-        cascade_notification_emitted: set[UUID] = set()
+        # Cascade series updates to their stored entries in one statement
+        # (one notification per series when cascading).
         if series_changed_ids:
-            for series_id in series_changed_ids:
-                series_for_update = series_by_id.get(series_id)
-                if series_for_update is None:
-                    continue
-                series_entries = await self.calendar_entry_ro_repo.search(
-                    value_objects.CalendarEntryQuery(calendar_entry_series_id=series_id)
+            cascaded_entries = await uow.cascade_calendar_entry_series(
+                [series_by_id[series_id] for series_id in series_changed_ids]
+            )
+            cascade_notification_emitted = run.notified_series_ids
+            # Sort so we have a deterministic representative (earliest by starts_at)
+            for entry in sorted(
+                cascaded_entries, key=lambda e: (e.starts_at, e.platform_id)
+            ):
+                series_id = cast("UUID", entry.calendar_entry_series_id)
+                series_for_update = series_by_id[series_id]
+                cascade_update_object = CalendarEntryUpdateObject(
+                    name=series_for_update.name,
+                    category=series_for_update.event_category,
+                    frequency=series_for_update.frequency,
                 )
-                # Sort so we have a deterministic representative (earliest by starts_at)
-                series_entries_sorted = sorted(
-                    series_entries, key=lambda e: (e.starts_at, e.platform_id)
+                # Emit only when no entries for this series were in the batch (so we did not already emit in Process entries).
+                emit_cascade = (
+                    series_id not in cascade_notification_emitted
+                    and not entries_by_series.get(series_id)
                 )
-                for entry in series_entries_sorted:
-                    cascade_update_fields: dict[str, Any] = {}
-                    if entry.name != series_for_update.name:
-                        cascade_update_fields["name"] = series_for_update.name
-                    if entry.category != series_for_update.event_category:
-                        cascade_update_fields["category"] = (
-                            series_for_update.event_category
-                        )
-                    if entry.frequency != series_for_update.frequency:
-                        cascade_update_fields["frequency"] = series_for_update.frequency
-
-                    if cascade_update_fields:
-                        cascade_update_object = CalendarEntryUpdateObject(
-                            **cascade_update_fields
-                        )
-                        # Emit only when no entries for this series were in the batch (so we did not already emit in Process entries).
-                        had_entries_in_batch = (
-                            len(entries_by_series.get(series_id, [])) > 0
-                        )
-                        emit_cascade = (
-                            series_id not in cascade_notification_emitted
-                            and not had_entries_in_batch
-                        )
-                        if emit_cascade:
-                            cascade_notification_emitted.add(series_id)
-                        if emit_cascade:
-                            updated_entry = entry.apply_calendar_entry_update(
-                                cascade_update_object
-                            )
-                        else:
-                            updated_entry = entry.apply_calendar_entry_update_silently(
-                                cascade_update_object
-                            )
-                        uow.add(updated_entry)
+                if emit_cascade:
+                    cascade_notification_emitted.add(series_id)
+                    updated_entry = entry.apply_calendar_entry_update(
+                        cascade_update_object
+                    )
+                else:
+                    updated_entry = entry.apply_calendar_entry_update_silently(
+                        cascade_update_object
+                    )
+                uow.add_persisted(updated_entry)
 
         # Delete entries - use per-entry delete() instead of bulk delete
         # to ensure delete events are emitted
         deleted_platform_ids: set[str] = set()
-        deleted_entry_ids: set[UUID] = set()
         series_ids_with_deletions: set[UUID] = set(cancelled_series_ids)
         deleted_series_ids = {
             entry.calendar_entry_series_id
@@ -425,7 +645,6 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
                 value_objects.CalendarEntryQuery(platform_ids=unique_platform_ids)
             )
             deleted_platform_ids = {entry.platform_id for entry in entries_to_delete}
-            deleted_entry_ids = {entry.id for entry in entries_to_delete}
             for entry in entries_to_delete:
                 if entry.starts_at < current_time:
                     continue
@@ -450,41 +669,37 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
                 **log_ctx,
                 series_ids_with_deletions=[str(s) for s in series_ids_with_deletions],
             )
+            # Delete future entries not already handled above in one statement
+            # (one notification per series).
+            future_entries = await uow.delete_calendar_series_entries_from(
+                series_ids_with_deletions,
+                current_time,
+                exclude_platform_ids=deleted_platform_ids | run.listed_platform_ids,
+            )
+            for entry in sorted(
+                future_entries, key=lambda e: (e.starts_at, e.platform_id)
+            ):
+                series_id = cast("UUID", entry.calendar_entry_series_id)
+                if series_id not in series_delete_notification_emitted:
+                    series_delete_notification_emitted.add(series_id)
+                    entry.delete()
+                else:
+                    entry.delete_silently()
+                uow.add_persisted(entry)
+
+            # End the series themselves to avoid FK violations
+            missing_series_ids = [
+                series_id
+                for series_id in series_ids_with_deletions
+                if series_id not in series_by_id
+            ]
+            if missing_series_ids:
+                for series in await self.calendar_entry_series_ro_repo.search(
+                    value_objects.CalendarEntrySeriesQuery(ids=missing_series_ids)
+                ):
+                    series_by_id[series.id] = series
             for series_id in series_ids_with_deletions:
-                existing_series_entries = await self.calendar_entry_ro_repo.search(
-                    value_objects.CalendarEntryQuery(calendar_entry_series_id=series_id)
-                )
-                future_entries = [
-                    entry
-                    for entry in existing_series_entries
-                    if entry.starts_at >= current_time
-                    and entry.platform_id not in deleted_platform_ids
-                    and entry.platform_id
-                    not in upsert_platform_ids_by_series.get(series_id, set())
-                ]
-
-                # Delete any future entries for the series not already marked (one notification per series).
-                for entry in future_entries:
-                    if entry.id in deleted_entry_ids:
-                        continue
-                    emit = series_id not in series_delete_notification_emitted
-                    if emit:
-                        series_delete_notification_emitted.add(series_id)
-                    if emit:
-                        entry.delete()
-                    else:
-                        entry.delete_silently()
-                    uow.add(entry)
-
-                # End the series itself to avoid FK violations
                 series_for_delete = series_by_id.get(series_id)
-                if series_for_delete is None:
-                    try:
-                        series_for_delete = await self.calendar_entry_series_ro_repo.get(
-                            series_id
-                        )
-                    except NotFoundError:
-                        series_for_delete = None
                 if series_for_delete is not None:
                     series_end_update_fields: dict[str, Any] = {}
                     if series_for_delete.ends_at is None or (
@@ -505,49 +720,15 @@ class SyncCalendarHandler(BaseCommandHandler[SyncCalendarCommand, CalendarEntity
                         )
                         uow.add(updated_series)
 
-        updated_calendar = self._apply_calendar_update(calendar, next_sync_token)
-        return uow.add(updated_calendar)
-
-    async def _load_calendar_events(
-        self,
-        calendar: CalendarEntity,
-        lookback: datetime,
-        sync_token: str | None,
-        token: AuthTokenEntity,
-        *,
-        user_timezone: str | None,
-    ) -> tuple[
-        list[CalendarEntryEntity],
-        list[CalendarEntryEntity],
-        list[CalendarEntrySeriesEntity],
-        list[UUID],
-        str | None,
-    ]:
-        """Load events from the provider, handling sync token expiration."""
-        if calendar.platform != "google":
-            raise NotImplementedError(
-                f"Sync not implemented for platform {calendar.platform}"
-            )
-
-        try:
-            return await self.google_gateway.load_calendar_events(
-                calendar=calendar,
-                lookback=lookback,
-                token=token,
-                user_timezone=user_timezone,
-                sync_token=sync_token,
-            )
-        except HttpError as exc:
-            if exc.resp.status == 410:
-                logger.info("Sync token expired, performing full sync")
-                return await self.google_gateway.load_calendar_events(
-                    calendar=calendar,
-                    lookback=lookback,
-                    token=token,
-                    user_timezone=user_timezone,
-                    sync_token=None,
-                )
-            raise
+    @staticmethod
+    def _merge_cancelled_occurrences(
+        series: CalendarEntrySeriesEntity, starts: set[datetime]
+    ) -> list[datetime] | None:
+        """Return the series' cancelled occurrences plus ``starts``, if that adds any."""
+        merged = set(series.cancelled_occurrences) | starts
+        if len(merged) == len(series.cancelled_occurrences):
+            return None
+        return sorted(merged)
 
     def _apply_calendar_update(
         self, calendar: CalendarEntity, next_sync_token: str | None
@@ -583,20 +764,17 @@ class SyncAllCalendarsHandler(BaseCommandHandler[SyncAllCalendarsCommand, None])
         await self.sync_all_calendars()
 
     async def sync_all_calendars(self) -> None:
-        """Sync all calendars for the user."""
-        uow = self.new_uow()
-        async with uow:
-            calendars = await self.calendar_ro_repo.all()
-            for calendar in calendars:
-                if calendar.platform == "lykke" or calendar.auth_token_id is None:
-                    continue
-                try:
-                    token = await self.auth_token_ro_repo.get(calendar.auth_token_id)
-                    await self.sync_calendar_handler.sync_calendar_with_uow(
-                        calendar, token, uow
-                    )
-                except TokenExpiredError:
-                    logger.info(f"Token expired for calendar {calendar.name}")
-                except Exception as e:  # pylint: disable=broad-except
-                    logger.exception(f"Error syncing calendar {calendar.name}: {e}")
-                    await uow.rollback()
+        """Sync all calendars for the user, several at a time."""
+        calendars = [
+            calendar
+            for calendar in await self.calendar_ro_repo.all()
+            if calendar.platform != "lykke" and calendar.auth_token_id is not None
+        ]
+        results = await self.sync_calendar_handler.sync_calendars(calendars)
+        for calendar, result in zip(calendars, results, strict=True):
+            if isinstance(result, TokenExpiredError):
+                logger.info(f"Token expired for calendar {calendar.name}")
+            elif isinstance(result, Exception):
+                logger.opt(exception=result).error(
+                    f"Error syncing calendar {calendar.name}: {result}"
+                )
@@ -230,7 +230,9 @@ class ScheduleDayHandler(
                             value_objects.TaskQuery(date=command.date)
                         ),
                         self.calendar_entry_ro_repo.search(
-                            value_objects.CalendarEntryQuery(date=command.date)
+                            value_objects.CalendarEntryQuery(
+                                date=command.date, expand_series=True
+                            )
                         ),
                         self.routine_ro_repo.search(
                             value_objects.RoutineQuery(date=command.date)
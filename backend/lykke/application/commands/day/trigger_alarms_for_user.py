@@ -13,6 +13,7 @@ from lykke.core.exceptions import NotFoundError
 from lykke.core.utils.dates import get_current_date, get_current_datetime
 from lykke.domain import value_objects
 from lykke.domain.entities import DayEntity
+from lykke.domain.services import DueScheduleService
 
 
 @dataclass(frozen=True)
@@ -27,13 +28,16 @@ class TriggerAlarmsForUserCommand(Command):
 
 
 class TriggerAlarmsForUserHandler(
-    BaseCommandHandler[TriggerAlarmsForUserCommand, None]
+    BaseCommandHandler[TriggerAlarmsForUserCommand, dt_datetime | None]
 ):
-    """Evaluates day alarms for the user and marks due ones as triggered."""
+    """Evaluates day alarms for the user and marks due ones as triggered.
+
+    Returns the next instant one of the evaluated alarms becomes due.
+    """
 
     day_ro_repo: DayRepositoryReadOnlyProtocol
 
-    async def handle(self, command: TriggerAlarmsForUserCommand) -> None:
+    async def handle(self, command: TriggerAlarmsForUserCommand) -> dt_datetime | None:
         """Evaluate alarms for today and yesterday (snoozed only) and persist changes."""
         user = self.user
         timezone = user.settings.timezone if user.settings else None
@@ -49,6 +53,7 @@ class TriggerAlarmsForUserHandler(
             else get_current_date(timezone)
         )
         previous_date = target_date - dt_timedelta(days=1)
+        next_due: list[dt_datetime] = []
 
         async with self.new_uow() as uow:
             for day_date, snoozed_only in (
@@ -76,6 +81,14 @@ class TriggerAlarmsForUserHandler(
                 if day.has_events():
                     uow.add(day)
 
+                day_next_due = DueScheduleService.next_alarm_due(
+                    day.alarms, evaluation_time
+                )
+                if day_next_due is not None:
+                    next_due.append(day_next_due)
+
+        return min(next_due, default=None)
+
     @staticmethod
     def _evaluate_day_alarms(
         day: DayEntity,
@@ -47,6 +47,7 @@ from lykke.domain.entities import (
 )
 from lykke.domain.events.ai_chat_events import MessageSentEvent
 from lykke.domain.events.day_events import AlarmTriggeredEvent
+from lykke.domain.services import DueScheduleService
 
 EVALUATION_WINDOW = timedelta(minutes=1)
 
@@ -60,9 +61,12 @@ class CalendarEntryNotificationCommand(Command):
 
 
 class CalendarEntryNotificationHandler(
-    BaseCommandHandler[CalendarEntryNotificationCommand, None]
+    BaseCommandHandler[CalendarEntryNotificationCommand, datetime | None]
 ):
-    """Deterministically sends calendar entry reminders."""
+    """Deterministically sends calendar entry reminders.
+
+    Returns the next reminder instant among the loaded entries, if any.
+    """
 
     calendar_entry_ro_repo: CalendarEntryRepositoryReadOnlyProtocol
     day_ro_repo: DayRepositoryReadOnlyProtocol
@@ -72,12 +76,14 @@ class CalendarEntryNotificationHandler(
     send_push_notification_handler: SendPushNotificationHandler
     sms_gateway: SMSProviderProtocol
 
-    async def handle(self, command: CalendarEntryNotificationCommand) -> None:
+    async def handle(
+        self, command: CalendarEntryNotificationCommand
+    ) -> datetime | None:
         _ = command.triggered_by
         user = self.user
         settings = user.settings.calendar_entry_notification_settings
         if not settings.enabled or not settings.rules:
-            return
+            return None
 
         rules = [
             rule
@@ -88,7 +94,7 @@ class CalendarEntryNotificationHandler(
             logger.debug(
                 f"No calendar entry notification rules found for user {self.user.id}"
             )
-            return
+            return None
 
         max_minutes = max(rule.minutes_before for rule in rules)
         look_ahead = timedelta(minutes=max_minutes) + EVALUATION_WINDOW
@@ -102,6 +108,14 @@ class CalendarEntryNotificationHandler(
         for entry in upcoming:
             await self._maybe_send_for_entry(entry, rules, user, now)
 
+        next_reminders = [
+            DueScheduleService.next_calendar_entry_reminder(entry, rules, now)
+            for entry in entries
+        ]
+        return min(
+            (value for value in next_reminders if value is not None), default=None
+        )
+
     async def _load_calendar_entries(
         self,
         user: UserEntity,
@@ -114,7 +128,7 @@ class CalendarEntryNotificationHandler(
         for day_date in dates:
             entries.extend(
                 await self.calendar_entry_ro_repo.search(
-                    value_objects.CalendarEntryQuery(date=day_date)
+                    value_objects.CalendarEntryQuery(date=day_date, expand_series=True)
                 )
             )
         return entries
@@ -34,7 +34,10 @@ from lykke.application.repositories import (
     PushSubscriptionRepositoryReadOnlyProtocol,
 )
 from lykke.core.config import settings
-from lykke.core.utils.llm_snapshot import build_referenced_entities
+from lykke.core.utils.llm_snapshot import (
+    build_referenced_entities,
+    prompt_context_age_seconds,
+)
 from lykke.core.utils.serialization import dataclass_to_json_dict
 from lykke.domain import value_objects
 from lykke.domain.entities import PushNotificationEntity, UserEntity
@@ -145,6 +148,9 @@ class MorningOverviewHandler(
                 tools=snapshot_context.tools,
                 tool_choice=snapshot_context.tool_choice,
                 model_params=snapshot_context.model_params,
+                prompt_context_age_seconds=prompt_context_age_seconds(
+                    snapshot_context.prompt_context, snapshot_context.current_time
+                ),
             )
 
         async def decide_morning_overview(
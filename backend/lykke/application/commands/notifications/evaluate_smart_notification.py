@@ -33,6 +33,7 @@ from lykke.application.repositories import (
 )
 from lykke.core.config import settings
 from lykke.core.utils.dates import get_current_datetime_in_timezone
+from lykke.core.utils.llm_snapshot import prompt_context_age_seconds
 from lykke.core.utils.serialization import dataclass_to_json_dict
 from lykke.domain import value_objects
 from lykke.domain.entities import PushNotificationEntity, TaskEntity, UserEntity
@@ -215,6 +216,8 @@ class SmartNotificationHandler(
     send_push_notification_handler: SendPushNotificationHandler
     name = "notification"
     template_usecase = "notification"
+    skip_unchanged_context = True
+    critical_usecase = False
     _triggered_by: str | None = None
 
     async def handle(self, command: SmartNotificationCommand) -> None:
@@ -267,6 +270,9 @@ class SmartNotificationHandler(
                 tools=snapshot_context.tools,
                 tool_choice=snapshot_context.tool_choice,
                 model_params=snapshot_context.model_params,
+                prompt_context_age_seconds=prompt_context_age_seconds(
+                    snapshot_context.prompt_context, snapshot_context.current_time
+                ),
             )
 
         async def decide_notification(
@@ -2,8 +2,14 @@ from .evaluate_timing_status import (
     EvaluateTimingStatusCommand,
     EvaluateTimingStatusHandler,
 )
+from .evaluate_timing_status_batch import (
+    EvaluateTimingStatusBatchCommand,
+    EvaluateTimingStatusBatchHandler,
+)
 
 __all__ = [
+    "EvaluateTimingStatusBatchCommand",
+    "EvaluateTimingStatusBatchHandler",
     "EvaluateTimingStatusCommand",
     "EvaluateTimingStatusHandler",
 ]
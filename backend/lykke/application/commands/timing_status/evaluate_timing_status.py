@@ -1,8 +1,8 @@
 """Command to emit timing status change events."""
 
-from collections.abc import Iterable
-from dataclasses import dataclass
-from datetime import date as dt_date, timedelta
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date as dt_date, datetime, timedelta
 from uuid import UUID
 
 from lykke.application.commands.base import BaseCommandHandler, Command
@@ -26,17 +26,168 @@ class EvaluateTimingStatusCommand(Command):
 
     date: dt_date | None = None
     poll_interval_seconds: int = 60
+    due_at: datetime | None = None
+
+
+@dataclass(frozen=True)
+class TimingStatusEvaluation:
+    """Entities whose timing status changed, and the next possible change."""
+
+    tasks: list[TaskEntity] = field(default_factory=list)
+    routines: list[RoutineEntity] = field(default_factory=list)
+    next_due: datetime | None = None
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.tasks or self.routines)
+
+
+# Statuses are compared from just before the scheduled transition.
+_BEFORE_DUE = timedelta(seconds=1)
+
+
+def previous_evaluation_time(
+    now: datetime, *, due_at: datetime | None, poll_interval_seconds: int
+) -> datetime:
+    """Return the instant whose statuses are compared with ``now``.
+
+    A job woken for a scheduled transition compares from just before that
+    transition, however late it was dispatched, so a lagging queue cannot
+    skip a change. Otherwise the comparison covers the last poll interval.
+    """
+    if due_at is not None and due_at <= now:
+        return due_at - _BEFORE_DUE
+    return now - timedelta(seconds=poll_interval_seconds)
+
+
+def evaluate_timing_status(
+    user_id: UUID,
+    tasks: Sequence[TaskEntity],
+    routines: Sequence[RoutineEntity],
+    *,
+    now: datetime,
+    previous_time: datetime,
+    timezone: str | None,
+) -> TimingStatusEvaluation:
+    """Compare statuses at ``previous_time`` and ``now`` for one user's day.
+
+    Changed tasks and routines get their timing-status events attached and
+    are returned so the caller can add them to a unit of work.
+    """
+    tasks_by_routine_definition = _group_tasks_by_routine_definition(tasks)
+
+    changed_tasks: list[TaskEntity] = []
+    changed_routines: list[RoutineEntity] = []
+    updated_task_ids: set[UUID] = set()
+    updated_routine_ids: set[UUID] = set()
+    next_transitions: list[datetime | None] = []
+
+    for task in tasks:
+        next_transitions.append(
+            TimingStatusService.next_task_transition(task, now, timezone=timezone)
+        )
+        current_status = TimingStatusService.task_status(task, now, timezone=timezone)
+        previous_status = TimingStatusService.task_status(
+            task, previous_time, timezone=timezone
+        )
+
+        if current_status.status == previous_status.status:
+            continue
+
+        if task.id in updated_task_ids:
+            continue
+
+        task_event = TaskTimingStatusChangedEvent(
+            user_id=user_id,
+            task_id=task.id,
+            old_timing_status=previous_status.status,
+            new_timing_status=current_status.status,
+            old_next_available_time=previous_status.next_available_time,
+            new_next_available_time=current_status.next_available_time,
+            task_scheduled_date=task.scheduled_date,
+            entity_id=task.id,
+            entity_type="task",
+            entity_date=task.scheduled_date,
+        )
+        task.add_event(task_event)
+        changed_tasks.append(task)
+        updated_task_ids.add(task.id)
+
+    for routine in routines:
+        routine_tasks = tasks_by_routine_definition.get(
+            routine.routine_definition_id, []
+        )
+        if not routine_tasks:
+            continue
+
+        next_transitions.append(
+            TimingStatusService.next_routine_transition(
+                routine, routine_tasks, now, timezone=timezone
+            )
+        )
+        current_status = TimingStatusService.routine_status(
+            routine, routine_tasks, now, timezone=timezone
+        )
+        previous_status = TimingStatusService.routine_status(
+            routine, routine_tasks, previous_time, timezone=timezone
+        )
+
+        if current_status.status == previous_status.status:
+            continue
+
+        if routine.id in updated_routine_ids:
+            continue
+
+        routine_event = RoutineTimingStatusChangedEvent(
+            user_id=user_id,
+            routine_id=routine.id,
+            old_timing_status=previous_status.status,
+            new_timing_status=current_status.status,
+            old_next_available_time=previous_status.next_available_time,
+            new_next_available_time=current_status.next_available_time,
+            routine_date=routine.date,
+            entity_id=routine.id,
+            entity_type="routine",
+            entity_date=routine.date,
+        )
+        routine.add_event(routine_event)
+        changed_routines.append(routine)
+        updated_routine_ids.add(routine.id)
+
+    return TimingStatusEvaluation(
+        tasks=changed_tasks,
+        routines=changed_routines,
+        next_due=min(
+            (value for value in next_transitions if value is not None), default=None
+        ),
+    )
+
+
+def _group_tasks_by_routine_definition(
+    tasks: Iterable[TaskEntity],
+) -> dict[UUID, list[TaskEntity]]:
+    grouped: dict[UUID, list[TaskEntity]] = {}
+    for task in tasks:
+        if task.routine_definition_id is None:
+            continue
+        key = task.routine_definition_id
+        grouped.setdefault(key, []).append(task)
+    return grouped
 
 
 class EvaluateTimingStatusHandler(
-    BaseCommandHandler[EvaluateTimingStatusCommand, None]
+    BaseCommandHandler[EvaluateTimingStatusCommand, datetime | None]
 ):
-    """Evaluates timing status changes and emits DomainEvents."""
+    """Evaluates timing status changes and emits DomainEvents.
+
+    Returns the next instant any task or routine status can change, so the
+    caller can schedule the next evaluation instead of polling.
+    """
 
     task_ro_repo: TaskRepositoryReadOnlyProtocol
     routine_ro_repo: RoutineRepositoryReadOnlyProtocol
 
-    async def handle(self, command: EvaluateTimingStatusCommand) -> None:
+    async def handle(self, command: EvaluateTimingStatusCommand) -> datetime | None:
         async with self.new_uow() as uow:
             try:
                 user = self.user
@@ -45,7 +196,11 @@ class EvaluateTimingStatusHandler(
                 user_timezone = None
 
             now = get_current_datetime_in_timezone(user_timezone)
-            previous_time = now - timedelta(seconds=command.poll_interval_seconds)
+            previous_time = previous_evaluation_time(
+                now,
+                due_at=command.due_at,
+                poll_interval_seconds=command.poll_interval_seconds,
+            )
             target_date = command.date or get_current_date(user_timezone)
 
             tasks = await self.task_ro_repo.search(
@@ -54,85 +209,18 @@ class EvaluateTimingStatusHandler(
             routines = await self.routine_ro_repo.search(
                 value_objects.RoutineQuery(date=target_date)
             )
-            tasks_by_routine_definition = self._group_tasks_by_routine_definition(tasks)
-
-            updated_task_ids: set[UUID] = set()
-            updated_routine_ids: set[UUID] = set()
-
-            for task in tasks:
-                current_status = TimingStatusService.task_status(
-                    task, now, timezone=user_timezone
-                )
-                previous_status = TimingStatusService.task_status(
-                    task, previous_time, timezone=user_timezone
-                )
-
-                if current_status.status == previous_status.status:
-                    continue
-
-                if task.id in updated_task_ids:
-                    continue
-
-                task_event = TaskTimingStatusChangedEvent(
-                    user_id=self.user.id,
-                    task_id=task.id,
-                    old_timing_status=previous_status.status,
-                    new_timing_status=current_status.status,
-                    old_next_available_time=previous_status.next_available_time,
-                    new_next_available_time=current_status.next_available_time,
-                    task_scheduled_date=task.scheduled_date,
-                    entity_id=task.id,
-                    entity_type="task",
-                    entity_date=task.scheduled_date,
-                )
-                task.add_event(task_event)
+
+            evaluation = evaluate_timing_status(
+                self.user.id,
+                tasks,
+                routines,
+                now=now,
+                previous_time=previous_time,
+                timezone=user_timezone,
+            )
+            for task in evaluation.tasks:
                 uow.add(task)
-                updated_task_ids.add(task.id)
-
-            for routine in routines:
-                routine_tasks = tasks_by_routine_definition.get(
-                    routine.routine_definition_id, []
-                )
-                if not routine_tasks:
-                    continue
-
-                current_status = TimingStatusService.routine_status(
-                    routine, routine_tasks, now, timezone=user_timezone
-                )
-                previous_status = TimingStatusService.routine_status(
-                    routine, routine_tasks, previous_time, timezone=user_timezone
-                )
-
-                if current_status.status == previous_status.status:
-                    continue
-
-                if routine.id in updated_routine_ids:
-                    continue
-
-                routine_event = RoutineTimingStatusChangedEvent(
-                    user_id=self.user.id,
-                    routine_id=routine.id,
-                    old_timing_status=previous_status.status,
-                    new_timing_status=current_status.status,
-                    old_next_available_time=previous_status.next_available_time,
-                    new_next_available_time=current_status.next_available_time,
-                    routine_date=routine.date,
-                    entity_id=routine.id,
-                    entity_type="routine",
-                    entity_date=routine.date,
-                )
-                routine.add_event(routine_event)
+            for routine in evaluation.routines:
                 uow.add(routine)
-                updated_routine_ids.add(routine.id)
-
-    @staticmethod
-    def _group_tasks_by_routine_definition(
-        tasks: Iterable[TaskEntity],
-    ) -> dict[UUID, list[TaskEntity]]:
-        grouped: dict[UUID, list[TaskEntity]] = {}
-        for task in tasks:
-            if task.routine_definition_id is None:
-                continue
-            key = task.routine_definition_id
-            grouped.setdefault(key, []).append(task)
-        return grouped
+
+        return evaluation.next_due
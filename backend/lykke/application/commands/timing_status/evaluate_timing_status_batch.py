@@ -0,0 +1,138 @@
+"""Command to evaluate timing status for a shard of users in one pass."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from loguru import logger
+
+from lykke.application.commands.base import Command
+from lykke.application.identity import (
+    CrossUserTimingStatusStoreProtocol,
+    UnauthenticatedIdentityAccessProtocol,
+)
+from lykke.application.unit_of_work import UnitOfWorkFactory
+from lykke.core.utils.dates import get_current_date, get_current_datetime_in_timezone
+from lykke.domain import value_objects
+from lykke.domain.services.timing_status import TimingStatusService
+
+from .evaluate_timing_status import (
+    TimingStatusEvaluation,
+    evaluate_timing_status,
+    previous_evaluation_time,
+)
+
+
+@dataclass(frozen=True)
+class EvaluateTimingStatusBatchCommand(Command):
+    """Command to evaluate timing status for many users' current day."""
+
+    users: tuple[value_objects.EligibleUser, ...]
+    poll_interval_seconds: int = 60
+    due_at: dict[UUID, datetime] = field(default_factory=dict)
+
+
+class EvaluateTimingStatusBatchHandler:
+    """Evaluates timing status for a shard of users with shared reads.
+
+    Tasks and routines for every user in the shard are loaded with one query
+    per table, then each user is evaluated exactly as
+    ``EvaluateTimingStatusHandler`` would. A unit of work is only opened for
+    users with changes, so the emitted events and writes match the per-user
+    handler.
+
+    Afterwards the persisted ``next_transition_at`` of every loaded row is
+    advanced past now, so users only match the due-transition range scan
+    again once a row can change.
+
+    Returns each evaluated user's next transition instant. Users that fail
+    to evaluate are logged and left out so the rest of the shard still runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        timing_status_store: CrossUserTimingStatusStoreProtocol,
+        identity_access: UnauthenticatedIdentityAccessProtocol,
+        uow_factory: UnitOfWorkFactory,
+    ) -> None:
+        self._timing_status_store = timing_status_store
+        self._identity_access = identity_access
+        self._uow_factory = uow_factory
+
+    async def handle(
+        self, command: EvaluateTimingStatusBatchCommand
+    ) -> dict[UUID, datetime | None]:
+        if not command.users:
+            return {}
+
+        dates_by_user = {
+            user.id: get_current_date(user.timezone) for user in command.users
+        }
+        tasks_by_user = await self._timing_status_store.list_tasks_by_user(
+            dates_by_user
+        )
+        routines_by_user = await self._timing_status_store.list_routines_by_user(
+            dates_by_user
+        )
+
+        next_due: dict[UUID, datetime | None] = {}
+        task_transitions: dict[UUID, datetime | None] = {}
+        routine_transitions: dict[UUID, datetime | None] = {}
+        for user in command.users:
+            try:
+                now = get_current_datetime_in_timezone(user.timezone)
+                tasks = tasks_by_user.get(user.id, [])
+                routines = routines_by_user.get(user.id, [])
+                evaluation = evaluate_timing_status(
+                    user.id,
+                    tasks,
+                    routines,
+                    now=now,
+                    previous_time=previous_evaluation_time(
+                        now,
+                        due_at=command.due_at.get(user.id),
+                        poll_interval_seconds=command.poll_interval_seconds,
+                    ),
+                    timezone=user.timezone,
+                )
+                if evaluation.has_changes:
+                    await self._persist(user.id, evaluation)
+                next_due[user.id] = evaluation.next_due
+            except Exception:  # pylint: disable=broad-except
+                logger.exception(f"Error evaluating timing status for user {user.id}")
+                continue
+
+            for task in tasks:
+                task_transitions[task.id] = TimingStatusService.next_transition_bound(
+                    task, now, timezone=user.timezone
+                )
+            for routine in routines:
+                routine_transitions[routine.id] = (
+                    TimingStatusService.next_transition_bound(
+                        routine, now, timezone=user.timezone
+                    )
+                )
+
+        try:
+            await self._timing_status_store.refresh_next_transitions(
+                {user_id: dates_by_user[user_id] for user_id in next_due},
+                tasks=task_transitions,
+                routines=routine_transitions,
+            )
+        except Exception:  # pylint: disable=broad-except
+            # Stale instants only cause an extra evaluation on the next sweep.
+            logger.exception("Failed to refresh next timing-status transitions")
+        return next_due
+
+    async def _persist(self, user_id: UUID, evaluation: TimingStatusEvaluation) -> None:
+        user = await self._identity_access.get_user_by_id(user_id)
+        if user is None:
+            logger.warning(f"User not found for timing-status evaluation {user_id}")
+            return
+
+        async with self._uow_factory.create(user) as uow:
+            for task in evaluation.tasks:
+                uow.add(task)
+            for routine in evaluation.routines:
+                uow.add(routine)
@@ -1,14 +1,19 @@
 """Gateway protocols for external services."""
 
+from .due_schedule_protocol import DueScheduleGatewayProtocol
 from .email_provider_protocol import EmailProviderGatewayProtocol
-from .google_protocol import GoogleCalendarGatewayProtocol
+from .google_protocol import CalendarEventPage, GoogleCalendarGatewayProtocol
+from .llm_run_fingerprint_protocol import LLMRunFingerprintGatewayProtocol
 from .pubsub_protocol import PubSubGatewayProtocol, PubSubSubscription
 from .sms_provider_protocol import SMSProviderProtocol
 from .web_push_protocol import WebPushGatewayProtocol
 
 __all__ = [
+    "CalendarEventPage",
+    "DueScheduleGatewayProtocol",
     "EmailProviderGatewayProtocol",
     "GoogleCalendarGatewayProtocol",
+    "LLMRunFingerprintGatewayProtocol",
     "PubSubGatewayProtocol",
     "PubSubSubscription",
     "SMSProviderProtocol",
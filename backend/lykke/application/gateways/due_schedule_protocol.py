@@ -0,0 +1,58 @@
+"""Protocol for the due-schedule index gateway."""
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Protocol
+
+from lykke.domain.value_objects import DueScheduleEntry
+
+
+class DueScheduleGatewayProtocol(Protocol):
+    """Protocol for an index of (user, job kind) -> next due instant.
+
+    Per-minute schedulers claim only the entries that are due instead of
+    fanning out to every user.
+    """
+
+    async def arm_many(self, entries: Iterable[DueScheduleEntry]) -> None:
+        """Record due instants, keeping the earliest one per (user, kind).
+
+        Args:
+            entries: Due-schedule entries to record
+        """
+        ...
+
+    async def claim_due(self, now: datetime) -> list[DueScheduleEntry]:
+        """Claim every entry due at or before ``now``.
+
+        Claimed entries leave the index but are held until ``ack`` or
+        ``release``; a claim that is never settled returns to the index
+        after a lease, so a crashed dispatcher cannot lose entries.
+
+        Args:
+            now: The current instant
+
+        Returns:
+            The claimed entries with the due instants they were armed for
+        """
+        ...
+
+    async def ack(self, entries: Iterable[DueScheduleEntry]) -> None:
+        """Drop claimed entries once their jobs have been enqueued.
+
+        Args:
+            entries: Entries returned by ``claim_due``
+        """
+        ...
+
+    async def release(self, entries: Iterable[DueScheduleEntry]) -> None:
+        """Return claimed entries to the index at their original due instants.
+
+        Args:
+            entries: Entries returned by ``claim_due``
+        """
+        ...
+
+    async def close(self) -> None:
+        """Close any underlying connection."""
+        ...
@@ -1,7 +1,10 @@
 """Protocol for Google Calendar gateway."""
 
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Protocol
+from uuid import UUID
 
 from lykke.domain import value_objects
 from lykke.domain.entities import (
@@ -12,15 +15,27 @@ from lykke.domain.entities import (
 )
 
 if TYPE_CHECKING:
-    from uuid import UUID
-
     from google_auth_oauthlib.flow import Flow
 
 
+@dataclass(frozen=True)
+class CalendarEventPage:
+    """One page of a calendar listing, converted to entries and series."""
+
+    entries: list[CalendarEntryEntity]
+    deleted_entries: list[CalendarEntryEntity]
+    series: list[CalendarEntrySeriesEntity]
+    cancelled_series_ids: list[UUID]
+    # Token of the following page; None on the last page
+    next_page_token: str | None = None
+    # Token for the next incremental sync; only set on the last page
+    next_sync_token: str | None = None
+
+
 class GoogleCalendarGatewayProtocol(Protocol):
     """Protocol defining the interface for Google Calendar gateways."""
 
-    async def load_calendar_events(
+    def iter_calendar_event_pages(
         self,
         calendar: CalendarEntity,
         lookback: datetime,
@@ -28,30 +43,23 @@ class GoogleCalendarGatewayProtocol(Protocol):
         *,
         user_timezone: str | None = None,
         sync_token: str | None = None,
-    ) -> tuple[
-        list[CalendarEntryEntity],
-        list[CalendarEntryEntity],
-        list[CalendarEntrySeriesEntity],
-        list["UUID"],
-        str | None,
-    ]:
-        """Load calendar entries and series from Google Calendar (full or incremental).
+        page_token: str | None = None,
+    ) -> AsyncIterator[CalendarEventPage]:
+        """Stream calendar entries and series from Google Calendar page by page.
 
         Args:
             calendar: The calendar to load entries from.
             lookback: The datetime to look back from.
             token: The authentication token.
+            user_timezone: Timezone to assume for events without one.
             sync_token: Optional sync token for incremental syncs. If provided,
                 only changes since the token will be returned.
+            page_token: Optional page to resume a listing from. Must come from
+                a listing with the same ``lookback`` and ``sync_token``.
 
-        Returns:
-            Tuple of (
-                new/updated entries,
-                deleted entries,
-                series,
-                cancelled series IDs,
-                next sync token,
-            ).
+        Yields:
+            Pages in listing order. Cancelled series found outside the
+            instance listing are reported on the last page.
         """
         ...
 
@@ -71,6 +71,23 @@ class LLMToolCallResult:
     result: Any
 
 
+@dataclass(frozen=True)
+class LLMPreparedRequest:
+    """A provider request built once per run.
+
+    The same object backs the snapshot payload, the provider call and any
+    retry against a fallback model, so tool schemas and messages are not
+    rebuilt along the way.
+    """
+
+    system_prompt: str
+    ask_prompt: str
+    tools: Sequence[LLMTool]
+    tool_specs: list[dict[str, Any]]
+    payload: dict[str, Any]
+    metadata: dict[str, Any] | None = None
+
+
 @dataclass(frozen=True)
 class LLMToolRunResult:
     """Result for an LLM run that may include multiple tool calls."""
@@ -84,8 +101,46 @@ class LLMGatewayProtocol(Protocol):
 
     This protocol allows the system to work with any LLM provider
     (Anthropic, OpenAI, etc.) as long as they implement this interface.
+    ``prepare_usecase`` and ``run_prepared`` let a caller reuse one request
+    for its snapshot and the call; ``run_usecase`` and ``preview_usecase``
+    prepare the request themselves.
     """
 
+    async def prepare_usecase(
+        self,
+        system_prompt: str,
+        ask_prompt: str,
+        tools: Sequence[LLMTool],
+        metadata: dict[str, Any] | None = None,
+    ) -> LLMPreparedRequest:
+        """Build the provider request for an LLM use case.
+
+        Args:
+            system_prompt: The system prompt defining the LLM's role and instructions
+            ask_prompt: The specific ask prompt for the LLM
+            tools: Tools available for the LLM to call
+            metadata: Optional metadata for logging/diagnostics; ``usecase``
+                keys usage stats and ``critical: False`` lets the gateway skip
+                the run while the provider is failing
+
+        Returns:
+            The prepared request; its ``payload`` is what would be sent
+        """
+        raise NotImplementedError
+
+    async def run_prepared(
+        self, request: LLMPreparedRequest
+    ) -> LLMToolRunResult | None:
+        """Send a prepared request and return the tool call results.
+
+        Args:
+            request: A request returned by ``prepare_usecase`` on this gateway
+
+        Returns:
+            The tool call results or None if no completion was returned
+        """
+        raise NotImplementedError
+
     async def run_usecase(
         self,
         system_prompt: str,
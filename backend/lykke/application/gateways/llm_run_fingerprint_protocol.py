@@ -0,0 +1,48 @@
+"""Protocol for remembering the last evaluated LLM context per user."""
+
+from typing import Protocol
+from uuid import UUID
+
+
+class LLMRunFingerprintGatewayProtocol(Protocol):
+    """Protocol for a store of recently evaluated LLM context fingerprints.
+
+    Scheduled LLM handlers re-evaluate the same context many times an hour;
+    remembering what was last sent lets them skip identical provider calls.
+    """
+
+    async def is_recent(self, usecase: str, user_id: UUID, fingerprint: str) -> bool:
+        """Check whether ``fingerprint`` is the last one evaluated and unexpired.
+
+        Each check counts as a hit or a miss for ``usecase``.
+
+        Args:
+            usecase: The LLM use case being run
+            user_id: The user the context belongs to
+            fingerprint: Fingerprint of the normalized prompts
+
+        Returns:
+            True if the same context was evaluated within its TTL
+        """
+        ...
+
+    async def remember(
+        self, usecase: str, user_id: UUID, fingerprint: str, ttl_seconds: int
+    ) -> None:
+        """Record ``fingerprint`` as the last evaluated context.
+
+        Args:
+            usecase: The LLM use case that was run
+            user_id: The user the context belongs to
+            fingerprint: Fingerprint of the normalized prompts
+            ttl_seconds: How long the fingerprint stays valid
+        """
+        ...
+
+    async def hit_counts(self) -> dict[str, tuple[int, int]]:
+        """Return ``(hits, misses)`` per use case."""
+        ...
+
+    async def close(self) -> None:
+        """Close any underlying connection."""
+        ...
@@ -1,5 +1,6 @@
 """Protocol for pub/sub messaging gateway."""
 
+from collections.abc import Sequence
 from typing import Any, Protocol, Self
 from uuid import UUID
 
@@ -26,6 +27,20 @@ class PubSubGatewayProtocol(Protocol):
         """
         ...
 
+    async def publish_many_to_user_channels(
+        self,
+        channel_type: str,
+        messages: Sequence[tuple[UUID, dict[str, Any]]],
+    ) -> None:
+        """Publish one message per user in a single round trip.
+
+        Args:
+            channel_type: Type of channel (e.g., 'domain-events')
+            messages: Pairs of the user whose channel to publish to and the
+                JSON-serializable payload
+        """
+        ...
+
     def subscribe_to_user_channel(
         self,
         user_id: UUID,
@@ -68,6 +83,27 @@ class PubSubGatewayProtocol(Protocol):
         """
         ...
 
+    async def append_many_to_user_stream(
+        self,
+        user_id: UUID,
+        stream_type: str,
+        messages: Sequence[dict[str, Any]],
+        *,
+        maxlen: int | None = None,
+    ) -> list[str]:
+        """Append several messages to a user-specific stream in one round trip.
+
+        Args:
+            user_id: The user whose stream to append to
+            stream_type: Type of stream (e.g., 'entity-changes')
+            messages: The message payloads to append, in order
+            maxlen: Optional approximate max length for the stream
+
+        Returns:
+            The Redis stream entry IDs, in message order
+        """
+        ...
+
     async def read_user_stream(
         self,
         user_id: UUID,
@@ -1,6 +1,10 @@
 from .access_protocols import CurrentUserAccessProtocol, UnauthenticatedIdentityAccessProtocol
+from .alarm_store_protocol import CrossUserAlarmStoreProtocol
+from .timing_status_store_protocol import CrossUserTimingStatusStoreProtocol
 
 __all__ = [
+    "CrossUserAlarmStoreProtocol",
+    "CrossUserTimingStatusStoreProtocol",
     "CurrentUserAccessProtocol",
     "UnauthenticatedIdentityAccessProtocol",
 ]
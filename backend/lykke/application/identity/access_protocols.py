@@ -9,9 +9,11 @@ They replace unscoped repositories like UserRepository and SmsLoginCodeRepositor
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Collection
 from typing import Protocol
 from uuid import UUID
 
+from lykke.domain import value_objects
 from lykke.domain.entities import SmsLoginCodeEntity, UserEntity
 
 
@@ -21,6 +23,25 @@ class UnauthenticatedIdentityAccessProtocol(Protocol):
     async def list_all_users(self) -> list[UserEntity]:
         ...
 
+    def iter_eligible_users(
+        self,
+        eligibility: value_objects.UserEligibility = value_objects.UserEligibility.ALL,
+        *,
+        batch_size: int | None = None,
+        user_ids: Collection[UUID] | None = None,
+        timezones: Collection[str | None] | None = None,
+    ) -> AsyncIterator[list[value_objects.EligibleUser]]:
+        """Stream projections of the users matching ``eligibility`` in batches.
+
+        ``user_ids`` restricts the stream to the given users and ``timezones``
+        to users with one of the given timezone settings (None for unset).
+        """
+        ...
+
+    async def list_user_timezones(self) -> list[str | None]:
+        """Return the distinct timezone settings of all users (None for unset)."""
+        ...
+
     async def get_user_by_id(self, user_id: UUID) -> UserEntity | None:
         ...
 
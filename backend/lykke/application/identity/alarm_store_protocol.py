@@ -0,0 +1,28 @@
+"""Protocol for cross-user due-alarm lookups.
+
+Days persist the instant their earliest pending alarm is due, so finding
+the users with alarms to trigger is one indexed query instead of loading
+every user's days.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Protocol
+from uuid import UUID
+
+
+class CrossUserAlarmStoreProtocol(Protocol):
+    """Cross-user access to the persisted ``next_alarm_at`` of days.
+
+    The column holds ``DueScheduleService.pending_alarm_due`` of the day's
+    alarms, written by the day repository on every save.
+    """
+
+    async def list_user_ids_with_alarms_due_before(self, until: datetime) -> list[UUID]:
+        """Return users with an alarm due at or before ``until``.
+
+        Only recent days are considered; alarms left pending on older days
+        are never triggered.
+        """
+        ...
@@ -0,0 +1,56 @@
+"""Protocol for cross-user timing-status reads.
+
+Timing status is evaluated for shards of users at once, so its inputs are
+loaded for many users in one query per table instead of through
+user-scoped repositories.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Protocol
+from uuid import UUID
+
+from lykke.domain.entities import RoutineEntity, TaskEntity
+
+
+class CrossUserTimingStatusStoreProtocol(Protocol):
+    """Cross-user access to the tasks and routines of a day.
+
+    Besides the entities, the store exposes the persisted
+    ``next_transition_at`` column, the earliest instant a row's timing
+    status may change (see ``TimingStatusService.next_transition_bound``).
+    """
+
+    async def list_tasks_by_user(
+        self, dates_by_user: Mapping[UUID, date]
+    ) -> dict[UUID, list[TaskEntity]]:
+        """Load each user's tasks for their date, grouped by user id."""
+        ...
+
+    async def list_routines_by_user(
+        self, dates_by_user: Mapping[UUID, date]
+    ) -> dict[UUID, list[RoutineEntity]]:
+        """Load each user's routines for their date, grouped by user id."""
+        ...
+
+    async def list_user_ids_with_transitions_before(
+        self, until: datetime
+    ) -> list[UUID]:
+        """Return users with a task or routine transition at or before ``until``."""
+        ...
+
+    async def refresh_next_transitions(
+        self,
+        dates_by_user: Mapping[UUID, date],
+        *,
+        tasks: Mapping[UUID, datetime | None],
+        routines: Mapping[UUID, datetime | None],
+    ) -> None:
+        """Store the next transition instants of evaluated rows, keyed by id.
+
+        Rows dated before each user's evaluated date can no longer change
+        status, so their instants are cleared.
+        """
+        ...
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from loguru import logger
 
@@ -13,6 +14,9 @@ from lykke.application.gateways.llm_gateway_factory_protocol import (
     LLMGatewayFactoryProtocol,
 )
 from lykke.application.gateways.llm_protocol import LLMTool, LLMToolCallResult
+from lykke.application.gateways.llm_run_fingerprint_protocol import (
+    LLMRunFingerprintGatewayProtocol,
+)
 from lykke.application.llm.prompt_rendering import (
     combine_system_prompt,
     render_ask_prompt,
@@ -20,6 +24,7 @@ from lykke.application.llm.prompt_rendering import (
     render_system_prompt,
 )
 from lykke.application.llm.tools_prompt import render_tools_prompt
+from lykke.core.config import settings
 from lykke.core.exceptions import DomainError, NotFoundError
 from lykke.core.utils.dates import get_current_date, get_current_datetime_in_timezone
 
@@ -82,6 +87,12 @@ class LLMHandlerMixin(ABC):
     user: UserEntity
     usecase_config_ro_repo: UseCaseConfigRepositoryReadOnlyProtocol
     llm_gateway_factory: LLMGatewayFactoryProtocol
+    # Only wired where a fingerprint store is configured (worker processes).
+    llm_run_fingerprint_gateway: LLMRunFingerprintGatewayProtocol
+    # Scheduled handlers opt in to skipping runs whose context is unchanged.
+    skip_unchanged_context: ClassVar[bool] = False
+    # Non-critical use cases are skipped while their provider's circuit is open.
+    critical_usecase: ClassVar[bool] = True
     _llm_snapshot_context: LLMRunSnapshotContext | None = None
 
     @abstractmethod
@@ -143,14 +154,31 @@ class LLMHandlerMixin(ABC):
             user=user,
             usecase_config_ro_repo=self.usecase_config_ro_repo,
         )
-        context_prompt = render_context_prompt(
+        ask_prompt = render_ask_prompt(
             usecase=self.template_usecase,
-            prompt_context=prompt_input.prompt_context,
-            current_time=current_time,
             extra_template_vars=extra_template_vars,
         )
-        ask_prompt = render_ask_prompt(
+        tool_names = [tool.name for tool in tools]
+
+        fingerprint = None
+        if self._fingerprinting_enabled():
+            fingerprint = self._context_fingerprint(
+                prompt_context=prompt_input.prompt_context,
+                current_time=current_time,
+                extra_template_vars=extra_template_vars,
+                parts=[llm_provider.value, system_prompt, ask_prompt, *tool_names],
+            )
+            if await self._is_recent_fingerprint(fingerprint):
+                logger.debug(
+                    f"Context for LLM handler {self.template_usecase} unchanged "
+                    f"for user {self.user.id}, skipping"
+                )
+                return None
+
+        context_prompt = render_context_prompt(
             usecase=self.template_usecase,
+            prompt_context=prompt_input.prompt_context,
+            current_time=current_time,
             extra_template_vars=extra_template_vars,
         )
         combined_system_prompt = combine_system_prompt(
@@ -165,7 +193,6 @@ class LLMHandlerMixin(ABC):
             )
             return None
 
-        tool_names = [tool.name for tool in tools]
         logger.info(
             f"Running LLM handler {self.template_usecase} with tools {tool_names}"
         )
@@ -174,14 +201,17 @@ class LLMHandlerMixin(ABC):
             "handler": self.name,
             "usecase": self.template_usecase,
             "llm_provider": llm_provider.value,
+            "critical": self.critical_usecase,
         }
 
-        request_payload = await llm_gateway.preview_usecase(
+        # The prepared request backs both the snapshot and the provider call.
+        request = await llm_gateway.prepare_usecase(
             combined_system_prompt,
             ask_prompt,
             tools,
             metadata=metadata,
         )
+        request_payload = request.payload
         request_messages = request_payload.get("request_messages")
         request_tools = request_payload.get("request_tools")
         request_tool_choice = request_payload.get("request_tool_choice")
@@ -198,12 +228,9 @@ class LLMHandlerMixin(ABC):
             model_params=request_model_params,
         )
 
-        tool_result = await llm_gateway.run_usecase(
-            combined_system_prompt,
-            ask_prompt,
-            tools,
-            metadata=metadata,
-        )
+        tool_result = await llm_gateway.run_prepared(request)
+        if fingerprint is not None:
+            await self._remember_fingerprint(fingerprint)
         if tool_result is None:
             logger.debug(
                 f"LLM returned no tool call for handler {self.template_usecase}"
@@ -221,3 +248,60 @@ class LLMHandlerMixin(ABC):
             tools_prompt=tools_prompt,
             request_payload=tool_result.request_payload,
         )
+
+    def _fingerprinting_enabled(self) -> bool:
+        return (
+            self.skip_unchanged_context
+            and getattr(self, "llm_run_fingerprint_gateway", None) is not None
+            and settings.LLM_FINGERPRINT_TTL_SECONDS > 0
+        )
+
+    def _context_fingerprint(
+        self,
+        *,
+        prompt_context: value_objects.LLMPromptContext,
+        current_time: datetime,
+        extra_template_vars: dict[str, Any],
+        parts: list[str],
+    ) -> str:
+        """Hash the prompts with the current time rounded down to a bucket.
+
+        The context prompt is rendered against the bucketed time, so values
+        derived from it (e.g. "starts in 12 mins") are normalized as well.
+        """
+        bucket_seconds = max(settings.LLM_FINGERPRINT_TIME_BUCKET_MINUTES, 1) * 60
+        timestamp = int(current_time.timestamp())
+        bucketed_time = datetime.fromtimestamp(
+            timestamp - timestamp % bucket_seconds, tz=current_time.tzinfo
+        )
+        normalized_context = render_context_prompt(
+            usecase=self.template_usecase,
+            prompt_context=prompt_context,
+            current_time=bucketed_time,
+            extra_template_vars=extra_template_vars,
+        )
+        digest = hashlib.sha256()
+        for part in (*parts, normalized_context):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    async def _is_recent_fingerprint(self, fingerprint: str) -> bool:
+        try:
+            return await self.llm_run_fingerprint_gateway.is_recent(
+                self.template_usecase, self.user.id, fingerprint
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(f"Failed to check LLM context fingerprint: {exc}")
+            return False
+
+    async def _remember_fingerprint(self, fingerprint: str) -> None:
+        try:
+            await self.llm_run_fingerprint_gateway.remember(
+                self.template_usecase,
+                self.user.id,
+                fingerprint,
+                settings.LLM_FINGERPRINT_TTL_SECONDS,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(f"Failed to record LLM context fingerprint: {exc}")
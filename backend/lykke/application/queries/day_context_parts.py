@@ -97,7 +97,7 @@ class GetDayCalendarEntriesHandler(
     ) -> list[CalendarEntryEntity]:
         """Handle calendar entries lookup query."""
         entries = await self.calendar_entry_ro_repo.search(
-            value_objects.CalendarEntryQuery(date=query.date)
+            value_objects.CalendarEntryQuery(date=query.date, expand_series=True)
         )
         return sorted(entries, key=lambda entry: entry.starts_at)
 
@@ -31,6 +31,15 @@ from lykke.domain.entities import (
 )
 
 
+def task_sort_key(task: TaskEntity) -> time:
+    """Order tasks by start time, then available time, unscheduled last."""
+    if task.time_window and task.time_window.start_time:
+        return task.time_window.start_time
+    if task.time_window and task.time_window.available_time:
+        return task.time_window.available_time
+    return DEFAULT_END_OF_DAY_TIME
+
+
 @dataclass(frozen=True)
 class GetDayContextQuery(Query):
     """Query to get day context."""
@@ -82,7 +91,7 @@ class GetDayContextHandler(
         ) = await asyncio.gather(
             self.task_ro_repo.search(value_objects.TaskQuery(date=date)),
             self.calendar_entry_ro_repo.search(
-                value_objects.CalendarEntryQuery(date=date)
+                value_objects.CalendarEntryQuery(date=date, expand_series=True)
             ),
             self.routine_ro_repo.search(value_objects.RoutineQuery(date=date)),
             self.day_ro_repo.get(day_id),
@@ -184,16 +193,7 @@ class GetDayContextHandler(
         """
         return value_objects.DayContext(
             day=day,
-            tasks=sorted(
-                tasks,
-                key=lambda x: (
-                    x.time_window.start_time
-                    if x.time_window and x.time_window.start_time
-                    else x.time_window.available_time
-                    if x.time_window and x.time_window.available_time
-                    else DEFAULT_END_OF_DAY_TIME
-                ),
-            ),
+            tasks=sorted(tasks, key=task_sort_key),
             calendar_entries=sorted(calendar_entries, key=lambda e: e.starts_at),
             routines=sorted(
                 routines,
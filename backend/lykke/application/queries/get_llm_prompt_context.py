@@ -1,22 +1,58 @@
-"""Query to get the complete context for LLM prompts."""
+"""Query to get the complete context for LLM prompts.
+
+Where the entity-changes stream is available, the day, tasks and calendar
+entries of a prompt context are cached per (user, date) and brought up to
+date from the stream: a run only re-queries the parts with changes since the
+cached stream id. A change to any calendar series re-queries the calendar
+entries, since entries past a series' horizon are expanded from it. Brain
+dumps, factoids, messages and push notifications are not on the stream and
+are read on every run.
+"""
 
 import asyncio
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from datetime import UTC, date as datetime_date, datetime, timedelta
+from typing import ClassVar, TypeVar
+from uuid import UUID
 
+from lykke.application.gateways.pubsub_protocol import PubSubGatewayProtocol
 from lykke.application.queries.base import BaseQueryHandler, Query
-from lykke.application.queries.get_day_context import GetDayContextHandler
+from lykke.application.queries.get_day_context import (
+    GetDayContextHandler,
+    task_sort_key,
+)
 from lykke.application.repositories import (
+    BrainDumpRepositoryReadOnlyProtocol,
+    CalendarEntryRepositoryReadOnlyProtocol,
+    DayRepositoryReadOnlyProtocol,
     FactoidRepositoryReadOnlyProtocol,
     MessageRepositoryReadOnlyProtocol,
     PushNotificationRepositoryReadOnlyProtocol,
+    TaskRepositoryReadOnlyProtocol,
 )
+from lykke.core.config import settings
 from lykke.domain import value_objects
-from lykke.domain.entities import FactoidEntity, MessageEntity, PushNotificationEntity
+from lykke.domain.entities import (
+    BrainDumpEntity,
+    CalendarEntryEntity,
+    DayEntity,
+    FactoidEntity,
+    MessageEntity,
+    PushNotificationEntity,
+    TaskEntity,
+)
 
 _RECENT_MESSAGES_LIMIT = 20
 _RECENT_PUSH_NOTIFICATIONS_LIMIT = 20
 _RECENT_PUSH_NOTIFICATIONS_WINDOW = timedelta(hours=4)
+_ENTITY_CHANGES_STREAM = "entity-changes"
+# More pending changes than this are cheaper to apply with a full reload. It
+# also bounds the read far below the stream's MAXLEN, so a cached stream id
+# whose successors were trimmed always falls back to a reload.
+_MAX_INCREMENTAL_CHANGES = 200
+
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True)
@@ -26,15 +62,63 @@ class GetLLMPromptContextQuery(Query):
     date: datetime_date
 
 
+@dataclass(frozen=True)
+class CachedDayParts:
+    """Streamed parts of a prompt context as of an entity-changes stream id."""
+
+    day: DayEntity
+    tasks: list[TaskEntity]
+    calendar_entries: list[CalendarEntryEntity]
+    stream_id: str
+    loaded_at: datetime
+
+
+class PromptContextCache:
+    """Process-wide LRU of prompt context day parts keyed by (user, date)."""
+
+    CACHE_SIZE: ClassVar[int] = 512
+    _entries: ClassVar[OrderedDict[tuple[UUID, datetime_date], CachedDayParts]] = (
+        OrderedDict()
+    )
+
+    @classmethod
+    def get(cls, user_id: UUID, date: datetime_date) -> CachedDayParts | None:
+        """Return the cached parts for ``(user_id, date)``, if any."""
+        key = (user_id, date)
+        parts = cls._entries.get(key)
+        if parts is not None:
+            cls._entries.move_to_end(key)
+        return parts
+
+    @classmethod
+    def put(cls, user_id: UUID, date: datetime_date, parts: CachedDayParts) -> None:
+        """Store parts for ``(user_id, date)``, evicting the least recently used."""
+        cls._entries[(user_id, date)] = parts
+        cls._entries.move_to_end((user_id, date))
+        if len(cls._entries) > cls.CACHE_SIZE:
+            cls._entries.popitem(last=False)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached parts."""
+        cls._entries.clear()
+
+
 class GetLLMPromptContextHandler(
     BaseQueryHandler[GetLLMPromptContextQuery, value_objects.LLMPromptContext]
 ):
     """Gets the complete context needed for LLM prompts."""
 
+    brain_dump_ro_repo: BrainDumpRepositoryReadOnlyProtocol
+    calendar_entry_ro_repo: CalendarEntryRepositoryReadOnlyProtocol
+    day_ro_repo: DayRepositoryReadOnlyProtocol
     factoid_ro_repo: FactoidRepositoryReadOnlyProtocol
     message_ro_repo: MessageRepositoryReadOnlyProtocol
     push_notification_ro_repo: PushNotificationRepositoryReadOnlyProtocol
+    task_ro_repo: TaskRepositoryReadOnlyProtocol
     get_day_context_handler: GetDayContextHandler
+    # Only wired where the entity-changes stream is readable (worker processes).
+    pubsub_gateway: PubSubGatewayProtocol
 
     async def handle(
         self, query: GetLLMPromptContextQuery
@@ -46,24 +130,164 @@ class GetLLMPromptContextHandler(
         self, date: datetime_date
     ) -> value_objects.LLMPromptContext:
         """Load complete LLM prompt context for the given date."""
-        day_context = await self.get_day_context_handler.get_day_context(date)
+        if not self._cache_enabled():
+            loaded_at = datetime.now(UTC)
+            day_context = await self.get_day_context_handler.get_day_context(date)
+            factoids, messages, push_notifications = await asyncio.gather(
+                self._get_factoids(),
+                self._get_recent_messages(),
+                self._get_recent_push_notifications(),
+            )
+            return value_objects.LLMPromptContext(
+                day=day_context.day,
+                tasks=day_context.tasks,
+                calendar_entries=day_context.calendar_entries,
+                brain_dumps=day_context.brain_dumps,
+                factoids=factoids,
+                messages=messages,
+                push_notifications=push_notifications,
+                loaded_at=loaded_at,
+            )
 
-        factoids, messages, push_notifications = await asyncio.gather(
-            self._get_factoids(),
-            self._get_recent_messages(),
-            self._get_recent_push_notifications(),
+        parts, brain_dumps, factoids, messages, push_notifications = (
+            await asyncio.gather(
+                self._get_day_parts(date),
+                self._get_brain_dumps(date),
+                self._get_factoids(),
+                self._get_recent_messages(),
+                self._get_recent_push_notifications(),
+            )
         )
-
         return value_objects.LLMPromptContext(
-            day=day_context.day,
-            tasks=day_context.tasks,
-            calendar_entries=day_context.calendar_entries,
-            brain_dumps=day_context.brain_dumps,
+            day=parts.day,
+            tasks=parts.tasks,
+            calendar_entries=parts.calendar_entries,
+            brain_dumps=brain_dumps,
             factoids=factoids,
             messages=messages,
             push_notifications=push_notifications,
+            loaded_at=parts.loaded_at,
+        )
+
+    def _cache_enabled(self) -> bool:
+        return (
+            getattr(self, "pubsub_gateway", None) is not None
+            and settings.LLM_PROMPT_CONTEXT_CACHE_SECONDS > 0
+        )
+
+    async def _get_day_parts(self, date: datetime_date) -> CachedDayParts:
+        """Return the streamed parts for ``date``, reusing the cache if possible."""
+        cached = PromptContextCache.get(self.user.id, date)
+        max_age = timedelta(seconds=settings.LLM_PROMPT_CONTEXT_CACHE_SECONDS)
+        parts = None
+        if cached is not None and datetime.now(UTC) - cached.loaded_at < max_age:
+            parts = await self._apply_changes(cached, date)
+        if parts is None:
+            parts = await self._load_day_parts(date)
+        PromptContextCache.put(self.user.id, date, parts)
+        return parts
+
+    async def _load_day_parts(self, date: datetime_date) -> CachedDayParts:
+        # Read the stream position first so changes committed while loading
+        # are applied (again) on the next run rather than missed.
+        latest = await self.pubsub_gateway.get_latest_user_stream_entry(
+            user_id=self.user.id, stream_type=_ENTITY_CHANGES_STREAM
+        )
+        loaded_at = datetime.now(UTC)
+        day, tasks, calendar_entries = await asyncio.gather(
+            self._get_day(date),
+            self._get_tasks(date),
+            self._get_calendar_entries(date),
+        )
+        return CachedDayParts(
+            day=day,
+            tasks=tasks,
+            calendar_entries=calendar_entries,
+            stream_id=latest[0] if latest else "0-0",
+            loaded_at=loaded_at,
+        )
+
+    async def _apply_changes(
+        self, cached: CachedDayParts, date: datetime_date
+    ) -> CachedDayParts | None:
+        """Re-query the parts with changes since ``cached`` was built.
+
+        Returns None when there are too many changes to apply incrementally.
+        """
+        entries = await self.pubsub_gateway.read_user_stream(
+            user_id=self.user.id,
+            stream_type=_ENTITY_CHANGES_STREAM,
+            last_id=cached.stream_id,
+            count=_MAX_INCREMENTAL_CHANGES + 1,
+        )
+        if not entries:
+            return cached
+        if len(entries) > _MAX_INCREMENTAL_CHANGES:
+            return None
+
+        cached_ids = {
+            "day": {str(cached.day.id)},
+            "task": {str(task.id) for task in cached.tasks},
+            "calendarentry": {str(entry.id) for entry in cached.calendar_entries},
+        }
+        changed: set[str] = set()
+        for _, payload in entries:
+            entity_type = payload.get("entity_type")
+            if entity_type == "calendarentryseries":
+                # Series edits change expanded occurrences on any date.
+                changed.add("calendarentry")
+                continue
+            if entity_type not in cached_ids or entity_type in changed:
+                continue
+            entity_date = payload.get("entity_date")
+            # Changes on other dates matter only if they move an entity out.
+            if (
+                entity_date is None
+                or entity_date == date.isoformat()
+                or payload.get("entity_id") in cached_ids[entity_type]
+            ):
+                changed.add(entity_type)
+
+        day, tasks, calendar_entries = await asyncio.gather(
+            self._get_day(date) if "day" in changed else _value(cached.day),
+            self._get_tasks(date) if "task" in changed else _value(cached.tasks),
+            (
+                self._get_calendar_entries(date)
+                if "calendarentry" in changed
+                else _value(cached.calendar_entries)
+            ),
+        )
+        return replace(
+            cached,
+            day=day,
+            tasks=tasks,
+            calendar_entries=calendar_entries,
+            stream_id=entries[-1][0],
         )
 
+    async def _get_day(self, date: datetime_date) -> DayEntity:
+        return await self.day_ro_repo.get(
+            DayEntity.id_from_date_and_user(date, self.user.id)
+        )
+
+    async def _get_tasks(self, date: datetime_date) -> list[TaskEntity]:
+        tasks = await self.task_ro_repo.search(value_objects.TaskQuery(date=date))
+        return sorted(tasks, key=task_sort_key)
+
+    async def _get_calendar_entries(
+        self, date: datetime_date
+    ) -> list[CalendarEntryEntity]:
+        entries = await self.calendar_entry_ro_repo.search(
+            value_objects.CalendarEntryQuery(date=date, expand_series=True)
+        )
+        return sorted(entries, key=lambda entry: entry.starts_at)
+
+    async def _get_brain_dumps(self, date: datetime_date) -> list[BrainDumpEntity]:
+        brain_dumps = await self.brain_dump_ro_repo.search(
+            value_objects.BrainDumpQuery(date=date)
+        )
+        return sorted(brain_dumps, key=lambda item: item.created_at)
+
     async def _get_recent_messages(self) -> list[MessageEntity]:
         """Load recent messages for the user."""
         messages = await self.message_ro_repo.search(
@@ -92,3 +316,7 @@ class GetLLMPromptContextHandler(
                 limit=_RECENT_PUSH_NOTIFICATIONS_LIMIT,
             )
         )
+
+
+async def _value(value: _T) -> _T:
+    return value
@@ -18,6 +18,7 @@ class VerifyGoogleWebhookQuery(Query):
     calendar_id: UUID
     channel_token: str | None
     resource_state: str | None = None
+    channel_id: str | None = None
 
 
 @dataclass(frozen=True)
@@ -54,6 +55,16 @@ class VerifyGoogleWebhookHandler(
             logger.warning(f"Calendar {query.calendar_id} has no sync subscription")
             return VerifyGoogleWebhookResult(should_sync=False)
 
+        if (
+            query.channel_id is not None
+            and query.channel_id != calendar.sync_subscription.subscription_id
+        ):
+            logger.warning(
+                f"Channel {query.channel_id} is not the current subscription "
+                f"for calendar {query.calendar_id}"
+            )
+            return VerifyGoogleWebhookResult(should_sync=False)
+
         client_state = calendar.sync_subscription.client_state
         if client_state is None:
             logger.warning(f"Missing client_state for calendar {query.calendar_id}")
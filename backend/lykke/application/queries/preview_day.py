@@ -69,7 +69,7 @@ class PreviewDayHandler(BaseQueryHandler[PreviewDayQuery, value_objects.DayConte
         tasks, calendar_entries, routines = await asyncio.gather(
             self.preview_tasks_handler.handle(PreviewTasksQuery(date=target_date)),
             self.calendar_entry_ro_repo.search(
-                value_objects.CalendarEntryQuery(date=target_date)
+                value_objects.CalendarEntryQuery(date=target_date, expand_series=True)
             ),
             self._preview_routines(target_date),
         )
@@ -26,7 +26,10 @@ from lykke.application.queries.get_llm_prompt_context import (
 from lykke.application.repositories import UseCaseConfigRepositoryReadOnlyProtocol
 from lykke.core.exceptions import DomainError
 from lykke.core.utils.dates import get_current_date, get_current_datetime_in_timezone
-from lykke.core.utils.llm_snapshot import build_referenced_entities
+from lykke.core.utils.llm_snapshot import (
+    build_referenced_entities,
+    prompt_context_age_seconds,
+)
 from lykke.domain import value_objects
 from lykke.domain.entities import MessageEntity
 
@@ -145,6 +148,9 @@ class PreviewLLMSnapshotHandler(
             tools=request_tools,
             tool_choice=request_tool_choice,
             model_params=request_model_params,
+            prompt_context_age_seconds=prompt_context_age_seconds(
+                prompt_context, current_time
+            ),
         )
 
     @staticmethod
@@ -1,24 +1,61 @@
 """Protocol for CalendarEntryRepository."""
 
+from collections.abc import Collection
+from datetime import date as dt_date, datetime
+from typing import ClassVar, Protocol
+from uuid import UUID
+
 from lykke.application.repositories.base import (
     ReadOnlyRepositoryProtocol,
     ReadWriteRepositoryProtocol,
 )
 from lykke.domain import value_objects
-from lykke.domain.entities import CalendarEntryEntity
+from lykke.domain.entities import CalendarEntryEntity, CalendarEntrySeriesEntity
 
 
 class CalendarEntryRepositoryReadOnlyProtocol(
-    ReadOnlyRepositoryProtocol[CalendarEntryEntity]
+    ReadOnlyRepositoryProtocol[CalendarEntryEntity], Protocol
 ):
     """Read-only protocol defining the interface for calendar entry repositories."""
 
-    Query = value_objects.CalendarEntryQuery
+    Query: ClassVar[type[value_objects.CalendarEntryQuery]] = (
+        value_objects.CalendarEntryQuery
+    )
+
+    async def unchanged_platform_ids(
+        self, entries: list[CalendarEntryEntity]
+    ) -> set[str]:
+        """Return platform ids of entries already stored with identical content."""
+        ...
 
 
 class CalendarEntryRepositoryReadWriteProtocol(
-    ReadWriteRepositoryProtocol[CalendarEntryEntity]
+    ReadWriteRepositoryProtocol[CalendarEntryEntity], Protocol
 ):
     """Read-write protocol defining the interface for calendar entry repositories."""
 
-    Query = value_objects.CalendarEntryQuery
+    Query: ClassVar[type[value_objects.CalendarEntryQuery]] = (
+        value_objects.CalendarEntryQuery
+    )
+
+    async def cascade_series_fields(
+        self, series: list[CalendarEntrySeriesEntity]
+    ) -> list[CalendarEntryEntity]:
+        """Copy series name, category and frequency onto their entries."""
+        ...
+
+    async def delete_series_entries_from(
+        self,
+        series_ids: Collection[UUID],
+        starts_at: datetime,
+        *,
+        exclude_platform_ids: Collection[str] = (),
+    ) -> list[CalendarEntryEntity]:
+        """Delete entries of the given series starting at or after ``starts_at``."""
+        ...
+
+    async def delete_calendar_entries_from(
+        self, calendar_ids: Collection[UUID], starts_at: datetime
+    ) -> dict[UUID, dt_date]:
+        """Delete entries of the given calendars starting at or after ``starts_at``."""
+        ...
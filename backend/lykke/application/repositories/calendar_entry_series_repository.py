@@ -1,5 +1,8 @@
 """Protocol for CalendarEntrySeriesRepository."""
 
+from typing import ClassVar, Protocol
+from uuid import UUID
+
 from lykke.application.repositories.base import (
     ReadOnlyRepositoryProtocol,
     ReadWriteRepositoryProtocol,
@@ -9,16 +12,24 @@ from lykke.domain.entities import CalendarEntrySeriesEntity
 
 
 class CalendarEntrySeriesRepositoryReadOnlyProtocol(
-    ReadOnlyRepositoryProtocol[CalendarEntrySeriesEntity]
+    ReadOnlyRepositoryProtocol[CalendarEntrySeriesEntity], Protocol
 ):
     """Read-only protocol for calendar entry series repositories."""
 
-    Query = value_objects.CalendarEntrySeriesQuery
+    Query: ClassVar[type[value_objects.CalendarEntrySeriesQuery]] = (
+        value_objects.CalendarEntrySeriesQuery
+    )
+
+    async def unchanged_ids(self, series: list[CalendarEntrySeriesEntity]) -> set[UUID]:
+        """Return ids of series already stored with identical content."""
+        ...
 
 
 class CalendarEntrySeriesRepositoryReadWriteProtocol(
-    ReadWriteRepositoryProtocol[CalendarEntrySeriesEntity]
+    ReadWriteRepositoryProtocol[CalendarEntrySeriesEntity], Protocol
 ):
     """Read-write protocol for calendar entry series repositories."""
 
-    Query = value_objects.CalendarEntrySeriesQuery
+    Query: ClassVar[type[value_objects.CalendarEntrySeriesQuery]] = (
+        value_objects.CalendarEntrySeriesQuery
+    )
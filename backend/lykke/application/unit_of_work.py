@@ -8,6 +8,8 @@ The Unit of Work pattern provides a way to:
 5. Track entities that need to be saved (via add() method)
 """
 
+from collections.abc import Collection
+from datetime import datetime
 from typing import TYPE_CHECKING, Protocol, Self, TypeVar
 from uuid import UUID
 
@@ -34,7 +36,11 @@ from lykke.application.repositories import (
     UseCaseConfigRepositoryReadOnlyProtocol,
 )
 from lykke.domain import value_objects
-from lykke.domain.entities import UserEntity
+from lykke.domain.entities import (
+    CalendarEntryEntity,
+    CalendarEntrySeriesEntity,
+    UserEntity,
+)
 from lykke.domain.entities.base import BaseEntityObject
 
 if TYPE_CHECKING:
@@ -101,6 +107,20 @@ class UnitOfWorkProtocol(Protocol):
         """
         ...
 
+    def add_persisted(self, entity: _T) -> _T:
+        """Track an entity whose row a set-based statement already wrote.
+
+        Its domain events are dispatched and broadcast like those of added
+        entities, but commit() does not write it again.
+
+        Args:
+            entity: The already persisted entity, carrying its domain events.
+
+        Returns:
+            The entity that was added.
+        """
+        ...
+
     async def create(self, entity: _T) -> _T:
         """Create a new entity.
 
@@ -157,6 +177,41 @@ class UnitOfWorkProtocol(Protocol):
         """Bulk delete calendar entries matching query filters."""
         ...
 
+    async def cascade_calendar_entry_series(
+        self, series: list[CalendarEntrySeriesEntity]
+    ) -> list[CalendarEntryEntity]:
+        """Copy series name, category and frequency onto their entries.
+
+        Returns the entries that changed, as stored. Pass them to
+        add_persisted() to publish their events.
+        """
+        ...
+
+    async def delete_calendar_series_entries_from(
+        self,
+        series_ids: Collection[UUID],
+        starts_at: datetime,
+        *,
+        exclude_platform_ids: Collection[str] = (),
+    ) -> list[CalendarEntryEntity]:
+        """Delete entries of the given series starting at or after ``starts_at``.
+
+        Returns the deleted entries. Pass them to add_persisted() to publish
+        their events.
+        """
+        ...
+
+    async def purge_calendar_entries_from(
+        self, calendar_ids: Collection[UUID], starts_at: datetime
+    ) -> list[UUID]:
+        """Delete entries of the given calendars starting at or after ``starts_at``.
+
+        Runs as one statement and returns the deleted ids. No per-entry domain
+        events are emitted; the deletions reach the entity-change stream as
+        one batch after commit.
+        """
+        ...
+
     async def bulk_delete_tasks(self, query: value_objects.TaskQuery) -> None:
         """Bulk delete tasks matching query filters."""
         ...
@@ -45,6 +45,19 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "postgresql+psycopg://localhost/lykke"
     REDIS_URL: str = "redis://localhost:6379"
     REDIS_MAX_CONNECTIONS: int = 50  # Maximum connections in the pool
+    WORKER_FANOUT_CHUNK_SIZE: int = 500  # Messages per Redis round trip on fan-out
+    WORKER_DEDUP_TTL_SECONDS: int = 900  # Max lifetime of a pending-job dedup key
+    WORKER_QUEUES: str = "critical,default,heavy"  # Queue classes this worker pops
+    WORKER_QUEUE_LAG_WARN_SECONDS: float = 60.0  # Warn when a job waited longer
+    TIMING_STATUS_SHARD_SIZE: int = 200  # Users evaluated per timing-status job
+    NEW_DAY_PRESCHEDULE: bool = True  # Schedule each user's day when it starts
+    CALENDAR_SYNC_USER_CONCURRENCY: int = 4  # Calendars of one user synced at once
+    CALENDAR_SYNC_PROCESS_CONCURRENCY: int = 8  # Calendar syncs per worker process
+    CALENDAR_SERIES_MATERIALIZE_DAYS: int = 365  # Later series instances expand on read
+    TEMPLATE_BYTECODE_CACHE_DIR: str = ""  # Compiled Jinja templates; "" = temp dir
+    GOOGLE_CALENDAR_NATIVE_CLIENT: bool = True  # aiohttp client over googleapiclient
+    GOOGLE_WEBHOOK_QUIET_SECONDS: float = 10.0  # Sync once a burst has been quiet
+    GOOGLE_WEBHOOK_MAX_DELAY_SECONDS: float = 60.0  # Upper bound on sync delay
     SESSION_SECRET: str = ""
     ANTHROPIC_API_KEY: str = ""
     ANTHROPIC_MODEL: str = (
@@ -55,8 +68,19 @@ class Settings(BaseSettings):
     )
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4o-mini"  # Default to cheaper model
+    LLM_REQUEST_TIMEOUT_SECONDS: float = 60.0  # Per provider HTTP request
+    LLM_MAX_RETRIES: int = 2  # Client retries of a failed provider request
+    LLM_PROVIDER_CONCURRENCY: int = 8  # Provider calls in flight per process
+    LLM_QUEUE_TIMEOUT_SECONDS: float = 30.0  # Wait for a free provider slot
+    LLM_CIRCUIT_WINDOW: int = 20  # Recent calls a model's breaker looks at
+    LLM_CIRCUIT_MIN_CALLS: int = 5  # Calls in the window before it can open
+    LLM_CIRCUIT_ERROR_RATE: float = 0.5  # Failure share that opens it
+    LLM_CIRCUIT_COOLDOWN_SECONDS: float = 60.0  # Open time before a trial call
     SMART_NOTIFICATIONS_ENABLED: bool = True  # Feature flag
     SMART_NOTIFICATION_RATE_LIMIT_MINUTES: int = 10  # Prevent spam
+    LLM_FINGERPRINT_TTL_SECONDS: int = 3600  # Skip unchanged contexts; 0 = off
+    LLM_FINGERPRINT_TIME_BUCKET_MINUTES: int = 30  # Current time rounding
+    LLM_PROMPT_CONTEXT_CACHE_SECONDS: int = 1800  # Full reload interval; 0 = off
     SENTRY_DSN: str = ""
     BRAIN_DUMP_ENCRYPTION_KEY: str = ""
 
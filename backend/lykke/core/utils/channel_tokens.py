@@ -0,0 +1,61 @@
+"""Signed tokens for calendar push-notification channels.
+
+The token handed to the provider when a channel is opened is an HMAC of the
+(user, calendar, channel) triple, so a webhook carrying a forged token can be
+rejected from its URL and headers alone, without loading the calendar. Since
+channels from earlier subscriptions keep delivering until they expire, the
+channels behind a validly signed burst are still checked against the
+calendar's current subscription, once, when the burst settles.
+"""
+
+import hashlib
+import hmac
+from uuid import UUID
+
+from lykke.core.config import settings
+from lykke.core.exceptions import ServerError
+
+TOKEN_VERSION = "v1"
+
+
+def _signature(user_id: UUID, calendar_id: UUID, channel_id: str) -> str:
+    if not settings.SESSION_SECRET:
+        raise ServerError("SESSION_SECRET is not configured")
+    return hmac.new(
+        settings.SESSION_SECRET.encode("utf-8"),
+        f"{user_id}:{calendar_id}:{channel_id}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+
+def sign_channel_token(user_id: UUID, calendar_id: UUID, channel_id: str) -> str:
+    """Build the channel token for a calendar subscription.
+
+    Raises:
+        ServerError: If ``SESSION_SECRET`` is not configured.
+    """
+    return f"{TOKEN_VERSION}.{_signature(user_id, calendar_id, channel_id)}"
+
+
+def is_signed_channel_token(token: str | None) -> bool:
+    """Return whether ``token`` has the shape of a signed channel token."""
+    return bool(token) and str(token).startswith(f"{TOKEN_VERSION}.")
+
+
+def verify_channel_token(
+    token: str | None,
+    *,
+    user_id: UUID,
+    calendar_id: UUID,
+    channel_id: str | None,
+) -> bool:
+    """Check a channel token against the channel it was sent for.
+
+    Returns False for tokens that were not produced by ``sign_channel_token``
+    (e.g. random tokens from older subscriptions) and whenever
+    ``SESSION_SECRET`` is not configured. Constant-time comparison.
+    """
+    if not token or not channel_id or not settings.SESSION_SECRET:
+        return False
+    expected = sign_channel_token(user_id, calendar_id, channel_id)
+    return hmac.compare_digest(expected, token)
@@ -1,6 +1,7 @@
 """Date and time utility functions."""
 
 import datetime
+from collections.abc import Iterable
 from datetime import UTC
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
@@ -61,6 +62,30 @@ def get_tomorrows_date(timezone: str | None = None) -> datetime.date:
     return get_current_date(timezone) + datetime.timedelta(days=1)
 
 
+def timezones_starting_day(
+    timezones: Iterable[str | None],
+    *,
+    at: datetime.datetime,
+    window: datetime.timedelta,
+) -> list[str | None]:
+    """Return the timezones whose local day starts within ``[at, at + window)``.
+
+    Unknown or missing timezones fall back to UTC, like ``resolve_timezone``.
+    """
+    starting: list[str | None] = []
+    for timezone in timezones:
+        local = at.astimezone(resolve_timezone(timezone))
+        since_midnight = datetime.timedelta(
+            hours=local.hour,
+            minutes=local.minute,
+            seconds=local.second,
+            microseconds=local.microsecond,
+        )
+        if since_midnight < window:
+            starting.append(timezone)
+    return starting
+
+
 def get_time_between(
     t1: datetime.time | datetime.datetime,
     t2: datetime.time | datetime.datetime | None = None,
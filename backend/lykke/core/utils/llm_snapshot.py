@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from datetime import datetime
 from uuid import UUID
 
 from lykke.domain import value_objects
@@ -45,3 +46,12 @@ def build_referenced_entities(
     add_entities("push_notification", getattr(prompt_context, "push_notifications", []))
 
     return referenced
+
+
+def prompt_context_age_seconds(
+    prompt_context: value_objects.LLMPromptContext, current_time: datetime
+) -> float | None:
+    """Return how long ago the prompt context's day parts were loaded in full."""
+    if prompt_context.loaded_at is None:
+        return None
+    return max((current_time - prompt_context.loaded_at).total_seconds(), 0.0)
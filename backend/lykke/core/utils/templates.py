@@ -1,10 +1,22 @@
 import re
 import textwrap
+import time as time_module
+from dataclasses import dataclass
 from datetime import date, datetime, time
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, pass_context
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateError,
+    pass_context,
+)
+from loguru import logger
+
+from lykke.core.config import settings
 
 TEMPLATE_PATH: Path = Path(__file__).resolve().parents[3] / "templates"
 BASE_PERSONALITY_DIR = "base_personalities"
@@ -167,14 +179,6 @@ def _register_template_helpers(environment: Environment) -> None:
     environment.globals["minutes_between"] = minutes_between
 
 
-env = Environment(
-    loader=FileSystemLoader(TEMPLATE_PATH),
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
-_register_template_helpers(env)
-
-
 def _post_process_rendered(rendered: str) -> str:
     dedented = textwrap.dedent(str(rendered))
     lines = [line.rstrip() for line in dedented.splitlines()]
@@ -210,8 +214,7 @@ def _post_process_rendered(rendered: str) -> str:
 
 
 def render(template_name: str, /, **kwargs: Any) -> str:
-    template = env.get_template(template_name)
-    rendered = template.render(**kwargs)
+    rendered = get_template_registry().render(template_name, **kwargs)
     return _post_process_rendered(rendered)
 
 
@@ -291,17 +294,106 @@ def template_display_name(value: str) -> str:
     return cleaned.title() if cleaned else value
 
 
-def create_template_environment() -> Environment:
+def create_template_environment(
+    *,
+    auto_reload: bool = True,
+    bytecode_cache: FileSystemBytecodeCache | None = None,
+) -> Environment:
     """Create a Jinja2 environment for system templates."""
     environment = Environment(
         loader=FileSystemLoader(TEMPLATE_PATH),
         trim_blocks=True,
         lstrip_blocks=True,
+        auto_reload=auto_reload,
+        bytecode_cache=bytecode_cache,
+        cache_size=-1,  # keep every compiled template
     )
     _register_template_helpers(environment)
     return environment
 
 
+@dataclass
+class TemplateRenderStats:
+    """Render timings for one template."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class TemplateRegistry:
+    """Process-wide store of compiled system templates.
+
+    Templates compile once and stay cached; the bytecode cache lets a new
+    process skip compilation too. Outside development templates are never
+    re-checked on disk.
+    """
+
+    def __init__(
+        self,
+        *,
+        auto_reload: bool,
+        bytecode_cache_dir: str | None = None,
+    ) -> None:
+        self.environment = create_template_environment(
+            auto_reload=auto_reload,
+            bytecode_cache=FileSystemBytecodeCache(bytecode_cache_dir or None),
+        )
+        self.stats: dict[str, TemplateRenderStats] = {}
+
+    def warm(self) -> int:
+        """Compile every template up front and return how many compiled."""
+        started = time_module.perf_counter()
+        compiled = 0
+        for name in self.environment.list_templates(extensions=["j2"]):
+            try:
+                self.environment.get_template(name)
+            except TemplateError:
+                logger.exception(f"Failed to compile template {name}")
+                continue
+            compiled += 1
+        logger.info(
+            f"Compiled {compiled} templates in "
+            f"{time_module.perf_counter() - started:.3f}s"
+        )
+        return compiled
+
+    def get_template(self, name: str) -> Template:
+        """Return the compiled template ``name``."""
+        return self.environment.get_template(name)
+
+    def render(self, name: str, /, **kwargs: Any) -> str:
+        """Render ``name`` and record how long it took."""
+        started = time_module.perf_counter()
+        rendered = self.get_template(name).render(**kwargs)
+        elapsed = time_module.perf_counter() - started
+        stats = self.stats.setdefault(name, TemplateRenderStats())
+        stats.count += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        logger.debug(f"Rendered template {name} in {elapsed * 1000:.2f}ms")
+        return rendered
+
+
+_registry: TemplateRegistry | None = None
+
+
+def get_template_registry() -> TemplateRegistry:
+    """Return the process-wide template registry, creating it on first use."""
+    global _registry
+    if _registry is None:
+        _registry = TemplateRegistry(
+            auto_reload=settings.ENVIRONMENT == "development",
+            bytecode_cache_dir=settings.TEMPLATE_BYTECODE_CACHE_DIR,
+        )
+    return _registry
+
+
+def warm_templates() -> int:
+    """Compile all system templates into the process-wide registry."""
+    return get_template_registry().warm()
+
+
 def render_for_user(
     usecase: str,
     part: str,
@@ -309,9 +401,8 @@ def render_for_user(
     **kwargs: Any,
 ) -> str:
     """Render a system template."""
-    environment = create_template_environment()
     template_key = build_template_key(usecase, part)
-    template = environment.get_template(to_template_name(template_key))
     resolved_slug = resolve_base_personality_slug(base_personality_slug)
     kwargs.setdefault("base_personality_slug", resolved_slug)
-    return _post_process_rendered(template.render(**kwargs))
+    rendered = get_template_registry().render(to_template_name(template_key), **kwargs)
+    return _post_process_rendered(rendered)
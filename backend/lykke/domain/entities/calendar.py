@@ -13,7 +13,10 @@ if TYPE_CHECKING:
     from datetime import datetime
 
     from lykke.domain.events.calendar_events import CalendarUpdatedEvent
-    from lykke.domain.value_objects.sync import SyncSubscription
+    from lykke.domain.value_objects.sync import (
+        CalendarSyncCheckpoint,
+        SyncSubscription,
+    )
     from lykke.domain.value_objects.task import EventCategory
 
 
@@ -28,6 +31,7 @@ class CalendarEntity(BaseEntityObject[CalendarUpdateObject, "CalendarUpdatedEven
     last_sync_at: datetime | None = None
     sync_subscription: SyncSubscription | None = None
     sync_subscription_id: str | None = None
+    sync_checkpoint: CalendarSyncCheckpoint | None = None
     id: UUID = field(default=None, init=True)  # type: ignore[assignment]
 
     def __post_init__(self) -> None:
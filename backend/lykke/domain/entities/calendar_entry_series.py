@@ -24,10 +24,18 @@ class CalendarEntrySeriesEntity(BaseEntityObject):
     recurrence: list[str] = field(default_factory=list)
     starts_at: datetime | None = None
     ends_at: datetime | None = None
+    # IANA zone the provider expands the recurrence in (the event's start zone)
+    timezone: str | None = None
+    is_all_day: bool = False
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     ical_uid: str | None = None  # master iCalUID from provider
     deleted_at: datetime | None = None  # tombstone when series was deleted/cancelled
+    # Instances up to this instant are stored as entries; later ones are
+    # expanded from ``recurrence`` on read.
+    materialized_until: datetime | None = None
+    # Original starts of cancelled instances after ``materialized_until``
+    cancelled_occurrences: list[datetime] = field(default_factory=list)
     id: UUID = field(default=None, init=True)  # type: ignore[assignment]
 
     def __post_init__(self) -> None:
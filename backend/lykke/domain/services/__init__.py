@@ -1,3 +1,5 @@
+from .due_schedule import DueScheduleService
+from .recurrence import RecurrenceExpansionService
 from .timing_status import TimingStatusService
 
-__all__ = ["TimingStatusService"]
+__all__ = ["DueScheduleService", "RecurrenceExpansionService", "TimingStatusService"]
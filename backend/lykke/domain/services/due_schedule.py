@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from lykke.core.utils.dates import ensure_utc
+from lykke.domain.entities import (
+    CalendarEntryEntity,
+    DayEntity,
+    RoutineEntity,
+    TaskEntity,
+    UserEntity,
+)
+from lykke.domain.value_objects import (
+    Alarm,
+    AlarmStatus,
+    CalendarEntryAttendanceStatus,
+    CalendarEntryNotificationRule,
+    DueJobKind,
+    DueScheduleEntry,
+)
+
+from .timing_status import TimingStatusService
+
+
+class DueScheduleService:
+    """Pure computations of when per-user jobs next have work to do."""
+
+    @staticmethod
+    def alarm_due_at(alarm: Alarm) -> datetime | None:
+        """Return the instant an alarm fires, or None if it never will.
+
+        Snoozed alarms fire at the later of their time and ``snoozed_until``.
+        """
+        if alarm.status in (AlarmStatus.CANCELLED, AlarmStatus.TRIGGERED):
+            return None
+        if alarm.datetime is None:
+            return None
+        due_at = ensure_utc(alarm.datetime) or alarm.datetime
+        if alarm.status == AlarmStatus.SNOOZED:
+            if alarm.snoozed_until is None:
+                return None
+            snoozed_until = ensure_utc(alarm.snoozed_until) or alarm.snoozed_until
+            due_at = max(due_at, snoozed_until)
+        return due_at
+
+    @staticmethod
+    def next_alarm_due(alarms: Iterable[Alarm], after: datetime) -> datetime | None:
+        """Return the earliest instant after ``after`` an alarm becomes due."""
+        due_times = (DueScheduleService.alarm_due_at(alarm) for alarm in alarms)
+        return min(
+            (due_at for due_at in due_times if due_at is not None and due_at > after),
+            default=None,
+        )
+
+    @staticmethod
+    def pending_alarm_due(alarms: Iterable[Alarm]) -> datetime | None:
+        """Return the earliest instant an alarm is due, including overdue ones."""
+        due_times = (DueScheduleService.alarm_due_at(alarm) for alarm in alarms)
+        return min((due_at for due_at in due_times if due_at is not None), default=None)
+
+    @staticmethod
+    def next_calendar_entry_reminder(
+        entry: CalendarEntryEntity,
+        rules: Iterable[CalendarEntryNotificationRule],
+        after: datetime,
+    ) -> datetime | None:
+        """Return the earliest reminder instant after ``after`` for an entry."""
+        if CalendarEntryAttendanceStatus.blocks_notifications(entry.attendance_status):
+            return None
+        starts_at = ensure_utc(entry.starts_at) or entry.starts_at
+        due_times = [
+            starts_at - timedelta(minutes=rule.minutes_before) for rule in rules
+        ]
+        return min((value for value in due_times if value > after), default=None)
+
+    @staticmethod
+    def entries_for(
+        entity: object,
+        *,
+        user: UserEntity,
+        after: datetime,
+    ) -> list[DueScheduleEntry]:
+        """Return the due-schedule entries implied by a persisted entity."""
+        timezone = user.settings.timezone if user.settings else None
+        kind: DueJobKind
+        due_at: datetime | None
+        if isinstance(entity, DayEntity):
+            kind = DueJobKind.ALARMS
+            due_at = DueScheduleService.next_alarm_due(entity.alarms, after)
+        elif isinstance(entity, (TaskEntity, RoutineEntity)):
+            kind = DueJobKind.TIMING_STATUS
+            due_at = TimingStatusService.next_transition_bound(
+                entity, after, timezone=timezone
+            )
+        elif isinstance(entity, CalendarEntryEntity):
+            settings = user.settings.calendar_entry_notification_settings
+            if not settings.enabled:
+                return []
+            kind = DueJobKind.CALENDAR_ENTRY_NOTIFICATIONS
+            due_at = DueScheduleService.next_calendar_entry_reminder(
+                entity, settings.rules, after
+            )
+        else:
+            return []
+
+        if due_at is None:
+            return []
+        return [DueScheduleEntry(user_id=user.id, kind=kind, due_at=due_at)]
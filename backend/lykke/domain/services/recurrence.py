@@ -0,0 +1,251 @@
+"""Expansion of calendar series recurrence rules into occurrences.
+
+Calendar sync stores one entry per series instance only up to the series'
+``materialized_until`` horizon. Later instances are computed on read from the
+series' RFC 5545 ``recurrence`` lines (RRULE, RDATE, EXDATE) and merged with
+the stored entries, so edits to a series touch its row rather than every
+future instance.
+
+Rules are evaluated in wall-clock time of the series' own timezone (the
+event's start zone, falling back to the user's) so a weekly 9:00 meeting
+stays at 9:00 across DST changes, as the provider expands it. Parsed rule
+sets are cached per series and remember the occurrences they already
+generated.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta, tzinfo
+from typing import ClassVar, cast
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from dateutil.rrule import rrule, rruleset, rrulestr
+from loguru import logger
+
+from lykke.core.utils.dates import ensure_utc
+from lykke.domain.entities import CalendarEntryEntity, CalendarEntrySeriesEntity
+
+_UTC_UNTIL = re.compile(r"UNTIL=(\d{8}T\d{6})Z")
+_DATE_UNTIL = re.compile(r"UNTIL=(\d{8})(?=;|$)")
+_RuleSetKey = tuple[UUID, tuple[str, ...], datetime, str]
+
+
+class RecurrenceExpansionService:
+    """Expands calendar series into occurrences over date ranges."""
+
+    CACHE_SIZE: ClassVar[int] = 1024
+    _rule_sets: ClassVar[OrderedDict[_RuleSetKey, rruleset]] = OrderedDict()
+
+    @classmethod
+    def occurrences(
+        cls,
+        series: CalendarEntrySeriesEntity,
+        window_start: datetime,
+        window_end: datetime,
+        *,
+        timezone: str | None = None,
+    ) -> list[datetime]:
+        """Return UTC starts of ``series`` occurrences in ``[window_start, window_end)``.
+
+        Cancelled occurrences recorded on the series are left out. ``timezone``
+        is used only for series stored without a timezone of their own.
+        """
+        if not series.recurrence or series.starts_at is None:
+            return []
+        tz = _zone(series.timezone or timezone)
+        rule_set = cls._rule_set(series, tz)
+        local_start = _to_local(window_start, tz)
+        local_end = _to_local(window_end, tz)
+        cancelled = {ensure_utc(item) for item in series.cancelled_occurrences}
+        starts: list[datetime] = []
+        for local in rule_set.between(local_start, local_end, inc=True):
+            starts_at = local.replace(tzinfo=tz).astimezone(UTC)
+            if window_start <= starts_at < window_end and starts_at not in cancelled:
+                starts.append(starts_at)
+        return starts
+
+    @classmethod
+    def occurrence_entry(
+        cls,
+        series: CalendarEntrySeriesEntity,
+        starts_at: datetime,
+        *,
+        timezone: str | None = None,
+    ) -> CalendarEntryEntity:
+        """Build the (unsaved) entry for the occurrence of ``series`` at ``starts_at``.
+
+        The platform id follows Google's instance id format (the UTC start for
+        timed events, the local date for all-day ones), so an expanded
+        occurrence has the same id its stored row would have.
+        """
+        if series.is_all_day:
+            local_day = starts_at.astimezone(_zone(series.timezone or timezone))
+            instance_suffix = f"{local_day:%Y%m%d}"
+        else:
+            instance_suffix = f"{starts_at.astimezone(UTC):%Y%m%dT%H%M%SZ}"
+        duration = None
+        if series.starts_at is not None and series.ends_at is not None:
+            duration = series.ends_at - series.starts_at
+        return CalendarEntryEntity(
+            user_id=series.user_id,
+            name=series.name,
+            calendar_id=series.calendar_id,
+            calendar_entry_series_id=series.id,
+            platform_id=f"{series.platform_id}_{instance_suffix}",
+            platform=series.platform,
+            status="confirmed",
+            starts_at=starts_at,
+            ends_at=(
+                starts_at + duration if duration and duration > timedelta() else None
+            ),
+            frequency=series.frequency,
+            category=series.event_category,
+            created_at=series.created_at,
+            updated_at=series.updated_at,
+            timezone=series.timezone or timezone,
+            user_timezone=timezone,
+            ical_uid=series.ical_uid,
+            original_starts_at=starts_at,
+            recurring_platform_id=series.platform_id,
+        )
+
+    @classmethod
+    def merge_occurrences(
+        cls,
+        entries: list[CalendarEntryEntity],
+        series: Iterable[CalendarEntrySeriesEntity],
+        window_start: datetime,
+        window_end: datetime,
+        *,
+        timezone: str | None = None,
+    ) -> list[CalendarEntryEntity]:
+        """Add expanded occurrences in the window that have no stored entry.
+
+        Only occurrences after a series' ``materialized_until`` are expanded;
+        before it the stored entries (and their absence, for cancelled
+        instances) are authoritative. Stored exceptions are matched by their
+        original start, so a moved instance is not listed twice.
+        """
+        stored_platform_ids = {entry.platform_id for entry in entries}
+        stored_slots: set[tuple[UUID | None, datetime | None]] = set()
+        for entry in entries:
+            stored_slots.add(
+                (entry.calendar_entry_series_id, ensure_utc(entry.starts_at))
+            )
+            if entry.original_starts_at is not None:
+                stored_slots.add(
+                    (
+                        entry.calendar_entry_series_id,
+                        ensure_utc(entry.original_starts_at),
+                    )
+                )
+
+        merged = list(entries)
+        for item in series:
+            if item.deleted_at is not None or item.materialized_until is None:
+                continue
+            materialized_until = ensure_utc(item.materialized_until)
+            if materialized_until is None or materialized_until >= window_end:
+                continue
+            for starts_at in cls.occurrences(
+                item,
+                max(window_start, materialized_until),
+                window_end,
+                timezone=timezone,
+            ):
+                if (
+                    starts_at <= materialized_until
+                    or (item.id, starts_at) in stored_slots
+                ):
+                    continue
+                entry = cls.occurrence_entry(item, starts_at, timezone=timezone)
+                if entry.platform_id not in stored_platform_ids:
+                    merged.append(entry)
+        return merged
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached rule sets."""
+        cls._rule_sets.clear()
+
+    @classmethod
+    def _rule_set(cls, series: CalendarEntrySeriesEntity, tz: tzinfo) -> rruleset:
+        starts_at = ensure_utc(series.starts_at) or datetime.now(UTC)
+        key = (series.id, tuple(series.recurrence), starts_at, str(tz))
+        rule_set = cls._rule_sets.get(key)
+        if rule_set is not None:
+            cls._rule_sets.move_to_end(key)
+            return rule_set
+        rule_set = _build_rule_set(series.recurrence, _to_local(starts_at, tz), tz)
+        cls._rule_sets[key] = rule_set
+        if len(cls._rule_sets) > cls.CACHE_SIZE:
+            cls._rule_sets.popitem(last=False)
+        return rule_set
+
+
+def _zone(timezone: str | None) -> tzinfo:
+    try:
+        return ZoneInfo(timezone) if timezone else UTC
+    except (ZoneInfoNotFoundError, ValueError):
+        return UTC
+
+
+def _to_local(value: datetime, tz: tzinfo) -> datetime:
+    """Convert an aware datetime to naive wall-clock time in ``tz``."""
+    return (ensure_utc(value) or value).astimezone(tz).replace(tzinfo=None)
+
+
+def _build_rule_set(recurrence: list[str], dtstart: datetime, tz: tzinfo) -> rruleset:
+    """Compile recurrence lines against a naive local ``dtstart``."""
+    rule_set = rruleset(cache=True)
+    for line in recurrence:
+        head, _, value = line.partition(":")
+        name, *params = head.split(";")
+        name = name.upper()
+        try:
+            if name == "RRULE":
+                # A single RRULE without forceset always parses to an rrule.
+                rule = rrulestr(_local_until(value, tz), dtstart=dtstart, cache=True)
+                rule_set.rrule(cast("rrule", rule))
+            elif name in ("RDATE", "EXDATE"):
+                add = rule_set.rdate if name == "RDATE" else rule_set.exdate
+                for item in value.split(","):
+                    add(_parse_date_value(item, params, dtstart, tz))
+        except (ValueError, ZoneInfoNotFoundError) as exc:
+            logger.warning(f"Skipping unparseable recurrence line {line!r}: {exc}")
+    return rule_set
+
+
+def _local_until(rule: str, tz: tzinfo) -> str:
+    """Rewrite ``UNTIL`` to naive local time to match the naive ``dtstart``."""
+
+    def from_utc(match: re.Match[str]) -> str:
+        until = datetime.strptime(match.group(1), "%Y%m%dT%H%M%S").replace(tzinfo=UTC)
+        return f"UNTIL={_to_local(until, tz):%Y%m%dT%H%M%S}"
+
+    rule = _UTC_UNTIL.sub(from_utc, rule)
+    # A date-only UNTIL includes occurrences on that day.
+    return _DATE_UNTIL.sub(r"UNTIL=\1T235959", rule)
+
+
+def _parse_date_value(
+    value: str, params: list[str], dtstart: datetime, tz: tzinfo
+) -> datetime:
+    """Parse one RDATE/EXDATE value as naive local time."""
+    value = value.strip()
+    if len(value) == 8:
+        day = datetime.strptime(value, "%Y%m%d")
+        return datetime.combine(day.date(), dtstart.time())
+    if value.endswith("Z"):
+        parsed = datetime.strptime(value[:-1], "%Y%m%dT%H%M%S").replace(tzinfo=UTC)
+        return _to_local(parsed, tz)
+    parsed = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    for param in params:
+        if param.upper().startswith("TZID="):
+            zone = ZoneInfo(param[len("TZID=") :].strip('"'))
+            return _to_local(parsed.replace(tzinfo=zone), tz)
+    return parsed
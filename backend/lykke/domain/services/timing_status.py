@@ -126,6 +126,142 @@ class TimingStatusService:
             status=TimingStatus.HIDDEN, next_available_time=next_available
         )
 
+    @staticmethod
+    def next_task_transition(
+        task: TaskEntity,
+        after: datetime,
+        *,
+        timezone: str | None = None,
+        routine_time_window: TimeWindow | None = None,
+        routine_snoozed_until: datetime | None = None,
+        upcoming_window: timedelta = UPCOMING_WINDOW_TASK,
+        needs_attention_window: timedelta = NEEDS_ATTENTION_WINDOW_TASK,
+    ) -> datetime | None:
+        """Return the earliest instant after ``after`` the task status can change.
+
+        Mirrors the boundaries checked by ``task_status`` so callers can wait
+        until then instead of polling.
+        """
+        if task.status in (TaskStatus.COMPLETE, TaskStatus.PUNT):
+            return None
+
+        tzinfo = TimingStatusService._resolve_tzinfo(after, timezone)
+        window = TimingStatusService._build_effective_window(
+            task_date=task.scheduled_date,
+            task_time_window=task.time_window,
+            routine_time_window=routine_time_window,
+            tzinfo=tzinfo,
+        )
+        boundaries: list[datetime | None] = [
+            TimingStatusService._resolve_snoozed_until(
+                task.snoozed_until, routine_snoozed_until
+            )
+        ]
+        if window is not None:
+            if window.availability_start:
+                boundaries.append(window.availability_start - upcoming_window)
+            if window.availability_end:
+                boundaries.append(window.availability_end - needs_attention_window)
+            boundaries.extend(
+                [
+                    window.availability_start,
+                    window.availability_end,
+                    window.active_start,
+                    window.active_end,
+                ]
+            )
+
+        return TimingStatusService._earliest_time(
+            value for value in boundaries if value is not None and value > after
+        )
+
+    @staticmethod
+    def next_routine_transition(
+        routine: RoutineEntity,
+        tasks: Iterable[TaskEntity],
+        after: datetime,
+        *,
+        timezone: str | None = None,
+        upcoming_window: timedelta = UPCOMING_WINDOW_ROUTINE,
+    ) -> datetime | None:
+        """Return the earliest instant after ``after`` the routine status can change."""
+        relevant_tasks = [
+            task
+            for task in tasks
+            if task.routine_definition_id == routine.routine_definition_id
+        ]
+        if not relevant_tasks:
+            return None
+
+        return TimingStatusService._earliest_time(
+            TimingStatusService.next_task_transition(
+                task,
+                after,
+                timezone=timezone,
+                routine_time_window=routine.time_window,
+                routine_snoozed_until=routine.snoozed_until,
+                upcoming_window=upcoming_window,
+            )
+            for task in relevant_tasks
+        )
+
+    @staticmethod
+    def next_transition_bound(
+        entity: TaskEntity | RoutineEntity,
+        after: datetime,
+        *,
+        timezone: str | None = None,
+    ) -> datetime | None:
+        """Return the earliest instant after ``after`` that may change a status.
+
+        Unlike ``next_task_transition`` this only looks at the entity itself,
+        so it can be computed (and persisted) whenever a single task or
+        routine row is written. A task's effective window is always bounded
+        by either its own or its routine's window, so the union of the
+        bounds of a task and its routine never misses a transition; it may
+        fire early when a boundary is masked by the other window.
+        """
+        if isinstance(entity, TaskEntity):
+            if entity.status in (TaskStatus.COMPLETE, TaskStatus.PUNT):
+                return None
+            entity_date = entity.scheduled_date
+            upcoming_windows = [UPCOMING_WINDOW_TASK]
+            if entity.routine_definition_id is not None:
+                upcoming_windows.append(UPCOMING_WINDOW_ROUTINE)
+        else:
+            entity_date = entity.date
+            upcoming_windows = [UPCOMING_WINDOW_TASK, UPCOMING_WINDOW_ROUTINE]
+
+        tzinfo = TimingStatusService._resolve_tzinfo(after, timezone)
+        window = TimingStatusService._window_from_time_window(
+            entity.time_window, entity_date, tzinfo
+        )
+        boundaries: list[datetime | None] = [
+            ensure_utc(entity.snoozed_until) if entity.snoozed_until else None
+        ]
+        if window is not None:
+            if window.availability_start:
+                boundaries.extend(
+                    window.availability_start - upcoming
+                    for upcoming in upcoming_windows
+                )
+            if window.availability_end:
+                boundaries.append(
+                    window.availability_end - NEEDS_ATTENTION_WINDOW_TASK
+                )
+            boundaries.extend(
+                [
+                    window.availability_start,
+                    window.availability_end,
+                    window.active_start,
+                    window.active_end,
+                ]
+            )
+
+        return TimingStatusService._earliest_time(
+            value for value in boundaries if value is not None and value > after
+        )
+
     @staticmethod
     def _resolve_tzinfo(now: datetime, timezone: str | None) -> tzinfo:
         if timezone is not None:
@@ -21,6 +21,7 @@ from .day import (
     DayTag,
     LLMPromptContext,
 )
+from .due_schedule import DueJobKind, DueScheduleEntry
 from .high_level_plan import HighLevelPlan
 from .llm_run import (
     LLMReferencedEntitySnapshot,
@@ -62,7 +63,7 @@ from .routine_definition import (
     RoutineDefinitionTask,
     TimeWindow,
 )
-from .sync import SyncSubscription
+from .sync import CalendarSyncCheckpoint, SyncSubscription
 from .task import (
     CalendarEntryAttendanceStatus,
     EventCategory,
@@ -102,6 +103,8 @@ from .user import (
     CalendarEntryNotificationChannel,
     CalendarEntryNotificationRule,
     CalendarEntryNotificationSettings,
+    EligibleUser,
+    UserEligibility,
     UserSetting,
     UserSettingUpdate,
     UserStatus,
@@ -135,6 +138,7 @@ __all__ = [
     "CalendarEntryUpdateObject",
     "CalendarQuery",
     "CalendarSubscription",
+    "CalendarSyncCheckpoint",
     "CalendarUpdateObject",
     "DateQuery",
     "DayContext",
@@ -148,6 +152,9 @@ __all__ = [
     "DayTemplateUpdateObject",
     "DayTimeBlock",
     "DayUpdateObject",
+    "DueJobKind",
+    "DueScheduleEntry",
+    "EligibleUser",
     "EventCategory",
     "FactoidCriticality",
     "FactoidQuery",
@@ -199,6 +206,7 @@ __all__ = [
     "TriggerUpdateObject",
     "UseCaseConfigQuery",
     "UserQuery",
+    "UserEligibility",
     "UserSetting",
     "UserSettingUpdate",
     "UserStatus",
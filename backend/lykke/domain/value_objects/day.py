@@ -180,3 +180,5 @@ class LLMPromptContext(DayContext):
     """Expanded context for LLM prompts."""
 
     factoids: list["FactoidEntity"] = field(default_factory=list)
+    # When the day parts were last loaded in full (they may be cached since).
+    loaded_at: dt_datetime | None = None
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from .base import BaseValueObject
+
+
+class DueJobKind(str, Enum):
+    """Per-user jobs that are woken from the due-schedule index."""
+
+    TIMING_STATUS = "timing_status"
+    ALARMS = "alarms"
+    CALENDAR_ENTRY_NOTIFICATIONS = "calendar_entry_notifications"
+    CALENDAR_SYNC = "calendar_sync"
+
+
+@dataclass(kw_only=True)
+class DueScheduleEntry(BaseValueObject):
+    """The next instant a user's job of a given kind has work to do."""
+
+    user_id: UUID
+    kind: DueJobKind
+    due_at: datetime
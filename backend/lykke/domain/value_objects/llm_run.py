@@ -37,3 +37,5 @@ class LLMRunResultSnapshot(BaseValueObject):
     tools: list[dict[str, Any]] | None = None
     tool_choice: Any = None
     model_params: dict[str, Any] | None = None
+    # Seconds since the prompt context's day parts were loaded in full
+    prompt_context_age_seconds: float | None = None
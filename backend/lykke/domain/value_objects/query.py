@@ -81,6 +81,8 @@ class CalendarEntryQuery(DateQuery):
     ical_uid: str | None = None
     recurring_platform_id: str | None = None
     starts_at_after: datetime | None = None  # for future-entry queries
+    # With ``date``: include series occurrences past their stored horizon
+    expand_series: bool = False
 
 
 @dataclass(kw_only=True)
@@ -90,6 +92,9 @@ class CalendarEntrySeriesQuery(BaseQuery):
     calendar_id: UUID | None = None
     platform_id: str | None = None
     ical_uid: str | None = None
+    ids: list[UUID] | None = None
+    # Live recurring series whose stored instances end before this instant
+    materialized_before: datetime | None = None
 
 
 @dataclass(kw_only=True)
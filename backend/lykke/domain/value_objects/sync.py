@@ -21,3 +21,19 @@ class SyncSubscription(BaseValueObject):
     client_state: str | None = None  # Optional validation token
     sync_token: str | None = None  # For incremental sync
     webhook_url: str | None = None  # Webhook URL for debugging purposes
+
+
+@dataclass(kw_only=True)
+class CalendarSyncCheckpoint(BaseValueObject):
+    """Progress of a paged calendar sync, saved after each committed page.
+
+    A sync that stops part-way resumes from ``page_token``. Page tokens are
+    only valid for the listing that issued them, so the checkpoint also keeps
+    that listing's ``sync_token`` and ``lookback``.
+    """
+
+    page_token: str  # Provider token of the next page to fetch
+    sync_token: str | None = None  # Sync token the listing started from
+    lookback: datetime  # Lower bound of a full listing
+    started_at: datetime  # When the interrupted sync started
+    pages_synced: int = 0
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
         RoutineDefinitionTask,
         TimeWindow,
     )
-    from .sync import SyncSubscription
+    from .sync import CalendarSyncCheckpoint, SyncSubscription
     from .task import (
         CalendarEntryAttendanceStatus,
         EventCategory,
@@ -154,6 +154,7 @@ class CalendarUpdateObject(BaseUpdateObject):
     last_sync_at: datetime | None = None
     sync_subscription: SyncSubscription | None = None
     sync_subscription_id: str | None = None
+    sync_checkpoint: CalendarSyncCheckpoint | None = None
 
 
 @dataclass(kw_only=True)
@@ -166,8 +167,12 @@ class CalendarEntrySeriesUpdateObject(BaseUpdateObject):
     recurrence: list[str] | None = None
     starts_at: datetime | None = None
     ends_at: datetime | None = None
+    timezone: str | None = None
+    is_all_day: bool | None = None
     ical_uid: str | None = None
     deleted_at: datetime | None = None
+    materialized_until: datetime | None = None
+    cancelled_occurrences: list[datetime] | None = None
 
 
 @dataclass(kw_only=True)
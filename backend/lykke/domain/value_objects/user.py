@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from datetime import time
 from enum import Enum
 from typing import Any, cast
+from uuid import UUID
 
 from .ai_chat import LLMProvider
 from .base import BaseRequestObject, BaseValueObject
@@ -275,3 +276,21 @@ class UserStatus(str, Enum):
 
     ACTIVE = "active"
     NEW_LEAD = "new-lead"
+
+
+class UserEligibility(str, Enum):
+    """Which users a scheduled fan-out applies to."""
+
+    ALL = "all"
+    LLM_PROVIDER = "llm-provider"
+    CALENDAR_ENTRY_NOTIFICATIONS = "calendar-entry-notifications"
+    MORNING_OVERVIEW = "morning-overview"
+
+
+@dataclass(kw_only=True)
+class EligibleUser(BaseValueObject):
+    """Projection of the user fields scheduled fan-out tasks need."""
+
+    id: UUID
+    timezone: str | None = None
+    morning_overview_time: time | None = None
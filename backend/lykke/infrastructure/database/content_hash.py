@@ -0,0 +1,67 @@
+"""Content fingerprints for rows that are mirrored from external providers.
+
+Tables store the fingerprint in a generated ``content_hash`` column so every
+row (including ones written before the column existed) carries one. The same
+digest is computed in Python from an entity, letting sync code find rows that
+already match what a provider returned without loading them.
+
+Both sides hash the same canonical text: each field rendered as text, NULLs
+replaced by a marker, joined by a unit separator and fed to MD5. A Python
+digest that drifts from the SQL one only costs a full comparison, never a
+missed update.
+"""
+
+import hashlib
+import json
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from typing import Any, Literal
+
+FieldKind = Literal["text", "uuid", "timestamp", "jsonb", "boolean"]
+
+_SEPARATOR = "\x1f"
+_NULL = "\x1e"
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def content_hash_sql(columns: Sequence[tuple[str, FieldKind]]) -> str:
+    """Build the immutable SQL expression for a generated ``content_hash`` column."""
+    parts: list[str] = []
+    for name, kind in columns:
+        if kind == "jsonb":
+            # SQL NULL and JSON null both hash as ``null``
+            parts.append(f"coalesce({name}::text, 'null')")
+            continue
+        if kind == "timestamp":
+            value = f"(extract(epoch from {name}) * 1000000)::bigint::text"
+        elif kind == "text":
+            value = name
+        else:
+            value = f"{name}::text"
+        parts.append(f"coalesce({value}, chr(30))")
+    return f"md5({' || chr(31) || '.join(parts)})"
+
+
+def content_hash(values: Sequence[tuple[Any, FieldKind]]) -> str:
+    """Compute the digest ``content_hash_sql`` yields for the given values."""
+    return hashlib.md5(
+        _SEPARATOR.join(_render(value, kind) for value, kind in values).encode()
+    ).hexdigest()
+
+
+def _render(value: Any, kind: FieldKind) -> str:
+    if kind == "jsonb":
+        return json.dumps(value, ensure_ascii=False)
+    if value is None:
+        return _NULL
+    if kind == "timestamp":
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return str((value - _EPOCH) // timedelta(microseconds=1))
+    if kind == "boolean":
+        # Matches Postgres' ``bool::text``
+        return "true" if value else "false"
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
@@ -1,10 +1,26 @@
 """Calendar entries table definition."""
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, String
+from sqlalchemy import Column, Computed, Date, DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 
+from lykke.infrastructure.database.content_hash import FieldKind, content_hash_sql
+
 from .base import Base
 
+# Provider-mapped fields fingerprinted by ``content_hash``
+CONTENT_HASH_COLUMNS: tuple[tuple[str, FieldKind], ...] = (
+    ("name", "text"),
+    ("status", "text"),
+    ("starts_at", "timestamp"),
+    ("ends_at", "timestamp"),
+    ("frequency", "text"),
+    ("category", "text"),
+    ("calendar_entry_series_id", "uuid"),
+    ("ical_uid", "text"),
+    ("original_starts_at", "timestamp"),
+    ("recurring_platform_id", "text"),
+)
+
 
 class CalendarEntry(Base):
     """CalendarEntry table for storing calendar entries."""
@@ -33,6 +49,9 @@ class CalendarEntry(Base):
     ical_uid = Column(String, nullable=True)
     original_starts_at = Column(DateTime, nullable=True)
     recurring_platform_id = Column(String, nullable=True)
+    content_hash = Column(
+        String, Computed(content_hash_sql(CONTENT_HASH_COLUMNS), persisted=True)
+    )
 
     __table_args__ = (
         Index("idx_calendar_entries_date", "date"),
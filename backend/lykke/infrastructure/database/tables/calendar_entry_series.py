@@ -1,10 +1,25 @@
 """Calendar entry series table definition."""
 
-from sqlalchemy import Column, DateTime, ForeignKey, Index, String
+from sqlalchemy import Boolean, Column, Computed, DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 
+from lykke.infrastructure.database.content_hash import FieldKind, content_hash_sql
+
 from .base import Base
 
+# Provider-mapped fields fingerprinted by ``content_hash``
+CONTENT_HASH_COLUMNS: tuple[tuple[str, FieldKind], ...] = (
+    ("name", "text"),
+    ("event_category", "text"),
+    ("frequency", "text"),
+    ("recurrence", "jsonb"),
+    ("starts_at", "timestamp"),
+    ("ends_at", "timestamp"),
+    ("ical_uid", "text"),
+    ("timezone", "text"),
+    ("is_all_day", "boolean"),
+)
+
 
 class CalendarEntrySeries(Base):
     """CalendarEntrySeries table for storing recurring event series."""
@@ -22,10 +37,17 @@ class CalendarEntrySeries(Base):
     recurrence = Column(JSONB)  # Recurrence rules from provider (e.g., Google)
     starts_at = Column(DateTime)
     ends_at = Column(DateTime)
+    timezone = Column(String, nullable=True)  # IANA zone of the event's start
+    is_all_day = Column(Boolean, nullable=False, server_default="false")
     created_at = Column(DateTime, nullable=False)
     updated_at = Column(DateTime, nullable=False)
     ical_uid = Column(String, nullable=True)
     deleted_at = Column(DateTime, nullable=True)
+    materialized_until = Column(DateTime, nullable=True)
+    cancelled_occurrences = Column(JSONB)  # ISO starts of cancelled expanded instances
+    content_hash = Column(
+        String, Computed(content_hash_sql(CONTENT_HASH_COLUMNS), persisted=True)
+    )
 
     __table_args__ = (
         Index("idx_calendar_entry_series_user_id", "user_id"),
@@ -23,6 +23,7 @@ class Calendar(Base):
     sync_subscription_id = Column(
         String, nullable=True
     )  # Denormalized for webhook lookups
+    sync_checkpoint = Column(JSONB, nullable=True)  # CalendarSyncCheckpoint
 
     __table_args__ = (
         Index("idx_calendars_user_id", "user_id"),
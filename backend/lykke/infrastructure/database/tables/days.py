@@ -1,6 +1,6 @@
 """Days table definition."""
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 
 from .base import Base
@@ -23,9 +23,16 @@ class Day(Base):
     time_blocks = Column(JSONB)  # list[DayTimeBlock]
     active_time_block_id = Column(PGUUID)  # UUID | None
     alarms = Column(JSONB)  # list[Alarm]
+    # Earliest instant a pending alarm is due; derived on write
+    next_alarm_at = Column(DateTime)
     high_level_plan = Column(JSONB)  # HighLevelPlan | None
 
     __table_args__ = (
         Index("idx_days_date", "date"),
         Index("idx_days_user_id", "user_id"),
+        Index(
+            "idx_days_next_alarm_at",
+            "next_alarm_at",
+            postgresql_where=text("next_alarm_at IS NOT NULL"),
+        ),
     )
@@ -1,6 +1,6 @@
 """Routines table definition."""
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, String
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 
 from .base import Base
@@ -23,9 +23,16 @@ class Routine(Base):
     status = Column(String, nullable=False)  # TaskStatus enum as string
     snoozed_until = Column(DateTime)
     time_window = Column(JSONB)  # TimeWindow | None
+    # Earliest instant the timing status may change; derived on write
+    next_transition_at = Column(DateTime)
 
     __table_args__ = (
         Index("idx_routines_date", "date"),
         Index("idx_routines_routine_definition_id", "routine_definition_id"),
         Index("idx_routines_user_id", "user_id"),
+        Index(
+            "idx_routines_next_transition_at",
+            "next_transition_at",
+            postgresql_where=text("next_transition_at IS NOT NULL"),
+        ),
     )
@@ -1,6 +1,6 @@
 """Tasks table definition."""
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, String
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 
 from .base import Base
@@ -27,9 +27,16 @@ class Task(Base):
     routine_definition_id = Column(PGUUID, ForeignKey("routine_definitions.id"))
     tags = Column(JSONB)  # list[TaskTag]
     actions = Column(JSONB)  # list[Action]
+    # Earliest instant the timing status may change; derived on write
+    next_transition_at = Column(DateTime)
 
     __table_args__ = (
         Index("idx_tasks_date", "date"),
         Index("idx_tasks_routine_definition_id", "routine_definition_id"),
         Index("idx_tasks_user_id", "user_id"),
+        Index(
+            "idx_tasks_next_transition_at",
+            "next_transition_at",
+            postgresql_where=text("next_transition_at IS NOT NULL"),
+        ),
     )
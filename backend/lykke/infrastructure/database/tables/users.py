@@ -3,7 +3,7 @@
 import uuid
 
 from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTableUUID
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, Index, String, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -23,6 +23,24 @@ class User(SQLAlchemyBaseUserTableUUID, Base):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Partial indexes backing the eligibility queries of scheduled fan-outs
+        Index(
+            "idx_users_llm_provider",
+            "id",
+            postgresql_where=text("(settings ->> 'llm_provider') IS NOT NULL"),
+        ),
+        Index(
+            "idx_users_morning_overview",
+            "id",
+            postgresql_where=text(
+                "(settings ->> 'llm_provider') IS NOT NULL"
+                " AND (settings ->> 'morning_overview_time') IS NOT NULL"
+            ),
+        ),
+        # Backs the timezone buckets of the new-day scheduler
+        Index("idx_users_timezone", text("(settings ->> 'timezone')")),
+    )
 
     # Custom fields
     email: Mapped[str] = mapped_column(
@@ -1,9 +1,22 @@
-from . import google, redis_pubsub, sendgrid, stub_pubsub, twilio, web_push
+from . import (
+    google,
+    google_async,
+    redis_pubsub,
+    sendgrid,
+    stub_pubsub,
+    twilio,
+    web_push,
+)
 from .anthropic_llm import AnthropicLLMGateway
 from .google import GoogleCalendarGateway
+from .google_async import AsyncGoogleCalendarGateway
 from .openai_llm import OpenAILLMGateway
+from .redis_due_schedule import RedisDueScheduleGateway
+from .redis_llm_run_fingerprint import RedisLLMRunFingerprintGateway
 from .redis_pubsub import RedisPubSubGateway
 from .sendgrid import SendGridGateway
+from .stub_due_schedule import StubDueScheduleGateway
+from .stub_llm_run_fingerprint import StubLLMRunFingerprintGateway
 from .stub_pubsub import StubPubSubGateway
 from .stub_sms import StubSMSGateway
 from .twilio import TwilioGateway
@@ -11,15 +24,21 @@ from .web_push import WebPushGateway
 
 __all__ = [
     "AnthropicLLMGateway",
+    "AsyncGoogleCalendarGateway",
     "GoogleCalendarGateway",
     "OpenAILLMGateway",
+    "RedisDueScheduleGateway",
+    "RedisLLMRunFingerprintGateway",
     "RedisPubSubGateway",
     "SendGridGateway",
+    "StubDueScheduleGateway",
+    "StubLLMRunFingerprintGateway",
     "StubPubSubGateway",
     "StubSMSGateway",
     "TwilioGateway",
     "WebPushGateway",
     "google",
+    "google_async",
     "redis_pubsub",
     "sendgrid",
     "stub_pubsub",
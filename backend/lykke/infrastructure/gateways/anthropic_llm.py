@@ -2,7 +2,7 @@
 
 import inspect
 import json
-from collections.abc import Callable, Sequence
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 
@@ -10,15 +10,19 @@ from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 from loguru import logger
 from lykke.application.gateways.llm_protocol import (
+    LLMPreparedRequest,
     LLMTool,
     LLMToolCallResult,
     LLMToolRunResult,
 )
 from lykke.core.config import settings
 from lykke.core.utils.serialization import dataclass_to_json_dict
-from lykke.infrastructure.gateways.llm_tools import build_tool_spec_from_callable
+from lykke.infrastructure.gateways.llm_provider_pool import LLMProviderPool
+from lykke.infrastructure.gateways.llm_tools import prepare_request
 from pydantic import SecretStr
 
+_PROVIDER = "anthropic"
+
 
 def _normalize_response_content(content: str | list[str | dict[str, Any]]) -> str:
     if isinstance(content, str):
@@ -155,17 +159,51 @@ def _is_model_not_found_error(exc: BaseException) -> bool:
     return "404" in msg or "not_found_error" in msg or "model:" in msg
 
 
+def _chat_model(model: str) -> ChatAnthropic:
+    """Return the process-wide client for ``model``."""
+    return LLMProviderPool.client(
+        _PROVIDER,
+        model,
+        lambda: ChatAnthropic(
+            model_name=model,
+            api_key=SecretStr(settings.ANTHROPIC_API_KEY),
+            temperature=0.7,
+            timeout=settings.LLM_REQUEST_TIMEOUT_SECONDS,
+            max_retries=settings.LLM_MAX_RETRIES,
+            stop=None,
+        ),
+    )
+
+
 class AnthropicLLMGateway:
-    """Anthropic (Claude) implementation of LLM gateway."""
+    """Anthropic (Claude) implementation of LLM gateway.
+
+    Calls go through ``LLMProviderPool``: while the configured model's circuit
+    is open they are routed to ``ANTHROPIC_FALLBACK_MODEL``, and non-critical
+    use cases are skipped when both circuits are open.
+    """
 
     def __init__(self) -> None:
         """Initialize Anthropic LLM gateway."""
-        self._llm = ChatAnthropic(
-            model_name=settings.ANTHROPIC_MODEL,
-            api_key=SecretStr(settings.ANTHROPIC_API_KEY),
-            temperature=0.7,
-            timeout=None,
-            stop=None,
+        self._llm = _chat_model(settings.ANTHROPIC_MODEL)
+
+    async def prepare_usecase(
+        self,
+        system_prompt: str,
+        ask_prompt: str,
+        tools: Sequence[LLMTool],
+        metadata: dict[str, Any] | None = None,
+    ) -> LLMPreparedRequest:
+        """Build the request for this LLM use case once."""
+        return prepare_request(
+            system_prompt,
+            ask_prompt,
+            tools,
+            model_params={
+                "model": getattr(self._llm, "model_name", settings.ANTHROPIC_MODEL),
+                "temperature": getattr(self._llm, "temperature", 0.7),
+            },
+            metadata=metadata,
         )
 
     async def run_usecase(
@@ -185,6 +223,20 @@ class AnthropicLLMGateway:
         Returns:
             The tool call result or None if no completion was returned
         """
+        request = await self.prepare_usecase(
+            system_prompt, ask_prompt, tools, metadata=metadata
+        )
+        return await self.run_prepared(request)
+
+    async def run_prepared(
+        self, request: LLMPreparedRequest
+    ) -> LLMToolRunResult | None:
+        """Send a prepared request and return the tool call results."""
+        system_prompt = request.system_prompt
+        ask_prompt = request.ask_prompt
+        tools = request.tools
+        metadata = request.metadata
+
         started_at = datetime.now(UTC)
         status = "success"
         tool_results_payload: list[dict[str, Any]] = []
@@ -194,37 +246,40 @@ class AnthropicLLMGateway:
         error_info: dict[str, Any] | None = None
         effective_model = settings.ANTHROPIC_MODEL
         used_fallback = False
+        usecase = str((metadata or {}).get("usecase") or "unknown")
 
         try:
             if not tools:
                 raise ValueError("At least one tool must be provided")
 
-            tool_specs, models_by_name, callbacks_by_name = self._build_tool_data(tools)
-            request_payload = await self.preview_usecase(
-                system_prompt,
-                ask_prompt,
-                tools,
-                metadata=metadata,
+            routed_model = LLMProviderPool.route(
+                _PROVIDER,
+                [settings.ANTHROPIC_MODEL, settings.ANTHROPIC_FALLBACK_MODEL],
+                critical=bool((metadata or {}).get("critical", True)),
             )
-            request_messages = request_payload.get("request_messages", [])
+            if routed_model is None:
+                status = "circuit_open"
+                logger.warning(
+                    f"Skipping non-critical use case {usecase}: Anthropic circuits open"
+                )
+                return None
+            effective_model = routed_model
+            used_fallback = routed_model != settings.ANTHROPIC_MODEL
+
+            models_by_name = {tool.name: tool.args_model for tool in tools}
+            callbacks_by_name = {tool.name: tool.callback for tool in tools}
             messages = [
-                SystemMessage(
-                    content=request_messages[0]["content"]
-                    if len(request_messages) > 0
-                    else system_prompt
-                ),
-                HumanMessage(
-                    content=request_messages[1]["content"]
-                    if len(request_messages) > 1
-                    else ask_prompt
-                ),
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=ask_prompt),
             ]
-            llm = self._llm.bind_tools(tool_specs)
+            llm = _chat_model(effective_model).bind_tools(request.tool_specs)
             try:
-                response = await llm.ainvoke(messages)
+                response = await LLMProviderPool.invoke(
+                    _PROVIDER, effective_model, usecase, lambda: llm.ainvoke(messages)
+                )
             except Exception as invoke_err:
                 if _is_model_not_found_error(invoke_err) and (
-                    settings.ANTHROPIC_FALLBACK_MODEL != settings.ANTHROPIC_MODEL
+                    effective_model != settings.ANTHROPIC_FALLBACK_MODEL
                 ):
                     used_fallback = True
                     effective_model = settings.ANTHROPIC_FALLBACK_MODEL
@@ -233,15 +288,14 @@ class AnthropicLLMGateway:
                         configured_model=settings.ANTHROPIC_MODEL,
                         fallback_model=settings.ANTHROPIC_FALLBACK_MODEL,
                     )
-                    fallback_llm = ChatAnthropic(
-                        model_name=settings.ANTHROPIC_FALLBACK_MODEL,
-                        api_key=SecretStr(settings.ANTHROPIC_API_KEY),
-                        temperature=0.7,
-                        timeout=None,
-                        stop=None,
+                    fallback_llm = _chat_model(effective_model).bind_tools(
+                        request.tool_specs
                     )
-                    response = await fallback_llm.bind_tools(tool_specs).ainvoke(
-                        messages
+                    response = await LLMProviderPool.invoke(
+                        _PROVIDER,
+                        effective_model,
+                        usecase,
+                        lambda: fallback_llm.ainvoke(messages),
                     )
                 else:
                     raise
@@ -308,7 +362,7 @@ class AnthropicLLMGateway:
                 return None
             return LLMToolRunResult(
                 tool_results=tool_results,
-                request_payload=request_payload,
+                request_payload=request.payload,
             )
 
         except json.JSONDecodeError as e:
@@ -371,42 +425,7 @@ class AnthropicLLMGateway:
         metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Preview the request payload for this LLM use case."""
-        _ = metadata
-        tool_specs, _, _ = self._build_tool_data(tools)
-        request_messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": ask_prompt},
-        ]
-        request_tool_choice = "auto"
-        request_model_params = {
-            "model": getattr(self._llm, "model_name", settings.ANTHROPIC_MODEL),
-            "temperature": getattr(self._llm, "temperature", 0.7),
-        }
-        return {
-            "request_messages": request_messages,
-            "request_tools": [_coerce_json_safe(s) for s in tool_specs],
-            "request_tool_choice": request_tool_choice,
-            "request_model_params": request_model_params,
-        }
-
-    @staticmethod
-    def _build_tool_data(
-        tools: Sequence[LLMTool],
-    ) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, Callable[..., Any]]]:
-        tool_specs: list[dict[str, Any]] = []
-        models_by_name: dict[str, Any] = {}
-        callbacks_by_name: dict[str, Callable[..., Any]] = {}
-
-        for tool in tools:
-            if tool.name is None:
-                raise ValueError("LLM tool name cannot be None")
-            tool_name = tool.name
-            tool_spec, model = build_tool_spec_from_callable(
-                tool.callback,
-                tool_name=tool_name,
-                description=tool.description,
-            )
-            tool_specs.append(tool_spec)
-            models_by_name[tool_name] = model
-            callbacks_by_name[tool_name] = tool.callback
-        return tool_specs, models_by_name, callbacks_by_name
+        request = await self.prepare_usecase(
+            system_prompt, ask_prompt, tools, metadata=metadata
+        )
+        return request.payload
@@ -1,8 +1,9 @@
 import asyncio
 import json
 import re
+from collections.abc import AsyncIterator, Iterable, Mapping
 from datetime import UTC, datetime
-from functools import lru_cache
+from functools import lru_cache, partial
 from typing import Any, cast
 from uuid import UUID
 from zoneinfo import ZoneInfo
@@ -14,7 +15,10 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from loguru import logger
 
-from lykke.application.gateways.google_protocol import GoogleCalendarGatewayProtocol
+from lykke.application.gateways.google_protocol import (
+    CalendarEventPage,
+    GoogleCalendarGatewayProtocol,
+)
 from lykke.core.config import settings
 from lykke.core.exceptions import TokenExpiredError
 from lykke.domain import value_objects
@@ -46,6 +50,9 @@ REDIRECT_URIS: dict[str, str] = {
     "calendar": _build_redirect_uri("/api/google/callback/calendar"),
 }
 
+# Requests per Google API batch; Google recommends at most 50.
+BATCH_REQUEST_SIZE = 50
+
 
 def _parse_recurrence_frequency(
     recurrence: list[str] | None,
@@ -135,6 +142,120 @@ class GoogleCalendarGateway(GoogleCalendarGatewayProtocol):
             return None
         return event_id[: match.start()]
 
+    @staticmethod
+    def _recurring_event_id(event: dict[str, Any]) -> str | None:
+        """Return the id of the recurring event an instance belongs to."""
+        recurring_event_id = event.get("recurringEventId")
+        if not recurring_event_id and isinstance(event.get("id"), str):
+            recurring_event_id = GoogleCalendarGateway._derive_recurring_event_id(
+                event["id"]
+            )
+        return recurring_event_id
+
+    @staticmethod
+    def _batch_get_events_sync(
+        service: Any,
+        calendar_id: str,
+        event_ids: Iterable[str],
+    ) -> tuple[dict[str, dict[str, Any] | None], dict[str, HttpError]]:
+        """Fetch events by id through Google API batch requests.
+
+        Returns the fetched events, with None for ids that returned 404, and
+        the other per-item errors keyed by event id.
+        """
+        fetched: dict[str, dict[str, Any] | None] = {}
+        errors: dict[str, HttpError] = {}
+
+        def collect(
+            event_id: str,
+            _request_id: str,
+            response: dict[str, Any] | None,
+            exception: HttpError | None,
+        ) -> None:
+            if exception is None:
+                fetched[event_id] = response
+            elif exception.resp.status == 404:
+                fetched[event_id] = None
+            else:
+                errors[event_id] = exception
+
+        ids = list(dict.fromkeys(event_ids))
+        for start in range(0, len(ids), BATCH_REQUEST_SIZE):
+            batch = service.new_batch_http_request()
+            for event_id in ids[start : start + BATCH_REQUEST_SIZE]:
+                batch.add(
+                    service.events().get(calendarId=calendar_id, eventId=event_id),
+                    callback=partial(collect, event_id),
+                )
+            batch.execute()
+        return fetched, errors
+
+    def _prefetch_recurrence_frequencies_sync(
+        self,
+        service: Any,
+        calendar_id: str,
+        events: Iterable[dict[str, Any]],
+        frequency_cache: dict[str, value_objects.TaskFrequency],
+        fetched_events: dict[str, dict[str, Any] | None],
+    ) -> None:
+        """Batch-fetch the parents of recurring instances into ``frequency_cache``.
+
+        Fetched parents are kept in ``fetched_events`` for the series master
+        pass, which needs the same events.
+        """
+        parent_ids = self._parent_event_ids(events, frequency_cache)
+        missing = parent_ids - fetched_events.keys()
+        errors: dict[str, HttpError] = {}
+        if missing:
+            try:
+                fetched, errors = self._batch_get_events_sync(
+                    service, calendar_id, sorted(missing)
+                )
+            except Exception as exc:
+                # _determine_frequency falls back to one lookup per parent.
+                logger.warning(f"Failed to batch-fetch parent events: {exc}")
+                return
+            fetched_events.update(fetched)
+        self._cache_parent_frequencies(
+            parent_ids, frequency_cache, fetched_events, errors
+        )
+
+    def _parent_event_ids(
+        self,
+        events: Iterable[dict[str, Any]],
+        frequency_cache: dict[str, value_objects.TaskFrequency],
+    ) -> set[str]:
+        """Return the uncached parents of the recurring instances in ``events``."""
+        return {
+            recurring_event_id
+            for event in events
+            if not event.get("recurrence")
+            and (recurring_event_id := self._recurring_event_id(event))
+            and recurring_event_id not in frequency_cache
+        }
+
+    @staticmethod
+    def _cache_parent_frequencies(
+        parent_ids: Iterable[str],
+        frequency_cache: dict[str, value_objects.TaskFrequency],
+        fetched_events: dict[str, dict[str, Any] | None],
+        errors: Mapping[str, Exception],
+    ) -> None:
+        """Record the recurrence frequency of each fetched parent event."""
+        for parent_id, exc in errors.items():
+            logger.warning(f"Failed to fetch parent event {parent_id}: {exc}")
+            frequency_cache[parent_id] = value_objects.TaskFrequency.ONCE
+
+        for parent_id in parent_ids:
+            if parent_id in frequency_cache or parent_id not in fetched_events:
+                continue
+            parent_event = fetched_events[parent_id]
+            if parent_event is None:
+                logger.warning(f"Failed to fetch parent event {parent_id}: not found")
+            frequency_cache[parent_id] = _parse_recurrence_frequency(
+                parent_event.get("recurrence") if parent_event else None
+            )
+
     @staticmethod
     def _client_config_from_env() -> dict[str, Any] | None:
         """Return OAuth client config from env if provided."""
@@ -182,6 +303,24 @@ class GoogleCalendarGateway(GoogleCalendarGatewayProtocol):
 
         return datetime.now(UTC)
 
+    @staticmethod
+    def _is_all_day(value: dict[str, Any] | None) -> bool:
+        """Return whether a Google start/end dict is a date without a time."""
+        return value is not None and "date" in value and "dateTime" not in value
+
+    @classmethod
+    def _series_timezone(
+        cls, start: dict[str, Any] | None, fallback_timezone: str
+    ) -> str | None:
+        """Return the zone Google expands a series' recurrence in.
+
+        Timed events carry it as ``start.timeZone``. All-day starts have no
+        zone; they were anchored at midnight in ``fallback_timezone``.
+        """
+        if start and start.get("timeZone"):
+            return str(start["timeZone"])
+        return fallback_timezone if cls._is_all_day(start) else None
+
     def _google_event_to_entity(
         self,
         calendar: CalendarEntity,
@@ -193,9 +332,7 @@ class GoogleCalendarGateway(GoogleCalendarGatewayProtocol):
         """Convert a Google API event dict to CalendarEntryEntity and optional series."""
         status = event.get("status", "confirmed")
         recurrence = event.get("recurrence")
-        recurring_event_id = event.get("recurringEventId")
-        if not recurring_event_id and isinstance(event.get("id"), str):
-            recurring_event_id = self._derive_recurring_event_id(event["id"])
+        recurring_event_id = self._recurring_event_id(event)
         has_recurrence = (
             bool(recurrence)
             or bool(recurring_event_id)
@@ -273,6 +410,8 @@ class GoogleCalendarGateway(GoogleCalendarGatewayProtocol):
                 recurrence=recurrence or [],
                 starts_at=start_dt,
                 ends_at=end_dt,
+                timezone=self._series_timezone(event.get("start"), fallback_timezone),
+                is_all_day=self._is_all_day(event.get("start")),
                 created_at=created_dt,
                 updated_at=updated_dt,
                 ical_uid=series_ical,
@@ -393,6 +532,10 @@ class GoogleCalendarGateway(GoogleCalendarGatewayProtocol):
             recurrence=recurrence,
             starts_at=start_dt,
             ends_at=end_dt,
+            timezone=self._series_timezone(
+                master_event.get("start"), fallback_timezone
+            ),
+            is_all_day=self._is_all_day(master_event.get("start")),
             created_at=created_dt,
             updated_at=updated_dt,
             ical_uid=ical_uid,
@@ -409,31 +552,16 @@ class GoogleCalendarGateway(GoogleCalendarGatewayProtocol):
         page_token: str | None = None
 
         while True:
-            params: dict[str, Any] = {
-                "calendarId": calendar.platform_id,
-                "showDeleted": True,
-                "singleEvents": False,
-                "maxResults": 2500,
-            }
-            if sync_token:
-                params["syncToken"] = sync_token
-            else:
-                params["timeMin"] = lookback.astimezone(UTC).isoformat()
-
+            params = self._list_events_params(
+                calendar, lookback, sync_token, single_events=False
+            )
             if page_token:
                 params["pageToken"] = page_token
 
             response = service.events().list(**params).execute()
-
-            for event in response.get("items", []):
-                if event.get("status") != "cancelled":
-                    continue
-                event_id = event.get("id")
-                if not isinstance(event_id, str):
-                    continue
-                cancelled_series_ids.add(
-                    CalendarEntrySeriesEntity.id_from_platform("google", event_id)
-                )
+            cancelled_series_ids |= self._cancelled_series_ids(
+                response.get("items", [])
+            )
 
             page_token = response.get("nextPageToken")
             if not page_token:
@@ -441,6 +569,42 @@ class GoogleCalendarGateway(GoogleCalendarGatewayProtocol):
 
         return cancelled_series_ids
 
+    @staticmethod
+    def _list_events_params(
+        calendar: CalendarEntity,
+        lookback: datetime,
+        sync_token: str | None,
+        *,
+        single_events: bool,
+    ) -> dict[str, Any]:
+        """Build ``events.list`` parameters for a full or incremental listing."""
+        params: dict[str, Any] = {
+            "calendarId": calendar.platform_id,
+            "showDeleted": True,
+            "singleEvents": single_events,
+            "maxResults": 2500,
+        }
+        if sync_token:
+            params["syncToken"] = sync_token
+        else:
+            params["timeMin"] = lookback.astimezone(UTC).isoformat()
+        return params
+
+    @staticmethod
+    def _cancelled_series_ids(items: Iterable[dict[str, Any]]) -> set[UUID]:
+        """Return the series ids of cancelled recurring masters in ``items``."""
+        cancelled_series_ids: set[UUID] = set()
+        for event in items:
+            if event.get("status") != "cancelled":
+                continue
+            event_id = event.get("id")
+            if not isinstance(event_id, str):
+                continue
+            cancelled_series_ids.add(
+                CalendarEntrySeriesEntity.id_from_platform("google", event_id)
+            )
+        return cancelled_series_ids
+
     async def load_calendar_events(
         self,
         calendar: CalendarEntity,
@@ -456,7 +620,7 @@ class GoogleCalendarGateway(GoogleCalendarGatewayProtocol):
         list[UUID],
         str | None,
     ]:
-        """Load calendar entries and series from Google Calendar (full or incremental).
+        """Load every page of a listing at once (full or incremental).
 
         Args:
             calendar: The calendar to load entries from.
@@ -466,18 +630,66 @@ class GoogleCalendarGateway(GoogleCalendarGatewayProtocol):
         Returns:
             Tuple of (new/updated entries, deleted entries, series, next sync token).
         """
+        return self._merge_event_pages(
+            [
+                page
+                async for page in self.iter_calendar_event_pages(
+                    calendar,
+                    lookback,
+                    token,
+                    user_timezone=user_timezone,
+                    sync_token=sync_token,
+                )
+            ]
+        )
+
+    async def iter_calendar_event_pages(
+        self,
+        calendar: CalendarEntity,
+        lookback: datetime,
+        token: AuthTokenEntity,
+        *,
+        user_timezone: str | None = None,
+        sync_token: str | None = None,
+        page_token: str | None = None,
+    ) -> AsyncIterator[CalendarEventPage]:
+        """Stream calendar entries and series page by page.
+
+        Each page is fetched and converted in a worker thread only when the
+        previous one has been consumed.
+        """
+        frequency_cache: dict[str, value_objects.TaskFrequency] = {}
+        fetched_events: dict[str, dict[str, Any] | None] = {}
         try:
-            return await asyncio.to_thread(
-                self._load_calendar_events_sync,
-                calendar,
-                lookback,
-                token,
-                user_timezone,
-                sync_token,
-            )
+            service = await asyncio.to_thread(self._build_calendar_service, token)
+            while True:
+                page = await asyncio.to_thread(
+                    partial(
+                        self._load_event_page_sync,
+                        service,
+                        calendar,
+                        lookback,
+                        user_timezone=user_timezone,
+                        sync_token=sync_token,
+                        page_token=page_token,
+                        frequency_cache=frequency_cache,
+                        fetched_events=fetched_events,
+                    )
+                )
+                yield page
+                page_token = page.next_page_token
+                if page_token is None:
+                    return
         except RefreshError as exc:
             raise TokenExpiredError("User needs to re-authenticate") from exc
 
+    def _build_calendar_service(self, token: AuthTokenEntity) -> Any:
+        """Build a Calendar API client authorized with ``token``."""
+        credentials = token.google_credentials()
+        if credentials.expired and credentials.refresh_token:
+            credentials.refresh(Request())
+        return build("calendar", "v3", credentials=credentials)
+
     def _load_calendar_events_sync(
         self,
         calendar: CalendarEntity,
@@ -492,115 +704,195 @@ class GoogleCalendarGateway(GoogleCalendarGatewayProtocol):
         list[UUID],
         str | None,
     ]:
-        """Fetch events using Google API with support for sync tokens."""
-        credentials = token.google_credentials()
-        if credentials.expired and credentials.refresh_token:
-            credentials.refresh(Request())
-
-        service = build("calendar", "v3", credentials=credentials)
-        events: list[CalendarEntryEntity] = []
-        deleted: list[CalendarEntryEntity] = []
-        series_entities: dict[UUID, CalendarEntrySeriesEntity] = {}
+        """Fetch every page of a listing using Google API."""
+        service = self._build_calendar_service(token)
         frequency_cache: dict[str, value_objects.TaskFrequency] = {}
-        next_sync_token: str | None = None
+        fetched_events: dict[str, dict[str, Any] | None] = {}
+        pages: list[CalendarEventPage] = []
         page_token: str | None = None
 
         while True:
-            params: dict[str, Any] = {
-                "calendarId": calendar.platform_id,
-                "showDeleted": True,
-                "singleEvents": True,
-                "maxResults": 2500,
-            }
-            if sync_token:
-                params["syncToken"] = sync_token
-            else:
-                params["timeMin"] = lookback.astimezone(UTC).isoformat()
+            page = self._load_event_page_sync(
+                service,
+                calendar,
+                lookback,
+                user_timezone=user_timezone,
+                sync_token=sync_token,
+                page_token=page_token,
+                frequency_cache=frequency_cache,
+                fetched_events=fetched_events,
+            )
+            pages.append(page)
+            page_token = page.next_page_token
+            if page_token is None:
+                return self._merge_event_pages(pages)
 
-            if page_token:
-                params["pageToken"] = page_token
+    def _load_event_page_sync(
+        self,
+        service: Any,
+        calendar: CalendarEntity,
+        lookback: datetime,
+        *,
+        user_timezone: str | None,
+        sync_token: str | None,
+        page_token: str | None,
+        frequency_cache: dict[str, value_objects.TaskFrequency],
+        fetched_events: dict[str, dict[str, Any] | None],
+    ) -> CalendarEventPage:
+        """Fetch and convert one ``events.list`` page.
 
-            response = service.events().list(**params).execute()
-            recurrence_lookup = service
-
-            for event in response.get("items", []):
-                entry, series_entity = self._google_event_to_entity(
-                    calendar=calendar,
-                    event=event,
-                    frequency_cache=frequency_cache,
-                    recurrence_lookup=recurrence_lookup,
-                    user_timezone=user_timezone,
-                )
-                if series_entity:
-                    existing_series = series_entities.get(series_entity.id)
-                    if (
-                        existing_series is None
-                        or series_entity.updated_at > existing_series.updated_at
-                    ):
-                        series_entities[series_entity.id] = series_entity
-                if entry.status == "cancelled":
-                    deleted.append(entry)
-                else:
-                    events.append(entry)
-
-            next_sync_token = response.get("nextSyncToken", next_sync_token)
-            page_token = response.get("nextPageToken")
-            if not page_token:
-                break
+        ``frequency_cache`` and ``fetched_events`` carry parent and master
+        lookups across the pages of one listing.
+        """
+        params = self._list_events_params(
+            calendar, lookback, sync_token, single_events=True
+        )
+        if page_token:
+            params["pageToken"] = page_token
+
+        response = service.events().list(**params).execute()
+        items = response.get("items", [])
+        self._prefetch_recurrence_frequencies_sync(
+            service,
+            calendar.platform_id,
+            items,
+            frequency_cache,
+            fetched_events,
+        )
+        events: list[CalendarEntryEntity] = []
+        deleted: list[CalendarEntryEntity] = []
+        series_entities: dict[UUID, CalendarEntrySeriesEntity] = {}
+        self._collect_events(
+            calendar,
+            items,
+            frequency_cache=frequency_cache,
+            recurrence_lookup=service,
+            user_timezone=user_timezone,
+            events=events,
+            deleted=deleted,
+            series_entities=series_entities,
+        )
 
         # Authoritative series state from master events: fetch each touched series
         # master; 404 or status cancelled => tombstone; else overwrite series from master.
-        recurring_master_platform_ids = {
-            s.platform_id for s in series_entities.values()
-        }
+        unfetched = self._series_master_ids(series_entities) - fetched_events.keys()
+        if unfetched:
+            fetched, errors = self._batch_get_events_sync(
+                service, calendar.platform_id, sorted(unfetched)
+            )
+            if errors:
+                raise next(iter(errors.values()))
+            fetched_events.update(fetched)
+
+        cancelled_series_ids = self._apply_series_masters(
+            calendar, series_entities, fetched_events
+        )
+
+        next_page_token = response.get("nextPageToken")
+        if not next_page_token:
+            cancelled_series_ids |= self._load_cancelled_series_ids_sync(
+                service=service,
+                calendar=calendar,
+                lookback=lookback,
+                sync_token=sync_token,
+            )
+
+        return CalendarEventPage(
+            entries=events,
+            deleted_entries=deleted,
+            series=list(series_entities.values()),
+            cancelled_series_ids=list(cancelled_series_ids),
+            next_page_token=next_page_token or None,
+            next_sync_token=response.get("nextSyncToken"),
+        )
+
+    @staticmethod
+    def _merge_event_pages(
+        pages: list[CalendarEventPage],
+    ) -> tuple[
+        list[CalendarEntryEntity],
+        list[CalendarEntryEntity],
+        list[CalendarEntrySeriesEntity],
+        list[UUID],
+        str | None,
+    ]:
+        """Combine the pages of one listing into a single result."""
+        series_entities: dict[UUID, CalendarEntrySeriesEntity] = {}
+        cancelled_series_ids: set[UUID] = set()
+        for page in pages:
+            series_entities.update((series.id, series) for series in page.series)
+            cancelled_series_ids.update(page.cancelled_series_ids)
+        return (
+            [entry for page in pages for entry in page.entries],
+            [entry for page in pages for entry in page.deleted_entries],
+            list(series_entities.values()),
+            list(cancelled_series_ids),
+            pages[-1].next_sync_token if pages else None,
+        )
+
+    def _collect_events(
+        self,
+        calendar: CalendarEntity,
+        items: Iterable[dict[str, Any]],
+        *,
+        frequency_cache: dict[str, value_objects.TaskFrequency],
+        recurrence_lookup: Any,
+        user_timezone: str | None,
+        events: list[CalendarEntryEntity],
+        deleted: list[CalendarEntryEntity],
+        series_entities: dict[UUID, CalendarEntrySeriesEntity],
+    ) -> None:
+        """Convert one page of listed events into entries and series."""
+        for event in items:
+            entry, series_entity = self._google_event_to_entity(
+                calendar=calendar,
+                event=event,
+                frequency_cache=frequency_cache,
+                recurrence_lookup=recurrence_lookup,
+                user_timezone=user_timezone,
+            )
+            if series_entity:
+                existing_series = series_entities.get(series_entity.id)
+                if (
+                    existing_series is None
+                    or series_entity.updated_at > existing_series.updated_at
+                ):
+                    series_entities[series_entity.id] = series_entity
+            if entry.status == "cancelled":
+                deleted.append(entry)
+            else:
+                events.append(entry)
+
+    @staticmethod
+    def _series_master_ids(
+        series_entities: dict[UUID, CalendarEntrySeriesEntity],
+    ) -> set[str]:
+        """Return the platform ids of the masters of the touched series."""
+        return {s.platform_id for s in series_entities.values()}
+
+    def _apply_series_masters(
+        self,
+        calendar: CalendarEntity,
+        series_entities: dict[UUID, CalendarEntrySeriesEntity],
+        fetched_events: dict[str, dict[str, Any] | None],
+    ) -> set[UUID]:
+        """Overwrite series from their fetched masters and return tombstoned ids."""
         cancelled_from_masters: set[UUID] = set()
-        for master_platform_id in recurring_master_platform_ids:
-            try:
-                master_event = (
-                    service.events()
-                    .get(
-                        calendarId=calendar.platform_id,
-                        eventId=master_platform_id,
-                    )
-                    .execute()
-                )
-            except HttpError as exc:
-                if exc.resp.status == 404:
-                    cancelled_from_masters.add(
-                        CalendarEntrySeriesEntity.id_from_platform(
-                            "google", master_platform_id
-                        )
-                    )
-                else:
-                    raise
-                continue
-            if master_event.get("status") == "cancelled":
+        for master_platform_id in self._series_master_ids(series_entities):
+            master_event = fetched_events[master_platform_id]
+            if master_event is None or master_event.get("status") == "cancelled":
                 series_id_tombstone = CalendarEntrySeriesEntity.id_from_platform(
                     "google", master_platform_id
                 )
                 cancelled_from_masters.add(series_id_tombstone)
-                series_entities.pop(series_id_tombstone, None)
+                if master_event is not None:
+                    series_entities.pop(series_id_tombstone, None)
                 continue
             series_from_master = self._master_event_to_series_entity(
                 calendar, master_event
             )
             series_entities[series_from_master.id] = series_from_master
-
-        cancelled_series_ids = self._load_cancelled_series_ids_sync(
-            service=service,
-            calendar=calendar,
-            lookback=lookback,
-            sync_token=sync_token,
-        )
-        cancelled_series_ids |= cancelled_from_masters
-
-        return (
-            events,
-            deleted,
-            list(series_entities.values()),
-            list(cancelled_series_ids),
-            next_sync_token,
-        )
+        return cancelled_from_masters
 
     def _subscribe_to_calendar_sync(
         self,
@@ -0,0 +1,497 @@
+"""Native asyncio gateway for the Google Calendar v3 REST API.
+
+``GoogleCalendarGateway`` runs the blocking ``googleapiclient`` in
+``asyncio.to_thread`` and builds a discovery-based client on every call, so
+sync throughput is capped by the default thread pool. This gateway speaks
+the REST API directly over an aiohttp session (the worker runtime's shared
+one, so connections stay alive across calls) and reuses the base gateway's
+event conversion. ``GoogleCalendarGateway`` remains the fallback when
+``GOOGLE_CALENDAR_NATIVE_CLIENT`` is off.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable
+from contextlib import aclosing, asynccontextmanager
+from datetime import UTC, datetime
+from typing import Any
+from urllib.parse import quote
+from uuid import UUID
+
+import aiohttp
+import httplib2  # type: ignore[import-untyped]
+from googleapiclient.errors import HttpError
+from loguru import logger
+
+from lykke.application.gateways.google_protocol import CalendarEventPage
+from lykke.core.exceptions import TokenExpiredError
+from lykke.domain import value_objects
+from lykke.domain.entities import (
+    AuthTokenEntity,
+    CalendarEntity,
+    CalendarEntryEntity,
+    CalendarEntrySeriesEntity,
+)
+
+from .google import GoogleCalendarGateway
+
+CALENDAR_API_URL = "https://www.googleapis.com/calendar/v3"
+DEFAULT_TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+MAX_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 0.5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+# Event lookups in flight per calendar sync.
+FETCH_CONCURRENCY = 10
+# Refresh access tokens this long before Google expires them.
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+# Cached refreshed access tokens, oldest first, evicted beyond this many.
+MAX_CACHED_ACCESS_TOKENS = 10_000
+
+# Refreshed access tokens per auth token id: (access token, expiry epoch).
+_access_tokens: dict[UUID, tuple[str, float]] = {}
+
+
+def _cache_access_token(token_id: UUID, access_token: str, expires_at: float) -> None:
+    """Cache a refreshed access token, evicting expired and excess entries."""
+    now = time.time()
+    for cached_id in [
+        cached_id
+        for cached_id, (_, cached_expiry) in _access_tokens.items()
+        if cached_expiry <= now
+    ]:
+        del _access_tokens[cached_id]
+    _access_tokens.pop(token_id, None)
+    _access_tokens[token_id] = (access_token, expires_at)
+    while len(_access_tokens) > MAX_CACHED_ACCESS_TOKENS:
+        del _access_tokens[next(iter(_access_tokens))]
+
+
+def _discard(task: asyncio.Future[Any]) -> None:
+    """Cancel ``task`` if still running, otherwise consume its outcome."""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+class _Authorization:
+    """Access token for one auth token, refreshed on expiry or on a 401."""
+
+    def __init__(self, token: AuthTokenEntity) -> None:
+        self._token = token
+        self._refresh_lock = asyncio.Lock()
+
+    async def access_token(self, session: aiohttp.ClientSession) -> str:
+        cached = _access_tokens.get(self._token.id)
+        if cached is not None and cached[1] > time.time():
+            return cached[0]
+        expires_at = self._token.expires_at
+        if (
+            expires_at is not None
+            and expires_at <= datetime.now(UTC)
+            and self._token.refresh_token
+        ):
+            return await self.refresh(session)
+        return self._token.token
+
+    async def refresh(
+        self, session: aiohttp.ClientSession, rejected: str | None = None
+    ) -> str:
+        """Exchange the refresh token for a new access token.
+
+        Concurrent requests rejected with the same token share one refresh.
+        """
+        async with self._refresh_lock:
+            cached = _access_tokens.get(self._token.id)
+            if cached is not None and cached[0] != rejected and cached[1] > time.time():
+                return cached[0]
+            return await self._refresh(session)
+
+    async def _refresh(self, session: aiohttp.ClientSession) -> str:
+        if not self._token.refresh_token:
+            raise TokenExpiredError("User needs to re-authenticate")
+
+        payload = {
+            "grant_type": "refresh_token",
+            "refresh_token": self._token.refresh_token,
+            "client_id": self._token.client_id or "",
+            "client_secret": self._token.client_secret or "",
+        }
+        async with session.post(
+            self._token.token_uri or DEFAULT_TOKEN_URI,
+            data=payload,
+            timeout=REQUEST_TIMEOUT,
+        ) as response:
+            body = await response.json(content_type=None)
+        if response.status in (400, 401):
+            raise TokenExpiredError("User needs to re-authenticate")
+        if response.status >= 400:
+            raise HttpError(
+                httplib2.Response({"status": response.status}),
+                json.dumps(body).encode(),
+                uri=self._token.token_uri or DEFAULT_TOKEN_URI,
+            )
+
+        access_token = str(body["access_token"])
+        expires_in = float(body.get("expires_in", 3600))
+        _cache_access_token(
+            self._token.id,
+            access_token,
+            time.time() + expires_in - TOKEN_EXPIRY_MARGIN_SECONDS,
+        )
+        return access_token
+
+
+class AsyncGoogleCalendarGateway(GoogleCalendarGateway):
+    """Gateway for the Google Calendar API over a pooled aiohttp session."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None = None,
+        *,
+        api_url: str = CALENDAR_API_URL,
+    ) -> None:
+        """Initialize the gateway.
+
+        Args:
+            session: Optional shared HTTP session. When None, a session is
+                opened per call.
+            api_url: Base URL of the Calendar v3 API.
+        """
+        self._session = session
+        self._api_url = api_url.rstrip("/")
+
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        if self._session is not None:
+            yield self._session
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
+    @staticmethod
+    def _is_retryable(status: int, body: bytes) -> bool:
+        if status in RETRY_STATUSES:
+            return True
+        if status != 403:
+            return False
+        try:
+            errors = json.loads(body)["error"]["errors"]
+        except (ValueError, KeyError, TypeError):
+            return False
+        return any(error.get("reason") in RATE_LIMIT_REASONS for error in errors)
+
+    @staticmethod
+    async def _backoff(attempt: int) -> None:
+        delay = BACKOFF_BASE_SECONDS * 2**attempt
+        await asyncio.sleep(delay + random.uniform(0, delay))
+
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        auth: _Authorization,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        body: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Call the API, refreshing the token once and retrying transient errors.
+
+        Errors are raised as ``HttpError`` so callers handle them exactly as
+        with ``GoogleCalendarGateway``.
+        """
+        url = f"{self._api_url}{path}"
+        query = {
+            key: str(value).lower() if isinstance(value, bool) else str(value)
+            for key, value in (params or {}).items()
+        }
+        refreshed = False
+        attempt = 0
+        while True:
+            access_token = await auth.access_token(session)
+            headers = {"Authorization": f"Bearer {access_token}"}
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    params=query,
+                    json=body,
+                    headers=headers,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response:
+                    status = response.status
+                    content = await response.read()
+            except (aiohttp.ClientError, TimeoutError) as exc:
+                attempt += 1
+                if attempt >= MAX_ATTEMPTS:
+                    raise
+                logger.warning(f"Google API {method} {path} failed: {exc}, retrying")
+                await self._backoff(attempt - 1)
+                continue
+
+            if status < 400:
+                return json.loads(content) if content else {}
+            if status == 401 and not refreshed:
+                refreshed = True
+                await auth.refresh(session, rejected=access_token)
+                continue
+            attempt += 1
+            if attempt < MAX_ATTEMPTS and self._is_retryable(status, content):
+                logger.warning(
+                    f"Google API {method} {path} returned {status}, retrying"
+                )
+                await self._backoff(attempt - 1)
+                continue
+            raise HttpError(httplib2.Response({"status": status}), content, uri=url)
+
+    @staticmethod
+    def _events_path(calendar_id: str, event_id: str | None = None) -> str:
+        path = f"/calendars/{quote(calendar_id, safe='')}/events"
+        if event_id is not None:
+            path = f"{path}/{quote(event_id, safe='')}"
+        return path
+
+    async def _iter_event_pages(
+        self,
+        session: aiohttp.ClientSession,
+        auth: _Authorization,
+        params: dict[str, Any],
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield ``events.list`` pages, fetching the next while one is processed."""
+        query = dict(params)
+        path = self._events_path(query.pop("calendarId"))
+        pending = asyncio.ensure_future(
+            self._request(session, auth, "GET", path, params=query)
+        )
+        try:
+            while True:
+                response = await pending
+                page_token = response.get("nextPageToken")
+                if page_token:
+                    pending = asyncio.ensure_future(
+                        self._request(
+                            session,
+                            auth,
+                            "GET",
+                            path,
+                            params={**query, "pageToken": page_token},
+                        )
+                    )
+                yield response
+                if not page_token:
+                    return
+        finally:
+            _discard(pending)
+
+    async def _get_events(
+        self,
+        session: aiohttp.ClientSession,
+        auth: _Authorization,
+        calendar_id: str,
+        event_ids: Iterable[str],
+    ) -> tuple[dict[str, dict[str, Any] | None], dict[str, HttpError]]:
+        """Fetch events by id concurrently over the session's kept-alive connections.
+
+        Returns the fetched events, with None for ids that returned 404, and
+        the other per-item errors keyed by event id.
+        """
+        fetched: dict[str, dict[str, Any] | None] = {}
+        errors: dict[str, HttpError] = {}
+        slots = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def get(event_id: str) -> None:
+            async with slots:
+                try:
+                    fetched[event_id] = await self._request(
+                        session,
+                        auth,
+                        "GET",
+                        self._events_path(calendar_id, event_id),
+                    )
+                except HttpError as exc:
+                    if exc.resp.status == 404:
+                        fetched[event_id] = None
+                    else:
+                        errors[event_id] = exc
+
+        await asyncio.gather(*(get(event_id) for event_id in dict.fromkeys(event_ids)))
+        return fetched, errors
+
+    async def _load_cancelled_series_ids(
+        self,
+        session: aiohttp.ClientSession,
+        auth: _Authorization,
+        calendar: CalendarEntity,
+        lookback: datetime,
+        sync_token: str | None,
+    ) -> set[UUID]:
+        cancelled_series_ids: set[UUID] = set()
+        params = self._list_events_params(
+            calendar, lookback, sync_token, single_events=False
+        )
+        async with aclosing(self._iter_event_pages(session, auth, params)) as pages:
+            async for response in pages:
+                cancelled_series_ids |= self._cancelled_series_ids(
+                    response.get("items", [])
+                )
+        return cancelled_series_ids
+
+    async def iter_calendar_event_pages(
+        self,
+        calendar: CalendarEntity,
+        lookback: datetime,
+        token: AuthTokenEntity,
+        *,
+        user_timezone: str | None = None,
+        sync_token: str | None = None,
+        page_token: str | None = None,
+    ) -> AsyncIterator[CalendarEventPage]:
+        """Stream calendar entries and series page by page.
+
+        The next page is requested while the caller handles the current one,
+        and the cancelled-master listing runs alongside the instance listing
+        (its result is added to the last page). Parents and masters of each
+        page's recurring instances are fetched concurrently.
+        """
+        auth = _Authorization(token)
+        async with self._get_session() as session:
+            cancelled_listing = asyncio.ensure_future(
+                self._load_cancelled_series_ids(
+                    session, auth, calendar, lookback, sync_token
+                )
+            )
+            try:
+                frequency_cache: dict[str, value_objects.TaskFrequency] = {}
+                fetched_events: dict[str, dict[str, Any] | None] = {}
+
+                params = self._list_events_params(
+                    calendar, lookback, sync_token, single_events=True
+                )
+                if page_token:
+                    params["pageToken"] = page_token
+                pages = self._iter_event_pages(session, auth, params)
+                async with aclosing(pages):
+                    async for response in pages:
+                        items = response.get("items", [])
+                        parent_ids = self._parent_event_ids(items, frequency_cache)
+                        fetched, errors = await self._get_events(
+                            session,
+                            auth,
+                            calendar.platform_id,
+                            sorted(parent_ids - fetched_events.keys()),
+                        )
+                        fetched_events.update(fetched)
+                        self._cache_parent_frequencies(
+                            parent_ids, frequency_cache, fetched_events, errors
+                        )
+                        events: list[CalendarEntryEntity] = []
+                        deleted: list[CalendarEntryEntity] = []
+                        series_entities: dict[UUID, CalendarEntrySeriesEntity] = {}
+                        self._collect_events(
+                            calendar,
+                            items,
+                            frequency_cache=frequency_cache,
+                            recurrence_lookup=None,
+                            user_timezone=user_timezone,
+                            events=events,
+                            deleted=deleted,
+                            series_entities=series_entities,
+                        )
+
+                        unfetched = (
+                            self._series_master_ids(series_entities)
+                            - fetched_events.keys()
+                        )
+                        fetched, errors = await self._get_events(
+                            session, auth, calendar.platform_id, sorted(unfetched)
+                        )
+                        if errors:
+                            raise next(iter(errors.values()))
+                        fetched_events.update(fetched)
+                        cancelled_series_ids = self._apply_series_masters(
+                            calendar, series_entities, fetched_events
+                        )
+
+                        next_page_token = response.get("nextPageToken") or None
+                        if next_page_token is None:
+                            cancelled_series_ids |= await cancelled_listing
+                        yield CalendarEventPage(
+                            entries=events,
+                            deleted_entries=deleted,
+                            series=list(series_entities.values()),
+                            cancelled_series_ids=list(cancelled_series_ids),
+                            next_page_token=next_page_token,
+                            next_sync_token=response.get("nextSyncToken"),
+                        )
+            finally:
+                _discard(cancelled_listing)
+
+    async def subscribe_to_calendar(
+        self,
+        calendar: CalendarEntity,
+        token: AuthTokenEntity,
+        webhook_url: str,
+        channel_id: str,
+        client_state: str,
+    ) -> value_objects.CalendarSubscription:
+        """Subscribe to push notifications for calendar updates."""
+        # The 'token' field is returned as X-Goog-Channel-Token in notifications
+        watch_body = {
+            "id": channel_id,
+            "type": "web_hook",
+            "address": webhook_url,
+            "token": client_state,
+        }
+        async with self._get_session() as session:
+            response = await self._request(
+                session,
+                _Authorization(token),
+                "POST",
+                f"{self._events_path(calendar.platform_id)}/watch",
+                body=watch_body,
+            )
+
+        # Parse expiration timestamp (milliseconds since epoch)
+        expiration_ms = int(response["expiration"])
+        return value_objects.CalendarSubscription(
+            channel_id=response["id"],
+            resource_id=response["resourceId"],
+            expiration=datetime.fromtimestamp(expiration_ms / 1000, tz=UTC),
+        )
+
+    async def unsubscribe_from_calendar(
+        self,
+        calendar: CalendarEntity,
+        token: AuthTokenEntity,
+        channel_id: str,
+        resource_id: str | None,
+    ) -> None:
+        """Unsubscribe from push notifications for calendar updates."""
+        stop_body = {"id": channel_id}
+        if resource_id:
+            stop_body["resourceId"] = resource_id
+        try:
+            async with self._get_session() as session:
+                await self._request(
+                    session,
+                    _Authorization(token),
+                    "POST",
+                    "/channels/stop",
+                    body=stop_body,
+                )
+        except HttpError as exc:
+            if exc.resp.status == 404:
+                logger.info(
+                    "Calendar channel already stopped or expired",
+                    channel_id=channel_id,
+                    resource_id=resource_id,
+                )
+                return
+            raise
@@ -14,9 +14,23 @@ from lykke.domain.value_objects.ai_chat import LLMProvider
 
 
 class InfraLLMGatewayFactory(LLMGatewayFactoryProtocol):
-    """Selects and constructs concrete LLM gateways based on provider."""
+    """Selects and constructs concrete LLM gateways based on provider.
+
+    Gateways are built once per provider and reused, so a long-lived factory
+    keeps a single set of provider HTTP clients.
+    """
+
+    def __init__(self) -> None:
+        self._gateways: dict[LLMProvider, LLMGatewayProtocol] = {}
 
     def create_gateway(self, provider: LLMProvider) -> LLMGatewayProtocol:
+        gateway = self._gateways.get(provider)
+        if gateway is None:
+            gateway = self._build_gateway(provider)
+            self._gateways[provider] = gateway
+        return gateway
+
+    def _build_gateway(self, provider: LLMProvider) -> LLMGatewayProtocol:
         match provider:
             case LLMProvider.ANTHROPIC:
                 if not settings.ANTHROPIC_API_KEY:
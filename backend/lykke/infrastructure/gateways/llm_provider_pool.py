@@ -0,0 +1,239 @@
+"""Process-wide state shared by the LLM provider gateways.
+
+Gateways are cheap to build, but the chat-model clients they call hold HTTP
+connection pools, so clients are created once per (provider, model) and
+shared. Every provider call takes a slot from a per-provider semaphore, so a
+provider brownout ties up at most ``LLM_PROVIDER_CONCURRENCY`` callers, and
+reports its outcome to a per-model circuit breaker that gateways consult to
+route around a failing model. Latency and token usage are accumulated per use
+case.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
+
+from loguru import logger
+
+from lykke.core.config import settings
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_T = TypeVar("_T")
+
+
+class CircuitBreaker:
+    """Error-rate circuit breaker over the most recent calls to one model.
+
+    The breaker opens once at least ``min_calls`` of the last ``window`` calls
+    are recorded and the share of failures reaches ``error_rate``. After
+    ``cooldown_seconds`` one trial call is let through; its outcome closes the
+    breaker or keeps it open for another cooldown.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        window: int,
+        min_calls: int,
+        error_rate: float,
+        cooldown_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self._outcomes: deque[bool] = deque(maxlen=max(window, 1))
+        self._min_calls = max(min_calls, 1)
+        self._error_rate = error_rate
+        self._cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._opened_at: float | None = None
+        self._trial_started_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being turned away."""
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Return whether a call may go to the model now."""
+        if self._opened_at is None:
+            return True
+        now = self._clock()
+        if now - self._opened_at < self._cooldown_seconds:
+            return False
+        # A trial that never reported back (e.g. cancelled) expires as well.
+        if (
+            self._trial_started_at is not None
+            and now - self._trial_started_at < self._cooldown_seconds
+        ):
+            return False
+        self._trial_started_at = now
+        return True
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of a call."""
+        if self._opened_at is not None:
+            if self._trial_started_at is None:
+                return
+            self._trial_started_at = None
+            if success:
+                self._opened_at = None
+                self._outcomes.clear()
+                logger.info(f"LLM circuit {self.name} closed")
+            else:
+                self._opened_at = self._clock()
+            return
+
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        if (
+            len(self._outcomes) >= self._min_calls
+            and failures / len(self._outcomes) >= self._error_rate
+        ):
+            self._opened_at = self._clock()
+            logger.warning(
+                f"LLM circuit {self.name} opened after {failures} failures "
+                f"in {len(self._outcomes)} calls"
+            )
+
+
+@dataclass
+class LLMUsageStats:
+    """Provider calls made for one use case."""
+
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+class LLMProviderPool:
+    """Shared clients, concurrency limits, circuit breakers and usage stats."""
+
+    _clients: ClassVar[dict[tuple[str, str], Any]] = {}
+    _semaphores: ClassVar[
+        dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]]
+    ] = {}
+    _breakers: ClassVar[dict[tuple[str, str], CircuitBreaker]] = {}
+    stats: ClassVar[dict[str, LLMUsageStats]] = {}
+
+    @classmethod
+    def client(cls, provider: str, model: str, build: Callable[[], _T]) -> _T:
+        """Return the shared client for ``model``, building it on first use."""
+        key = (provider, model)
+        client = cls._clients.get(key)
+        if client is None:
+            client = build()
+            cls._clients[key] = client
+        return client
+
+    @classmethod
+    def breaker(cls, provider: str, model: str) -> CircuitBreaker:
+        """Return the circuit breaker for ``model``."""
+        key = (provider, model)
+        breaker = cls._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                f"{provider}/{model}",
+                window=settings.LLM_CIRCUIT_WINDOW,
+                min_calls=settings.LLM_CIRCUIT_MIN_CALLS,
+                error_rate=settings.LLM_CIRCUIT_ERROR_RATE,
+                cooldown_seconds=settings.LLM_CIRCUIT_COOLDOWN_SECONDS,
+            )
+            cls._breakers[key] = breaker
+        return breaker
+
+    @classmethod
+    def route(cls, provider: str, models: list[str], *, critical: bool) -> str | None:
+        """Pick the first model whose circuit lets a call through.
+
+        When every circuit is open, critical use cases still go to the first
+        model (bounded by the provider semaphore and client timeout) while
+        non-critical ones are skipped.
+        """
+        for model in dict.fromkeys(models):
+            if cls.breaker(provider, model).allow():
+                return model
+        return models[0] if critical else None
+
+    @classmethod
+    async def invoke(
+        cls,
+        provider: str,
+        model: str,
+        usecase: str,
+        call: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Await ``call`` within a provider slot and record its outcome.
+
+        Raises TimeoutError when no slot frees up within
+        ``LLM_QUEUE_TIMEOUT_SECONDS``.
+        """
+        semaphore = cls._semaphore(provider)
+        async with asyncio.timeout(settings.LLM_QUEUE_TIMEOUT_SECONDS):
+            await semaphore.acquire()
+        started = time.perf_counter()
+        try:
+            result = await call()
+        except Exception:
+            cls._record(provider, model, usecase, started, None, success=False)
+            raise
+        finally:
+            semaphore.release()
+        usage = getattr(result, "usage_metadata", None)
+        cls._record(provider, model, usecase, started, usage, success=True)
+        return result
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop all clients, semaphores, breakers and stats."""
+        cls._clients.clear()
+        cls._semaphores.clear()
+        cls._breakers.clear()
+        cls.stats.clear()
+
+    @classmethod
+    def _semaphore(cls, provider: str) -> asyncio.Semaphore:
+        # Semaphores bind to the running loop on first contention, so each
+        # loop (one per worker process, several in tests) gets its own.
+        loop = asyncio.get_running_loop()
+        entry = cls._semaphores.get(provider)
+        if entry is None or entry[0] is not loop:
+            limit = max(settings.LLM_PROVIDER_CONCURRENCY, 1)
+            entry = (loop, asyncio.Semaphore(limit))
+            cls._semaphores[provider] = entry
+        return entry[1]
+
+    @classmethod
+    def _record(
+        cls,
+        provider: str,
+        model: str,
+        usecase: str,
+        started: float,
+        usage: Any,
+        *,
+        success: bool,
+    ) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        cls.breaker(provider, model).record(success)
+        stats = cls.stats.setdefault(usecase, LLMUsageStats())
+        stats.calls += 1
+        stats.errors += 0 if success else 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        if isinstance(usage, dict):
+            stats.input_tokens += int(usage.get("input_tokens") or 0)
+            stats.output_tokens += int(usage.get("output_tokens") or 0)
+        logger.debug(
+            f"LLM call to {provider}/{model} for {usecase} "
+            f"{'succeeded' if success else 'failed'} in {elapsed_ms:.0f}ms"
+        )
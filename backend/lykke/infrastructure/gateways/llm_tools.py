@@ -1,4 +1,4 @@
-"""Helpers for building LLM tool schemas from callables."""
+"""Helpers for building LLM tool schemas and provider requests."""
 
 from __future__ import annotations
 
@@ -7,8 +7,12 @@ from typing import TYPE_CHECKING, Any, cast, get_type_hints
 
 from pydantic import BaseModel, Field, create_model
 
+from lykke.application.gateways.llm_protocol import LLMPreparedRequest
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
+
+    from lykke.application.gateways.llm_protocol import LLMTool
 
 
 def build_tool_spec_from_callable(
@@ -47,3 +51,42 @@ def build_tool_spec_from_callable(
         "description": tool_description,
         "parameters": schema,
     }, model
+
+
+def build_tool_spec(tool: LLMTool) -> dict[str, Any]:
+    """Build the tool spec for ``tool`` from the args model it already has."""
+    if tool.name is None:
+        raise ValueError("LLM tool name cannot be None")
+    return {
+        "name": tool.name,
+        "description": tool.description or "Finalize the use case.",
+        "parameters": tool.args_model.model_json_schema(),
+    }
+
+
+def prepare_request(
+    system_prompt: str,
+    ask_prompt: str,
+    tools: Sequence[LLMTool],
+    *,
+    model_params: dict[str, Any],
+    metadata: dict[str, Any] | None = None,
+) -> LLMPreparedRequest:
+    """Build the request (and its snapshot payload) for one LLM run."""
+    tool_specs = [build_tool_spec(tool) for tool in tools]
+    return LLMPreparedRequest(
+        system_prompt=system_prompt,
+        ask_prompt=ask_prompt,
+        tools=tools,
+        tool_specs=tool_specs,
+        payload={
+            "request_messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": ask_prompt},
+            ],
+            "request_tools": tool_specs,
+            "request_tool_choice": "auto",
+            "request_model_params": model_params,
+        },
+        metadata=metadata,
+    )
@@ -2,7 +2,7 @@
 
 import inspect
 import json
-from collections.abc import Callable, Sequence
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 
@@ -12,13 +12,17 @@ from loguru import logger
 from pydantic import SecretStr
 
 from lykke.application.gateways.llm_protocol import (
+    LLMPreparedRequest,
     LLMTool,
     LLMToolCallResult,
     LLMToolRunResult,
 )
 from lykke.core.config import settings
 from lykke.core.utils.serialization import dataclass_to_json_dict
-from lykke.infrastructure.gateways.llm_tools import build_tool_spec_from_callable
+from lykke.infrastructure.gateways.llm_provider_pool import LLMProviderPool
+from lykke.infrastructure.gateways.llm_tools import prepare_request
+
+_PROVIDER = "openai"
 
 
 def _normalize_response_content(content: str | list[str | dict[str, Any]]) -> str:
@@ -150,15 +154,49 @@ def _coerce_json_safe(value: Any) -> Any:
         return str(value)
 
 
+def _chat_model(model: str) -> ChatOpenAI:
+    """Return the process-wide client for ``model``."""
+    return LLMProviderPool.client(
+        _PROVIDER,
+        model,
+        lambda: ChatOpenAI(
+            model=model,
+            api_key=SecretStr(settings.OPENAI_API_KEY),
+            temperature=0.7,
+            timeout=settings.LLM_REQUEST_TIMEOUT_SECONDS,
+            max_retries=settings.LLM_MAX_RETRIES,
+        ),
+    )
+
+
 class OpenAILLMGateway:
-    """OpenAI (ChatGPT) implementation of LLM gateway."""
+    """OpenAI (ChatGPT) implementation of LLM gateway.
+
+    Calls go through ``LLMProviderPool``; non-critical use cases are skipped
+    while the model's circuit is open.
+    """
 
     def __init__(self) -> None:
         """Initialize OpenAI LLM gateway."""
-        self._llm = ChatOpenAI(
-            model=settings.OPENAI_MODEL,
-            api_key=SecretStr(settings.OPENAI_API_KEY),
-            temperature=0.7,
+        self._llm = _chat_model(settings.OPENAI_MODEL)
+
+    async def prepare_usecase(
+        self,
+        system_prompt: str,
+        ask_prompt: str,
+        tools: Sequence[LLMTool],
+        metadata: dict[str, Any] | None = None,
+    ) -> LLMPreparedRequest:
+        """Build the request for this LLM use case once."""
+        return prepare_request(
+            system_prompt,
+            ask_prompt,
+            tools,
+            model_params={
+                "model": settings.OPENAI_MODEL,
+                "temperature": getattr(self._llm, "temperature", 0.7),
+            },
+            metadata=metadata,
         )
 
     async def run_usecase(
@@ -178,6 +216,20 @@ class OpenAILLMGateway:
         Returns:
             The tool call result or None if no completion was returned
         """
+        request = await self.prepare_usecase(
+            system_prompt, ask_prompt, tools, metadata=metadata
+        )
+        return await self.run_prepared(request)
+
+    async def run_prepared(
+        self, request: LLMPreparedRequest
+    ) -> LLMToolRunResult | None:
+        """Send a prepared request and return the tool call results."""
+        system_prompt = request.system_prompt
+        ask_prompt = request.ask_prompt
+        tools = request.tools
+        metadata = request.metadata
+
         started_at = datetime.now(UTC)
         status = "success"
         tool_results_payload: list[dict[str, Any]] = []
@@ -185,35 +237,36 @@ class OpenAILLMGateway:
         response_excerpt = ""
         response_length = 0
         error_info: dict[str, Any] | None = None
+        usecase = str((metadata or {}).get("usecase") or "unknown")
 
         try:
             if not tools:
                 raise ValueError("At least one tool must be provided")
 
-            tool_specs, models_by_name, callbacks_by_name = self._build_tool_data(
-                tools
-            )
-            request_payload = await self.preview_usecase(
-                system_prompt,
-                ask_prompt,
-                tools,
-                metadata=metadata,
-            )
-            request_messages = request_payload.get("request_messages", [])
+            if (
+                LLMProviderPool.route(
+                    _PROVIDER,
+                    [settings.OPENAI_MODEL],
+                    critical=bool((metadata or {}).get("critical", True)),
+                )
+                is None
+            ):
+                status = "circuit_open"
+                logger.warning(
+                    f"Skipping non-critical use case {usecase}: OpenAI circuit open"
+                )
+                return None
+
+            models_by_name = {tool.name: tool.args_model for tool in tools}
+            callbacks_by_name = {tool.name: tool.callback for tool in tools}
             messages = [
-                SystemMessage(
-                    content=request_messages[0]["content"]
-                    if len(request_messages) > 0
-                    else system_prompt
-                ),
-                HumanMessage(
-                    content=request_messages[1]["content"]
-                    if len(request_messages) > 1
-                    else ask_prompt
-                ),
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=ask_prompt),
             ]
-            llm = self._llm.bind_tools(tool_specs)
-            response = await llm.ainvoke(messages)
+            llm = self._llm.bind_tools(request.tool_specs)
+            response = await LLMProviderPool.invoke(
+                _PROVIDER, settings.OPENAI_MODEL, usecase, lambda: llm.ainvoke(messages)
+            )
 
             tool_calls = _extract_tool_calls_from_response(
                 response, list(models_by_name.keys())
@@ -277,7 +330,7 @@ class OpenAILLMGateway:
                 return None
             return LLMToolRunResult(
                 tool_results=tool_results,
-                request_payload=request_payload,
+                request_payload=request.payload,
             )
 
         except json.JSONDecodeError as e:
@@ -330,42 +383,7 @@ class OpenAILLMGateway:
         metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Preview the request payload for this LLM use case."""
-        _ = metadata
-        tool_specs, _, _ = self._build_tool_data(tools)
-        request_messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": ask_prompt},
-        ]
-        request_tool_choice = "auto"
-        request_model_params = {
-            "model": settings.OPENAI_MODEL,
-            "temperature": getattr(self._llm, "temperature", 0.7),
-        }
-        return {
-            "request_messages": request_messages,
-            "request_tools": [_coerce_json_safe(s) for s in tool_specs],
-            "request_tool_choice": request_tool_choice,
-            "request_model_params": request_model_params,
-        }
-
-    @staticmethod
-    def _build_tool_data(
-        tools: Sequence[LLMTool],
-    ) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, Callable[..., Any]]]:
-        tool_specs: list[dict[str, Any]] = []
-        models_by_name: dict[str, Any] = {}
-        callbacks_by_name: dict[str, Callable[..., Any]] = {}
-
-        for tool in tools:
-            if tool.name is None:
-                raise ValueError("LLM tool name cannot be None")
-            tool_name = tool.name
-            tool_spec, model = build_tool_spec_from_callable(
-                tool.callback,
-                tool_name=tool_name,
-                description=tool.description,
-            )
-            tool_specs.append(tool_spec)
-            models_by_name[tool_name] = model
-            callbacks_by_name[tool_name] = tool.callback
-        return tool_specs, models_by_name, callbacks_by_name
+        request = await self.prepare_usecase(
+            system_prompt, ask_prompt, tools, metadata=metadata
+        )
+        return request.payload
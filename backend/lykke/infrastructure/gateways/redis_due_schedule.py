@@ -0,0 +1,186 @@
+"""Redis sorted-set implementation of the due-schedule index."""
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import cast
+from uuid import UUID
+
+from loguru import logger
+from redis import asyncio as aioredis  # type: ignore
+
+from lykke.application.gateways.due_schedule_protocol import (
+    DueScheduleGatewayProtocol,
+)
+from lykke.core.config import settings
+from lykke.domain.value_objects import DueJobKind, DueScheduleEntry
+
+DUE_SCHEDULE_KEY = "due-schedule"
+CLAIMED_KEY = "due-schedule:claimed"
+# How long a claim may stay unsettled before its entry is due again.
+CLAIM_LEASE_SECONDS = 300
+
+
+class RedisDueScheduleGateway(DueScheduleGatewayProtocol):
+    """Due-schedule index stored in a single Redis sorted set.
+
+    Members are ``"{kind}:{user_id}"`` and scores are epoch seconds. Arming
+    uses ``ZADD LT`` so an earlier instant always replaces a later one; the
+    worst case for a stale score is a spurious wake-up, never a missed one.
+
+    Claimed entries move to a second sorted set scored by lease expiry, with
+    the original due instant kept in the member (``"{member}@{due}"``).
+    """
+
+    def __init__(self, redis_pool: aioredis.ConnectionPool | None = None) -> None:
+        """Initialize the gateway.
+
+        Args:
+            redis_pool: Optional shared Redis connection pool. If None, a new
+                connection is created lazily when needed.
+        """
+        self._redis: aioredis.Redis | None = None
+        self._redis_pool = redis_pool
+
+    async def _get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            if self._redis_pool is not None:
+                self._redis = aioredis.Redis(connection_pool=self._redis_pool)
+            else:
+                self._redis = await aioredis.from_url(settings.REDIS_URL)
+        return self._redis
+
+    @staticmethod
+    def _member(user_id: UUID, kind: DueJobKind) -> str:
+        return f"{kind.value}:{user_id}"
+
+    @staticmethod
+    def _parse_member(member: bytes | str) -> tuple[UUID, DueJobKind] | None:
+        raw = member.decode() if isinstance(member, bytes) else member
+        kind_value, _, user_id = raw.partition(":")
+        try:
+            return UUID(user_id), DueJobKind(kind_value)
+        except ValueError:
+            logger.warning(f"Ignoring malformed due-schedule member {raw!r}")
+            return None
+
+    async def arm_many(self, entries: Iterable[DueScheduleEntry]) -> None:
+        mapping: dict[str, float] = {}
+        for entry in entries:
+            member = self._member(entry.user_id, entry.kind)
+            score = entry.due_at.timestamp()
+            mapping[member] = min(score, mapping.get(member, score))
+        if not mapping:
+            return
+
+        redis = await self._get_redis()
+        await redis.zadd(DUE_SCHEDULE_KEY, mapping, lt=True)
+
+    @staticmethod
+    def _claim_member(entry: DueScheduleEntry) -> str:
+        member = RedisDueScheduleGateway._member(entry.user_id, entry.kind)
+        return f"{member}@{entry.due_at.timestamp()!r}"
+
+    async def claim_due(self, now: datetime) -> list[DueScheduleEntry]:
+        redis = await self._get_redis()
+        max_score = now.timestamp()
+        await self._requeue_expired_claims(redis, max_score)
+
+        members = cast(
+            "list[tuple[bytes | str, float]]",
+            await redis.zrangebyscore(
+                DUE_SCHEDULE_KEY, "-inf", max_score, withscores=True
+            ),
+        )
+        if not members:
+            return []
+
+        entries: list[DueScheduleEntry | None] = []
+        pipe = redis.pipeline(transaction=True)
+        for member, score in members:
+            pipe.zrem(DUE_SCHEDULE_KEY, member)
+            parsed = self._parse_member(member)
+            if parsed is None:
+                entries.append(None)
+                continue
+            entry = DueScheduleEntry(
+                user_id=parsed[0],
+                kind=parsed[1],
+                due_at=datetime.fromtimestamp(score, UTC),
+            )
+            entries.append(entry)
+            pipe.zadd(
+                CLAIMED_KEY,
+                {self._claim_member(entry): max_score + CLAIM_LEASE_SECONDS},
+            )
+        results = iter(await pipe.execute())
+
+        claimed: list[DueScheduleEntry] = []
+        for claim in entries:
+            removed = next(results)
+            if claim is None:
+                continue
+            next(results)
+            # A dispatcher that lost the race leaves at most a stray claim,
+            # which only causes a spurious wake-up once its lease expires.
+            if removed:
+                claimed.append(claim)
+        return claimed
+
+    async def ack(self, entries: Iterable[DueScheduleEntry]) -> None:
+        members = [self._claim_member(entry) for entry in entries]
+        if not members:
+            return
+        redis = await self._get_redis()
+        await redis.zrem(CLAIMED_KEY, *members)
+
+    async def release(self, entries: Iterable[DueScheduleEntry]) -> None:
+        released = list(entries)
+        if not released:
+            return
+        redis = await self._get_redis()
+        pipe = redis.pipeline(transaction=True)
+        pipe.zadd(
+            DUE_SCHEDULE_KEY,
+            {
+                self._member(entry.user_id, entry.kind): entry.due_at.timestamp()
+                for entry in released
+            },
+            lt=True,
+        )
+        pipe.zrem(CLAIMED_KEY, *(self._claim_member(entry) for entry in released))
+        await pipe.execute()
+
+    async def _requeue_expired_claims(
+        self, redis: aioredis.Redis, max_score: float
+    ) -> None:
+        expired = cast(
+            "list[bytes | str]",
+            await redis.zrangebyscore(CLAIMED_KEY, "-inf", max_score),
+        )
+        if not expired:
+            return
+
+        mapping: dict[str, float] = {}
+        for expired_claim in expired:
+            raw = (
+                expired_claim.decode()
+                if isinstance(expired_claim, bytes)
+                else expired_claim
+            )
+            member, _, due = raw.rpartition("@")
+            try:
+                mapping[member] = min(float(due), mapping.get(member, float(due)))
+            except ValueError:
+                logger.warning(f"Dropping malformed due-schedule claim {raw!r}")
+        logger.warning(f"Re-arming {len(expired)} expired due-schedule claims")
+
+        pipe = redis.pipeline(transaction=True)
+        if mapping:
+            pipe.zadd(DUE_SCHEDULE_KEY, mapping, lt=True)
+        pipe.zrem(CLAIMED_KEY, *expired)
+        await pipe.execute()
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
@@ -0,0 +1,75 @@
+"""Redis implementation of the LLM run fingerprint store."""
+
+from uuid import UUID
+
+from redis import asyncio as aioredis  # type: ignore
+
+from lykke.application.gateways.llm_run_fingerprint_protocol import (
+    LLMRunFingerprintGatewayProtocol,
+)
+from lykke.core.config import settings
+
+FINGERPRINT_KEY_PREFIX = "llm-fingerprint"
+FINGERPRINT_STATS_KEY = "llm-fingerprint-stats"
+
+
+class RedisLLMRunFingerprintGateway(LLMRunFingerprintGatewayProtocol):
+    """Last evaluated fingerprint per (use case, user) stored as expiring keys.
+
+    Hits and misses are counted in a single hash with ``"{usecase}:hits"`` and
+    ``"{usecase}:misses"`` fields.
+    """
+
+    def __init__(self, redis_pool: aioredis.ConnectionPool | None = None) -> None:
+        """Initialize the gateway.
+
+        Args:
+            redis_pool: Optional shared Redis connection pool. If None, a new
+                connection is created lazily when needed.
+        """
+        self._redis: aioredis.Redis | None = None
+        self._redis_pool = redis_pool
+
+    async def _get_redis(self) -> aioredis.Redis:
+        if self._redis is None:
+            if self._redis_pool is not None:
+                self._redis = aioredis.Redis(connection_pool=self._redis_pool)
+            else:
+                self._redis = await aioredis.from_url(settings.REDIS_URL)
+        return self._redis
+
+    @staticmethod
+    def _key(usecase: str, user_id: UUID) -> str:
+        return f"{FINGERPRINT_KEY_PREFIX}:{usecase}:{user_id}"
+
+    async def is_recent(self, usecase: str, user_id: UUID, fingerprint: str) -> bool:
+        redis = await self._get_redis()
+        stored = await redis.get(self._key(usecase, user_id))
+        if isinstance(stored, bytes):
+            stored = stored.decode()
+        hit = bool(stored == fingerprint)
+        field = f"{usecase}:{'hits' if hit else 'misses'}"
+        await redis.hincrby(FINGERPRINT_STATS_KEY, field, 1)
+        return hit
+
+    async def remember(
+        self, usecase: str, user_id: UUID, fingerprint: str, ttl_seconds: int
+    ) -> None:
+        redis = await self._get_redis()
+        await redis.set(self._key(usecase, user_id), fingerprint, ex=ttl_seconds)
+
+    async def hit_counts(self) -> dict[str, tuple[int, int]]:
+        redis = await self._get_redis()
+        raw = await redis.hgetall(FINGERPRINT_STATS_KEY)
+        counts: dict[str, list[int]] = {}
+        for field, value in raw.items():
+            name = field.decode() if isinstance(field, bytes) else field
+            usecase, _, outcome = name.rpartition(":")
+            pair = counts.setdefault(usecase, [0, 0])
+            pair[0 if outcome == "hits" else 1] = int(value)
+        return {usecase: (pair[0], pair[1]) for usecase, pair in counts.items()}
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
@@ -1,6 +1,7 @@
 """Redis-based implementation of PubSub gateway."""
 
 import json
+from collections.abc import Sequence
 from typing import Any
 from uuid import UUID
 
@@ -126,6 +127,39 @@ class RedisPubSubGateway(PubSubGatewayProtocol):
             logger.error(f"Failed to publish message to channel {channel}: {e}")
             raise
 
+    async def publish_many_to_user_channels(
+        self,
+        channel_type: str,
+        messages: Sequence[tuple[UUID, dict[str, Any]]],
+    ) -> None:
+        """Publish one message per user through a single Redis pipeline.
+
+        Args:
+            channel_type: Type of channel (e.g., 'domain-events')
+            messages: Pairs of the user whose channel to publish to and the
+                JSON-serializable payload
+        """
+        if not messages:
+            return
+
+        redis = await self._get_redis()
+        pipe = redis.pipeline(transaction=False)
+        for user_id, message in messages:
+            pipe.publish(
+                self._get_channel_name(user_id, channel_type), json.dumps(message)
+            )
+
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.error(
+                f"Failed to publish {len(messages)} messages "
+                f"to {channel_type} channels: {e}"
+            )
+            raise
+
+        logger.debug(f"Published {len(messages)} messages to {channel_type} channels")
+
     async def append_to_user_stream(
         self,
         user_id: UUID,
@@ -149,6 +183,42 @@ class RedisPubSubGateway(PubSubGatewayProtocol):
             logger.error(f"Failed to append message to stream {stream}: {e}")
             raise
 
+    async def append_many_to_user_stream(
+        self,
+        user_id: UUID,
+        stream_type: str,
+        messages: Sequence[dict[str, Any]],
+        *,
+        maxlen: int | None = None,
+    ) -> list[str]:
+        """Append several messages to a user-specific stream through one pipeline."""
+        if not messages:
+            return []
+
+        redis = await self._get_redis()
+        stream = self._get_stream_name(user_id, stream_type)
+        pipe = redis.pipeline(transaction=False)
+        for message in messages:
+            pipe.xadd(
+                stream,
+                {"payload": json.dumps(message)},
+                maxlen=maxlen,
+                approximate=True if maxlen else False,
+            )
+
+        try:
+            stream_ids = await pipe.execute()
+        except Exception as e:
+            logger.error(
+                f"Failed to append {len(messages)} messages to stream {stream}: {e}"
+            )
+            raise
+
+        return [
+            stream_id.decode("utf-8") if isinstance(stream_id, bytes) else stream_id
+            for stream_id in stream_ids
+        ]
+
     async def read_user_stream(
         self,
         user_id: UUID,
@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import aiohttp
 from loguru import logger
 
@@ -13,6 +16,23 @@ class SendGridGateway(EmailProviderGatewayProtocol):
 
     _BASE_URL = "https://api.sendgrid.com/v3/mail/send"
 
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        """Initialize the gateway.
+
+        Args:
+            session: Optional shared HTTP session. When None, a session is
+                opened per message.
+        """
+        self._session = session
+
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        if self._session is not None:
+            yield self._session
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
     async def send_message(self, email_address: str, subject: str, body: str) -> None:
         """Send a plain text email using SendGrid's REST API."""
         api_key = settings.SENDGRID_API_KEY
@@ -45,7 +65,7 @@ class SendGridGateway(EmailProviderGatewayProtocol):
         }
 
         async with (
-            aiohttp.ClientSession() as session,
+            self._get_session() as session,
             session.post(
                 self._BASE_URL,
                 headers=headers,
@@ -0,0 +1,50 @@
+"""In-memory implementation of the due-schedule index for tests and local use."""
+
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+from lykke.domain.value_objects import DueJobKind, DueScheduleEntry
+
+
+class StubDueScheduleGateway:
+    """In-memory DueScheduleGatewayProtocol implementation.
+
+    Keeps the earliest due instant per (user, kind), like the Redis gateway.
+    Claims are held until settled but never expire.
+    """
+
+    def __init__(self) -> None:
+        self.due: dict[tuple[UUID, DueJobKind], datetime] = {}
+        self.claimed: list[DueScheduleEntry] = []
+
+    async def arm_many(self, entries: Iterable[DueScheduleEntry]) -> None:
+        for entry in entries:
+            key = (entry.user_id, entry.kind)
+            current = self.due.get(key)
+            if current is None or entry.due_at < current:
+                self.due[key] = entry.due_at
+
+    async def claim_due(self, now: datetime) -> list[DueScheduleEntry]:
+        claimed = [
+            DueScheduleEntry(user_id=user_id, kind=kind, due_at=due_at)
+            for (user_id, kind), due_at in self.due.items()
+            if due_at <= now
+        ]
+        for entry in claimed:
+            del self.due[(entry.user_id, entry.kind)]
+        self.claimed.extend(claimed)
+        return claimed
+
+    async def ack(self, entries: Iterable[DueScheduleEntry]) -> None:
+        for entry in entries:
+            self.claimed.remove(entry)
+
+    async def release(self, entries: Iterable[DueScheduleEntry]) -> None:
+        released = list(entries)
+        for entry in released:
+            self.claimed.remove(entry)
+        await self.arm_many(released)
+
+    async def close(self) -> None:
+        return None
@@ -0,0 +1,35 @@
+"""In-memory LLM run fingerprint store for tests and local use."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+
+class StubLLMRunFingerprintGateway:
+    """In-memory LLMRunFingerprintGatewayProtocol implementation."""
+
+    def __init__(self) -> None:
+        self.fingerprints: dict[tuple[str, UUID], tuple[str, datetime]] = {}
+        self.counts: dict[str, tuple[int, int]] = {}
+
+    async def is_recent(self, usecase: str, user_id: UUID, fingerprint: str) -> bool:
+        stored = self.fingerprints.get((usecase, user_id))
+        hit = (
+            stored is not None
+            and stored[0] == fingerprint
+            and stored[1] > datetime.now(UTC)
+        )
+        hits, misses = self.counts.get(usecase, (0, 0))
+        self.counts[usecase] = (hits + 1, misses) if hit else (hits, misses + 1)
+        return hit
+
+    async def remember(
+        self, usecase: str, user_id: UUID, fingerprint: str, ttl_seconds: int
+    ) -> None:
+        expires_at = datetime.now(UTC) + timedelta(seconds=ttl_seconds)
+        self.fingerprints[(usecase, user_id)] = (fingerprint, expires_at)
+
+    async def hit_counts(self) -> dict[str, tuple[int, int]]:
+        return dict(self.counts)
+
+    async def close(self) -> None:
+        return None
@@ -1,5 +1,6 @@
 """Stub implementation of PubSubGateway for testing and non-broadcasting contexts."""
 
+from collections.abc import Sequence
 from typing import Any, Self
 from uuid import UUID
 
@@ -51,6 +52,14 @@ class StubPubSubGateway:
         """Do nothing (no-op publish)."""
         pass
 
+    async def publish_many_to_user_channels(
+        self,
+        channel_type: str,
+        messages: Sequence[tuple[UUID, dict[str, Any]]],
+    ) -> None:
+        """Do nothing (no-op publish)."""
+        pass
+
     def subscribe_to_user_channel(
         self,
         user_id: UUID,
@@ -70,6 +79,17 @@ class StubPubSubGateway:
         """Return a dummy stream id."""
         return "0-0"
 
+    async def append_many_to_user_stream(
+        self,
+        user_id: UUID,
+        stream_type: str,
+        messages: Sequence[dict[str, Any]],
+        *,
+        maxlen: int | None = None,
+    ) -> list[str]:
+        """Return dummy stream ids."""
+        return ["0-0"] * len(messages)
+
     async def read_user_stream(
         self,
         user_id: UUID,
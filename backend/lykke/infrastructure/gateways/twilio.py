@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import aiohttp
 from loguru import logger
 
@@ -11,6 +14,23 @@ class TwilioGateway(SMSProviderProtocol):
 
     _BASE_URL = "https://api.twilio.com/2010-04-01/Accounts"
 
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        """Initialize the gateway.
+
+        Args:
+            session: Optional shared HTTP session. When None, a session is
+                opened per message.
+        """
+        self._session = session
+
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        if self._session is not None:
+            yield self._session
+            return
+        async with aiohttp.ClientSession() as session:
+            yield session
+
     async def send_message(self, phone_number: str, message: str) -> None:
         """Send an SMS message using Twilio's REST API."""
         account_sid = settings.TWILIO_ACCOUNT_SID
@@ -36,8 +56,8 @@ class TwilioGateway(SMSProviderProtocol):
         auth = aiohttp.BasicAuth(account_sid, auth_token)
 
         async with (
-            aiohttp.ClientSession(auth=auth) as session,
-            session.post(url, data=payload) as response,
+            self._get_session() as session,
+            session.post(url, data=payload, auth=auth) as response,
         ):
             if response.status >= 400:
                 error_text = await response.text()
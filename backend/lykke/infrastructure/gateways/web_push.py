@@ -1,4 +1,6 @@
 import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 import aiohttp
 from loguru import logger
@@ -17,9 +19,22 @@ wp = WebPush(
 )
 
 
+@asynccontextmanager
+async def _client_session(
+    session: aiohttp.ClientSession | None,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    if session is not None:
+        yield session
+        return
+    async with aiohttp.ClientSession() as new_session:
+        yield new_session
+
+
 async def send_notification(
     subscription: PushSubscriptionEntity,
     content: str | dict | value_objects.NotificationPayload,
+    *,
+    session: aiohttp.ClientSession | None = None,
 ) -> None:
     from lykke.core.utils.serialization import dataclass_to_json_dict
 
@@ -42,12 +57,14 @@ async def send_notification(
         ),
     )
 
-    async with aiohttp.ClientSession() as session:
-        response = await session.post(
+    async with (
+        _client_session(session) as client_session,
+        client_session.post(
             url=subscription.endpoint,
             data=message.encrypted,
             headers=message.headers,
-        )
+        ) as response,
+    ):
         if response.status == 410:
             # 410 Gone means subscription is no longer valid (user unsubscribed or expired)
             # TODO: Delete the invalid subscription from the database
@@ -65,6 +82,15 @@ async def send_notification(
 class WebPushGateway(WebPushGatewayProtocol):
     """Gateway that implements WebPushGatewayProtocol using infrastructure implementation."""
 
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        """Initialize the gateway.
+
+        Args:
+            session: Optional shared HTTP session. When None, a session is
+                opened per notification.
+        """
+        self._session = session
+
     async def send_notification(
         self,
         subscription: PushSubscriptionEntity,
@@ -74,4 +100,5 @@ class WebPushGateway(WebPushGatewayProtocol):
         await send_notification(
             subscription=subscription,
             content=content,
+            session=self._session,
         )
@@ -168,6 +168,15 @@ class UserScopedBaseRepository(Generic[ObjectType, QueryType]):
             row["user_id"] = self.user_id
         return row
 
+    def _derived_row_fields(self, obj: ObjectType) -> dict[str, Any]:
+        """Return database-only columns derived from an entity on write.
+
+        Override in subclasses that persist values computed from the entity
+        (e.g., indexed lookup columns). Merged into the row by ``put``,
+        ``insert`` and ``insert_many``.
+        """
+        return {}
+
     def _strip_pagination(self, query: QueryType) -> QueryType:
         """Return a copy of the query with pagination removed."""
         return replace(query, limit=None, offset=None)
@@ -351,6 +360,7 @@ class UserScopedBaseRepository(Generic[ObjectType, QueryType]):
         # Prepare entity and row for save
         obj = self._prepare_entity_for_save(obj)
         row = type(self).entity_to_row(obj)  # type: ignore[attr-defined]
+        row.update(self._derived_row_fields(obj))
         row = self._prepare_row_for_save(row)
 
         async with self._get_connection(for_write=True) as conn:
@@ -376,6 +386,7 @@ class UserScopedBaseRepository(Generic[ObjectType, QueryType]):
         """
         obj = self._prepare_entity_for_save(obj)
         row = type(self).entity_to_row(obj)  # type: ignore[attr-defined]
+        row.update(self._derived_row_fields(obj))
         row = self._prepare_row_for_save(row)
 
         async with self._get_connection(for_write=True) as conn:
@@ -405,7 +416,13 @@ class UserScopedBaseRepository(Generic[ObjectType, QueryType]):
 
         # Prepare all entities and rows
         prepared_objs = [self._prepare_entity_for_save(obj) for obj in objs]
-        rows = [type(self).entity_to_row(obj) for obj in prepared_objs]  # type: ignore[attr-defined]
+        rows = [
+            {
+                **type(self).entity_to_row(obj),  # type: ignore[attr-defined]
+                **self._derived_row_fields(obj),
+            }
+            for obj in prepared_objs
+        ]
         rows = [self._prepare_row_for_save(row) for row in rows]
 
         async with self._get_connection(for_write=True) as conn:
@@ -86,6 +86,12 @@ class CalendarRepository(UserScopedBaseRepository[CalendarEntity, CalendarQuery]
             ),
             "last_sync_at": calendar.last_sync_at,
             "sync_subscription_id": calendar.sync_subscription_id,
+            # Always written so finishing a sync clears the checkpoint
+            "sync_checkpoint": (
+                dataclass_to_json_dict(calendar.sync_checkpoint)
+                if calendar.sync_checkpoint
+                else None
+            ),
         }
 
         if calendar.sync_subscription:
@@ -109,6 +115,14 @@ class CalendarRepository(UserScopedBaseRepository[CalendarEntity, CalendarQuery]
                 **sync_subscription
             )
 
+        sync_checkpoint = data.get("sync_checkpoint")
+        if sync_checkpoint:
+            for key in ("lookback", "started_at"):
+                sync_checkpoint[key] = ensure_datetime_utc(sync_checkpoint.get(key))
+            data["sync_checkpoint"] = value_objects.CalendarSyncCheckpoint(
+                **sync_checkpoint
+            )
+
         default_category = data.get("default_event_category")
         if isinstance(default_category, str):
             data["default_event_category"] = EventCategory(default_category)
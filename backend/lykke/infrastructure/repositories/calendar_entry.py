@@ -1,13 +1,22 @@
-from datetime import UTC
+from collections.abc import Collection
+from datetime import UTC, date as dt_date, datetime, time, timedelta
 from typing import Any, ClassVar
+from uuid import UUID
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from sqlalchemy import case, delete, or_, select, update
 from sqlalchemy.sql import Select
 
+from lykke.core.utils.dates import get_current_datetime
 from lykke.core.utils.serialization import dataclass_to_json_dict
 from lykke.domain import value_objects
-from lykke.domain.entities import CalendarEntryEntity
+from lykke.domain.entities import CalendarEntryEntity, CalendarEntrySeriesEntity
+from lykke.domain.services import RecurrenceExpansionService
+from lykke.infrastructure.database.content_hash import content_hash
 from lykke.infrastructure.database.tables import calendar_entries_tbl
+from lykke.infrastructure.database.tables.calendar_entries import (
+    CONTENT_HASH_COLUMNS,
+)
 from lykke.infrastructure.repositories.base.utils import (
     ensure_datetime_utc,
     ensure_datetimes_utc,
@@ -16,6 +25,7 @@ from lykke.infrastructure.repositories.base.utils import (
 )
 
 from .base import CalendarEntryQuery, UserScopedBaseRepository
+from .calendar_entry_series import CalendarEntrySeriesRepository
 
 
 class CalendarEntryRepository(
@@ -25,7 +35,7 @@ class CalendarEntryRepository(
     table = calendar_entries_tbl
     QueryClass = CalendarEntryQuery
     # Exclude 'date' - it's a database-only field for querying (computed from starts_at)
-    excluded_row_fields: ClassVar[set[str]] = {"date"}
+    excluded_row_fields: ClassVar[set[str]] = {"date", "content_hash"}
 
     def build_query(self, query: CalendarEntryQuery) -> Select[tuple]:
         """Build a SQLAlchemy Core select statement from a query object."""
@@ -62,6 +72,156 @@ class CalendarEntryRepository(
 
         return stmt
 
+    async def search(self, query: CalendarEntryQuery) -> list[CalendarEntryEntity]:
+        """Search entries, expanding series past their stored horizon if asked."""
+        entries = await super().search(query)
+        if not query.expand_series or query.date is None:
+            return entries
+
+        timezone_name = self.user.settings.timezone
+        try:
+            tz = ZoneInfo(timezone_name) if timezone_name else UTC
+        except (ZoneInfoNotFoundError, ValueError):
+            tz = UTC
+        window_start = datetime.combine(query.date, time.min, tzinfo=tz)
+        window_end = datetime.combine(
+            query.date + timedelta(days=1), time.min, tzinfo=tz
+        )
+        series = await CalendarEntrySeriesRepository(user=self.user).search(
+            value_objects.CalendarEntrySeriesQuery(
+                calendar_id=query.calendar_id, materialized_before=window_end
+            )
+        )
+        if query.calendar_entry_series_id is not None:
+            series = [
+                item for item in series if item.id == query.calendar_entry_series_id
+            ]
+        return RecurrenceExpansionService.merge_occurrences(
+            entries,
+            series,
+            window_start.astimezone(UTC),
+            window_end.astimezone(UTC),
+            timezone=timezone_name,
+        )
+
+    @classmethod
+    def compute_content_hash(cls, calendar_entry: CalendarEntryEntity) -> str:
+        """Compute the ``content_hash`` column value for an entry."""
+        row = cls.entity_to_row(calendar_entry)
+        return content_hash(
+            [(row.get(name), kind) for name, kind in CONTENT_HASH_COLUMNS]
+        )
+
+    async def unchanged_platform_ids(
+        self, entries: list[CalendarEntryEntity]
+    ) -> set[str]:
+        """Return platform ids of entries whose stored content hash matches."""
+        hashes = {entry.platform_id: self.compute_content_hash(entry) for entry in entries}
+        if not hashes:
+            return set()
+        async with self._get_connection(for_write=False) as conn:
+            stmt = select(self.table.c.platform_id, self.table.c.content_hash).where(
+                self.table.c.platform_id.in_(list(hashes))
+            )
+            stmt = self._apply_user_scope(stmt)
+            result = await conn.execute(stmt)
+            return {
+                platform_id
+                for platform_id, stored_hash in result.all()
+                if hashes[platform_id] == stored_hash
+            }
+
+    async def cascade_series_fields(
+        self, series: list[CalendarEntrySeriesEntity]
+    ) -> list[CalendarEntryEntity]:
+        """Copy series name, category and frequency onto their entries.
+
+        Runs a single UPDATE over every entry of the given series, bumping
+        ``updated_at`` on the entries it touches, and returns those entries.
+        """
+        if not series:
+            return []
+        series_id_col = self.table.c.calendar_entry_series_id
+        name = case({item.id: item.name for item in series}, value=series_id_col)
+        category = case(
+            {
+                item.id: item.event_category.value if item.event_category else None
+                for item in series
+            },
+            value=series_id_col,
+        )
+        frequency = case(
+            {item.id: item.frequency.value for item in series}, value=series_id_col
+        )
+        stmt = (
+            update(self.table)
+            .where(series_id_col.in_([item.id for item in series]))
+            .where(
+                or_(
+                    self.table.c.name.is_distinct_from(name),
+                    self.table.c.category.is_distinct_from(category),
+                    self.table.c.frequency.is_distinct_from(frequency),
+                )
+            )
+            .values(
+                name=name,
+                category=category,
+                frequency=frequency,
+                updated_at=get_current_datetime(),
+            )
+            .returning(*self.table.c)
+        )
+        stmt = self._apply_user_scope_to_mutate(stmt)
+        async with self._get_connection(for_write=True) as conn:
+            result = await conn.execute(stmt)
+            return [self.row_to_entity(dict(row._mapping)) for row in result]
+
+    async def delete_series_entries_from(
+        self,
+        series_ids: Collection[UUID],
+        starts_at: datetime,
+        *,
+        exclude_platform_ids: Collection[str] = (),
+    ) -> list[CalendarEntryEntity]:
+        """Delete entries of the given series starting at or after ``starts_at``.
+
+        Returns the deleted entries.
+        """
+        if not series_ids:
+            return []
+        stmt = delete(self.table).where(
+            self.table.c.calendar_entry_series_id.in_(list(series_ids)),
+            self.table.c.starts_at >= starts_at,
+        )
+        if exclude_platform_ids:
+            stmt = stmt.where(
+                self.table.c.platform_id.not_in(list(exclude_platform_ids))
+            )
+        stmt = self._apply_user_scope_to_mutate(stmt.returning(*self.table.c))
+        async with self._get_connection(for_write=True) as conn:
+            result = await conn.execute(stmt)
+            return [self.row_to_entity(dict(row._mapping)) for row in result]
+
+    async def delete_calendar_entries_from(
+        self, calendar_ids: Collection[UUID], starts_at: datetime
+    ) -> dict[UUID, dt_date]:
+        """Delete entries of the given calendars starting at or after ``starts_at``.
+
+        Returns the deleted ids mapped to their stored dates.
+        """
+        if not calendar_ids:
+            return {}
+        stmt = delete(self.table).where(
+            self.table.c.calendar_id.in_(list(calendar_ids)),
+            self.table.c.starts_at >= starts_at,
+        )
+        stmt = self._apply_user_scope_to_mutate(
+            stmt.returning(self.table.c.id, self.table.c.date)
+        )
+        async with self._get_connection(for_write=True) as conn:
+            result = await conn.execute(stmt)
+            return {entry_id: entry_date for entry_id, entry_date in result.all()}
+
     @staticmethod
     def entity_to_row(calendar_entry: CalendarEntryEntity) -> dict[str, Any]:
         """Convert a CalendarEntry entity to a database row dict."""
@@ -121,8 +281,9 @@ class CalendarEntryRepository(
         """
         data = normalize_list_fields(dict(row), CalendarEntryEntity)
 
-        # Remove 'date' field - it's a computed property, not a constructor argument
+        # Remove database-only fields - they are not constructor arguments
         data.pop("date", None)
+        data.pop("content_hash", None)
         # Convert frequency string back to enum if needed
         if "frequency" in data and isinstance(data["frequency"], str):
             data["frequency"] = value_objects.TaskFrequency(data["frequency"])
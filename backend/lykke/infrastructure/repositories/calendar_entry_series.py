@@ -1,11 +1,21 @@
 from typing import Any
+from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.sql import Select
 
 from lykke.domain import value_objects
 from lykke.domain.entities import CalendarEntrySeriesEntity
+from lykke.infrastructure.database.content_hash import content_hash
 from lykke.infrastructure.database.tables import calendar_entry_series_tbl
+from lykke.infrastructure.database.tables.calendar_entry_series import (
+    CONTENT_HASH_COLUMNS,
+)
 from lykke.infrastructure.repositories.base import BaseQuery, UserScopedBaseRepository
+from lykke.infrastructure.repositories.base.utils import (
+    ensure_datetime_utc,
+    ensure_datetimes_utc,
+)
 
 CalendarEntrySeriesQuery = value_objects.CalendarEntrySeriesQuery
 
@@ -27,9 +37,40 @@ class CalendarEntrySeriesRepository(
                 stmt = stmt.where(self.table.c.platform_id == query.platform_id)
             if query.ical_uid is not None:
                 stmt = stmt.where(self.table.c.ical_uid == query.ical_uid)
+            if query.ids:
+                stmt = stmt.where(self.table.c.id.in_(query.ids))
+            if query.materialized_before is not None:
+                stmt = stmt.where(
+                    self.table.c.deleted_at.is_(None),
+                    self.table.c.recurrence.is_not(None),
+                    self.table.c.materialized_until < query.materialized_before,
+                )
 
         return stmt
 
+    @classmethod
+    def compute_content_hash(cls, series: CalendarEntrySeriesEntity) -> str:
+        """Compute the ``content_hash`` column value for a series."""
+        row = cls.entity_to_row(series)
+        return content_hash([(row[name], kind) for name, kind in CONTENT_HASH_COLUMNS])
+
+    async def unchanged_ids(self, series: list[CalendarEntrySeriesEntity]) -> set[UUID]:
+        """Return ids of series whose stored content hash matches."""
+        hashes = {item.id: self.compute_content_hash(item) for item in series}
+        if not hashes:
+            return set()
+        async with self._get_connection(for_write=False) as conn:
+            stmt = select(self.table.c.id, self.table.c.content_hash).where(
+                self.table.c.id.in_(list(hashes))
+            )
+            stmt = self._apply_user_scope(stmt)
+            result = await conn.execute(stmt)
+            return {
+                series_id
+                for series_id, stored_hash in result.all()
+                if hashes[series_id] == stored_hash
+            }
+
     @staticmethod
     def entity_to_row(series: CalendarEntrySeriesEntity) -> dict[str, Any]:
         row: dict[str, Any] = {
@@ -46,23 +87,42 @@ class CalendarEntrySeriesRepository(
             "recurrence": series.recurrence or None,
             "starts_at": series.starts_at,
             "ends_at": series.ends_at,
+            "timezone": series.timezone,
+            "is_all_day": series.is_all_day,
             "created_at": series.created_at,
             "updated_at": series.updated_at,
             "ical_uid": series.ical_uid,
             "deleted_at": series.deleted_at,
+            "materialized_until": series.materialized_until,
+            "cancelled_occurrences": [
+                ensure_datetime_utc(item).isoformat()  # type: ignore[union-attr]
+                for item in series.cancelled_occurrences
+            ]
+            or None,
         }
         return row
 
     @classmethod
     def row_to_entity(cls, row: dict[str, Any]) -> CalendarEntrySeriesEntity:
-        from lykke.infrastructure.repositories.base.utils import ensure_datetimes_utc
-
         data = dict(row)
+        data.pop("content_hash", None)
         if "frequency" in data and isinstance(data["frequency"], str):
             data["frequency"] = value_objects.TaskFrequency(data["frequency"])
         if "event_category" in data and isinstance(data["event_category"], str):
             data["event_category"] = value_objects.EventCategory(data["event_category"])
         data = ensure_datetimes_utc(
-            data, keys=("starts_at", "ends_at", "created_at", "updated_at", "deleted_at")
+            data,
+            keys=(
+                "starts_at",
+                "ends_at",
+                "created_at",
+                "updated_at",
+                "deleted_at",
+                "materialized_until",
+            ),
         )
+        data["cancelled_occurrences"] = [
+            ensure_datetime_utc(item)
+            for item in data.get("cancelled_occurrences") or []
+        ]
         return CalendarEntrySeriesEntity(**data)
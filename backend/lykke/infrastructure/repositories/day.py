@@ -1,11 +1,12 @@
 from datetime import datetime as dt_datetime, time as dt_time
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID
 
 from lykke.core.utils.serialization import dataclass_to_json_dict
 from lykke.domain import value_objects
 from lykke.domain.entities import DayEntity
 from lykke.domain.entities.day_template import DayTemplateEntity
+from lykke.domain.services.due_schedule import DueScheduleService
 from lykke.infrastructure.database.tables import days_tbl
 from lykke.infrastructure.repositories.base.utils import (
     ensure_datetimes_utc,
@@ -20,6 +21,12 @@ class DayRepository(UserScopedBaseRepository[DayEntity, BaseQuery]):
     Object = DayEntity
     table = days_tbl
     QueryClass = BaseQuery
+    # 'next_alarm_at' is derived on write for indexed due-alarm lookups
+    excluded_row_fields: ClassVar[set[str]] = {"next_alarm_at"}
+
+    def _derived_row_fields(self, obj: DayEntity) -> dict[str, Any]:
+        """Persist the earliest pending alarm for indexed lookups."""
+        return {"next_alarm_at": DueScheduleService.pending_alarm_due(obj.alarms)}
 
     @staticmethod
     def entity_to_row(day: DayEntity) -> dict[str, Any]:
@@ -62,7 +69,10 @@ class DayRepository(UserScopedBaseRepository[DayEntity, BaseQuery]):
 
         Overrides base to handle JSONB fields (template) and enum conversion.
         """
-        data = normalize_list_fields(dict(row), DayEntity)
+        data = normalize_list_fields(
+            {k: v for k, v in row.items() if k not in cls.excluded_row_fields},
+            DayEntity,
+        )
 
         # Convert status string back to enum if needed
         if "status" in data and isinstance(data["status"], str):
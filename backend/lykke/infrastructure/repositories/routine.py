@@ -1,10 +1,12 @@
-from typing import Any
+from typing import Any, ClassVar
 
 from sqlalchemy.sql import Select
 
+from lykke.core.utils.dates import get_current_datetime
 from lykke.core.utils.serialization import dataclass_to_json_dict
 from lykke.domain import value_objects
 from lykke.domain.entities import RoutineEntity
+from lykke.domain.services.timing_status import TimingStatusService
 from lykke.domain.value_objects.task import TaskCategory
 from lykke.infrastructure.database.tables import routines_tbl
 from lykke.infrastructure.repositories.base.utils import (
@@ -22,6 +24,8 @@ class RoutineRepository(UserScopedBaseRepository[RoutineEntity, value_objects.Ro
     Object = RoutineEntity
     table = routines_tbl
     QueryClass = value_objects.RoutineQuery
+    # Derived on write for indexed lookups; not part of the entity
+    excluded_row_fields: ClassVar[set[str]] = {"next_transition_at"}
 
     def build_query(self, query: value_objects.RoutineQuery) -> Select[tuple]:
         """Build a SQLAlchemy Core select statement from a query object."""
@@ -39,6 +43,16 @@ class RoutineRepository(UserScopedBaseRepository[RoutineEntity, value_objects.Ro
 
         return stmt
 
+    def _derived_row_fields(self, obj: RoutineEntity) -> dict[str, Any]:
+        """Persist the next timing-status transition for indexed lookups."""
+        return {
+            "next_transition_at": TimingStatusService.next_transition_bound(
+                obj,
+                get_current_datetime(),
+                timezone=self.user.settings.timezone if self.user.settings else None,
+            )
+        }
+
     @staticmethod
     def entity_to_row(routine: RoutineEntity) -> dict[str, Any]:
         """Convert a Routine entity to a database row dict."""
@@ -62,7 +76,8 @@ class RoutineRepository(UserScopedBaseRepository[RoutineEntity, value_objects.Ro
     @classmethod
     def row_to_entity(cls, row: dict[str, Any]) -> RoutineEntity:
         """Convert a database row dict to a Routine entity."""
-        data = filter_init_false_fields(dict(row), RoutineEntity)
+        data = {k: v for k, v in row.items() if k not in cls.excluded_row_fields}
+        data = filter_init_false_fields(data, RoutineEntity)
 
         # Convert enum fields
         data = convert_enum_fields(data, {
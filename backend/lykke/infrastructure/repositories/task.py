@@ -2,9 +2,11 @@
 from datetime import time as dt_time
 from typing import Any, ClassVar
 
+from lykke.core.utils.dates import get_current_datetime
 from lykke.core.utils.serialization import dataclass_to_json_dict
 from lykke.domain import value_objects
 from lykke.domain.entities import TaskEntity
+from lykke.domain.services.timing_status import TimingStatusService
 from lykke.infrastructure.database.tables import tasks_tbl
 from lykke.infrastructure.repositories.base.utils import (
     ensure_datetimes_utc,
@@ -20,8 +22,9 @@ class TaskRepository(UserScopedBaseRepository[TaskEntity, value_objects.TaskQuer
     Object = TaskEntity
     table = tasks_tbl
     QueryClass = value_objects.TaskQuery
-    # Exclude 'date' - it's a database-only field for querying (computed from scheduled_date)
-    excluded_row_fields: ClassVar[set[str]] = {"date"}
+    # Exclude database-only fields for querying: 'date' (computed from
+    # scheduled_date) and 'next_transition_at' (derived on write)
+    excluded_row_fields: ClassVar[set[str]] = {"date", "next_transition_at"}
 
     def build_query(self, query: value_objects.TaskQuery) -> Select[tuple]:
         """Build a SQLAlchemy Core select statement from a query object."""
@@ -46,6 +49,16 @@ class TaskRepository(UserScopedBaseRepository[TaskEntity, value_objects.TaskQuer
 
         return stmt
 
+    def _derived_row_fields(self, obj: TaskEntity) -> dict[str, Any]:
+        """Persist the next timing-status transition for indexed lookups."""
+        return {
+            "next_transition_at": TimingStatusService.next_transition_bound(
+                obj,
+                get_current_datetime(),
+                timezone=self.user.settings.timezone if self.user.settings else None,
+            )
+        }
+
     @staticmethod
     def entity_to_row(task: TaskEntity) -> dict[str, Any]:
         """Convert a Task entity to a database row dict."""
@@ -94,8 +107,9 @@ class TaskRepository(UserScopedBaseRepository[TaskEntity, value_objects.TaskQuer
         """
         data = normalize_list_fields(dict(row), TaskEntity)
 
-        # Remove 'date' field - it's a computed property, not a constructor argument
-        data.pop("date", None)
+        # Remove database-only fields - they are not constructor arguments
+        for field_name in cls.excluded_row_fields:
+            data.pop(field_name, None)
 
         # Convert enum strings back to enums if needed
         if "status" in data and isinstance(data["status"], str):
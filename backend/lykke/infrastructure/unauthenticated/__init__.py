@@ -1,4 +1,9 @@
+from .alarm_store import UnauthenticatedAlarmStore
 from .identity_access import UnauthenticatedIdentityAccess
+from .timing_status_store import UnauthenticatedTimingStatusStore
 
-__all__ = ["UnauthenticatedIdentityAccess"]
-
+__all__ = [
+    "UnauthenticatedAlarmStore",
+    "UnauthenticatedIdentityAccess",
+    "UnauthenticatedTimingStatusStore",
+]
@@ -0,0 +1,33 @@
+"""Cross-user lookup of days with alarms due, backed by ``days.next_alarm_at``."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import select
+
+from lykke.application.identity import CrossUserAlarmStoreProtocol
+from lykke.infrastructure.database.tables import days_tbl
+from lykke.infrastructure.database.utils import get_engine
+
+# Alarms are evaluated on the user's local today and yesterday; two days
+# before the UTC date covers that for every timezone.
+_RECENT_DAYS = timedelta(days=2)
+
+
+class UnauthenticatedAlarmStore(CrossUserAlarmStoreProtocol):
+    """SQLAlchemy implementation of CrossUserAlarmStoreProtocol."""
+
+    async def list_user_ids_with_alarms_due_before(self, until: datetime) -> list[UUID]:
+        stmt = (
+            select(days_tbl.c.user_id)
+            .where(days_tbl.c.next_alarm_at.isnot(None))
+            .where(days_tbl.c.next_alarm_at <= until)
+            .where(days_tbl.c.date >= (until - _RECENT_DAYS).date())
+            .distinct()
+        )
+        engine = get_engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(stmt)
+            return [row[0] for row in result]
@@ -7,14 +7,16 @@ It intentionally exposes *only* specific methods (no generic repository surface)
 from __future__ import annotations
 
 import json
-from datetime import UTC, datetime
-from typing import Any
+from collections.abc import AsyncIterator, Collection
+from datetime import UTC, datetime, time
+from typing import Any, cast
 from uuid import UUID, uuid4
 
-from sqlalchemy import insert, select, update
+from sqlalchemy import ColumnElement, and_, false, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from lykke.application.identity import UnauthenticatedIdentityAccessProtocol
+from lykke.core.config import settings
 from lykke.core.exceptions import BadRequestError
 from lykke.core.utils.phone_numbers import digits_only, normalize_phone_number
 from lykke.core.utils.serialization import dataclass_to_json_dict
@@ -66,6 +68,69 @@ def _user_row_to_entity(row: dict[str, Any]) -> UserEntity:
     return UserEntity(**data)
 
 
+def _has_llm_provider() -> ColumnElement[bool]:
+    return cast(
+        "ColumnElement[bool]", users_tbl.c.settings["llm_provider"].astext.isnot(None)
+    )
+
+
+def _calendar_entry_notifications_enabled() -> ColumnElement[bool]:
+    # Mirrors UserSetting parsing: a missing or null settings object falls back
+    # to the defaults (enabled, with rules).
+    calendar_settings = users_tbl.c.settings["calendar_entry_notification_settings"]
+    rules = calendar_settings["rules"]
+    return or_(
+        calendar_settings.is_(None),
+        func.jsonb_typeof(calendar_settings) == "null",
+        and_(
+            func.coalesce(calendar_settings["enabled"].astext, "true").notin_(
+                ("false", "null")
+            ),
+            func.jsonb_typeof(rules) == "array",
+            rules.astext != "[]",
+        ),
+    )
+
+
+def _eligibility_clause(
+    eligibility: value_objects.UserEligibility,
+) -> ColumnElement[bool] | None:
+    """SQL predicate selecting users for a scheduled fan-out.
+
+    The LLM-based predicates match the partial indexes on the users table.
+    """
+    match eligibility:
+        case value_objects.UserEligibility.ALL:
+            return None
+        case value_objects.UserEligibility.LLM_PROVIDER:
+            return _has_llm_provider()
+        case value_objects.UserEligibility.CALENDAR_ENTRY_NOTIFICATIONS:
+            return _calendar_entry_notifications_enabled()
+        case value_objects.UserEligibility.MORNING_OVERVIEW:
+            return and_(
+                _has_llm_provider(),
+                users_tbl.c.settings["morning_overview_time"].astext.isnot(None),
+            )
+
+
+def _timezone_in(timezones: Collection[str | None]) -> ColumnElement[bool]:
+    timezone = users_tbl.c.settings["timezone"].astext
+    named = [value for value in timezones if value is not None]
+    clauses = [timezone.in_(named)] if named else []
+    if len(named) != len(timezones):
+        clauses.append(timezone.is_(None))
+    return or_(false(), *clauses)
+
+
+def _coerce_time(raw: str | None) -> time | None:
+    if raw is None:
+        return None
+    try:
+        return time.fromisoformat(raw)
+    except ValueError:
+        return None
+
+
 def _user_entity_to_row(user: UserEntity) -> dict[str, Any]:
     if not user.phone_number:
         raise BadRequestError("User phone_number is required")
@@ -116,6 +181,57 @@ class UnauthenticatedIdentityAccess(UnauthenticatedIdentityAccessProtocol):
             rows = result.mappings().all()
             return [_user_row_to_entity(dict(row)) for row in rows]
 
+    async def iter_eligible_users(
+        self,
+        eligibility: value_objects.UserEligibility = value_objects.UserEligibility.ALL,
+        *,
+        batch_size: int | None = None,
+        user_ids: Collection[UUID] | None = None,
+        timezones: Collection[str | None] | None = None,
+    ) -> AsyncIterator[list[value_objects.EligibleUser]]:
+        """Stream id/timezone projections of eligible users.
+
+        Eligibility is evaluated in SQL and rows come from a server-side
+        cursor, so memory stays bounded by ``batch_size`` rather than the
+        number of users. ``user_ids`` restricts the stream to those users and
+        ``timezones`` to those timezone settings, using the timezone index.
+        """
+        batch_size = batch_size or settings.WORKER_FANOUT_CHUNK_SIZE
+        stmt = select(
+            users_tbl.c.id,
+            users_tbl.c.settings["timezone"].astext.label("timezone"),
+            users_tbl.c.settings["morning_overview_time"].astext.label(
+                "morning_overview_time"
+            ),
+        ).order_by(users_tbl.c.id)
+        clause = _eligibility_clause(eligibility)
+        if clause is not None:
+            stmt = stmt.where(clause)
+        if user_ids is not None:
+            stmt = stmt.where(users_tbl.c.id.in_(list(user_ids)))
+        if timezones is not None:
+            stmt = stmt.where(_timezone_in(timezones))
+
+        engine = get_engine()
+        async with engine.connect() as conn:
+            result = await conn.stream(stmt.execution_options(yield_per=batch_size))
+            async for rows in result.partitions(batch_size):
+                yield [
+                    value_objects.EligibleUser(
+                        id=row.id,
+                        timezone=row.timezone,
+                        morning_overview_time=_coerce_time(row.morning_overview_time),
+                    )
+                    for row in rows
+                ]
+
+    async def list_user_timezones(self) -> list[str | None]:
+        stmt = select(users_tbl.c.settings["timezone"].astext).distinct()
+        engine = get_engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(stmt)
+            return [row[0] for row in result]
+
     async def get_user_by_id(self, user_id: UUID) -> UserEntity | None:
         engine = get_engine()
         async with engine.connect() as conn:
@@ -0,0 +1,138 @@
+"""Cross-user access to the tasks and routines timing status is evaluated on.
+
+Loads one day per user for a whole shard of users with a single query per
+table. Rows are converted with the user-scoped repositories' mappers so the
+entities are identical to what those repositories return.
+
+Rows also carry ``next_transition_at``, written by the repositories on every
+save and advanced here after each evaluation, so finding users with work due
+is a range scan over its partial index.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import date, datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Table, and_, bindparam, or_, select, tuple_, union, update
+
+from lykke.application.identity import CrossUserTimingStatusStoreProtocol
+from lykke.domain.entities import RoutineEntity, TaskEntity
+from lykke.infrastructure.database.tables import routines_tbl, tasks_tbl
+from lykke.infrastructure.database.utils import get_engine
+from lykke.infrastructure.repositories import RoutineRepository, TaskRepository
+
+_EntityT = TypeVar("_EntityT")
+
+
+class UnauthenticatedTimingStatusStore(CrossUserTimingStatusStoreProtocol):
+    """SQLAlchemy implementation of CrossUserTimingStatusStoreProtocol."""
+
+    async def list_tasks_by_user(
+        self, dates_by_user: Mapping[UUID, date]
+    ) -> dict[UUID, list[TaskEntity]]:
+        return await self._list_by_user(
+            tasks_tbl, dates_by_user, TaskRepository.row_to_entity
+        )
+
+    async def list_routines_by_user(
+        self, dates_by_user: Mapping[UUID, date]
+    ) -> dict[UUID, list[RoutineEntity]]:
+        return await self._list_by_user(
+            routines_tbl, dates_by_user, RoutineRepository.row_to_entity
+        )
+
+    async def list_user_ids_with_transitions_before(
+        self, until: datetime
+    ) -> list[UUID]:
+        stmt = union(
+            *(
+                select(table.c.user_id).where(
+                    table.c.next_transition_at.isnot(None),
+                    table.c.next_transition_at <= until,
+                )
+                for table in (tasks_tbl, routines_tbl)
+            )
+        )
+        engine = get_engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(stmt)
+            return [row[0] for row in result]
+
+    async def refresh_next_transitions(
+        self,
+        dates_by_user: Mapping[UUID, date],
+        *,
+        tasks: Mapping[UUID, datetime | None],
+        routines: Mapping[UUID, datetime | None],
+    ) -> None:
+        engine = get_engine()
+        async with engine.begin() as conn:
+            for table, next_by_id in ((tasks_tbl, tasks), (routines_tbl, routines)):
+                if dates_by_user:
+                    await conn.execute(
+                        update(table)
+                        .where(table.c.next_transition_at.isnot(None))
+                        .where(
+                            or_(
+                                *(
+                                    and_(
+                                        table.c.user_id == user_id,
+                                        table.c.date < current_date,
+                                    )
+                                    for user_id, current_date in dates_by_user.items()
+                                )
+                            )
+                        )
+                        .values(next_transition_at=None)
+                    )
+                if not next_by_id:
+                    continue
+                # Only rows whose stored instant moved are rewritten.
+                stmt = (
+                    update(table)
+                    .where(table.c.id == bindparam("row_id"))
+                    .where(
+                        table.c.next_transition_at.is_distinct_from(
+                            bindparam("next_at")
+                        )
+                    )
+                    .values(next_transition_at=bindparam("next_at"))
+                )
+                await conn.execute(
+                    stmt,
+                    [
+                        {"row_id": row_id, "next_at": next_at}
+                        for row_id, next_at in next_by_id.items()
+                    ],
+                )
+
+    @staticmethod
+    async def _list_by_user(
+        table: Table,
+        dates_by_user: Mapping[UUID, date],
+        row_to_entity: Callable[[dict[str, Any]], _EntityT],
+    ) -> dict[UUID, list[_EntityT]]:
+        grouped: dict[UUID, list[_EntityT]] = {user_id: [] for user_id in dates_by_user}
+        if not dates_by_user:
+            return grouped
+
+        # The plain date filter lets Postgres use the date index before
+        # matching each row against its user's date.
+        stmt = (
+            select(table)
+            .where(table.c.date.in_(set(dates_by_user.values())))
+            .where(
+                tuple_(table.c.user_id, table.c.date).in_(list(dates_by_user.items()))
+            )
+            .order_by(table.c.user_id, table.c.id)
+        )
+
+        engine = get_engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(stmt)
+            for row in result.mappings():
+                grouped[row["user_id"]].append(row_to_entity(dict(row)))
+        return grouped
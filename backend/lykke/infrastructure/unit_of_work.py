@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from contextvars import Token
 from dataclasses import replace
 from datetime import UTC, date as dt_date, datetime
@@ -54,6 +54,7 @@ from lykke.domain.events.base import (
     EntityDeletedEvent,
     EntityUpdatedEvent,
 )
+from lykke.domain.services import DueScheduleService
 from lykke.infrastructure.database import get_engine
 from lykke.infrastructure.database.transaction import (
     get_transaction_connection,
@@ -90,7 +91,10 @@ if TYPE_CHECKING:
 
     from sqlalchemy.ext.asyncio import AsyncConnection
 
-    from lykke.application.gateways import PubSubGatewayProtocol
+    from lykke.application.gateways import (
+        DueScheduleGatewayProtocol,
+        PubSubGatewayProtocol,
+    )
     from lykke.application.repositories import (
         AuthTokenRepositoryReadWriteProtocol,
         BotPersonalityRepositoryReadWriteProtocol,
@@ -165,6 +169,7 @@ class SqlAlchemyUnitOfWork:
         workers_to_schedule_factory: (
             Callable[[], WorkersToScheduleProtocol] | None
         ) = None,
+        due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
     ) -> None:
         """Initialize the unit of work for a specific user.
 
@@ -173,6 +178,9 @@ class SqlAlchemyUnitOfWork:
             pubsub_gateway: PubSub gateway for broadcasting events
             workers_to_schedule_factory: Optional callable that returns a fresh
                 WorkersToScheduleProtocol per UOW. When None, a no-op is used.
+            due_schedule_gateway: Optional due-schedule index to arm with the
+                next due instants of committed entities. When None, nothing
+                is armed.
         """
         self.user = user
         self._connection: AsyncConnection | None = None
@@ -182,8 +190,13 @@ class SqlAlchemyUnitOfWork:
         self._is_nested = False
         # Track entities that need to be saved
         self._added_entities: list[BaseEntityObject] = []
+        # Object ids of added entities already written by set-based statements
+        self._persisted_entity_ids: set[int] = set()
         # Track entity change events for streaming after commit
         self._pending_entity_changes: list[dict[str, Any]] = []
+        # Track next due instants for the due-schedule index
+        self._pending_due_entries: list[value_objects.DueScheduleEntry] = []
+        self._due_schedule_gateway = due_schedule_gateway
         # PubSub gateway for broadcasting domain events
         self._pubsub_gateway = pubsub_gateway
         # Cache user timezone to avoid repeated lookups
@@ -438,6 +451,21 @@ class SqlAlchemyUnitOfWork:
         self._added_entities.append(entity)
         return entity
 
+    def add_persisted(self, entity: _T) -> _T:
+        """Track an entity whose row a set-based statement already wrote.
+
+        Its domain events are dispatched and broadcast like those of added
+        entities, but commit() does not write it again.
+
+        Args:
+            entity: The already persisted entity, carrying its domain events.
+
+        Returns:
+            The entity that was added.
+        """
+        self._persisted_entity_ids.add(id(entity))
+        return self.add(entity)
+
     async def create(self, entity: _T) -> _T:
         """Create a new entity.
 
@@ -494,6 +522,7 @@ class SqlAlchemyUnitOfWork:
         3. Dispatch domain events to handlers (BEFORE commit - handlers can make transactional changes)
         4. Commit the database transaction
         5. Broadcast domain events via PubSub (AFTER commit - external systems see only committed data)
+        6. Arm the due-schedule index with the next due instants of committed entities
         """
         if self._connection is None:
             raise RuntimeError("Cannot commit: not in a transaction context")
@@ -522,6 +551,9 @@ class SqlAlchemyUnitOfWork:
         # Broadcast entity change events via Redis stream after successful commit
         await self._broadcast_entity_changes_to_redis()
 
+        # Arm the due-schedule index for committed entities
+        await self._arm_due_schedule()
+
         # Flush workers scheduled during this transaction (only after commit)
         await self.workers_to_schedule.flush()
 
@@ -545,6 +577,59 @@ class SqlAlchemyUnitOfWork:
 
         await self._calendar_entry_rw_repo.bulk_delete(query)
 
+    async def cascade_calendar_entry_series(
+        self, series: list[CalendarEntrySeriesEntity]
+    ) -> list[CalendarEntryEntity]:
+        """Copy series name, category and frequency onto their entries."""
+        if self._calendar_entry_rw_repo is None:
+            raise RuntimeError("Calendar entry repository not initialized")
+
+        return await self._calendar_entry_rw_repo.cascade_series_fields(series)
+
+    async def delete_calendar_series_entries_from(
+        self,
+        series_ids: Collection[UUID],
+        starts_at: datetime,
+        *,
+        exclude_platform_ids: Collection[str] = (),
+    ) -> list[CalendarEntryEntity]:
+        """Delete entries of the given series starting at or after ``starts_at``."""
+        if self._calendar_entry_rw_repo is None:
+            raise RuntimeError("Calendar entry repository not initialized")
+
+        return await self._calendar_entry_rw_repo.delete_series_entries_from(
+            series_ids, starts_at, exclude_platform_ids=exclude_platform_ids
+        )
+
+    async def purge_calendar_entries_from(
+        self, calendar_ids: Collection[UUID], starts_at: datetime
+    ) -> list[UUID]:
+        """Delete entries of the given calendars starting at or after ``starts_at``.
+
+        Skips per-entry domain events; the deletions are published together
+        on the entity-change stream after commit.
+        """
+        if self._calendar_entry_rw_repo is None:
+            raise RuntimeError("Calendar entry repository not initialized")
+
+        deleted = await self._calendar_entry_rw_repo.delete_calendar_entries_from(
+            calendar_ids, starts_at
+        )
+        occurred_at = datetime.now(UTC).isoformat()
+        entity_type = entity_type_from_class_name(CalendarEntryEntity.__name__)
+        self._pending_entity_changes.extend(
+            {
+                "change_type": "deleted",
+                "entity_type": entity_type,
+                "entity_id": str(entry_id),
+                "entity_date": entry_date.isoformat(),
+                "occurred_at": occurred_at,
+                "entity_patch": None,
+            }
+            for entry_id, entry_date in deleted.items()
+        )
+        return list(deleted)
+
     async def bulk_delete_tasks(self, query: value_objects.TaskQuery) -> None:
         """Bulk delete tasks matching the query."""
         if self._task_rw_repo is None:
@@ -660,6 +745,16 @@ class SqlAlchemyUnitOfWork:
                     }
                 )
 
+            if self._due_schedule_gateway is not None and not has_deleted_event:
+                self._pending_due_entries.extend(
+                    DueScheduleService.entries_for(
+                        entity, user=self.user, after=datetime.now(UTC)
+                    )
+                )
+
+            if id(entity) in self._persisted_entity_ids:
+                # Already written by a set-based statement
+                continue
             if has_deleted_event:
                 # Delete the entity
                 await repo.delete(entity)
@@ -733,6 +828,7 @@ class SqlAlchemyUnitOfWork:
 
         # Clear the added entities list after processing
         self._added_entities.clear()
+        self._persisted_entity_ids.clear()
 
         return events
 
@@ -815,25 +911,33 @@ class SqlAlchemyUnitOfWork:
         if not self._pending_entity_changes:
             return
 
-        for change in self._pending_entity_changes:
-            try:
-                change_id = str(uuid.uuid4())
-                stored_at = datetime.now(UTC).isoformat()
-                message_with_meta = {
-                    **change,
-                    "id": change_id,
-                    "stored_at": stored_at,
-                }
-                await self._pubsub_gateway.append_to_user_stream(
-                    user_id=self.user.id,
-                    stream_type="entity-changes",
-                    message=message_with_meta,
-                    maxlen=10000,
-                )
-            except Exception as e:
-                logger.error(f"Failed to broadcast entity change via stream: {e}")
+        stored_at = datetime.now(UTC).isoformat()
+        messages = [
+            {**change, "id": str(uuid.uuid4()), "stored_at": stored_at}
+            for change in self._pending_entity_changes
+        ]
+        try:
+            await self._pubsub_gateway.append_many_to_user_stream(
+                user_id=self.user.id,
+                stream_type="entity-changes",
+                messages=messages,
+                maxlen=10000,
+            )
+        except Exception as e:
+            logger.error(f"Failed to broadcast entity changes via stream: {e}")
         self._pending_entity_changes.clear()
 
+    async def _arm_due_schedule(self) -> None:
+        """Record next due instants in the due-schedule index after commit."""
+        if self._due_schedule_gateway is None or not self._pending_due_entries:
+            return
+
+        try:
+            await self._due_schedule_gateway.arm_many(self._pending_due_entries)
+        except Exception as e:
+            logger.error(f"Failed to arm due-schedule entries: {e}")
+        self._pending_due_entries.clear()
+
 
 def _extract_entity_date(
     entity: BaseEntityObject,
@@ -886,7 +990,13 @@ def _should_emit_entity_change(entity: BaseEntityObject) -> bool:
     """Return True if entity should emit change stream events."""
     return isinstance(
         entity,
-        (TaskEntity, CalendarEntryEntity, RoutineEntity, DayEntity),
+        (
+            TaskEntity,
+            CalendarEntryEntity,
+            CalendarEntrySeriesEntity,
+            RoutineEntity,
+            DayEntity,
+        ),
     )
 
 
@@ -924,6 +1034,7 @@ class SqlAlchemyUnitOfWorkFactory:
         workers_to_schedule_factory: (
             Callable[[], WorkersToScheduleProtocol] | None
         ) = None,
+        due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
     ) -> None:
         """Initialize the factory.
 
@@ -931,9 +1042,12 @@ class SqlAlchemyUnitOfWorkFactory:
             pubsub_gateway: PubSub gateway for broadcasting events
             workers_to_schedule_factory: Optional callable that returns a fresh
                 WorkersToScheduleProtocol per UOW. When None, a no-op is used.
+            due_schedule_gateway: Optional due-schedule index armed after
+                each commit.
         """
         self._pubsub_gateway = pubsub_gateway
         self._workers_to_schedule_factory = workers_to_schedule_factory
+        self._due_schedule_gateway = due_schedule_gateway
 
     def create(self, user: UserEntity) -> UnitOfWorkProtocol:
         """Create a new UnitOfWork instance for the given user.
@@ -948,4 +1062,5 @@ class SqlAlchemyUnitOfWorkFactory:
             user=user,
             pubsub_gateway=self._pubsub_gateway,
             workers_to_schedule_factory=self._workers_to_schedule_factory,
+            due_schedule_gateway=self._due_schedule_gateway,
         )
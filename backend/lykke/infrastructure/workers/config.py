@@ -1,10 +1,34 @@
 """Taskiq worker configuration."""
 
-from taskiq_redis import ListQueueBroker
+from taskiq import TaskiqEvents, TaskiqState
 
 from lykke.core.config import settings
 from lykke.core.observability import init_sentry_taskiq
+from lykke.infrastructure.workers.bulk import PipelinedListQueueBroker
+from lykke.infrastructure.workers.dedup import JobDedupMiddleware
+from lykke.infrastructure.workers.queues import QueueLagMiddleware, worker_queue_names
+from lykke.infrastructure.workers.runtime import (
+    start_worker_runtime,
+    stop_worker_runtime,
+)
 
 init_sentry_taskiq()
 
-broker = ListQueueBroker(url=settings.REDIS_URL)
+broker = PipelinedListQueueBroker(
+    url=settings.REDIS_URL, listen_queues=worker_queue_names()
+).with_middlewares(JobDedupMiddleware(), QueueLagMiddleware())
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)  # type: ignore[untyped-decorator]
+async def startup_worker_runtime(state: TaskiqState) -> None:
+    """Build worker-lifetime shared resources once per worker process."""
+    state.runtime = await start_worker_runtime()
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)  # type: ignore[untyped-decorator]
+async def shutdown_worker_runtime(state: TaskiqState) -> None:
+    """Release worker-lifetime shared resources."""
+    runtime = getattr(state, "runtime", None)
+    if runtime is not None:
+        await stop_worker_runtime(runtime)
+        state.runtime = None
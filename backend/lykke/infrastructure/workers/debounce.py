@@ -0,0 +1,90 @@
+"""Trailing-edge debouncing for bursty job triggers.
+
+Google sends several push notifications for a single calendar edit. Instead
+of enqueueing a sync for each one, the webhook records the notification in a
+per-key Redis hash holding the first and last trigger times::
+
+    if await note_trigger(redis_conn, key, ttl_seconds=900):
+        ...  # first trigger of a burst: schedule a check
+
+Nothing sleeps while a burst settles. The scheduled check calls
+``quiet_at``, which returns when the burst will have been quiet for
+``quiet_seconds`` (but never later than ``max_delay_seconds`` after its
+first trigger). Before then the caller schedules another check; after it,
+the caller ``claim``s the key. Only the caller whose ``DEL`` removes the key
+runs the job; triggers arriving after the claim start a new burst. A burst
+older than the TTL is treated as lost and restarted, so a dropped check
+cannot suppress syncs for long.
+"""
+
+import time
+
+from redis import asyncio as aioredis  # type: ignore
+
+DEBOUNCE_KEY_PREFIX = "debounce"
+
+
+def debounce_key(*parts: object) -> str:
+    """Build the Redis key for a debounced job."""
+    return ":".join([DEBOUNCE_KEY_PREFIX, *(str(part) for part in parts)])
+
+
+async def note_trigger(
+    redis_conn: aioredis.Redis,
+    key: str,
+    *,
+    ttl_seconds: int,
+    now: float | None = None,
+) -> bool:
+    """Record a trigger for ``key``.
+
+    Returns:
+        True when the trigger starts a new burst, i.e. the caller should
+        enqueue the debounced job.
+    """
+    now = time.time() if now is None else now
+    pipe = redis_conn.pipeline(transaction=True)
+    pipe.hsetnx(key, "first", repr(now))
+    pipe.hset(key, "last", repr(now))
+    pipe.hget(key, "first")
+    pipe.expire(key, ttl_seconds)
+    started, _, first, _ = await pipe.execute()
+    if started:
+        return True
+    if now - float(first) <= ttl_seconds:
+        return False
+    # The job for this burst was lost; start over rather than wait for expiry.
+    pipe = redis_conn.pipeline(transaction=True)
+    pipe.delete(key)
+    pipe.hset(key, mapping={"first": repr(now), "last": repr(now)})
+    pipe.expire(key, ttl_seconds)
+    await pipe.execute()
+    return True
+
+
+async def quiet_at(
+    redis_conn: aioredis.Redis,
+    key: str,
+    *,
+    quiet_seconds: float,
+    max_delay_seconds: float,
+) -> float | None:
+    """Return the epoch at which the burst on ``key`` may be claimed.
+
+    Returns:
+        The end of the quiet period after the last trigger, capped at the
+        maximum delay after the first, or None if there is no pending burst.
+    """
+    first, last = await redis_conn.hmget(key, ["first", "last"])
+    if first is None or last is None:
+        return None
+    return min(float(last) + quiet_seconds, float(first) + max_delay_seconds)
+
+
+async def claim(redis_conn: aioredis.Redis, key: str) -> bool:
+    """Claim the burst on ``key``.
+
+    Returns:
+        True if this caller removed the burst and should run the job.
+    """
+    return bool(await redis_conn.delete(key))
@@ -0,0 +1,109 @@
+"""Enqueue-time deduplication for per-user worker tasks.
+
+When workers fall behind, the crons and webhooks keep enqueueing jobs for
+users who already have the same job waiting in the queue, which turns a
+short backlog into a long one. Tasks opt in with a ``dedup_by`` label
+naming the kwargs that identify a job::
+
+    @broker.task(dedup_by="user_id,calendar_id")
+
+``JobDedupMiddleware.pre_send`` turns that into a ``dedup_key`` label, the
+broker claims the key with ``SET NX EX`` before pushing (dropping the
+message if the key is taken), and ``pre_execute`` releases the key once a
+worker picks the job up, so work arriving while a job runs is not lost.
+The TTL only bounds how long a lost message can suppress new jobs.
+"""
+
+from collections import Counter
+from collections.abc import Sequence
+
+from loguru import logger
+from redis import asyncio as aioredis  # type: ignore
+from taskiq import TaskiqMessage, TaskiqMiddleware
+from taskiq.message import BrokerMessage
+
+from lykke.core.config import settings
+
+DEDUP_BY_LABEL = "dedup_by"
+DEDUP_KEY_LABEL = "dedup_key"
+DEDUP_KEY_PREFIX = "job-dedup"
+COALESCED_COUNTER_KEY = "job-dedup:coalesced"
+
+
+def dedup_key_for(message: TaskiqMessage) -> str | None:
+    """Build the dedup key for a message, or None if the task does not opt in."""
+    dedup_by = message.labels.get(DEDUP_BY_LABEL)
+    if not dedup_by:
+        return None
+
+    parts: list[str] = []
+    for field_name in str(dedup_by).split(","):
+        value = message.kwargs.get(field_name.strip())
+        if value is None:
+            return None
+        parts.append(str(value))
+    return ":".join([DEDUP_KEY_PREFIX, message.task_name, *parts])
+
+
+async def claim_dedup_keys(
+    redis_conn: aioredis.Redis,
+    messages: Sequence[BrokerMessage],
+) -> list[BrokerMessage]:
+    """Claim dedup keys for ``messages`` and return the ones to push.
+
+    Messages without a dedup key are always kept. Keys are claimed in one
+    pipelined round trip; duplicates within ``messages`` lose to the first.
+    Dropped messages are counted per task in ``COALESCED_COUNTER_KEY``.
+    """
+    keyed = [m for m in messages if m.labels.get(DEDUP_KEY_LABEL)]
+    if not keyed:
+        return list(messages)
+
+    pipe = redis_conn.pipeline(transaction=False)
+    for message in keyed:
+        pipe.set(
+            message.labels[DEDUP_KEY_LABEL],
+            message.task_id,
+            nx=True,
+            ex=settings.WORKER_DEDUP_TTL_SECONDS,
+        )
+    results = await pipe.execute()
+
+    dropped = {id(m) for m, claimed in zip(keyed, results, strict=True) if not claimed}
+    if not dropped:
+        return list(messages)
+
+    coalesced = Counter(m.task_name for m in keyed if id(m) in dropped)
+    pipe = redis_conn.pipeline(transaction=False)
+    for task_name, count in coalesced.items():
+        pipe.hincrby(COALESCED_COUNTER_KEY, task_name, count)
+    await pipe.execute()
+    for task_name, count in coalesced.items():
+        logger.info(f"Coalesced {count} {task_name} jobs already pending")
+
+    return [m for m in messages if id(m) not in dropped]
+
+
+class JobDedupMiddleware(TaskiqMiddleware):
+    """Attach dedup keys on send and release them when a job starts."""
+
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        key = dedup_key_for(message)
+        if key is not None:
+            message.labels[DEDUP_KEY_LABEL] = key
+        return message
+
+    async def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        key = message.labels.get(DEDUP_KEY_LABEL)
+        pool: aioredis.ConnectionPool | None = getattr(
+            self.broker, "connection_pool", None
+        )
+        if not key or pool is None:
+            return message
+        try:
+            async with aioredis.Redis(connection_pool=pool) as redis_conn:
+                await redis_conn.delete(key)
+        except Exception:  # pylint: disable=broad-except
+            # The TTL releases the key eventually; never fail the job over it.
+            logger.exception(f"Failed to release dedup key {key}")
+        return message
@@ -0,0 +1,103 @@
+"""Priority classes for worker queues.
+
+Every task declares the class of work it does through the ``queue_name``
+label, which the broker uses to pick the Redis list it is pushed to::
+
+    @broker.task(queue_name=QueueClass.CRITICAL.queue_name)
+
+Workers pop with a single ``BRPOP`` over their configured queues in
+priority order (``WORKER_QUEUES``), so minute-critical jobs such as alarms
+never wait behind LLM or calendar-sync bursts. Deployments can also run
+dedicated worker processes per class, e.g. ``WORKER_QUEUES=critical``.
+
+``QueueLagMiddleware`` reports how long jobs waited in each class.
+"""
+
+import time
+from enum import Enum
+
+from loguru import logger
+from redis import asyncio as aioredis  # type: ignore
+from taskiq import TaskiqMessage, TaskiqMiddleware
+
+from lykke.core.config import settings
+
+ENQUEUED_AT_LABEL = "enqueued_at"
+QUEUE_LAG_KEY = "queue-lag"
+
+
+class QueueClass(str, Enum):
+    """Latency class of a worker task, highest priority first."""
+
+    CRITICAL = "critical"  # alarms, reminders, timing status
+    DEFAULT = "default"
+    HEAVY = "heavy"  # LLM-bound work and calendar syncs
+
+    @property
+    def queue_name(self) -> str:
+        # DEFAULT keeps taskiq's queue name so already-queued messages drain.
+        if self is QueueClass.DEFAULT:
+            return "taskiq"
+        return f"taskiq:{self.value}"
+
+    @classmethod
+    def from_queue_name(cls, queue_name: str | None) -> "QueueClass":
+        for queue_class in cls:
+            if queue_class.queue_name == queue_name:
+                return queue_class
+        return cls.DEFAULT
+
+
+def worker_queue_names(raw: str | None = None) -> list[str]:
+    """Resolve the Redis lists a worker listens on, in priority order.
+
+    Args:
+        raw: Comma-separated queue classes. Defaults to ``WORKER_QUEUES``.
+    """
+    names = raw if raw is not None else settings.WORKER_QUEUES
+    classes = {QueueClass(name.strip()) for name in names.split(",") if name.strip()}
+    return [
+        queue_class.queue_name for queue_class in QueueClass if queue_class in classes
+    ]
+
+
+class QueueLagMiddleware(TaskiqMiddleware):
+    """Stamp messages on send and report their queue wait per class.
+
+    The last lag, running total and job count per class are kept in the
+    ``QUEUE_LAG_KEY`` hash; lags above ``WORKER_QUEUE_LAG_WARN_SECONDS``
+    are logged as warnings.
+    """
+
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        message.labels[ENQUEUED_AT_LABEL] = time.time()
+        return message
+
+    async def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        enqueued_at = message.labels.get(ENQUEUED_AT_LABEL)
+        if enqueued_at is None:
+            return message
+
+        lag = max(0.0, time.time() - float(enqueued_at))
+        queue_class = QueueClass.from_queue_name(message.labels.get("queue_name"))
+        if lag > settings.WORKER_QUEUE_LAG_WARN_SECONDS:
+            logger.warning(
+                f"{message.task_name} waited {lag:.1f}s in the "
+                f"{queue_class.value} queue"
+            )
+
+        pool: aioredis.ConnectionPool | None = getattr(
+            self.broker, "connection_pool", None
+        )
+        if pool is None:
+            return message
+        try:
+            async with aioredis.Redis(connection_pool=pool) as redis_conn:
+                pipe = redis_conn.pipeline(transaction=False)
+                pipe.hset(QUEUE_LAG_KEY, f"{queue_class.value}:last", round(lag, 3))
+                pipe.hincrbyfloat(QUEUE_LAG_KEY, f"{queue_class.value}:total", lag)
+                pipe.hincrby(QUEUE_LAG_KEY, f"{queue_class.value}:count", 1)
+                await pipe.execute()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed to record queue lag")
+        return message
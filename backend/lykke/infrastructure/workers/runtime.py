@@ -0,0 +1,96 @@
+"""Worker-lifetime shared resources.
+
+A worker process runs many short tasks. Building Redis clients, HTTP
+sessions and LLM clients inside every task dominates the runtime of the
+minute-level tasks, so the broker startup hook builds them once and tasks
+receive them through ``taskiq_dependencies``.
+"""
+
+from dataclasses import dataclass
+from typing import Annotated
+
+import aiohttp
+from loguru import logger
+from redis import asyncio as aioredis  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncEngine
+from taskiq import Context, TaskiqDepends
+
+from lykke.core.config import settings
+from lykke.core.utils.templates import warm_templates
+from lykke.infrastructure.database import close_engine, get_engine
+from lykke.infrastructure.gateways import (
+    RedisDueScheduleGateway,
+    RedisLLMRunFingerprintGateway,
+    RedisPubSubGateway,
+)
+from lykke.infrastructure.gateways.llm_gateway_factory import InfraLLMGatewayFactory
+from lykke.infrastructure.repository_factories import (
+    SqlAlchemyReadOnlyRepositoryFactory,
+)
+
+
+@dataclass
+class WorkerRuntime:
+    """Resources shared by every task a worker process runs."""
+
+    redis_pool: aioredis.ConnectionPool
+    http_session: aiohttp.ClientSession
+    engine: AsyncEngine
+    due_schedule_gateway: RedisDueScheduleGateway
+    llm_gateway_factory: InfraLLMGatewayFactory
+    llm_run_fingerprint_gateway: RedisLLMRunFingerprintGateway
+    ro_repo_factory: SqlAlchemyReadOnlyRepositoryFactory
+
+    def create_pubsub_gateway(self) -> RedisPubSubGateway:
+        """Create a PubSub gateway backed by the shared connection pool.
+
+        Closing the returned gateway only releases its client, not the pool.
+        """
+        return RedisPubSubGateway(redis_pool=self.redis_pool)
+
+
+async def start_worker_runtime() -> WorkerRuntime:
+    """Build the shared resources for a worker process."""
+    warm_templates()
+    redis_pool = aioredis.ConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        encoding="utf-8",
+        decode_responses=False,
+    )
+    runtime = WorkerRuntime(
+        redis_pool=redis_pool,
+        http_session=aiohttp.ClientSession(),
+        engine=get_engine(),
+        due_schedule_gateway=RedisDueScheduleGateway(redis_pool=redis_pool),
+        llm_gateway_factory=InfraLLMGatewayFactory(),
+        llm_run_fingerprint_gateway=RedisLLMRunFingerprintGateway(
+            redis_pool=redis_pool
+        ),
+        ro_repo_factory=SqlAlchemyReadOnlyRepositoryFactory(),
+    )
+    logger.info(
+        f"Started worker runtime (max_connections={settings.REDIS_MAX_CONNECTIONS})"
+    )
+    return runtime
+
+
+async def stop_worker_runtime(runtime: WorkerRuntime) -> None:
+    """Release the shared resources of a worker process."""
+    await runtime.due_schedule_gateway.close()
+    await runtime.llm_run_fingerprint_gateway.close()
+    await runtime.http_session.close()
+    await close_engine()
+    await runtime.redis_pool.disconnect()
+    logger.info("Stopped worker runtime")
+
+
+def get_worker_runtime(
+    context: Annotated[Context, TaskiqDepends()],
+) -> WorkerRuntime | None:
+    """Resolve the worker runtime stored on the broker state.
+
+    Returns None when the broker was not started as a worker (e.g. when a
+    task is awaited directly).
+    """
+    return getattr(context.state, "runtime", None)
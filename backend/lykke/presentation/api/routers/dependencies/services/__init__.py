@@ -28,7 +28,7 @@ from lykke.application.unit_of_work import (
     UnitOfWorkFactory,
 )
 from lykke.domain.entities import UserEntity
-from lykke.infrastructure.gateways import RedisPubSubGateway
+from lykke.infrastructure.gateways import RedisDueScheduleGateway, RedisPubSubGateway
 from lykke.infrastructure.repository_factories import (
     SqlAlchemyReadOnlyRepositoryFactory,
 )
@@ -77,7 +77,7 @@ async def get_unit_of_work_factory(
 ) -> AsyncIterator[UnitOfWorkFactory]:
     """Get a UnitOfWorkFactory instance for HTTP requests.
 
-    Creates a RedisPubSubGateway with proper cleanup to avoid connection leaks.
+    Creates the Redis-backed gateways with proper cleanup to avoid connection leaks.
 
     Args:
         request: FastAPI Request object
@@ -87,13 +87,16 @@ async def get_unit_of_work_factory(
     """
     redis_pool = getattr(request.app.state, "redis_pool", None)
     pubsub_gateway = RedisPubSubGateway(redis_pool=redis_pool)
+    due_schedule_gateway = RedisDueScheduleGateway(redis_pool=redis_pool)
     try:
         yield SqlAlchemyUnitOfWorkFactory(
             pubsub_gateway=pubsub_gateway,
             workers_to_schedule_factory=lambda: WorkersToSchedule(WorkerRegistry()),
+            due_schedule_gateway=due_schedule_gateway,
         )
     finally:
         await pubsub_gateway.close()
+        await due_schedule_gateway.close()
 
 
 async def get_unit_of_work_factory_websocket(
@@ -101,7 +104,7 @@ async def get_unit_of_work_factory_websocket(
 ) -> AsyncIterator[UnitOfWorkFactory]:
     """Get a UnitOfWorkFactory instance for WebSocket requests.
 
-    Creates a RedisPubSubGateway with proper cleanup to avoid connection leaks.
+    Creates the Redis-backed gateways with proper cleanup to avoid connection leaks.
 
     Args:
         websocket: FastAPI WebSocket object
@@ -111,13 +114,16 @@ async def get_unit_of_work_factory_websocket(
     """
     redis_pool = getattr(websocket.app.state, "redis_pool", None)
     pubsub_gateway = RedisPubSubGateway(redis_pool=redis_pool)
+    due_schedule_gateway = RedisDueScheduleGateway(redis_pool=redis_pool)
     try:
         yield SqlAlchemyUnitOfWorkFactory(
             pubsub_gateway=pubsub_gateway,
             workers_to_schedule_factory=lambda: WorkersToSchedule(WorkerRegistry()),
+            due_schedule_gateway=due_schedule_gateway,
         )
     finally:
         await pubsub_gateway.close()
+        await due_schedule_gateway.close()
 
 
 @dataclass(frozen=True)
@@ -17,13 +17,17 @@ from lykke.application.queries.google import (
 )
 from lykke.application.unit_of_work import ReadOnlyRepositoryFactory
 from lykke.core.constants import OAUTH_STATE_EXPIRY
+from lykke.core.utils.channel_tokens import (
+    is_signed_channel_token,
+    verify_channel_token,
+)
 from lykke.domain.entities import UserEntity
 from lykke.infrastructure.gateways.google import GoogleCalendarGateway
 from lykke.infrastructure.unauthenticated import UnauthenticatedIdentityAccess
 from lykke.presentation.handler_factory import QueryHandlerFactory
 from lykke.presentation.workers.tasks.calendar import (
+    request_calendar_sync,
     resubscribe_calendar_task,
-    sync_single_calendar_task,
 )
 
 from .dependencies.factories import create_command_handler
@@ -143,19 +147,26 @@ async def google_webhook(
     ro_repo_factory: Annotated[
         ReadOnlyRepositoryFactory, Depends(get_read_only_repository_factory)
     ],
+    x_goog_channel_id: Annotated[str | None, Header()] = None,
     x_goog_channel_token: Annotated[str | None, Header()] = None,
     x_goog_resource_state: Annotated[str | None, Header()] = None,
 ) -> Response:
     """Webhook endpoint for Google Calendar push notifications.
 
-    Google sends notifications to this endpoint when calendar events change.
-    The actual sync is performed asynchronously via a background task.
+    Google sends notifications to this endpoint when calendar events change,
+    often several for a single edit. Signed tokens are verified from the
+    URL and headers alone, without touching the database; the channel is
+    checked against the calendar's current subscription once the burst
+    settles. Legacy unsigned tokens are checked against the stored
+    subscription here. Bursts are debounced into one background sync (see
+    ``request_calendar_sync``).
 
     Args:
         user_id: The user ID extracted from the webhook URL.
         calendar_id: The calendar ID extracted from the webhook URL.
 
     Headers:
+        X-Goog-Channel-ID: The channel the notification was sent for.
         X-Goog-Channel-Token: Secret token for webhook verification.
         X-Goog-Resource-State: The type of change (sync, exists, not_exists).
 
@@ -167,6 +178,23 @@ async def google_webhook(
         f"state={x_goog_resource_state}"
     )
 
+    if is_signed_channel_token(x_goog_channel_token):
+        if not verify_channel_token(
+            x_goog_channel_token,
+            user_id=user_id,
+            calendar_id=calendar_id,
+            channel_id=x_goog_channel_id,
+        ):
+            logger.warning(f"Invalid channel token for calendar {calendar_id}")
+            return Response(status_code=200)
+
+        # The channel is checked against the calendar's current subscription
+        # once the burst settles, not on every notification.
+        await request_calendar_sync(user_id, calendar_id, channel_id=x_goog_channel_id)
+        return Response(status_code=200)
+
+    # Channels opened before tokens were signed carry a random token, which
+    # can only be checked against the stored subscription.
     identity_access = UnauthenticatedIdentityAccess()
     user = await identity_access.get_user_by_id(user_id)
     if user is None:
@@ -180,14 +208,14 @@ async def google_webhook(
             calendar_id=calendar_id,
             channel_token=x_goog_channel_token,
             resource_state=x_goog_resource_state,
+            channel_id=x_goog_channel_id,
         )
     )
 
     if not result.should_sync:
         return Response(status_code=200)
 
-    # Schedule background task to sync the calendar (initial + incremental)
-    await sync_single_calendar_task.kiq(user_id=user_id, calendar_id=calendar_id)
-    logger.info(f"Scheduled sync task for calendar {calendar_id}")
+    # Collapse notification bursts into one background sync
+    await request_calendar_sync(user_id, calendar_id)
 
     return Response(status_code=200)
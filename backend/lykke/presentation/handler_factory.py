@@ -32,10 +32,17 @@ from lykke.application.commands.task import (
     DeleteTaskHandler,
     RecordTaskActionHandler,
 )
+from lykke.application.gateways.email_provider_protocol import (
+    EmailProviderGatewayProtocol,
+)
 from lykke.application.gateways.google_protocol import GoogleCalendarGatewayProtocol
 from lykke.application.gateways.llm_gateway_factory_protocol import (
     LLMGatewayFactoryProtocol,
 )
+from lykke.application.gateways.llm_run_fingerprint_protocol import (
+    LLMRunFingerprintGatewayProtocol,
+)
+from lykke.application.gateways.pubsub_protocol import PubSubGatewayProtocol
 from lykke.application.gateways.sms_provider_protocol import SMSProviderProtocol
 from lykke.application.gateways.web_push_protocol import WebPushGatewayProtocol
 from lykke.application.identity import CurrentUserAccessProtocol
@@ -47,7 +54,9 @@ from lykke.application.queries import (
     PreviewLLMSnapshotHandler,
 )
 from lykke.application.queries.base import BaseQueryHandler
+from lykke.core.config import settings
 from lykke.infrastructure.gateways import (
+    AsyncGoogleCalendarGateway,
     GoogleCalendarGateway,
     RedisPubSubGateway,
     TwilioGateway,
@@ -70,6 +79,8 @@ CommandHandlerT = TypeVar("CommandHandlerT", bound=BaseCommandHandler)
 
 
 def _default_google_gateway() -> GoogleCalendarGatewayProtocol:
+    if settings.GOOGLE_CALENDAR_NATIVE_CLIENT:
+        return AsyncGoogleCalendarGateway()
     return GoogleCalendarGateway()
 
 
@@ -444,6 +455,13 @@ class CommandHandlerFactory:
         sms_gateway_provider: Callable[[], SMSProviderProtocol] | None = None,
         llm_gateway_factory_provider: Callable[[], LLMGatewayFactoryProtocol]
         | None = None,
+        llm_run_fingerprint_gateway_provider: (
+            Callable[[], LLMRunFingerprintGatewayProtocol] | None
+        ) = None,
+        pubsub_gateway_provider: Callable[[], PubSubGatewayProtocol] | None = None,
+        email_gateway_provider: (
+            Callable[[], EmailProviderGatewayProtocol] | None
+        ) = None,
         registry: dict[type[BaseCommandHandler], CommandHandlerProvider] | None = None,
     ) -> None:
         self.user = user
@@ -467,6 +485,13 @@ class CommandHandlerFactory:
         self._llm_gateway_factory_provider = (
             llm_gateway_factory_provider or _default_llm_gateway_factory
         )
+        self._optional_gateway_providers: dict[
+            type[object], Callable[[], object] | None
+        ] = {
+            LLMRunFingerprintGatewayProtocol: llm_run_fingerprint_gateway_provider,
+            PubSubGatewayProtocol: pubsub_gateway_provider,
+            EmailProviderGatewayProtocol: email_gateway_provider,
+        }
         self._google_gateway: GoogleCalendarGatewayProtocol | None = None
         self._web_push_gateway: WebPushGatewayProtocol | None = None
         self._sms_gateway: SMSProviderProtocol | None = None
@@ -607,6 +632,9 @@ class CommandHandlerFactory:
     def _gateway_provider_for_type(
         self, gateway_type: type[object]
     ) -> Callable[[], object] | None:
+        if gateway_type in self._optional_gateway_providers:
+            # Optional gateways are only wired when a provider was given.
+            return self._optional_gateway_providers[gateway_type]
         return {
             GoogleCalendarGatewayProtocol: lambda: self.google_gateway,
             WebPushGatewayProtocol: lambda: self.web_push_gateway,
@@ -8,12 +8,15 @@ from lykke.infrastructure.workers.config import broker
 from .alarms import trigger_alarms_for_all_users_task, trigger_alarms_for_user_task
 from .brain_dump import process_brain_dump_item_task
 from .calendar import (
+    debounced_calendar_sync_task,
+    request_calendar_sync,
     resubscribe_calendar_task,
     sync_calendar_task,
     sync_single_calendar_task,
 )
 from .common import (
     get_calendar_entry_notification_handler,
+    get_due_schedule_gateway,
     get_google_gateway,
     get_identity_access,
     get_morning_overview_handler,
@@ -27,6 +30,7 @@ from .common import (
     get_sync_calendar_handler,
     get_unit_of_work_factory,
 )
+from .due_schedule import dispatch_due_jobs_task
 from .inbound_sms import process_inbound_sms_message_task
 from .misc import example_triggered_task, heartbeat_task
 from .new_day import (
@@ -52,6 +56,7 @@ from .scheduling import schedule_all_users_day_task, schedule_user_day_task
 from .timing_status import (
     evaluate_timing_status_for_all_users_task,
     evaluate_timing_status_for_user_task,
+    evaluate_timing_status_for_users_task,
 )
 
 # Create a scheduler for periodic tasks
@@ -66,6 +71,8 @@ __all__ = [
     "WorkerRegistry",
     "WorkersToSchedule",
     "clear_worker_overrides",
+    "debounced_calendar_sync_task",
+    "dispatch_due_jobs_task",
     "emit_new_day_event_for_all_users_task",
     "emit_new_day_event_for_user_task",
     "evaluate_calendar_entry_notifications_for_all_users_task",
@@ -75,9 +82,11 @@ __all__ = [
     "evaluate_smart_notification_task",
     "evaluate_timing_status_for_all_users_task",
     "evaluate_timing_status_for_user_task",
+    "evaluate_timing_status_for_users_task",
     "evaluate_smart_notifications_for_all_users_task",
     "example_triggered_task",
     "get_calendar_entry_notification_handler",
+    "get_due_schedule_gateway",
     "get_google_gateway",
     "get_identity_access",
     "get_morning_overview_handler",
@@ -95,6 +104,7 @@ __all__ = [
     "process_brain_dump_item_task",
     "process_inbound_sms_message_task",
     "register_worker_event_handlers",
+    "request_calendar_sync",
     "resubscribe_calendar_task",
     "schedule_all_users_day_task",
     "schedule_user_day_task",
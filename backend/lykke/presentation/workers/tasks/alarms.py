@@ -1,5 +1,6 @@
 """Alarm-related background worker tasks."""
 
+from datetime import timedelta
 from typing import Annotated, Protocol
 from uuid import UUID
 
@@ -10,45 +11,69 @@ from lykke.application.commands.day import (
     TriggerAlarmsForUserCommand,
     TriggerAlarmsForUserHandler,
 )
-from lykke.application.identity import UnauthenticatedIdentityAccessProtocol
+from lykke.application.gateways import DueScheduleGatewayProtocol
+from lykke.application.identity import (
+    CrossUserAlarmStoreProtocol,
+    UnauthenticatedIdentityAccessProtocol,
+)
 from lykke.application.unit_of_work import ReadOnlyRepositoryFactory, UnitOfWorkFactory
+from lykke.core.utils.dates import get_current_datetime
+from lykke.domain import value_objects
 from lykke.infrastructure.gateways import RedisPubSubGateway
+from lykke.infrastructure.workers.bulk import kiq_many
 from lykke.infrastructure.workers.config import broker
+from lykke.infrastructure.workers.queues import QueueClass
+from lykke.infrastructure.workers.runtime import WorkerRuntime, get_worker_runtime
 
 from .common import (
+    arm_next_due,
+    get_alarm_store,
+    get_due_schedule_gateway,
+    get_identity_access,
+    get_pubsub_gateway,
     get_read_only_repository_factory,
     get_trigger_alarms_for_user_handler,
     get_unit_of_work_factory,
-    get_identity_access,
 )
 
+# Slightly longer than the sweep interval so no alarm falls between sweeps.
+SWEEP_HORIZON = timedelta(minutes=65)
+
 
 class _EnqueueTask(Protocol):
     async def kiq(self, **kwargs: object) -> None: ...
 
 
-@broker.task(schedule=[{"cron": "* * * * *"}])  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    schedule=[{"cron": "0 * * * *"}],
+    queue_name=QueueClass.CRITICAL.queue_name,
+)
 async def trigger_alarms_for_all_users_task(
-    identity_access: Annotated[
-        UnauthenticatedIdentityAccessProtocol, Depends(get_identity_access)
-    ],
+    alarm_store: Annotated[CrossUserAlarmStoreProtocol, Depends(get_alarm_store)],
     *,
     enqueue_task: _EnqueueTask | None = None,
 ) -> None:
-    """Trigger alarms for all users every minute."""
-    logger.info("Starting alarm trigger evaluation for all users")
+    """Trigger alarms hourly for users with alarms due soon or overdue.
 
-    users = await identity_access.list_all_users()
-    logger.info(f"Found {len(users)} users to evaluate alarms")
+    Per-minute evaluation is driven by the due-schedule index; this sweep
+    bootstraps the index and re-arms anything it lost. Users are found with
+    a range scan over ``days.next_alarm_at``.
+    """
+    logger.info("Starting alarm trigger evaluation for users with alarms due")
 
     task = enqueue_task or trigger_alarms_for_user_task
-    for user in users:
-        await task.kiq(user_id=user.id)
+    user_ids = await alarm_store.list_user_ids_with_alarms_due_before(
+        get_current_datetime() + SWEEP_HORIZON
+    )
+    await kiq_many(task, ({"user_id": user_id} for user_id in user_ids))
 
-    logger.info("Enqueued alarm trigger tasks for all users")
+    logger.info(f"Enqueued alarm trigger tasks for {len(user_ids)} users")
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    dedup_by="user_id",
+    queue_name=QueueClass.CRITICAL.queue_name,
+)
 async def trigger_alarms_for_user_task(
     user_id: UUID,
     identity_access: Annotated[
@@ -58,15 +83,17 @@ async def trigger_alarms_for_user_task(
     uow_factory: UnitOfWorkFactory | None = None,
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
     command: TriggerAlarmsForUserCommand | None = None,
+    due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
 ) -> None:
     """Trigger alarms for a specific user."""
     logger.info(f"Evaluating alarms for user {user_id}")
 
-    gateway = pubsub_gateway or RedisPubSubGateway()
+    gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
-        uow_factory = uow_factory or get_unit_of_work_factory(gateway)
-        ro_repo_factory = ro_repo_factory or get_read_only_repository_factory()
+        uow_factory = uow_factory or get_unit_of_work_factory(gateway, runtime=runtime)
+        ro_repo_factory = ro_repo_factory or get_read_only_repository_factory(runtime)
 
         user = await identity_access.get_user_by_id(user_id)
         if user is None:
@@ -77,8 +104,16 @@ async def trigger_alarms_for_user_task(
             user=user,
             uow_factory=uow_factory,
             ro_repo_factory=ro_repo_factory,
+            runtime=runtime,
+        )
+        next_due = await handler.handle(command or TriggerAlarmsForUserCommand())
+        await arm_next_due(
+            user_id,
+            value_objects.DueJobKind.ALARMS,
+            next_due,
+            due_schedule_gateway=due_schedule_gateway
+            or get_due_schedule_gateway(runtime),
         )
-        await handler.handle(command or TriggerAlarmsForUserCommand())
 
         logger.info(f"Alarm evaluation completed for user {user_id}")
     finally:
@@ -1,18 +1,22 @@
 """Brain dump background worker tasks."""
 
 from datetime import date as dt_date
-from typing import Protocol
+from typing import Annotated, Protocol
 from uuid import UUID
 
 from loguru import logger
+from taskiq_dependencies import Depends
 
 from lykke.application.commands.brain_dump import ProcessBrainDumpCommand
 from lykke.application.unit_of_work import ReadOnlyRepositoryFactory, UnitOfWorkFactory
 from lykke.infrastructure.gateways import RedisPubSubGateway
 from lykke.infrastructure.workers.config import broker
+from lykke.infrastructure.workers.queues import QueueClass
+from lykke.infrastructure.workers.runtime import WorkerRuntime, get_worker_runtime
 
 from .common import (
     get_process_brain_dump_handler,
+    get_pubsub_gateway,
     get_read_only_repository_factory,
     get_unit_of_work_factory,
     load_user,
@@ -23,7 +27,7 @@ class _BrainDumpHandler(Protocol):
     async def handle(self, command: ProcessBrainDumpCommand) -> None: ...
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(queue_name=QueueClass.HEAVY.queue_name)  # type: ignore[untyped-decorator]
 async def process_brain_dump_item_task(
     user_id: UUID,
     day_date: str,
@@ -33,6 +37,7 @@ async def process_brain_dump_item_task(
     uow_factory: UnitOfWorkFactory | None = None,
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
 ) -> None:
     """Process a brain dump item for a specific user."""
     logger.info(f"Starting brain dump processing for user {user_id} item {item_id}")
@@ -45,7 +50,7 @@ async def process_brain_dump_item_task(
         )
         return
 
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         if handler is None:
             try:
@@ -56,8 +61,11 @@ async def process_brain_dump_item_task(
 
             handler = get_process_brain_dump_handler(
                 user=user,
-                uow_factory=uow_factory or get_unit_of_work_factory(pubsub_gateway),
-                ro_repo_factory=ro_repo_factory or get_read_only_repository_factory(),
+                uow_factory=uow_factory
+                or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+                ro_repo_factory=ro_repo_factory
+                or get_read_only_repository_factory(runtime),
+                runtime=runtime,
             )
 
         try:
@@ -1,23 +1,46 @@
 """Calendar-related background worker tasks."""
 
-from typing import Protocol
+from datetime import UTC, datetime, timedelta
+from typing import Annotated, Protocol
 from uuid import UUID
 
 from loguru import logger
+from redis import asyncio as aioredis  # type: ignore
+from taskiq_dependencies import Depends
 
 from lykke.application.commands.calendar import (
     SubscribeCalendarCommand,
     SyncAllCalendarsCommand,
     SyncCalendarCommand,
 )
+from lykke.application.gateways import DueScheduleGatewayProtocol
 from lykke.application.gateways.google_protocol import GoogleCalendarGatewayProtocol
-from lykke.application.unit_of_work import ReadOnlyRepositoryFactory, UnitOfWorkFactory
+from lykke.application.unit_of_work import (
+    ReadOnlyRepositories,
+    ReadOnlyRepositoryFactory,
+    UnitOfWorkFactory,
+)
+from lykke.core.config import settings
+from lykke.core.exceptions import NotFoundError
+from lykke.core.utils.dates import get_current_datetime
+from lykke.domain import value_objects
 from lykke.domain.entities import UserEntity
 from lykke.infrastructure.gateways import RedisPubSubGateway
 from lykke.infrastructure.workers.config import broker
+from lykke.infrastructure.workers.debounce import (
+    claim,
+    debounce_key,
+    note_trigger,
+    quiet_at,
+)
+from lykke.infrastructure.workers.queues import QueueClass
+from lykke.infrastructure.workers.runtime import WorkerRuntime, get_worker_runtime
 
 from .common import (
+    arm_next_due,
+    get_due_schedule_gateway,
     get_google_gateway,
+    get_pubsub_gateway,
     get_read_only_repository_factory,
     get_subscribe_calendar_handler,
     get_sync_all_calendars_handler,
@@ -45,7 +68,10 @@ class _SubscribeCalendarHandler(Protocol):
     async def handle(self, command: SubscribeCalendarCommand) -> object: ...
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    dedup_by="user_id",
+    queue_name=QueueClass.HEAVY.queue_name,
+)
 async def sync_calendar_task(
     user_id: UUID,
     *,
@@ -54,6 +80,7 @@ async def sync_calendar_task(
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     google_gateway: GoogleCalendarGatewayProtocol | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
 ) -> None:
     """Sync all calendar entries for a specific user.
 
@@ -64,7 +91,7 @@ async def sync_calendar_task(
     """
     logger.info(f"Starting calendar sync for user {user_id}")
 
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         resolved_handler: _SyncAllCalendarsHandler
         if handler is None:
@@ -76,9 +103,12 @@ async def sync_calendar_task(
 
             resolved_handler = get_sync_all_calendars_handler(
                 user=user,
-                uow_factory=uow_factory or get_unit_of_work_factory(pubsub_gateway),
-                ro_repo_factory=ro_repo_factory or get_read_only_repository_factory(),
-                google_gateway=google_gateway or get_google_gateway(),
+                uow_factory=uow_factory
+                or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+                ro_repo_factory=ro_repo_factory
+                or get_read_only_repository_factory(runtime),
+                google_gateway=google_gateway or get_google_gateway(runtime),
+                runtime=runtime,
             )
         else:
             resolved_handler = handler
@@ -90,7 +120,10 @@ async def sync_calendar_task(
         await pubsub_gateway.close()
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    dedup_by="user_id,calendar_id",
+    queue_name=QueueClass.HEAVY.queue_name,
+)
 async def sync_single_calendar_task(
     user_id: UUID,
     calendar_id: UUID,
@@ -100,6 +133,7 @@ async def sync_single_calendar_task(
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     google_gateway: GoogleCalendarGatewayProtocol | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
 ) -> None:
     """Sync a single calendar for a user (triggered by webhook).
 
@@ -113,7 +147,7 @@ async def sync_single_calendar_task(
         f"Starting single calendar sync for user {user_id}, calendar {calendar_id}"
     )
 
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         resolved_handler: _SyncCalendarHandler
         if handler is None:
@@ -127,9 +161,12 @@ async def sync_single_calendar_task(
 
             resolved_handler = get_sync_calendar_handler(
                 user=user,
-                uow_factory=uow_factory or get_unit_of_work_factory(pubsub_gateway),
-                ro_repo_factory=ro_repo_factory or get_read_only_repository_factory(),
-                google_gateway=google_gateway or get_google_gateway(),
+                uow_factory=uow_factory
+                or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+                ro_repo_factory=ro_repo_factory
+                or get_read_only_repository_factory(runtime),
+                google_gateway=google_gateway or get_google_gateway(runtime),
+                runtime=runtime,
             )
         else:
             resolved_handler = handler
@@ -143,7 +180,167 @@ async def sync_single_calendar_task(
         await pubsub_gateway.close()
 
 
-@broker.task  # type: ignore[untyped-decorator]
+def _calendar_sync_debounce_key(user_id: UUID, calendar_id: UUID) -> str:
+    return debounce_key("calendar-sync", user_id, calendar_id)
+
+
+def _pending_calendar_syncs_key(user_id: UUID) -> str:
+    return debounce_key("calendar-sync-pending", user_id)
+
+
+def _burst_channels_key(user_id: UUID, calendar_id: UUID) -> str:
+    return debounce_key("calendar-sync-channels", user_id, calendar_id)
+
+
+async def request_calendar_sync(
+    user_id: UUID,
+    calendar_id: UUID,
+    *,
+    channel_id: str | None = None,
+    redis_conn: aioredis.Redis | None = None,
+    due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
+) -> None:
+    """Request a debounced sync of a calendar after a change notification.
+
+    The first notification of a burst marks the calendar as pending and arms
+    the user's calendar-sync due entry for the end of the quiet period;
+    later ones only push the sync back, up to the maximum delay.
+
+    ``channel_id`` is given for notifications not yet checked against the
+    calendar's current subscription; the channels seen in a burst are checked
+    once when it settles.
+    """
+    redis_conn = redis_conn or aioredis.Redis(connection_pool=broker.connection_pool)
+    if channel_id is not None:
+        channels_key = _burst_channels_key(user_id, calendar_id)
+        await redis_conn.sadd(channels_key, channel_id)
+        await redis_conn.expire(channels_key, settings.WORKER_DEDUP_TTL_SECONDS)
+    started = await note_trigger(
+        redis_conn,
+        _calendar_sync_debounce_key(user_id, calendar_id),
+        ttl_seconds=settings.WORKER_DEDUP_TTL_SECONDS,
+    )
+    if not started:
+        return
+
+    await redis_conn.sadd(_pending_calendar_syncs_key(user_id), str(calendar_id))
+    await arm_next_due(
+        user_id,
+        value_objects.DueJobKind.CALENDAR_SYNC,
+        get_current_datetime()
+        + timedelta(seconds=settings.GOOGLE_WEBHOOK_QUIET_SECONDS),
+        due_schedule_gateway=due_schedule_gateway,
+    )
+
+
+@broker.task(  # type: ignore[untyped-decorator]
+    dedup_by="user_id",
+    queue_name=QueueClass.DEFAULT.queue_name,
+)
+async def debounced_calendar_sync_task(
+    user_id: UUID,
+    *,
+    redis_conn: aioredis.Redis | None = None,
+    ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
+    due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
+) -> None:
+    """Enqueue syncs for a user's calendars whose notification bursts settled.
+
+    Woken from the due-schedule index. Calendars still inside their burst
+    re-arm the user's entry for the earliest settle time instead of waiting
+    in the worker. A settled burst whose notifications all came from
+    channels other than the calendar's current subscription (channels from
+    earlier subscriptions keep delivering until they expire) is dropped.
+
+    Args:
+        user_id: The user ID that owns the calendars.
+    """
+    redis_conn = redis_conn or aioredis.Redis(connection_pool=broker.connection_pool)
+    pending_key = _pending_calendar_syncs_key(user_id)
+    now = get_current_datetime().timestamp()
+    next_check: float | None = None
+    ro_repos: ReadOnlyRepositories | None = None
+
+    for member in await redis_conn.smembers(pending_key):
+        calendar_id = UUID(member.decode() if isinstance(member, bytes) else member)
+        key = _calendar_sync_debounce_key(user_id, calendar_id)
+        settles_at = await quiet_at(
+            redis_conn,
+            key,
+            quiet_seconds=settings.GOOGLE_WEBHOOK_QUIET_SECONDS,
+            max_delay_seconds=settings.GOOGLE_WEBHOOK_MAX_DELAY_SECONDS,
+        )
+        if settles_at is not None and settles_at > now:
+            next_check = (
+                settles_at if next_check is None else min(next_check, settles_at)
+            )
+            continue
+
+        # Unmark before claiming, so a burst starting after the claim marks
+        # the calendar again.
+        await redis_conn.srem(pending_key, member)
+        if settles_at is None or not await claim(redis_conn, key):
+            logger.debug(f"Calendar {calendar_id} sync burst already claimed")
+            continue
+
+        channel_ids = await _pop_burst_channel_ids(redis_conn, user_id, calendar_id)
+        if channel_ids:
+            if ro_repos is None:
+                try:
+                    user = await load_user(user_id)
+                except Exception:
+                    logger.warning(f"User not found for calendar sync task {user_id}")
+                    return
+                ro_factory = ro_repo_factory or get_read_only_repository_factory(
+                    runtime
+                )
+                ro_repos = ro_factory.create(user)
+            if not await _is_current_subscription(ro_repos, calendar_id, channel_ids):
+                logger.warning(
+                    f"Dropping sync for calendar {calendar_id}: notified only by "
+                    f"channels {sorted(channel_ids)} from earlier subscriptions"
+                )
+                continue
+
+        await sync_single_calendar_task.kiq(user_id=user_id, calendar_id=calendar_id)
+        logger.info(f"Scheduled debounced sync for calendar {calendar_id}")
+
+    if next_check is not None:
+        await arm_next_due(
+            user_id,
+            value_objects.DueJobKind.CALENDAR_SYNC,
+            datetime.fromtimestamp(next_check, UTC),
+            due_schedule_gateway=due_schedule_gateway
+            or get_due_schedule_gateway(runtime),
+        )
+
+
+async def _pop_burst_channel_ids(
+    redis_conn: aioredis.Redis, user_id: UUID, calendar_id: UUID
+) -> set[str]:
+    """Return and clear the unchecked channels that notified during a burst."""
+    key = _burst_channels_key(user_id, calendar_id)
+    members = await redis_conn.smembers(key)
+    await redis_conn.delete(key)
+    return {
+        member.decode() if isinstance(member, bytes) else member for member in members
+    }
+
+
+async def _is_current_subscription(
+    ro_repos: ReadOnlyRepositories, calendar_id: UUID, channel_ids: set[str]
+) -> bool:
+    """Return whether one of ``channel_ids`` is the calendar's subscription."""
+    try:
+        calendar = await ro_repos.calendar_ro_repo.get(calendar_id)
+    except NotFoundError:
+        return False
+    subscription = calendar.sync_subscription
+    return subscription is not None and subscription.subscription_id in channel_ids
+
+
+@broker.task(queue_name=QueueClass.HEAVY.queue_name)  # type: ignore[untyped-decorator]
 async def resubscribe_calendar_task(
     user_id: UUID,
     calendar_id: UUID,
@@ -153,6 +350,7 @@ async def resubscribe_calendar_task(
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     google_gateway: GoogleCalendarGatewayProtocol | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
 ) -> None:
     """Resubscribe a calendar to push notifications (after re-authentication).
 
@@ -167,7 +365,7 @@ async def resubscribe_calendar_task(
         f"Starting calendar resubscription for user {user_id}, calendar {calendar_id}"
     )
 
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         resolved_handler: _SubscribeCalendarHandler
         user: UserEntity
@@ -182,15 +380,18 @@ async def resubscribe_calendar_task(
 
             resolved_handler = get_subscribe_calendar_handler(
                 user=user,
-                uow_factory=uow_factory or get_unit_of_work_factory(pubsub_gateway),
-                ro_repo_factory=ro_repo_factory or get_read_only_repository_factory(),
-                google_gateway=google_gateway or get_google_gateway(),
+                uow_factory=uow_factory
+                or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+                ro_repo_factory=ro_repo_factory
+                or get_read_only_repository_factory(runtime),
+                google_gateway=google_gateway or get_google_gateway(runtime),
+                runtime=runtime,
             )
         else:
             resolved_handler = handler
             user = handler.user
 
-        ro_factory = ro_repo_factory or get_read_only_repository_factory()
+        ro_factory = ro_repo_factory or get_read_only_repository_factory(runtime)
         ro_repos = ro_factory.create(user)
         calendar = await ro_repos.calendar_ro_repo.get(calendar_id)
 
@@ -2,23 +2,41 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from datetime import datetime
 from typing import TYPE_CHECKING, cast
 from uuid import UUID
 
+from loguru import logger
+
+from lykke.application.gateways.due_schedule_protocol import (
+    DueScheduleGatewayProtocol,
+)
 from lykke.application.gateways.google_protocol import GoogleCalendarGatewayProtocol
+from lykke.application.identity import UnauthenticatedIdentityAccessProtocol
 from lykke.application.repositories import DayRepositoryReadOnlyProtocol
 from lykke.application.unit_of_work import ReadOnlyRepositoryFactory, UnitOfWorkFactory
+from lykke.core.config import settings
 from lykke.core.exceptions import NotFoundError
+from lykke.domain import value_objects
 from lykke.domain.entities import UserEntity
-from lykke.infrastructure.gateways import GoogleCalendarGateway, RedisPubSubGateway
+from lykke.infrastructure.gateways import (
+    AsyncGoogleCalendarGateway,
+    GoogleCalendarGateway,
+    RedisDueScheduleGateway,
+    RedisPubSubGateway,
+)
 from lykke.infrastructure.repositories import DayRepository
-from lykke.infrastructure.unauthenticated import UnauthenticatedIdentityAccess
+from lykke.infrastructure.unauthenticated import (
+    UnauthenticatedAlarmStore,
+    UnauthenticatedIdentityAccess,
+    UnauthenticatedTimingStatusStore,
+)
 from lykke.presentation.workers.tasks.post_commit_workers import WorkersToSchedule
 from lykke.presentation.workers.tasks.registry import WorkerRegistry
 
 if TYPE_CHECKING:
     from lykke.application.commands import ScheduleDayHandler
-    from lykke.application.commands.timing_status import EvaluateTimingStatusHandler
     from lykke.application.commands.brain_dump import ProcessBrainDumpHandler
     from lykke.application.commands.calendar import (
         SubscribeCalendarHandler,
@@ -32,44 +50,208 @@ if TYPE_CHECKING:
         MorningOverviewHandler,
         SmartNotificationHandler,
     )
+    from lykke.application.commands.timing_status import (
+        EvaluateTimingStatusBatchHandler,
+        EvaluateTimingStatusHandler,
+    )
+    from lykke.infrastructure.workers.runtime import WorkerRuntime
     from lykke.presentation.handler_factory import CommandHandlerFactory
 
 
-def get_google_gateway() -> GoogleCalendarGatewayProtocol:
-    """Get a GoogleCalendarGateway instance."""
-    return GoogleCalendarGateway()
+def get_google_gateway(
+    runtime: WorkerRuntime | None = None,
+) -> GoogleCalendarGatewayProtocol:
+    """Get a Google Calendar gateway.
+
+    The native client shares the worker runtime's HTTP session when available,
+    so calendar calls reuse kept-alive connections.
+    """
+    if not settings.GOOGLE_CALENDAR_NATIVE_CLIENT:
+        return GoogleCalendarGateway()
+    session = runtime.http_session if runtime is not None else None
+    return AsyncGoogleCalendarGateway(session=session)
+
+
+def get_pubsub_gateway(runtime: WorkerRuntime | None = None) -> RedisPubSubGateway:
+    """Get a RedisPubSubGateway for a single task.
+
+    Uses the worker runtime's shared connection pool when available, so
+    closing the gateway at the end of the task only releases its client.
+    """
+    if runtime is not None:
+        return runtime.create_pubsub_gateway()
+    return RedisPubSubGateway()
+
+
+_due_schedule_gateway: RedisDueScheduleGateway | None = None
+
+
+def get_due_schedule_gateway(
+    runtime: WorkerRuntime | None = None,
+) -> DueScheduleGatewayProtocol:
+    """Get the worker process's shared due-schedule gateway.
+
+    The gateway connects lazily and is reused across tasks so each task
+    does not open its own Redis connection.
+    """
+    if runtime is not None:
+        return runtime.due_schedule_gateway
+    global _due_schedule_gateway
+    if _due_schedule_gateway is None:
+        _due_schedule_gateway = RedisDueScheduleGateway()
+    return _due_schedule_gateway
+
+
+async def arm_next_due(
+    user_id: UUID,
+    kind: value_objects.DueJobKind,
+    due_at: datetime | None,
+    *,
+    due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
+) -> None:
+    """Record when a user's job of ``kind`` next has work to do.
+
+    Failures are logged rather than raised; the hourly sweep re-arms anything
+    missed here.
+    """
+    if due_at is None:
+        return
+    gateway = due_schedule_gateway or get_due_schedule_gateway()
+    try:
+        await gateway.arm_many(
+            [value_objects.DueScheduleEntry(user_id=user_id, kind=kind, due_at=due_at)]
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.exception(f"Failed to arm {kind.value} due time for user {user_id}")
+
+
+async def arm_next_due_many(
+    kind: value_objects.DueJobKind,
+    due_by_user: Mapping[UUID, datetime | None],
+    *,
+    due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
+) -> None:
+    """Record the next due instants for many users in one round trip.
+
+    Like ``arm_next_due``, failures are logged and left to the hourly sweep.
+    """
+    entries = [
+        value_objects.DueScheduleEntry(user_id=user_id, kind=kind, due_at=due_at)
+        for user_id, due_at in due_by_user.items()
+        if due_at is not None
+    ]
+    if not entries:
+        return
+    gateway = due_schedule_gateway or get_due_schedule_gateway()
+    try:
+        await gateway.arm_many(entries)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception(
+            f"Failed to arm {kind.value} due times for {len(entries)} users"
+        )
 
 
 def get_unit_of_work_factory(
     pubsub_gateway: RedisPubSubGateway | None = None,
+    *,
+    runtime: WorkerRuntime | None = None,
 ) -> UnitOfWorkFactory:
     """Get a UnitOfWorkFactory instance.
 
     Args:
         pubsub_gateway: Optional RedisPubSubGateway instance. If not provided,
             a new one will be created that connects lazily to Redis.
+        runtime: Optional worker runtime providing shared resources.
     """
     from lykke.infrastructure.unit_of_work import SqlAlchemyUnitOfWorkFactory
 
-    gateway = pubsub_gateway or RedisPubSubGateway()
+    gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     return SqlAlchemyUnitOfWorkFactory(
         pubsub_gateway=gateway,
         workers_to_schedule_factory=lambda: WorkersToSchedule(WorkerRegistry()),
+        due_schedule_gateway=get_due_schedule_gateway(runtime),
     )
 
 
-def get_read_only_repository_factory() -> ReadOnlyRepositoryFactory:
+def get_read_only_repository_factory(
+    runtime: WorkerRuntime | None = None,
+) -> ReadOnlyRepositoryFactory:
     """Get a ReadOnlyRepositoryFactory instance."""
-    from lykke.infrastructure.repository_factories import SqlAlchemyReadOnlyRepositoryFactory
+    if runtime is not None:
+        return runtime.ro_repo_factory
+
+    from lykke.infrastructure.repository_factories import (
+        SqlAlchemyReadOnlyRepositoryFactory,
+    )
 
     return SqlAlchemyReadOnlyRepositoryFactory()
 
 
+def create_command_handler_factory(
+    user: UserEntity,
+    uow_factory: UnitOfWorkFactory,
+    ro_repo_factory: ReadOnlyRepositoryFactory,
+    *,
+    runtime: WorkerRuntime | None = None,
+    google_gateway: GoogleCalendarGatewayProtocol | None = None,
+) -> CommandHandlerFactory:
+    """Create a CommandHandlerFactory wired to the worker's shared resources.
+
+    When a worker runtime is available, HTTP gateways share its client
+    session, LLM gateways come from its long-lived factory, LLM handlers can
+    skip runs whose context has not changed and LLM prompt contexts are
+    cached and kept current from the entity-changes stream.
+    """
+    from lykke.infrastructure.gateways import (
+        SendGridGateway,
+        TwilioGateway,
+        WebPushGateway,
+    )
+    from lykke.presentation.handler_factory import CommandHandlerFactory
+
+    def _google_gateway() -> GoogleCalendarGatewayProtocol:
+        return google_gateway or get_google_gateway(runtime)
+
+    if runtime is None:
+        return CommandHandlerFactory(
+            user=user,
+            ro_repo_factory=ro_repo_factory,
+            uow_factory=uow_factory,
+            google_gateway_provider=_google_gateway,
+        )
+
+    session = runtime.http_session
+    llm_gateway_factory = runtime.llm_gateway_factory
+    llm_run_fingerprint_gateway = runtime.llm_run_fingerprint_gateway
+    return CommandHandlerFactory(
+        user=user,
+        ro_repo_factory=ro_repo_factory,
+        uow_factory=uow_factory,
+        google_gateway_provider=_google_gateway,
+        web_push_gateway_provider=lambda: WebPushGateway(session=session),
+        sms_gateway_provider=lambda: TwilioGateway(session=session),
+        email_gateway_provider=lambda: SendGridGateway(session=session),
+        llm_gateway_factory_provider=lambda: llm_gateway_factory,
+        llm_run_fingerprint_gateway_provider=lambda: llm_run_fingerprint_gateway,
+        pubsub_gateway_provider=runtime.create_pubsub_gateway,
+    )
+
+
 def get_identity_access() -> UnauthenticatedIdentityAccess:
     """Get identity access for workers (cross-user lookups allowed)."""
     return UnauthenticatedIdentityAccess()
 
 
+def get_alarm_store() -> UnauthenticatedAlarmStore:
+    """Get cross-user due-alarm lookups for workers."""
+    return UnauthenticatedAlarmStore()
+
+
+def get_timing_status_store() -> UnauthenticatedTimingStatusStore:
+    """Get cross-user timing-status access for workers."""
+    return UnauthenticatedTimingStatusStore()
+
+
 def get_day_repository(user_id: UUID) -> DayRepositoryReadOnlyProtocol:
     """Get a DayRepository instance scoped to the given user."""
     from lykke.presentation.api.routers.dependencies.user import build_synthetic_user
@@ -92,16 +274,17 @@ def get_sync_all_calendars_handler(
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
     google_gateway: GoogleCalendarGatewayProtocol,
+    runtime: WorkerRuntime | None = None,
 ) -> SyncAllCalendarsHandler:
     """Get a SyncAllCalendarsHandler instance for a user."""
     from lykke.application.commands.calendar import SyncAllCalendarsHandler
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
-        google_gateway_provider=lambda: google_gateway,
+    factory = create_command_handler_factory(
+        user,
+        uow_factory,
+        ro_repo_factory,
+        runtime=runtime,
+        google_gateway=google_gateway,
     )
     return factory.create(SyncAllCalendarsHandler)
 
@@ -111,16 +294,17 @@ def get_sync_calendar_handler(
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
     google_gateway: GoogleCalendarGatewayProtocol,
+    runtime: WorkerRuntime | None = None,
 ) -> SyncCalendarHandler:
     """Get a SyncCalendarHandler instance for a user."""
     from lykke.application.commands.calendar import SyncCalendarHandler
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
-        google_gateway_provider=lambda: google_gateway,
+    factory = create_command_handler_factory(
+        user,
+        uow_factory,
+        ro_repo_factory,
+        runtime=runtime,
+        google_gateway=google_gateway,
     )
     return factory.create(SyncCalendarHandler)
 
@@ -130,16 +314,17 @@ def get_subscribe_calendar_handler(
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
     google_gateway: GoogleCalendarGatewayProtocol,
+    runtime: WorkerRuntime | None = None,
 ) -> SubscribeCalendarHandler:
     """Get a SubscribeCalendarHandler instance for a user."""
     from lykke.application.commands.calendar import SubscribeCalendarHandler
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
-        google_gateway_provider=lambda: google_gateway,
+    factory = create_command_handler_factory(
+        user,
+        uow_factory,
+        ro_repo_factory,
+        runtime=runtime,
+        google_gateway=google_gateway,
     )
     return factory.create(SubscribeCalendarHandler)
 
@@ -148,15 +333,13 @@ def get_schedule_day_handler(
     user: UserEntity,
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
+    runtime: WorkerRuntime | None = None,
 ) -> ScheduleDayHandler:
     """Get a ScheduleDayHandler instance for a user."""
     from lykke.application.commands import ScheduleDayHandler
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
+    factory = create_command_handler_factory(
+        user, uow_factory, ro_repo_factory, runtime=runtime
     )
     return factory.create(ScheduleDayHandler)
 
@@ -165,32 +348,44 @@ def get_evaluate_timing_status_handler(
     user: UserEntity,
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
+    runtime: WorkerRuntime | None = None,
 ) -> EvaluateTimingStatusHandler:
     """Get an EvaluateTimingStatusHandler instance for a user."""
     from lykke.application.commands.timing_status import EvaluateTimingStatusHandler
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
+    factory = create_command_handler_factory(
+        user, uow_factory, ro_repo_factory, runtime=runtime
     )
     return factory.create(EvaluateTimingStatusHandler)
 
 
+def get_evaluate_timing_status_batch_handler(
+    uow_factory: UnitOfWorkFactory,
+    identity_access: UnauthenticatedIdentityAccessProtocol | None = None,
+) -> EvaluateTimingStatusBatchHandler:
+    """Get an EvaluateTimingStatusBatchHandler for a shard of users."""
+    from lykke.application.commands.timing_status import (
+        EvaluateTimingStatusBatchHandler,
+    )
+
+    return EvaluateTimingStatusBatchHandler(
+        timing_status_store=get_timing_status_store(),
+        identity_access=identity_access or get_identity_access(),
+        uow_factory=uow_factory,
+    )
+
+
 def get_smart_notification_handler(
     user: UserEntity,
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
+    runtime: WorkerRuntime | None = None,
 ) -> SmartNotificationHandler:
     """Get a SmartNotificationHandler instance for a user."""
     from lykke.application.commands.notifications import SmartNotificationHandler
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
+    factory = create_command_handler_factory(
+        user, uow_factory, ro_repo_factory, runtime=runtime
     )
     return factory.create(SmartNotificationHandler)
 
@@ -199,15 +394,13 @@ def get_morning_overview_handler(
     user: UserEntity,
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
+    runtime: WorkerRuntime | None = None,
 ) -> MorningOverviewHandler:
     """Get a MorningOverviewHandler instance for a user."""
     from lykke.application.commands.notifications import MorningOverviewHandler
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
+    factory = create_command_handler_factory(
+        user, uow_factory, ro_repo_factory, runtime=runtime
     )
     return factory.create(MorningOverviewHandler)
 
@@ -216,17 +409,15 @@ def get_calendar_entry_notification_handler(
     user: UserEntity,
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
+    runtime: WorkerRuntime | None = None,
 ) -> CalendarEntryNotificationHandler:
     """Get a CalendarEntryNotificationHandler instance for a user."""
     from lykke.application.commands.notifications import (
         CalendarEntryNotificationHandler,
     )
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
+    factory = create_command_handler_factory(
+        user, uow_factory, ro_repo_factory, runtime=runtime
     )
     return factory.create(CalendarEntryNotificationHandler)
 
@@ -235,15 +426,13 @@ def get_process_brain_dump_handler(
     user: UserEntity,
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
+    runtime: WorkerRuntime | None = None,
 ) -> ProcessBrainDumpHandler:
     """Get a ProcessBrainDumpHandler instance for a user."""
     from lykke.application.commands.brain_dump import ProcessBrainDumpHandler
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
+    factory = create_command_handler_factory(
+        user, uow_factory, ro_repo_factory, runtime=runtime
     )
     return factory.create(ProcessBrainDumpHandler)
 
@@ -252,15 +441,13 @@ def get_process_inbound_sms_handler(
     user: UserEntity,
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
+    runtime: WorkerRuntime | None = None,
 ) -> ProcessInboundSmsHandler:
     """Get a ProcessInboundSmsHandler instance for a user."""
     from lykke.application.commands.message import ProcessInboundSmsHandler
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
+    factory = create_command_handler_factory(
+        user, uow_factory, ro_repo_factory, runtime=runtime
     )
     return factory.create(ProcessInboundSmsHandler)
 
@@ -269,14 +456,12 @@ def get_trigger_alarms_for_user_handler(
     user: UserEntity,
     uow_factory: UnitOfWorkFactory,
     ro_repo_factory: ReadOnlyRepositoryFactory,
+    runtime: WorkerRuntime | None = None,
 ) -> TriggerAlarmsForUserHandler:
     """Get a TriggerAlarmsForUserHandler instance for a user."""
     from lykke.application.commands.day import TriggerAlarmsForUserHandler
-    from lykke.presentation.handler_factory import CommandHandlerFactory
 
-    factory = CommandHandlerFactory(
-        user=user,
-        ro_repo_factory=ro_repo_factory,
-        uow_factory=uow_factory,
+    factory = create_command_handler_factory(
+        user, uow_factory, ro_repo_factory, runtime=runtime
     )
     return factory.create(TriggerAlarmsForUserHandler)
@@ -0,0 +1,97 @@
+"""Due-schedule dispatcher background worker task."""
+
+from collections import defaultdict
+from collections.abc import Iterator, Mapping
+from typing import Annotated, Any, Protocol
+
+from loguru import logger
+from taskiq_dependencies import Depends
+
+from lykke.application.gateways import DueScheduleGatewayProtocol
+from lykke.core.utils.dates import get_current_datetime
+from lykke.domain import value_objects
+from lykke.infrastructure.workers.bulk import kiq_many
+from lykke.infrastructure.workers.config import broker
+from lykke.infrastructure.workers.queues import QueueClass
+from lykke.infrastructure.workers.runtime import WorkerRuntime, get_worker_runtime
+
+from .alarms import trigger_alarms_for_user_task
+from .calendar import debounced_calendar_sync_task
+from .common import get_due_schedule_gateway
+from .notifications import evaluate_calendar_entry_notifications_task
+from .timing_status import (
+    evaluate_timing_status_for_users_task,
+    timing_status_shards,
+)
+
+
+class _EnqueueTask(Protocol):
+    async def kiq(self, *args: Any, **kwargs: Any) -> Any: ...
+
+
+_DEFAULT_TASKS: Mapping[value_objects.DueJobKind, _EnqueueTask] = {
+    value_objects.DueJobKind.TIMING_STATUS: evaluate_timing_status_for_users_task,
+    value_objects.DueJobKind.ALARMS: trigger_alarms_for_user_task,
+    value_objects.DueJobKind.CALENDAR_ENTRY_NOTIFICATIONS: (
+        evaluate_calendar_entry_notifications_task
+    ),
+    value_objects.DueJobKind.CALENDAR_SYNC: debounced_calendar_sync_task,
+}
+
+
+def _task_kwargs(
+    kind: value_objects.DueJobKind, entries: list[value_objects.DueScheduleEntry]
+) -> Iterator[dict[str, Any]]:
+    if kind == value_objects.DueJobKind.TIMING_STATUS:
+        # Timing status is evaluated per shard so its reads are shared.
+        yield from timing_status_shards(
+            [entry.user_id for entry in entries],
+            due_at={entry.user_id: entry.due_at for entry in entries},
+        )
+        return
+    for entry in entries:
+        if kind == value_objects.DueJobKind.CALENDAR_ENTRY_NOTIFICATIONS:
+            yield {"user_id": entry.user_id, "triggered_by": "scheduled"}
+        else:
+            yield {"user_id": entry.user_id}
+
+
+@broker.task(  # type: ignore[untyped-decorator]
+    schedule=[{"cron": "* * * * *"}],
+    queue_name=QueueClass.CRITICAL.queue_name,
+)
+async def dispatch_due_jobs_task(
+    *,
+    due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
+    enqueue_tasks: Mapping[value_objects.DueJobKind, _EnqueueTask] | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
+) -> None:
+    """Enqueue per-user jobs whose next due instant has passed.
+
+    Runs every minute and only touches users with work due, instead of
+    fanning out to every user. Due entries are claimed and only dropped once
+    their jobs are enqueued; a failed enqueue puts them back in the index.
+    """
+    gateway = due_schedule_gateway or get_due_schedule_gateway(runtime)
+    tasks = enqueue_tasks or _DEFAULT_TASKS
+
+    due = await gateway.claim_due(get_current_datetime())
+    if not due:
+        logger.debug("No due jobs to dispatch")
+        return
+
+    entries_by_kind: dict[
+        value_objects.DueJobKind, list[value_objects.DueScheduleEntry]
+    ] = defaultdict(list)
+    for entry in due:
+        entries_by_kind[entry.kind].append(entry)
+
+    for kind, entries in entries_by_kind.items():
+        try:
+            await kiq_many(tasks[kind], _task_kwargs(kind, entries))
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(f"Failed to dispatch {len(entries)} due {kind.value} jobs")
+            await gateway.release(entries)
+            continue
+        await gateway.ack(entries)
+        logger.info(f"Dispatched {len(entries)} due {kind.value} jobs")
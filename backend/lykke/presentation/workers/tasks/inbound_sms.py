@@ -1,17 +1,21 @@
 """Inbound SMS background worker tasks."""
 
-from typing import Protocol
+from typing import Annotated, Protocol
 from uuid import UUID
 
 from loguru import logger
+from taskiq_dependencies import Depends
 
 from lykke.application.commands.message import ProcessInboundSmsCommand
 from lykke.application.unit_of_work import ReadOnlyRepositoryFactory, UnitOfWorkFactory
 from lykke.infrastructure.gateways import RedisPubSubGateway
 from lykke.infrastructure.workers.config import broker
+from lykke.infrastructure.workers.queues import QueueClass
+from lykke.infrastructure.workers.runtime import WorkerRuntime, get_worker_runtime
 
 from .common import (
     get_process_inbound_sms_handler,
+    get_pubsub_gateway,
     get_read_only_repository_factory,
     get_unit_of_work_factory,
     load_user,
@@ -22,7 +26,9 @@ class _InboundSmsHandler(Protocol):
     async def handle(self, command: ProcessInboundSmsCommand) -> None: ...
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    queue_name=QueueClass.DEFAULT.queue_name,
+)
 async def process_inbound_sms_message_task(
     user_id: UUID,
     message_id: UUID,
@@ -31,13 +37,14 @@ async def process_inbound_sms_message_task(
     uow_factory: UnitOfWorkFactory | None = None,
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
 ) -> None:
     """Process an inbound SMS message for a specific user."""
     logger.info(
         f"Starting inbound SMS processing for user {user_id} message {message_id}"
     )
 
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         if handler is None:
             try:
@@ -47,8 +54,11 @@ async def process_inbound_sms_message_task(
                 return
             handler = get_process_inbound_sms_handler(
                 user=user,
-                uow_factory=uow_factory or get_unit_of_work_factory(pubsub_gateway),
-                ro_repo_factory=ro_repo_factory or get_read_only_repository_factory(),
+                uow_factory=uow_factory
+                or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+                ro_repo_factory=ro_repo_factory
+                or get_read_only_repository_factory(runtime),
+                runtime=runtime,
             )
 
         try:
@@ -3,9 +3,13 @@
 from loguru import logger
 
 from lykke.infrastructure.workers.config import broker
+from lykke.infrastructure.workers.queues import QueueClass
 
 
-@broker.task(schedule=[{"cron": "* * * * *"}])  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    schedule=[{"cron": "* * * * *"}],
+    queue_name=QueueClass.DEFAULT.queue_name,
+)
 async def heartbeat_task() -> None:
     """Heartbeat task that runs every minute.
 
@@ -15,7 +19,9 @@ async def heartbeat_task() -> None:
     logger.info("💓 Heartbeat: Worker is alive and processing tasks")
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    queue_name=QueueClass.DEFAULT.queue_name,
+)
 async def example_triggered_task(message: str) -> dict[str, str]:
     """Example task that can be triggered via API.
 
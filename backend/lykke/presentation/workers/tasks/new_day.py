@@ -4,27 +4,54 @@ These tasks publish `NewDayEvent` to the user's `domain-events` Redis channel.
 
 IMPORTANT: `NewDayEvent` is intentionally decoupled from day scheduling.
 Days may be scheduled ahead of time (e.g. user views tomorrow), but the
-"new day" signal should only be emitted on the actual day (per user timezone),
-in the middle of the night, similar to `schedule_all_users_day_task`.
+"new day" signal should only be emitted on the actual day (per user timezone).
+
+The scheduler runs every quarter hour and handles the bucket of timezones
+whose local day just started, so every user gets the signal at their own
+midnight. With ``NEW_DAY_PRESCHEDULE`` the bucket's days are also scheduled
+right away instead of on the user's first visit.
 """
 
-from collections.abc import Callable
-from datetime import date as dt_date
-from typing import Annotated, Protocol
+from collections.abc import Callable, Sequence
+from datetime import date as dt_date, datetime as dt_datetime, timedelta
+from typing import Annotated, Any, Protocol
 from uuid import UUID
 
 from loguru import logger
 from taskiq_dependencies import Depends
 
 from lykke.application.identity import UnauthenticatedIdentityAccessProtocol
-from lykke.core.utils.dates import get_current_date
+from lykke.core.config import settings
+from lykke.core.utils.dates import (
+    get_current_date,
+    get_current_datetime,
+    resolve_timezone,
+    timezones_starting_day,
+)
 from lykke.core.utils.domain_event_serialization import serialize_domain_event
 from lykke.domain.entities import DayEntity
 from lykke.domain.events.day_events import NewDayEvent
-from lykke.infrastructure.gateways import RedisPubSubGateway
+from lykke.infrastructure.workers.bulk import kiq_many
 from lykke.infrastructure.workers.config import broker
+from lykke.infrastructure.workers.queues import QueueClass
+from lykke.infrastructure.workers.runtime import WorkerRuntime, get_worker_runtime
+
+from .common import get_identity_access, get_pubsub_gateway
+from .scheduling import schedule_user_day_task
+
+BUCKET_MINUTES = 15  # Matches the scheduler cron; covers :30 and :45 offsets
 
-from .common import get_identity_access
+
+def _new_day_event(user_id: UUID, target_date: dt_date) -> NewDayEvent:
+    day_id = DayEntity.id_from_date_and_user(target_date, user_id)
+    return NewDayEvent(
+        user_id=user_id,
+        day_id=day_id,
+        date=target_date,
+        entity_id=day_id,
+        entity_type="day",
+        entity_date=target_date,
+    )
 
 
 class _EnqueueTask(Protocol):
@@ -39,31 +66,72 @@ class _PubSubGateway(Protocol):
         message: dict[str, object],
     ) -> None: ...
 
+    async def publish_many_to_user_channels(
+        self,
+        channel_type: str,
+        messages: Sequence[tuple[UUID, dict[str, Any]]],
+    ) -> None: ...
+
     async def close(self) -> None: ...
 
 
-@broker.task(schedule=[{"cron": "5 3 * * *"}])  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    schedule=[{"cron": "*/15 * * * *"}],
+    queue_name=QueueClass.DEFAULT.queue_name,
+)
 async def emit_new_day_event_for_all_users_task(
     identity_access: Annotated[
         UnauthenticatedIdentityAccessProtocol, Depends(get_identity_access)
     ],
     *,
-    enqueue_task: _EnqueueTask | None = None,
+    pubsub_gateway: _PubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
+    schedule_task: _EnqueueTask | None = None,
+    current_datetime_provider: Callable[[], dt_datetime] | None = None,
 ) -> None:
-    """Load all users and enqueue a NewDayEvent publish task for each user."""
-    logger.info("Starting new-day event task for all users")
-
-    users = await identity_access.list_all_users()
-    logger.info(f"Found {len(users)} users to emit new-day events for")
-
-    task = enqueue_task or emit_new_day_event_for_user_task
-    for user in users:
-        await task.kiq(user_id=user.id)
+    """Publish NewDayEvents for users whose local day just started."""
+    now = (current_datetime_provider or get_current_datetime)()
+    # Bucket by the cron slot so a late run still picks the right timezones.
+    slot = now.replace(
+        minute=now.minute - now.minute % BUCKET_MINUTES, second=0, microsecond=0
+    )
+    timezones = timezones_starting_day(
+        await identity_access.list_user_timezones(),
+        at=slot,
+        window=timedelta(minutes=BUCKET_MINUTES),
+    )
+    if not timezones:
+        logger.debug(f"No timezones start a new day at {slot.isoformat()}")
+        return
+
+    logger.info(f"Starting new-day events for timezones {timezones}")
+
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
+    task = schedule_task or schedule_user_day_task
+    count = 0
+    try:
+        async for users in identity_access.iter_eligible_users(timezones=timezones):
+            messages: list[tuple[UUID, dict[str, Any]]] = []
+            for user in users:
+                local_date = slot.astimezone(resolve_timezone(user.timezone)).date()
+                event = _new_day_event(user.id, local_date)
+                messages.append((user.id, serialize_domain_event(event)))
+            # One pipelined round trip per batch of the bucket.
+            await pubsub_gateway.publish_many_to_user_channels(
+                "domain-events", messages
+            )
+            if settings.NEW_DAY_PRESCHEDULE:
+                await kiq_many(task, ({"user_id": user.id} for user in users))
+            count += len(users)
+    finally:
+        await pubsub_gateway.close()
 
-    logger.info(f"Enqueued new-day event tasks for {len(users)} users")
+    logger.info(f"Published new-day events for {count} users")
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    queue_name=QueueClass.DEFAULT.queue_name,
+)
 async def emit_new_day_event_for_user_task(
     user_id: UUID,
     identity_access: Annotated[
@@ -71,12 +139,13 @@ async def emit_new_day_event_for_user_task(
     ],
     *,
     pubsub_gateway: _PubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
     current_date_provider: Callable[[str | None], dt_date] | None = None,
 ) -> None:
     """Publish a NewDayEvent for today's date in the user's timezone."""
     logger.info(f"Publishing NewDayEvent for user {user_id}")
 
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         user = await identity_access.get_user_by_id(user_id)
         timezone = user.settings.timezone if user and user.settings else None
@@ -84,20 +153,10 @@ async def emit_new_day_event_for_user_task(
         current_date_provider = current_date_provider or get_current_date
         target_date = current_date_provider(timezone)
 
-        day_id = DayEntity.id_from_date_and_user(target_date, user_id)
-        event = NewDayEvent(
-            user_id=user_id,
-            day_id=day_id,
-            date=target_date,
-            entity_id=day_id,
-            entity_type="day",
-            entity_date=target_date,
-        )
-
         await pubsub_gateway.publish_to_user_channel(
             user_id=user_id,
             channel_type="domain-events",
-            message=serialize_domain_event(event),
+            message=serialize_domain_event(_new_day_event(user_id, target_date)),
         )
         logger.debug(f"Published NewDayEvent for {target_date} (user {user_id})")
     finally:
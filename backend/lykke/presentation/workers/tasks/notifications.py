@@ -13,24 +13,30 @@ from lykke.application.commands.notifications import (
     MorningOverviewCommand,
     SmartNotificationCommand,
 )
+from lykke.application.gateways import DueScheduleGatewayProtocol
 from lykke.application.repositories import (
     PushNotificationRepositoryReadOnlyProtocol,
 )
 from lykke.application.identity import UnauthenticatedIdentityAccessProtocol
 from lykke.application.unit_of_work import ReadOnlyRepositoryFactory, UnitOfWorkFactory
 from lykke.core.utils.dates import (
-    get_current_date,
     get_current_datetime_in_timezone,
     get_current_time,
 )
 from lykke.domain import value_objects
 from lykke.domain.entities import UserEntity
 from lykke.infrastructure.gateways import RedisPubSubGateway
+from lykke.infrastructure.workers.bulk import kiq_many
 from lykke.infrastructure.workers.config import broker
+from lykke.infrastructure.workers.queues import QueueClass
+from lykke.infrastructure.workers.runtime import WorkerRuntime, get_worker_runtime
 
 from .common import (
+    arm_next_due,
+    get_due_schedule_gateway,
     get_calendar_entry_notification_handler,
     get_morning_overview_handler,
+    get_pubsub_gateway,
     get_read_only_repository_factory,
     get_smart_notification_handler,
     get_unit_of_work_factory,
@@ -52,7 +58,10 @@ class _NotificationHandler(Protocol[_CommandT]):
     async def handle(self, command: _CommandT) -> None: ...
 
 
-@broker.task(schedule=[{"cron": "0,19,20,30,50 * * * *"}])  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    schedule=[{"cron": "0,19,20,30,50 * * * *"}],
+    queue_name=QueueClass.DEFAULT.queue_name,
+)
 async def evaluate_smart_notifications_for_all_users_task(
     identity_access: Annotated[
         UnauthenticatedIdentityAccessProtocol, Depends(get_identity_access)
@@ -66,51 +75,51 @@ async def evaluate_smart_notifications_for_all_users_task(
     """
     logger.info("Starting smart notification evaluation for all users")
 
-    users = await identity_access.list_all_users()
-    users_with_llm = [
-        user for user in users if user.settings and user.settings.llm_provider
-    ]
-    logger.info(f"Found {len(users_with_llm)} users with LLM provider configured")
-
     task = enqueue_task or evaluate_smart_notification_task
-    for user in users_with_llm:
-        await task.kiq(user_id=user.id, triggered_by="scheduled")
+    count = 0
+    async for users in identity_access.iter_eligible_users(
+        value_objects.UserEligibility.LLM_PROVIDER
+    ):
+        await kiq_many(
+            task,
+            ({"user_id": user.id, "triggered_by": "scheduled"} for user in users),
+        )
+        count += len(users)
 
-    logger.info(
-        f"Enqueued smart notification evaluation tasks for {len(users_with_llm)} users"
-    )
+    logger.info(f"Enqueued smart notification evaluation tasks for {count} users")
 
 
-@broker.task(schedule=[{"cron": "* * * * *"}])  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    schedule=[{"cron": "0 * * * *"}],
+    queue_name=QueueClass.CRITICAL.queue_name,
+)
 async def evaluate_calendar_entry_notifications_for_all_users_task(
     identity_access: Annotated[
         UnauthenticatedIdentityAccessProtocol, Depends(get_identity_access)
     ],
+    *,
+    enqueue_task: _EnqueueTask | None = None,
 ) -> None:
-    """Evaluate calendar entry reminders for all eligible users."""
-    logger.info("Starting calendar entry notification evaluation for all users")
-    users = await identity_access.list_all_users()
-    eligible_users = [
-        user
-        for user in users
-        if user.settings
-        and user.settings.calendar_entry_notification_settings.enabled
-        and user.settings.calendar_entry_notification_settings.rules
-    ]
-    logger.info(
-        f"Found {len(eligible_users)} users eligible for calendar entry notifications",
-    )
+    """Evaluate calendar entry reminders for all eligible users hourly.
 
-    for user in eligible_users:
-        logger.info(
-            f"Enqueued calendar entry notification evaluation task for user {user.id}"
-        )
-        await evaluate_calendar_entry_notifications_task.kiq(
-            user_id=user.id, triggered_by="scheduled"
+    Per-minute evaluation is driven by the due-schedule index; this sweep
+    bootstraps the index and re-arms anything it lost.
+    """
+    logger.info("Starting calendar entry notification evaluation for all users")
+    task = enqueue_task or evaluate_calendar_entry_notifications_task
+    count = 0
+    async for users in identity_access.iter_eligible_users(
+        value_objects.UserEligibility.CALENDAR_ENTRY_NOTIFICATIONS
+    ):
+        await kiq_many(
+            task,
+            ({"user_id": user.id, "triggered_by": "scheduled"} for user in users),
         )
+        count += len(users)
+    logger.info(f"Enqueued calendar entry notification tasks for {count} users")
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(queue_name=QueueClass.HEAVY.queue_name)  # type: ignore[untyped-decorator]
 async def evaluate_smart_notification_task(
     user_id: UUID,
     triggered_by: str | None = None,
@@ -119,6 +128,7 @@ async def evaluate_smart_notification_task(
     uow_factory: UnitOfWorkFactory | None = None,
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
 ) -> None:
     """Evaluate and send smart notification for a specific user.
 
@@ -132,7 +142,7 @@ async def evaluate_smart_notification_task(
     """
     logger.info(f"Starting smart notification evaluation for user {user_id}")
 
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         resolved_handler: _NotificationHandler[SmartNotificationCommand]
         if handler is None:
@@ -143,8 +153,11 @@ async def evaluate_smart_notification_task(
                 return
             resolved_handler = get_smart_notification_handler(
                 user=user,
-                uow_factory=uow_factory or get_unit_of_work_factory(pubsub_gateway),
-                ro_repo_factory=ro_repo_factory or get_read_only_repository_factory(),
+                uow_factory=uow_factory
+                or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+                ro_repo_factory=ro_repo_factory
+                or get_read_only_repository_factory(runtime),
+                runtime=runtime,
             )
         else:
             resolved_handler = handler
@@ -165,7 +178,10 @@ async def evaluate_smart_notification_task(
         await pubsub_gateway.close()
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    dedup_by="user_id",
+    queue_name=QueueClass.CRITICAL.queue_name,
+)
 async def evaluate_calendar_entry_notifications_task(
     user_id: UUID,
     triggered_by: str | None = None,
@@ -173,10 +189,12 @@ async def evaluate_calendar_entry_notifications_task(
     uow_factory: UnitOfWorkFactory | None = None,
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
+    due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
 ) -> None:
     """Evaluate calendar entry reminders for a specific user."""
     logger.info(f"Starting calendar entry notification evaluation for user {user_id}")
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         try:
             user = await load_user(user_id)
@@ -187,16 +205,26 @@ async def evaluate_calendar_entry_notifications_task(
             return
         handler = get_calendar_entry_notification_handler(
             user=user,
-            uow_factory=uow_factory or get_unit_of_work_factory(pubsub_gateway),
-            ro_repo_factory=ro_repo_factory or get_read_only_repository_factory(),
+            uow_factory=uow_factory
+            or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+            ro_repo_factory=ro_repo_factory
+            or get_read_only_repository_factory(runtime),
+            runtime=runtime,
         )
         try:
-            await handler.handle(
+            next_due = await handler.handle(
                 CalendarEntryNotificationCommand(
                     user=user,
                     triggered_by=triggered_by,
                 )
             )
+            await arm_next_due(
+                user_id,
+                value_objects.DueJobKind.CALENDAR_ENTRY_NOTIFICATIONS,
+                next_due,
+                due_schedule_gateway=due_schedule_gateway
+                or get_due_schedule_gateway(runtime),
+            )
             logger.debug(
                 f"Calendar entry notification evaluation completed for user {user_id}",
             )
@@ -208,7 +236,10 @@ async def evaluate_calendar_entry_notifications_task(
         await pubsub_gateway.close()
 
 
-@broker.task(schedule=[{"cron": "*/15 * * * *"}])  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    schedule=[{"cron": "*/15 * * * *"}],
+    queue_name=QueueClass.DEFAULT.queue_name,
+)
 async def evaluate_morning_overviews_for_all_users_task(
     identity_access: Annotated[
         UnauthenticatedIdentityAccessProtocol, Depends(get_identity_access)
@@ -216,6 +247,7 @@ async def evaluate_morning_overviews_for_all_users_task(
     *,
     enqueue_task: _EnqueueTask | None = None,
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
     current_time_provider: Callable[[str | None], dt_time] | None = None,
     current_datetime_provider: Callable[[str | None], dt_datetime] | None = None,
 ) -> None:
@@ -226,79 +258,79 @@ async def evaluate_morning_overviews_for_all_users_task(
     """
     logger.info("Starting morning overview evaluation for all users")
 
-    users = await identity_access.list_all_users()
-    eligible_users = [
-        user
-        for user in users
-        if user.settings
-        and user.settings.llm_provider
-        and user.settings.morning_overview_time
-    ]
-    logger.info(f"Found {len(eligible_users)} users eligible for morning overview")
-
-    ro_repo_factory = ro_repo_factory or get_read_only_repository_factory()
+    ro_repo_factory = ro_repo_factory or get_read_only_repository_factory(runtime)
     current_time_provider = current_time_provider or get_current_time
     current_datetime_provider = (
         current_datetime_provider or get_current_datetime_in_timezone
     )
 
     task = enqueue_task or evaluate_morning_overview_task
-    for user in eligible_users:
-        try:
-            overview_time = user.settings.morning_overview_time
-            if not overview_time:
-                continue
+    async for eligible_users in identity_access.iter_eligible_users(
+        value_objects.UserEligibility.MORNING_OVERVIEW
+    ):
+        for eligible_user in eligible_users:
+            try:
+                overview_time = eligible_user.morning_overview_time
+                if not overview_time:
+                    continue
 
-            overview_hour = overview_time.hour
-            overview_minute = overview_time.minute
+                overview_hour = overview_time.hour
+                overview_minute = overview_time.minute
 
-            current_time = current_time_provider(user.settings.timezone)
-            current_hour = current_time.hour
-            current_minute = current_time.minute
+                current_time = current_time_provider(eligible_user.timezone)
+                current_hour = current_time.hour
+                current_minute = current_time.minute
 
-            time_matches = (
-                current_hour == overview_hour
-                and current_minute >= overview_minute
-                and current_minute < overview_minute + 15
-            )
-
-            if not time_matches:
-                continue
+                time_matches = (
+                    current_hour == overview_hour
+                    and current_minute >= overview_minute
+                    and current_minute < overview_minute + 15
+                )
 
-            ro_repos = ro_repo_factory.create(user)
-            push_notification_repo: PushNotificationRepositoryReadOnlyProtocol = (
-                ro_repos.push_notification_ro_repo
-            )
+                if not time_matches:
+                    continue
 
-            get_current_date(user.settings.timezone)
-            today_start = current_datetime_provider(user.settings.timezone)
-            today_start = today_start.replace(hour=0, minute=0, second=0, microsecond=0)
+                user = await identity_access.get_user_by_id(eligible_user.id)
+                if user is None:
+                    continue
 
-            existing_notifications = await push_notification_repo.search(
-                value_objects.PushNotificationQuery(
-                    sent_after=today_start,
-                    triggered_by="morning_overview",
+                ro_repos = ro_repo_factory.create(user)
+                push_notification_repo: PushNotificationRepositoryReadOnlyProtocol = (
+                    ro_repos.push_notification_ro_repo
                 )
-            )
 
-            morning_overview_sent_today = bool(existing_notifications)
+                today_start = current_datetime_provider(eligible_user.timezone)
+                today_start = today_start.replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
 
-            if morning_overview_sent_today:
-                logger.debug(
-                    f"Morning overview already sent today for user {user.id}, skipping",
+                existing_notifications = await push_notification_repo.search(
+                    value_objects.PushNotificationQuery(
+                        sent_after=today_start,
+                        triggered_by="morning_overview",
+                    )
                 )
-                continue
 
-            await task.kiq(user_id=user.id)
-            logger.info(f"Enqueued morning overview for user {user.id}")
+                morning_overview_sent_today = bool(existing_notifications)
 
-        except Exception:  # pylint: disable=broad-except
-            logger.exception(f"Error checking morning overview for user {user.id}")
+                if morning_overview_sent_today:
+                    logger.debug(
+                        f"Morning overview already sent today for user {user.id}, skipping",
+                    )
+                    continue
+
+                await task.kiq(user_id=user.id)
+                logger.info(f"Enqueued morning overview for user {user.id}")
+
+            except Exception:  # pylint: disable=broad-except
+                logger.exception(
+                    f"Error checking morning overview for user {eligible_user.id}"
+                )
 
     logger.info("Completed morning overview evaluation for all users")
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(queue_name=QueueClass.HEAVY.queue_name)  # type: ignore[untyped-decorator]
 async def evaluate_morning_overview_task(
     user_id: UUID,
     *,
@@ -306,6 +338,7 @@ async def evaluate_morning_overview_task(
     uow_factory: UnitOfWorkFactory | None = None,
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
 ) -> None:
     """Evaluate and send morning overview for a specific user.
 
@@ -314,7 +347,7 @@ async def evaluate_morning_overview_task(
     """
     logger.info(f"Starting morning overview evaluation for user {user_id}")
 
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         resolved_handler: _NotificationHandler[MorningOverviewCommand]
         if handler is None:
@@ -325,8 +358,11 @@ async def evaluate_morning_overview_task(
                 return
             resolved_handler = get_morning_overview_handler(
                 user=user,
-                uow_factory=uow_factory or get_unit_of_work_factory(pubsub_gateway),
-                ro_repo_factory=ro_repo_factory or get_read_only_repository_factory(),
+                uow_factory=uow_factory
+                or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+                ro_repo_factory=ro_repo_factory
+                or get_read_only_repository_factory(runtime),
+                runtime=runtime,
             )
         else:
             resolved_handler = handler
@@ -13,9 +13,13 @@ from lykke.application.identity import UnauthenticatedIdentityAccessProtocol
 from lykke.application.unit_of_work import ReadOnlyRepositoryFactory, UnitOfWorkFactory
 from lykke.core.utils.dates import get_current_date
 from lykke.infrastructure.gateways import RedisPubSubGateway
+from lykke.infrastructure.workers.bulk import kiq_many
 from lykke.infrastructure.workers.config import broker
+from lykke.infrastructure.workers.queues import QueueClass
+from lykke.infrastructure.workers.runtime import WorkerRuntime, get_worker_runtime
 
 from .common import (
+    get_pubsub_gateway,
     get_read_only_repository_factory,
     get_schedule_day_handler,
     get_unit_of_work_factory,
@@ -32,7 +36,10 @@ class _ScheduleDayHandler(Protocol):
     async def handle(self, command: ScheduleDayCommand) -> None: ...
 
 
-@broker.task(schedule=[{"cron": "0 3 * * *"}])  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    schedule=[{"cron": "0 3 * * *"}],
+    queue_name=QueueClass.DEFAULT.queue_name,
+)
 async def schedule_all_users_day_task(
     identity_access: Annotated[
         UnauthenticatedIdentityAccessProtocol, Depends(get_identity_access)
@@ -43,18 +50,18 @@ async def schedule_all_users_day_task(
     """Load all users and enqueue daily scheduling tasks for each user."""
     logger.info("Starting daily schedule task for all users")
 
-    users = await identity_access.list_all_users()
-    logger.info(f"Found {len(users)} users to schedule")
-
     task = enqueue_task or schedule_user_day_task
-    for user in users:
-        # Enqueue a sub-task for each user
-        await task.kiq(user_id=user.id)
+    count = 0
+    async for users in identity_access.iter_eligible_users():
+        await kiq_many(task, ({"user_id": user.id} for user in users))
+        count += len(users)
 
-    logger.info(f"Enqueued daily scheduling tasks for {len(users)} users")
+    logger.info(f"Enqueued daily scheduling tasks for {count} users")
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    queue_name=QueueClass.DEFAULT.queue_name,
+)
 async def schedule_user_day_task(
     user_id: UUID,
     *,
@@ -62,12 +69,13 @@ async def schedule_user_day_task(
     uow_factory: UnitOfWorkFactory | None = None,
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
     current_date_provider: Callable[[str | None], dt_date] | None = None,
 ) -> None:
     """Schedule today's day for a specific user."""
     logger.info(f"Starting daily scheduling for user {user_id}")
 
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         try:
             user = await load_user(user_id)
@@ -77,8 +85,11 @@ async def schedule_user_day_task(
 
         schedule_handler = handler or get_schedule_day_handler(
             user=user,
-            uow_factory=uow_factory or get_unit_of_work_factory(pubsub_gateway),
-            ro_repo_factory=ro_repo_factory or get_read_only_repository_factory(),
+            uow_factory=uow_factory
+            or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+            ro_repo_factory=ro_repo_factory
+            or get_read_only_repository_factory(runtime),
+            runtime=runtime,
         )
 
         timezone = user.settings.timezone if user.settings else None
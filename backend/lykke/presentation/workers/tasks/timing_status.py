@@ -1,68 +1,182 @@
 """Timing-status background worker tasks."""
 
-from typing import Annotated, Protocol
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from typing import Annotated, Any, Protocol
 from uuid import UUID
 
 from loguru import logger
 from taskiq_dependencies import Depends
 
-from lykke.application.commands.timing_status import EvaluateTimingStatusCommand
-from lykke.application.identity import UnauthenticatedIdentityAccessProtocol
+from lykke.application.commands.timing_status import (
+    EvaluateTimingStatusBatchCommand,
+    EvaluateTimingStatusCommand,
+)
+from lykke.application.gateways import DueScheduleGatewayProtocol
+from lykke.application.identity import (
+    CrossUserTimingStatusStoreProtocol,
+    UnauthenticatedIdentityAccessProtocol,
+)
 from lykke.application.unit_of_work import ReadOnlyRepositoryFactory, UnitOfWorkFactory
+from lykke.core.config import settings
+from lykke.core.utils.dates import get_current_datetime
+from lykke.domain import value_objects
 from lykke.infrastructure.gateways import RedisPubSubGateway
+from lykke.infrastructure.workers.bulk import kiq_many
 from lykke.infrastructure.workers.config import broker
+from lykke.infrastructure.workers.queues import QueueClass
+from lykke.infrastructure.workers.runtime import WorkerRuntime, get_worker_runtime
 
 from .common import (
+    arm_next_due,
+    arm_next_due_many,
+    get_due_schedule_gateway,
+    get_evaluate_timing_status_batch_handler,
     get_evaluate_timing_status_handler,
     get_identity_access,
+    get_pubsub_gateway,
     get_read_only_repository_factory,
+    get_timing_status_store,
     get_unit_of_work_factory,
     load_user,
 )
 
+# Slightly longer than the sweep interval so no transition falls between sweeps.
+SWEEP_HORIZON = timedelta(minutes=65)
+
+
+def timing_status_shards(
+    user_ids: list[UUID], *, due_at: dict[UUID, datetime] | None = None
+) -> Iterator[dict[str, Any]]:
+    """Split users into kwargs for ``evaluate_timing_status_for_users_task``.
+
+    ``due_at`` carries the due instants the users were scheduled for, so
+    each shard compares statuses from then rather than from the last poll.
+    """
+    shard_size = settings.TIMING_STATUS_SHARD_SIZE
+    for start in range(0, len(user_ids), shard_size):
+        shard = user_ids[start : start + shard_size]
+        kwargs: dict[str, Any] = {"user_ids": shard}
+        if due_at is not None:
+            kwargs["due_at"] = {
+                user_id: due_at[user_id] for user_id in shard if user_id in due_at
+            }
+        yield kwargs
+
 
 class _EnqueueTask(Protocol):
     async def kiq(self, **kwargs: object) -> None: ...
 
 
 class _TimingStatusHandler(Protocol):
-    async def handle(self, command: EvaluateTimingStatusCommand) -> None: ...
+    async def handle(self, command: EvaluateTimingStatusCommand) -> datetime | None: ...
+
 
+class _TimingStatusBatchHandler(Protocol):
+    async def handle(
+        self, command: EvaluateTimingStatusBatchCommand
+    ) -> dict[UUID, datetime | None]: ...
 
-@broker.task(schedule=[{"cron": "* * * * *"}])  # type: ignore[untyped-decorator]
+
+@broker.task(  # type: ignore[untyped-decorator]
+    schedule=[{"cron": "0 * * * *"}],
+    queue_name=QueueClass.CRITICAL.queue_name,
+)
 async def evaluate_timing_status_for_all_users_task(
-    identity_access: Annotated[
-        UnauthenticatedIdentityAccessProtocol, Depends(get_identity_access)
+    timing_status_store: Annotated[
+        CrossUserTimingStatusStoreProtocol, Depends(get_timing_status_store)
     ],
     *,
     enqueue_task: _EnqueueTask | None = None,
 ) -> None:
-    """Evaluate timing status for all users every minute."""
-    logger.info("Starting timing-status evaluation for all users")
+    """Evaluate timing status hourly for users with transitions coming up.
 
-    users = await identity_access.list_all_users()
-    logger.info(f"Found {len(users)} users for timing-status evaluation")
+    Per-minute evaluation is driven by the due-schedule index; this sweep
+    bootstraps the index and re-arms anything it lost. Users are found with
+    a range scan over the persisted ``next_transition_at`` of their tasks
+    and routines, and enqueued one shard per job.
+    """
+    logger.info("Starting timing-status evaluation sweep")
 
-    task = enqueue_task or evaluate_timing_status_for_user_task
-    for user in users:
-        await task.kiq(user_id=user.id)
+    task = enqueue_task or evaluate_timing_status_for_users_task
+    user_ids = await timing_status_store.list_user_ids_with_transitions_before(
+        get_current_datetime() + SWEEP_HORIZON
+    )
+    await kiq_many(task, timing_status_shards(user_ids))
 
-    logger.info(f"Enqueued timing-status evaluation tasks for {len(users)} users")
+    logger.info(f"Enqueued timing-status evaluation shards for {len(user_ids)} users")
 
 
-@broker.task  # type: ignore[untyped-decorator]
+@broker.task(  # type: ignore[untyped-decorator]
+    queue_name=QueueClass.CRITICAL.queue_name,
+)
+async def evaluate_timing_status_for_users_task(
+    user_ids: list[UUID],
+    due_at: dict[UUID, datetime] | None = None,
+    *,
+    handler: _TimingStatusBatchHandler | None = None,
+    identity_access: UnauthenticatedIdentityAccessProtocol | None = None,
+    uow_factory: UnitOfWorkFactory | None = None,
+    pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
+    due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
+) -> None:
+    """Evaluate and emit timing-status changes for a shard of users.
+
+    Loads the shard's tasks and routines with one query per table instead
+    of two per user, then arms every user's next transition at once.
+    """
+    logger.info(f"Starting timing-status evaluation for {len(user_ids)} users")
+
+    identity_access = identity_access or get_identity_access()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
+    try:
+        users = [
+            user
+            async for batch in identity_access.iter_eligible_users(user_ids=user_ids)
+            for user in batch
+        ]
+        resolved_handler = handler or get_evaluate_timing_status_batch_handler(
+            uow_factory or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+            identity_access,
+        )
+        next_due = await resolved_handler.handle(
+            EvaluateTimingStatusBatchCommand(
+                users=tuple(users), due_at=dict(due_at or {})
+            )
+        )
+        await arm_next_due_many(
+            value_objects.DueJobKind.TIMING_STATUS,
+            next_due,
+            due_schedule_gateway=due_schedule_gateway
+            or get_due_schedule_gateway(runtime),
+        )
+        logger.debug(f"Timing-status evaluation completed for {len(users)} users")
+    except Exception:  # pylint: disable=broad-except
+        logger.exception(f"Error evaluating timing status for {len(user_ids)} users")
+    finally:
+        await pubsub_gateway.close()
+
+
+@broker.task(  # type: ignore[untyped-decorator]
+    dedup_by="user_id",
+    queue_name=QueueClass.CRITICAL.queue_name,
+)
 async def evaluate_timing_status_for_user_task(
     user_id: UUID,
+    due_at: datetime | None = None,
     *,
     handler: _TimingStatusHandler | None = None,
     uow_factory: UnitOfWorkFactory | None = None,
     ro_repo_factory: ReadOnlyRepositoryFactory | None = None,
     pubsub_gateway: RedisPubSubGateway | None = None,
+    runtime: Annotated[WorkerRuntime | None, Depends(get_worker_runtime)] = None,
+    due_schedule_gateway: DueScheduleGatewayProtocol | None = None,
 ) -> None:
     """Evaluate and emit timing-status changes for a specific user."""
     logger.info(f"Starting timing-status evaluation for user {user_id}")
 
-    pubsub_gateway = pubsub_gateway or RedisPubSubGateway()
+    pubsub_gateway = pubsub_gateway or get_pubsub_gateway(runtime)
     try:
         resolved_handler: _TimingStatusHandler
         if handler is None:
@@ -73,14 +187,26 @@ async def evaluate_timing_status_for_user_task(
                 return
             resolved_handler = get_evaluate_timing_status_handler(
                 user=user,
-                uow_factory=uow_factory or get_unit_of_work_factory(pubsub_gateway),
-                ro_repo_factory=ro_repo_factory or get_read_only_repository_factory(),
+                uow_factory=uow_factory
+                or get_unit_of_work_factory(pubsub_gateway, runtime=runtime),
+                ro_repo_factory=ro_repo_factory
+                or get_read_only_repository_factory(runtime),
+                runtime=runtime,
             )
         else:
             resolved_handler = handler
 
         try:
-            await resolved_handler.handle(EvaluateTimingStatusCommand())
+            next_due = await resolved_handler.handle(
+                EvaluateTimingStatusCommand(due_at=due_at)
+            )
+            await arm_next_due(
+                user_id,
+                value_objects.DueJobKind.TIMING_STATUS,
+                next_due,
+                due_schedule_gateway=due_schedule_gateway
+                or get_due_schedule_gateway(runtime),
+            )
             logger.debug(f"Timing-status evaluation completed for user {user_id}")
         except Exception:  # pylint: disable=broad-except
             logger.exception(f"Error evaluating timing status for user {user_id}")
@@ -0,0 +1,295 @@
+"""Benchmark calendar sync against a local Google Calendar stand-in.
+
+Seeds ``FakeGoogleCalendarServer`` with a synthetic calendar (single events,
+weekly series with exceptions and cancellations), creates a throwaway user
+wired to it, and runs the real sync handlers against the configured database:
+
+1. initial sync (full lookback, no sync token)
+2. incremental syncs after upstream edits (renamed events, a renamed series,
+   cancelled occurrences), each using the stored sync token
+3. reset (unsubscribe, purge future entries, resubscribe, full sync)
+
+Each phase reports wall time, SQL statements executed, Google API round trips
+and peak Python memory. The user and everything synced for it are deleted
+afterwards.
+
+Usage:
+    python -m scripts.benchmark_calendar_sync --events 2000 --series 50
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import delete, event
+
+from lykke.application.commands.calendar import (
+    ResetCalendarSyncCommand,
+    ResetCalendarSyncHandler,
+    SyncCalendarCommand,
+    SyncCalendarHandler,
+)
+from lykke.domain.entities import AuthTokenEntity, CalendarEntity, UserEntity
+from lykke.domain.value_objects import SyncSubscription, UserSetting
+from lykke.infrastructure.database import close_engine, get_engine
+from lykke.infrastructure.database.tables import (
+    auth_tokens_tbl,
+    calendar_entries_tbl,
+    calendar_entry_series_tbl,
+    calendars_tbl,
+    users_tbl,
+)
+from lykke.infrastructure.gateways import StubPubSubGateway
+from lykke.infrastructure.gateways.google_async import AsyncGoogleCalendarGateway
+from lykke.infrastructure.repositories import AuthTokenRepository, CalendarRepository
+from lykke.infrastructure.repository_factories import (
+    SqlAlchemyReadOnlyRepositoryFactory,
+)
+from lykke.infrastructure.unauthenticated import UnauthenticatedIdentityAccess
+from lykke.infrastructure.unit_of_work import SqlAlchemyUnitOfWorkFactory
+from lykke.presentation.handler_factory import CommandHandlerFactory
+from tests.support.fake_google_calendar import (
+    FakeGoogleCalendarServer,
+    SeededCalendar,
+    seed_calendar,
+)
+
+CALENDAR_ID = "benchmark@calendar.google.com"
+
+
+@dataclass
+class PhaseResult:
+    """Measurements for one benchmark phase."""
+
+    name: str
+    seconds: float
+    statements: int
+    api_requests: int
+    peak_bytes: int
+
+
+class StatementCounter:
+    """Counts SQL statements sent by the shared engine."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args: Any) -> None:
+        _ = args
+        self.count += 1
+
+
+async def measure(
+    name: str,
+    server: FakeGoogleCalendarServer,
+    counter: StatementCounter,
+    run: Callable[[], Awaitable[object]],
+) -> PhaseResult:
+    """Run one phase and collect its measurements."""
+    statements = counter.count
+    requests = len(server.requests)
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    await run()
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    return PhaseResult(
+        name=name,
+        seconds=seconds,
+        statements=counter.count - statements,
+        api_requests=len(server.requests) - requests,
+        peak_bytes=peak,
+    )
+
+
+async def create_benchmark_user(
+    server: FakeGoogleCalendarServer,
+) -> tuple[UserEntity, CalendarEntity]:
+    """Create a user with one subscribed Google calendar served by the fake."""
+    user = UserEntity(
+        email=f"bench-{uuid4()}@example.com",
+        phone_number=f"+1{uuid4().int % 10**10:010d}",
+        hashed_password="benchmark",
+        settings=UserSetting(),
+    )
+    await UnauthenticatedIdentityAccess().create_user(user)
+
+    token = await AuthTokenRepository(user=user).put(
+        AuthTokenEntity(
+            user_id=user.id,
+            platform="google",
+            token="benchmark-token",
+            refresh_token="benchmark-refresh",
+            token_uri=server.token_uri,
+        )
+    )
+    calendar = await CalendarRepository(user=user).put(
+        CalendarEntity(
+            user_id=user.id,
+            name="Benchmark",
+            auth_token_id=token.id,
+            platform="google",
+            platform_id=CALENDAR_ID,
+            sync_subscription=SyncSubscription(
+                subscription_id=str(uuid4()),
+                resource_id="benchmark-resource",
+                expiration=datetime.now(UTC) + timedelta(days=7),
+                provider="google",
+            ),
+        )
+    )
+    return user, calendar
+
+
+async def delete_benchmark_user(user: UserEntity) -> None:
+    """Remove the benchmark user and the rows synced for it."""
+    async with get_engine().begin() as conn:
+        for table in (
+            calendar_entries_tbl,
+            calendar_entry_series_tbl,
+            calendars_tbl,
+            auth_tokens_tbl,
+        ):
+            await conn.execute(delete(table).where(table.c.user_id == user.id))
+        await conn.execute(delete(users_tbl).where(users_tbl.c.id == user.id))
+
+
+def edit_upstream(
+    server: FakeGoogleCalendarServer, seeded: SeededCalendar, round_number: int
+) -> None:
+    """Apply a realistic batch of upstream edits between incremental syncs."""
+    for event_id in seeded.single_ids[round_number::10][:25]:
+        server.update_event(
+            CALENDAR_ID, event_id, summary=f"Edited in round {round_number}"
+        )
+    if seeded.series_ids:
+        series_id = seeded.series_ids[round_number % len(seeded.series_ids)]
+        server.update_event(
+            CALENDAR_ID, series_id, summary=f"Series renamed in round {round_number}"
+        )
+    live = [
+        event_id
+        for event_id in seeded.instance_ids
+        if event_id not in seeded.cancelled_ids
+    ]
+    for event_id in live[round_number::20][:5]:
+        server.cancel_event(CALENDAR_ID, event_id)
+
+
+async def run_benchmark(args: argparse.Namespace) -> list[PhaseResult]:
+    """Seed the fake, run every phase and clean up."""
+    counter = StatementCounter()
+    event.listen(get_engine().sync_engine, "before_cursor_execute", counter)
+    results: list[PhaseResult] = []
+    with FakeGoogleCalendarServer() as server:
+        seeded = seed_calendar(
+            server,
+            CALENDAR_ID,
+            events=args.events,
+            series=args.series,
+            occurrences=args.occurrences,
+            exceptions=args.exceptions,
+            cancellations=args.cancellations,
+        )
+        server.page_size = args.page_size
+        user, calendar = await create_benchmark_user(server)
+        gateway = AsyncGoogleCalendarGateway(api_url=server.api_url)
+        factory = CommandHandlerFactory(
+            user=user,
+            ro_repo_factory=SqlAlchemyReadOnlyRepositoryFactory(),
+            uow_factory=SqlAlchemyUnitOfWorkFactory(pubsub_gateway=StubPubSubGateway()),
+            google_gateway_provider=lambda: gateway,
+        )
+        sync_handler = factory.create(SyncCalendarHandler)
+        reset_handler = factory.create(ResetCalendarSyncHandler)
+        try:
+            results.append(
+                await measure(
+                    "initial sync",
+                    server,
+                    counter,
+                    lambda: sync_handler.handle(
+                        SyncCalendarCommand(calendar_id=calendar.id)
+                    ),
+                )
+            )
+            for round_number in range(1, args.rounds + 1):
+                edit_upstream(server, seeded, round_number)
+                results.append(
+                    await measure(
+                        f"incremental sync #{round_number}",
+                        server,
+                        counter,
+                        lambda: sync_handler.handle(
+                            SyncCalendarCommand(calendar_id=calendar.id)
+                        ),
+                    )
+                )
+            results.append(
+                await measure(
+                    "reset",
+                    server,
+                    counter,
+                    lambda: reset_handler.handle(ResetCalendarSyncCommand()),
+                )
+            )
+        finally:
+            await delete_benchmark_user(user)
+            event.remove(get_engine().sync_engine, "before_cursor_execute", counter)
+    return results
+
+
+def print_results(results: list[PhaseResult]) -> None:
+    """Print a fixed-width table of phase measurements."""
+    print(
+        f"{'phase':<24} {'seconds':>9} {'statements':>11} "
+        f"{'api calls':>10} {'peak MiB':>9}"
+    )
+    for result in results:
+        print(
+            f"{result.name:<24} {result.seconds:>9.3f} {result.statements:>11} "
+            f"{result.api_requests:>10} {result.peak_bytes / 2**20:>9.1f}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=500, help="single events")
+    parser.add_argument("--series", type=int, default=20, help="recurring series")
+    parser.add_argument(
+        "--occurrences", type=int, default=26, help="instances per series"
+    )
+    parser.add_argument(
+        "--exceptions", type=int, default=10, help="moved instances in total"
+    )
+    parser.add_argument(
+        "--cancellations", type=int, default=10, help="cancelled instances in total"
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=250, help="events per API page"
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="incremental sync rounds")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    """Run the benchmark and print its results."""
+    args = parse_args()
+    tracemalloc.start()
+    try:
+        results = await run_benchmark(args)
+    finally:
+        tracemalloc.stop()
+        await close_engine()
+    print_results(results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
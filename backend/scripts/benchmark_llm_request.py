@@ -0,0 +1,205 @@
+"""Benchmark the per-run overhead of an LLM gateway call, excluding network.
+
+Runs the Anthropic gateway against an in-process chat model that answers
+immediately, with the inbound SMS tool signatures (the highest-volume LLM
+path), and reports the mean time per run of:
+
+1. building the run's tools (``LLMTool`` compiles an args model per tool)
+2. the previous schema work: three ``build_tool_spec_from_callable`` passes
+   (snapshot preview, the preview inside ``run_usecase``, the call itself)
+3. ``preview_usecase`` followed by ``run_usecase`` (two request builds)
+4. ``prepare_usecase`` followed by ``run_prepared`` (one request build, the
+   path ``LLMHandlerMixin.run_llm`` takes)
+
+No API key, database or network is needed.
+
+Usage:
+    python -m scripts.benchmark_llm_request --runs 500
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import time as dt_time
+from typing import Any, Literal, Self
+from uuid import UUID
+
+from lykke.application.gateways.llm_protocol import LLMTool
+from lykke.core.config import settings
+from lykke.domain import value_objects
+from lykke.infrastructure.gateways.anthropic_llm import AnthropicLLMGateway
+from lykke.infrastructure.gateways.llm_provider_pool import LLMProviderPool
+from lykke.infrastructure.gateways.llm_tools import build_tool_spec_from_callable
+
+SYSTEM_PROMPT = "You are Lykke, a planning assistant.\n" + "Context line.\n" * 400
+ASK_PROMPT = "Handle this inbound SMS: Reminder: call the vet tomorrow at 9am."
+
+
+@dataclass
+class BenchmarkResult:
+    """Mean cost of one benchmarked step."""
+
+    name: str
+    runs: int
+    seconds: float
+
+    @property
+    def micros_per_run(self) -> float:
+        """Mean microseconds per run."""
+        return self.seconds / self.runs * 1_000_000
+
+
+class InstantChatModel:
+    """Chat model stand-in that replies with a ``reply`` tool call at once."""
+
+    def bind_tools(self, tool_specs: list[dict[str, Any]]) -> Self:
+        """Return self; binding is free for the stand-in."""
+        _ = tool_specs
+        return self
+
+    async def ainvoke(self, messages: list[Any]) -> Any:
+        """Return a response calling the ``reply`` tool."""
+        _ = messages
+        return _Response()
+
+
+class _Response:
+    content = ""
+    tool_calls = [{"name": "reply", "args": {"message": "Done."}}]  # noqa: RUF012
+    additional_kwargs: dict[str, Any] = {}  # noqa: RUF012
+    usage_metadata = {"input_tokens": 2000, "output_tokens": 20}  # noqa: RUF012
+
+
+def build_tools() -> list[LLMTool]:
+    """Build a tool set with the inbound SMS tool signatures, as a run does."""
+
+    async def reply(message: str | None = None) -> None:
+        """Reply to the user via SMS (optional message for no action)."""
+        _ = message
+
+    async def ask_question(message: str) -> None:
+        """Ask the user a follow-up question."""
+        _ = message
+
+    async def add_task(
+        name: str,
+        category: value_objects.TaskCategory,
+        description: str | None = None,
+        available_time: dt_time | None = None,
+        start_time: dt_time | None = None,
+        end_time: dt_time | None = None,
+        cutoff_time: dt_time | None = None,
+        tags: list[value_objects.TaskTag] | None = None,
+        message: str | None = None,
+    ) -> None:
+        """Create a new task based on the inbound SMS."""
+        _ = (name, category, description, available_time, start_time)
+        _ = (end_time, cutoff_time, tags, message)
+
+    async def add_reminder(reminder: str, message: str | None = None) -> None:
+        """Create a new reminder based on the inbound SMS."""
+        _ = (reminder, message)
+
+    async def add_alarm(
+        alarm_time: dt_time,
+        name: str | None = None,
+        url: str = "",
+        alarm_type: value_objects.AlarmType = value_objects.AlarmType.URL,
+        message: str | None = None,
+    ) -> None:
+        """Add an alarm to today's day (user-local time)."""
+        _ = (alarm_time, name, url, alarm_type, message)
+
+    async def update_task(
+        task_id: UUID,
+        action: Literal["complete", "punt"],
+        message: str | None = None,
+    ) -> None:
+        """Update an existing task when the inbound SMS implies a status change."""
+        _ = (task_id, action, message)
+
+    return [
+        LLMTool(callback=reply),
+        LLMTool(callback=ask_question),
+        LLMTool(callback=add_task),
+        LLMTool(callback=add_reminder),
+        LLMTool(callback=add_alarm),
+        LLMTool(callback=update_task),
+    ]
+
+
+async def measure(
+    name: str, runs: int, run: Callable[[], Awaitable[object]]
+) -> BenchmarkResult:
+    """Time ``runs`` awaits of ``run`` after one warm-up."""
+    await run()
+    started = time.perf_counter()
+    for _ in range(runs):
+        await run()
+    return BenchmarkResult(name=name, runs=runs, seconds=time.perf_counter() - started)
+
+
+async def run_benchmark(runs: int) -> list[BenchmarkResult]:
+    """Run every step and return its measurements."""
+    LLMProviderPool.client("anthropic", settings.ANTHROPIC_MODEL, InstantChatModel)
+    gateway = AnthropicLLMGateway()
+    tools = build_tools()
+    metadata = {"usecase": "process_inbound_sms", "critical": True}
+
+    async def build_only() -> object:
+        return build_tools()
+
+    async def legacy_schemas() -> object:
+        for _ in range(3):
+            for tool in tools:
+                build_tool_spec_from_callable(
+                    tool.callback, tool_name=tool.name, description=tool.description
+                )
+        return None
+
+    async def preview_then_run() -> object:
+        await gateway.preview_usecase(
+            SYSTEM_PROMPT, ASK_PROMPT, tools, metadata=metadata
+        )
+        return await gateway.run_usecase(
+            SYSTEM_PROMPT, ASK_PROMPT, tools, metadata=metadata
+        )
+
+    async def prepare_then_run() -> object:
+        request = await gateway.prepare_usecase(
+            SYSTEM_PROMPT, ASK_PROMPT, tools, metadata=metadata
+        )
+        return await gateway.run_prepared(request)
+
+    return [
+        await measure("build tools", runs, build_only),
+        await measure("legacy schemas x3", runs, legacy_schemas),
+        await measure("preview + run_usecase", runs, preview_then_run),
+        await measure("prepare + run_prepared", runs, prepare_then_run),
+    ]
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    """Print a fixed-width table of per-run costs."""
+    print(f"{'step':<26} {'runs':>7} {'us/run':>10}")
+    for result in results:
+        print(f"{result.name:<26} {result.runs:>7} {result.micros_per_run:>10.1f}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=200, help="runs per step")
+    return parser.parse_args()
+
+
+async def main() -> None:
+    """Run the benchmark and print its results."""
+    args = parse_args()
+    print_results(await run_benchmark(args.runs))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
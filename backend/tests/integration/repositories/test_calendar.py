@@ -1,11 +1,13 @@
 """Integration tests for CalendarRepository."""
 
+from datetime import UTC, datetime
 from uuid import uuid4
 
 import pytest
 
 from lykke.core.exceptions import NotFoundError
 from lykke.domain.entities import AuthTokenEntity, CalendarEntity
+from lykke.domain.value_objects import CalendarSyncCheckpoint
 from lykke.infrastructure.repositories import CalendarRepository
 
 
@@ -71,6 +73,44 @@ async def test_put(calendar_repo, test_user, auth_token_repo):
     assert result.platform == "google"
 
 
+@pytest.mark.asyncio
+async def test_sync_checkpoint_round_trip_and_clear(
+    calendar_repo, test_user, auth_token_repo
+):
+    """Test storing and clearing a sync checkpoint."""
+    auth_token = await auth_token_repo.put(
+        AuthTokenEntity(
+            id=uuid4(),
+            user_id=test_user.id,
+            platform="google",
+            token="test_token",
+        )
+    )
+    checkpoint = CalendarSyncCheckpoint(
+        page_token="page-2",
+        sync_token="sync-token",
+        lookback=datetime(2026, 1, 1, tzinfo=UTC),
+        started_at=datetime(2026, 2, 1, 12, 30, tzinfo=UTC),
+        pages_synced=1,
+    )
+    calendar = await calendar_repo.put(
+        CalendarEntity(
+            user_id=test_user.id,
+            name="Checkpointed Calendar",
+            auth_token_id=auth_token.id,
+            platform="google",
+            platform_id="checkpointed-platform-id",
+            sync_checkpoint=checkpoint,
+        )
+    )
+
+    assert (await calendar_repo.get(calendar.id)).sync_checkpoint == checkpoint
+
+    await calendar_repo.put(calendar.clone(sync_checkpoint=None))
+
+    assert (await calendar_repo.get(calendar.id)).sync_checkpoint is None
+
+
 @pytest.mark.asyncio
 async def test_all(calendar_repo, test_user, auth_token_repo):
     """Test getting all calendars."""
@@ -11,10 +11,14 @@ import pytest
 import pytest_asyncio
 
 from lykke.core.exceptions import NotFoundError
-from lykke.domain.entities import CalendarEntryEntity
+from lykke.domain.entities import CalendarEntryEntity, CalendarEntrySeriesEntity
+from lykke.domain.value_objects import EventCategory
 from lykke.domain.value_objects.query import CalendarEntryQuery
 from lykke.domain.value_objects.task import TaskFrequency
-from lykke.infrastructure.repositories import CalendarEntryRepository
+from lykke.infrastructure.repositories import (
+    CalendarEntryRepository,
+    CalendarEntrySeriesRepository,
+)
 
 USER_TIMEZONE = "America/Chicago"
 
@@ -369,3 +373,181 @@ async def test_user_isolation(
     # User1 should still see their calendar entry
     result = await calendar_entry_repo.get(calendar_entry.id)
     assert result.user_id == test_user.id
+
+
+@pytest.mark.asyncio
+async def test_unchanged_platform_ids(
+    calendar_entry_repo, test_user, test_date, test_calendar
+):
+    """Stored content hashes match entries that did not change."""
+    starts_at = datetime.datetime.combine(
+        test_date,
+        datetime.time(hour=10, microsecond=123456),
+        tzinfo=ZoneInfo(USER_TIMEZONE),
+    ).astimezone(UTC)
+    stored = [
+        CalendarEntryEntity(
+            id=uuid4(),
+            user_id=test_user.id,
+            name=f"Entry {index}",
+            frequency=TaskFrequency.ONCE,
+            calendar_id=test_calendar.id,
+            platform_id=f"hash-{index}",
+            platform="testing",
+            status="confirmed",
+            starts_at=starts_at,
+            ends_at=starts_at + datetime.timedelta(hours=1),
+            ical_uid=f"hash-{index}@example.com" if index else None,
+            user_timezone=USER_TIMEZONE,
+        )
+        for index in range(3)
+    ]
+    for entry in stored:
+        await calendar_entry_repo.put(entry)
+
+    fetched = [
+        stored[0].clone(),
+        stored[1].clone(name="Renamed"),
+        stored[2].clone(ends_at=starts_at + datetime.timedelta(hours=2)),
+    ]
+
+    assert await calendar_entry_repo.unchanged_platform_ids(fetched) == {"hash-0"}
+
+
+@pytest.mark.asyncio
+async def test_series_cascade_and_future_delete_are_set_based(
+    calendar_entry_repo, test_user, test_calendar
+):
+    """Series fields cascade and future entries delete in single statements."""
+    series = CalendarEntrySeriesEntity(
+        user_id=test_user.id,
+        calendar_id=test_calendar.id,
+        name="Standup",
+        platform_id="series-cascade",
+        platform="testing",
+        frequency=TaskFrequency.DAILY,
+    )
+    await CalendarEntrySeriesRepository(user=test_user).put(series)
+    now = datetime.datetime.now(UTC)
+    entries = [
+        CalendarEntryEntity(
+            user_id=test_user.id,
+            name="Standup",
+            frequency=TaskFrequency.DAILY,
+            calendar_id=test_calendar.id,
+            calendar_entry_series_id=series.id,
+            platform_id=f"series-cascade-{offset}",
+            platform="testing",
+            status="confirmed",
+            starts_at=now + datetime.timedelta(days=offset),
+        )
+        for offset in (-1, 1, 2)
+    ]
+    for entry in entries:
+        await calendar_entry_repo.put(entry)
+
+    renamed = series.clone(name="Daily sync", event_category=EventCategory.WORK)
+    cascade_started = datetime.datetime.now(UTC)
+    cascaded = await calendar_entry_repo.cascade_series_fields([renamed])
+
+    assert {entry.id for entry in cascaded} == {entry.id for entry in entries}
+    assert all(entry.name == "Daily sync" for entry in cascaded)
+    assert all(entry.category == EventCategory.WORK for entry in cascaded)
+    assert all(entry.updated_at >= cascade_started for entry in cascaded)
+    assert await calendar_entry_repo.cascade_series_fields([renamed]) == []
+
+    deleted = await calendar_entry_repo.delete_series_entries_from(
+        [series.id], now, exclude_platform_ids={"series-cascade-2"}
+    )
+
+    assert [entry.platform_id for entry in deleted] == ["series-cascade-1"]
+    remaining = await calendar_entry_repo.search(
+        CalendarEntryQuery(calendar_entry_series_id=series.id)
+    )
+    assert {entry.platform_id for entry in remaining} == {
+        "series-cascade--1",
+        "series-cascade-2",
+    }
+
+
+@pytest.mark.asyncio
+async def test_delete_calendar_entries_from(
+    calendar_entry_repo, test_user, test_calendar
+):
+    """Future entries of a calendar are purged in one statement."""
+    now = datetime.datetime.now(UTC)
+    entries = [
+        CalendarEntryEntity(
+            user_id=test_user.id,
+            name=f"Purge {offset}",
+            frequency=TaskFrequency.ONCE,
+            calendar_id=test_calendar.id,
+            platform_id=f"purge-{offset}",
+            platform="testing",
+            status="confirmed",
+            starts_at=now + datetime.timedelta(days=offset),
+        )
+        for offset in (-1, 1)
+    ]
+    for entry in entries:
+        await calendar_entry_repo.put(entry)
+
+    deleted = await calendar_entry_repo.delete_calendar_entries_from(
+        [test_calendar.id], now
+    )
+
+    assert list(deleted) == [entries[1].id]
+    assert await calendar_entry_repo.get(entries[0].id)
+    with pytest.raises(NotFoundError):
+        await calendar_entry_repo.get(entries[1].id)
+
+
+@pytest.mark.asyncio
+async def test_search_expands_series_past_materialized_horizon(
+    calendar_entry_repo, test_user, test_date, test_calendar
+):
+    """Date searches with expand_series add occurrences that have no row."""
+    tz = ZoneInfo(test_user.settings.timezone or "UTC")
+    starts_at = datetime.datetime.combine(
+        test_date - datetime.timedelta(days=7), datetime.time(hour=9), tzinfo=tz
+    ).astimezone(UTC)
+    series = CalendarEntrySeriesEntity(
+        user_id=test_user.id,
+        calendar_id=test_calendar.id,
+        name="Standup",
+        platform_id="series-expand",
+        platform="google",
+        frequency=TaskFrequency.DAILY,
+        recurrence=["RRULE:FREQ=DAILY"],
+        starts_at=starts_at,
+        ends_at=starts_at + datetime.timedelta(minutes=15),
+        materialized_until=starts_at + datetime.timedelta(days=1),
+        cancelled_occurrences=[
+            datetime.datetime.combine(
+                test_date + datetime.timedelta(days=1), datetime.time(hour=9), tzinfo=tz
+            ).astimezone(UTC)
+        ],
+    )
+    await CalendarEntrySeriesRepository(user=test_user).put(series)
+
+    stored = await calendar_entry_repo.search(CalendarEntryQuery(date=test_date))
+    expanded = await calendar_entry_repo.search(
+        CalendarEntryQuery(date=test_date, expand_series=True)
+    )
+    cancelled_day = await calendar_entry_repo.search(
+        CalendarEntryQuery(
+            date=test_date + datetime.timedelta(days=1), expand_series=True
+        )
+    )
+
+    assert stored == []
+    assert [(entry.name, entry.starts_at) for entry in expanded] == [
+        (
+            "Standup",
+            datetime.datetime.combine(
+                test_date, datetime.time(hour=9), tzinfo=tz
+            ).astimezone(UTC),
+        )
+    ]
+    assert expanded[0].calendar_entry_series_id == series.id
+    assert cancelled_day == []
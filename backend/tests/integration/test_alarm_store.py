@@ -0,0 +1,54 @@
+"""Integration tests for UnauthenticatedAlarmStore."""
+
+from datetime import time, timedelta
+
+import pytest
+
+from lykke.core.utils.dates import get_current_datetime
+from lykke.domain import value_objects
+from lykke.domain.entities import DayEntity
+from lykke.infrastructure.repositories import DayRepository
+from lykke.infrastructure.unauthenticated import UnauthenticatedAlarmStore
+
+
+def _day(user, alarm_status: value_objects.AlarmStatus, offset: timedelta):
+    due_at = get_current_datetime() + offset
+    return DayEntity(
+        user_id=user.id,
+        date=due_at.date(),
+        status=value_objects.DayStatus.SCHEDULED,
+        alarms=[
+            value_objects.Alarm(
+                name="Wake up",
+                time=time(due_at.hour, due_at.minute),
+                datetime=due_at,
+                status=alarm_status,
+            )
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_lists_users_with_pending_alarms_due(create_test_user):
+    due = await create_test_user()
+    later = await create_test_user()
+    triggered = await create_test_user()
+
+    await DayRepository(user=due).put(
+        _day(due, value_objects.AlarmStatus.ACTIVE, timedelta(minutes=-5))
+    )
+    await DayRepository(user=later).put(
+        _day(later, value_objects.AlarmStatus.ACTIVE, timedelta(hours=3))
+    )
+    await DayRepository(user=triggered).put(
+        _day(triggered, value_objects.AlarmStatus.TRIGGERED, timedelta(minutes=-5))
+    )
+
+    store = UnauthenticatedAlarmStore()
+    user_ids = await store.list_user_ids_with_alarms_due_before(
+        get_current_datetime() + timedelta(hours=1)
+    )
+
+    assert due.id in user_ids
+    assert later.id not in user_ids
+    assert triggered.id not in user_ids
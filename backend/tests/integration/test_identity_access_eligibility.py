@@ -0,0 +1,69 @@
+"""Integration tests for eligibility projections in UnauthenticatedIdentityAccess."""
+
+from datetime import time
+from uuid import UUID
+
+import pytest
+
+from lykke.domain import value_objects
+from lykke.domain.value_objects.ai_chat import LLMProvider
+from lykke.domain.value_objects.user import (
+    CalendarEntryNotificationSettings,
+    UserSetting,
+)
+from lykke.infrastructure.unauthenticated import UnauthenticatedIdentityAccess
+
+
+async def _eligible_ids(
+    eligibility: value_objects.UserEligibility,
+) -> dict[UUID, value_objects.EligibleUser]:
+    identity_access = UnauthenticatedIdentityAccess()
+    eligible: dict[UUID, value_objects.EligibleUser] = {}
+    async for users in identity_access.iter_eligible_users(eligibility, batch_size=2):
+        assert len(users) <= 2
+        eligible.update({user.id: user for user in users})
+    return eligible
+
+
+@pytest.mark.asyncio
+async def test_iter_eligible_users_filters_in_sql(create_test_user):
+    plain = await create_test_user(settings=UserSetting())
+    with_llm = await create_test_user(
+        settings=UserSetting(llm_provider=LLMProvider.OPENAI, timezone="UTC")
+    )
+    with_overview = await create_test_user(
+        settings=UserSetting(
+            llm_provider=LLMProvider.OPENAI,
+            morning_overview_time=time(7, 30),
+            timezone="America/Chicago",
+        )
+    )
+    reminders_disabled = await create_test_user(
+        settings=UserSetting(
+            calendar_entry_notification_settings=CalendarEntryNotificationSettings(
+                enabled=False
+            )
+        )
+    )
+
+    all_users = await _eligible_ids(value_objects.UserEligibility.ALL)
+    assert {plain.id, with_llm.id, with_overview.id, reminders_disabled.id} <= set(
+        all_users
+    )
+
+    llm_users = await _eligible_ids(value_objects.UserEligibility.LLM_PROVIDER)
+    assert with_llm.id in llm_users
+    assert with_overview.id in llm_users
+    assert plain.id not in llm_users
+
+    overview_users = await _eligible_ids(value_objects.UserEligibility.MORNING_OVERVIEW)
+    assert with_overview.id in overview_users
+    assert with_llm.id not in overview_users
+    assert overview_users[with_overview.id].morning_overview_time == time(7, 30)
+    assert overview_users[with_overview.id].timezone == "America/Chicago"
+
+    reminder_users = await _eligible_ids(
+        value_objects.UserEligibility.CALENDAR_ENTRY_NOTIFICATIONS
+    )
+    assert plain.id in reminder_users
+    assert reminders_disabled.id not in reminder_users
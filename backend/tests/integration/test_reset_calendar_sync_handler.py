@@ -1,5 +1,6 @@
 """Integration tests for ResetCalendarSyncHandler."""
 
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
@@ -11,7 +12,10 @@ from lykke.application.commands.calendar.reset_calendar_sync import (
     ResetCalendarSyncHandler,
 )
 from lykke.application.commands.calendar.sync_calendar import SyncCalendarHandler
-from lykke.application.gateways.google_protocol import GoogleCalendarGatewayProtocol
+from lykke.application.gateways.google_protocol import (
+    CalendarEventPage,
+    GoogleCalendarGatewayProtocol,
+)
 from lykke.domain import value_objects
 from lykke.domain.entities import AuthTokenEntity, CalendarEntity, CalendarEntryEntity
 from lykke.domain.value_objects.sync import SyncSubscription
@@ -69,7 +73,7 @@ class FakeGoogleGateway(GoogleCalendarGatewayProtocol):
             }
         )
 
-    async def load_calendar_events(
+    async def iter_calendar_event_pages(
         self,
         calendar: CalendarEntity,
         lookback: datetime,
@@ -77,13 +81,8 @@ class FakeGoogleGateway(GoogleCalendarGatewayProtocol):
         *,
         user_timezone: str | None = None,
         sync_token: str | None = None,
-    ) -> tuple[
-        list[CalendarEntryEntity],
-        list[CalendarEntryEntity],
-        list[Any],
-        list[Any],
-        str | None,
-    ]:
+        page_token: str | None = None,
+    ) -> AsyncIterator[CalendarEventPage]:
         self.load_events_calls.append(
             {
                 "calendar_id": calendar.id,
@@ -93,7 +92,13 @@ class FakeGoogleGateway(GoogleCalendarGatewayProtocol):
             }
         )
         # Return empty events for sync
-        return [], [], [], [], "next-sync-token"
+        yield CalendarEventPage(
+            entries=[],
+            deleted_entries=[],
+            series=[],
+            cancelled_series_ids=[],
+            next_sync_token="next-sync-token",
+        )
 
     def get_flow(self, flow_name: str) -> Any:  # pragma: no cover - unused
         raise NotImplementedError
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
@@ -8,9 +9,12 @@ from lykke.application.commands.calendar.subscribe_calendar import (
     SubscribeCalendarCommand,
     SubscribeCalendarHandler,
 )
-from lykke.application.gateways.google_protocol import GoogleCalendarGatewayProtocol
+from lykke.application.gateways.google_protocol import (
+    CalendarEventPage,
+    GoogleCalendarGatewayProtocol,
+)
 from lykke.domain import value_objects
-from lykke.domain.entities import AuthTokenEntity, CalendarEntity, CalendarEntryEntity
+from lykke.domain.entities import AuthTokenEntity, CalendarEntity
 from lykke.infrastructure.gateways import StubPubSubGateway
 from lykke.infrastructure.repository_factories import SqlAlchemyReadOnlyRepositoryFactory
 from lykke.infrastructure.unit_of_work import SqlAlchemyUnitOfWorkFactory
@@ -45,7 +49,7 @@ class FakeGoogleGateway(GoogleCalendarGatewayProtocol):
             expiration=self._expiration,
         )
 
-    async def load_calendar_events(  # pragma: no cover - unused in this test
+    async def iter_calendar_event_pages(  # pragma: no cover - unused in this test
         self,
         calendar: CalendarEntity,
         lookback: datetime,
@@ -53,14 +57,15 @@ class FakeGoogleGateway(GoogleCalendarGatewayProtocol):
         *,
         user_timezone: str | None = None,
         sync_token: str | None = None,
-    ) -> tuple[
-        list[CalendarEntryEntity],
-        list[CalendarEntryEntity],
-        list[Any],
-        list[Any],
-        str | None,
-    ]:
-        return [], [], [], [], "next-token"
+        page_token: str | None = None,
+    ) -> AsyncIterator[CalendarEventPage]:
+        yield CalendarEventPage(
+            entries=[],
+            deleted_entries=[],
+            series=[],
+            cancelled_series_ids=[],
+            next_sync_token="next-token",
+        )
 
     async def unsubscribe_from_calendar(  # pragma: no cover - unused in this test
         self,
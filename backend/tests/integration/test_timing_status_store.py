@@ -0,0 +1,57 @@
+"""Integration tests for UnauthenticatedTimingStatusStore."""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+
+from lykke.domain import value_objects
+from lykke.domain.entities import RoutineEntity, TaskEntity
+from lykke.infrastructure.repositories import RoutineRepository, TaskRepository
+from lykke.infrastructure.unauthenticated import UnauthenticatedTimingStatusStore
+
+
+def _task(user_id, scheduled_date: date) -> TaskEntity:
+    return TaskEntity(
+        user_id=user_id,
+        scheduled_date=scheduled_date,
+        name="Task",
+        status=value_objects.TaskStatus.NOT_STARTED,
+        type=value_objects.TaskType.WORK,
+        category=value_objects.TaskCategory.WORK,
+        frequency=value_objects.TaskFrequency.ONCE,
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_loads_each_users_own_date(create_test_user):
+    first = await create_test_user()
+    second = await create_test_user()
+    today = date(2025, 1, 2)
+    yesterday = today - timedelta(days=1)
+
+    first_tasks = TaskRepository(user=first)
+    second_tasks = TaskRepository(user=second)
+    first_today = await first_tasks.put(_task(first.id, today))
+    await first_tasks.put(_task(first.id, yesterday))
+    second_yesterday = await second_tasks.put(_task(second.id, yesterday))
+    await second_tasks.put(_task(second.id, today))
+    routine = await RoutineRepository(user=first).put(
+        RoutineEntity(
+            user_id=first.id,
+            date=today,
+            routine_definition_id=uuid4(),
+            name="Routine",
+            category=value_objects.TaskCategory.WORK,
+        )
+    )
+
+    store = UnauthenticatedTimingStatusStore()
+    dates_by_user = {first.id: today, second.id: yesterday}
+    tasks = await store.list_tasks_by_user(dates_by_user)
+    routines = await store.list_routines_by_user(dates_by_user)
+
+    assert [task.id for task in tasks[first.id]] == [first_today.id]
+    assert [task.id for task in tasks[second.id]] == [second_yesterday.id]
+    assert [r.id for r in routines[first.id]] == [routine.id]
+    assert routines[second.id] == []
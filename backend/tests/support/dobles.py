@@ -394,6 +394,9 @@ def create_uow_double(
     allow(uow_double).bulk_delete_tasks.and_return(None)
     allow(uow_double).bulk_delete_routines.and_return(None)
     allow(uow_double).bulk_delete_calendar_entries.and_return(None)
+    allow(uow_double).cascade_calendar_entry_series.and_return([])
+    allow(uow_double).delete_calendar_series_entries_from.and_return([])
+    allow(uow_double).purge_calendar_entries_from.and_return([])
     allow(uow_double).set_trigger_tactics.and_return(None)
 
     # Stub add method (synchronous)
@@ -419,6 +422,7 @@ def create_uow_double(
 
     # Manually assign the method since dobles and_return doesn't support callables
     uow_double.add = make_track_add()
+    uow_double.add_persisted = make_track_add()
 
     # For async methods, we need to return coroutines
     async def track_create_async(entity: Any) -> Any:
@@ -0,0 +1,387 @@
+"""Local fake of the Google Calendar v3 API for gateway tests and benchmarks.
+
+Serves the few endpoints the gateways use from in-memory events over real
+HTTP, including ``/batch/calendar/v3`` multipart batches and the OAuth token
+endpoint, so tests exercise googleapiclient's and aiohttp's request building
+and response parsing end to end. Every HTTP round trip is recorded in
+``requests``.
+
+Events changed through ``add_event``, ``update_event`` and ``cancel_event``
+are versioned, so ``events.list`` honours sync tokens the way Google does:
+a listing with a token returns only what changed since it was issued, and
+tokens older than ``invalidate_sync_tokens()`` answer 410. ``seed_calendar``
+fills a calendar with singles, recurring series, exceptions and cancellations.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from email.parser import Parser
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import httplib2
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+
+_EVENT_PATH = re.compile(r"^/calendar/v3/calendars/([^/]+)/events/([^/]+)$")
+_EVENTS_PATH = re.compile(r"^/calendar/v3/calendars/([^/]+)/events$")
+_WATCH_PATH = re.compile(r"^/calendar/v3/calendars/([^/]+)/events/watch$")
+_STOP_PATH = "/calendar/v3/channels/stop"
+_BATCH_PATH = "/batch/calendar/v3"
+_SYNC_TOKEN_PREFIX = "fake-sync-token-"
+TOKEN_PATH = "/token"
+
+
+class FakeGoogleCalendarServer:
+    """Threaded HTTP server holding events per calendar id."""
+
+    def __init__(self) -> None:
+        self.events: dict[str, dict[str, dict[str, Any]]] = defaultdict(dict)
+        self.requests: list[str] = []
+        self.batch_sizes: list[int] = []
+        # Items per events.list page; None honours ``maxResults``.
+        self.page_size: int | None = None
+        # Statuses answered, in order, before serving API requests normally.
+        self.failures: list[int] = []
+        # When set, API requests must carry this bearer token or get a 401.
+        self.access_token: str | None = None
+        # Refresh tokens the token endpoint exchanges for ``access_token``.
+        self.refresh_tokens: set[str] = set()
+        self.channels: dict[str, dict[str, Any]] = {}
+        self._version = 0
+        self._oldest_sync_version = 0
+        self._event_versions: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def root_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.root_url}calendar/v3"
+
+    @property
+    def token_uri(self) -> str:
+        return f"{self.root_url}{TOKEN_PATH.lstrip('/')}"
+
+    @property
+    def next_sync_token(self) -> str:
+        return f"{_SYNC_TOKEN_PREFIX}{self._version}"
+
+    def add_event(self, calendar_id: str, event: dict[str, Any]) -> None:
+        self.events[calendar_id][event["id"]] = event
+        self._touch(calendar_id, event["id"])
+
+    def update_event(self, calendar_id: str, event_id: str, **fields: Any) -> None:
+        self.events[calendar_id][event_id].update(fields)
+        self._touch(calendar_id, event_id)
+
+    def cancel_event(self, calendar_id: str, event_id: str) -> None:
+        self.update_event(calendar_id, event_id, status="cancelled")
+
+    def invalidate_sync_tokens(self) -> None:
+        """Make every token issued so far answer 410 Gone."""
+        self._oldest_sync_version = self._version + 1
+
+    def _touch(self, calendar_id: str, event_id: str) -> None:
+        self._version += 1
+        self._event_versions[(calendar_id, event_id)] = self._version
+
+    def build_service(self) -> Any:
+        """Build a Calendar service whose requests and batches hit this server."""
+        document = json.loads(get_static_doc("calendar", "v3"))
+        document["rootUrl"] = self.root_url
+        return build_from_document(document, http=httplib2.Http())
+
+    def __enter__(self) -> FakeGoogleCalendarServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def dispatch(
+        self, method: str, target: str, body: dict[str, Any] | None = None
+    ) -> tuple[int, dict[str, Any]]:
+        """Answer a single (possibly batched) API request."""
+        parts = urlsplit(target)
+        path = unquote(parts.path)
+        if method == "POST" and (match := _WATCH_PATH.match(path)):
+            channel = {
+                "kind": "api#channel",
+                "id": (body or {}).get("id"),
+                "resourceId": f"resource-{match.group(1)}",
+                "expiration": "1893456000000",
+            }
+            self.channels[str(channel["id"])] = channel
+            return 200, channel
+        if method == "POST" and path == _STOP_PATH:
+            if self.channels.pop(str((body or {}).get("id")), None) is None:
+                return 404, {"error": {"code": 404, "message": "Not Found"}}
+            return 204, {}
+        if method == "GET" and (match := _EVENT_PATH.match(path)):
+            event = self.events[match.group(1)].get(match.group(2))
+            if event is None:
+                return 404, {"error": {"code": 404, "message": "Not Found"}}
+            return 200, event
+        if method == "GET" and (match := _EVENTS_PATH.match(path)):
+            return self._list_events(match.group(1), parse_qs(parts.query))
+        return 400, {"error": {"code": 400, "message": f"Unsupported {path}"}}
+
+    def _list_events(
+        self, calendar_id: str, query: dict[str, list[str]]
+    ) -> tuple[int, dict[str, Any]]:
+        items = list(self.events[calendar_id].values())
+        if query.get("singleEvents") == ["true"]:
+            items = [item for item in items if not item.get("recurrence")]
+        if "syncToken" in query:
+            token = query["syncToken"][0]
+            since = (
+                int(token.removeprefix(_SYNC_TOKEN_PREFIX))
+                if token.startswith(_SYNC_TOKEN_PREFIX)
+                else -1
+            )
+            if since < self._oldest_sync_version:
+                return 410, {
+                    "error": {
+                        "code": 410,
+                        "message": "Sync token is no longer valid",
+                        "errors": [{"reason": "fullSyncRequired"}],
+                    }
+                }
+            items = [
+                item
+                for item in items
+                if self._event_versions.get((calendar_id, item["id"]), 0) > since
+            ]
+        limit = self.page_size or int(query.get("maxResults", ["0"])[0]) or None
+        if limit is None:
+            return 200, {"items": items, "nextSyncToken": self.next_sync_token}
+        offset = int(query.get("pageToken", ["0"])[0])
+        page: dict[str, Any] = {"items": items[offset : offset + limit]}
+        if offset + limit < len(items):
+            page["nextPageToken"] = str(offset + limit)
+        else:
+            page["nextSyncToken"] = self.next_sync_token
+        return 200, page
+
+    def _dispatch_http(
+        self,
+        method: str,
+        target: str,
+        authorization: str | None,
+        body: dict[str, Any] | None,
+    ) -> tuple[int, dict[str, Any]]:
+        with self._lock:
+            failure = self.failures.pop(0) if self.failures else None
+        if failure is not None:
+            return failure, {"error": {"code": failure, "message": "Injected"}}
+        if self.access_token is not None and (
+            authorization != f"Bearer {self.access_token}"
+        ):
+            return 401, {"error": {"code": 401, "message": "Invalid Credentials"}}
+        return self.dispatch(method, target, body)
+
+    def _refresh(self, form: dict[str, list[str]]) -> tuple[int, dict[str, Any]]:
+        if form.get("refresh_token", [""])[0] not in self.refresh_tokens:
+            return 400, {"error": "invalid_grant"}
+        return 200, {"access_token": self.access_token, "expires_in": 3600}
+
+    def _dispatch_batch(self, content_type: str, body: str) -> str:
+        message = Parser().parsestr(f"Content-Type: {content_type}\r\n\r\n{body}")
+        boundary = "fake-batch-boundary"
+        chunks: list[str] = []
+        parts = message.get_payload()
+        self.batch_sizes.append(len(parts))
+        for part in parts:
+            request_line = part.get_payload().splitlines()[0]
+            method, target, _ = request_line.split(" ", 2)
+            status, payload = self.dispatch(method, target)
+            content_id = part["Content-ID"].strip("<>")
+            chunks.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{json.dumps(payload)}\r\n"
+            )
+        chunks.append(f"--{boundary}--\r\n")
+        return "".join(chunks)
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                _ = (format, args)
+
+            def _send(self, status: int, content_type: str, body: str) -> None:
+                encoded = b"" if status == 204 else body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(encoded)))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def do_GET(self) -> None:
+                server.requests.append(f"GET {self.path}")
+                status, payload = server._dispatch_http(
+                    "GET", self.path, self.headers.get("Authorization"), None
+                )
+                self._send(status, "application/json", json.dumps(payload))
+
+            def do_POST(self) -> None:
+                server.requests.append(f"POST {self.path}")
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length).decode("utf-8")
+                path = urlsplit(self.path).path
+                if path == _BATCH_PATH:
+                    response = server._dispatch_batch(
+                        self.headers["Content-Type"], body
+                    )
+                    self._send(
+                        200, "multipart/mixed; boundary=fake-batch-boundary", response
+                    )
+                    return
+                if path == TOKEN_PATH:
+                    status, payload = server._refresh(parse_qs(body))
+                else:
+                    status, payload = server._dispatch_http(
+                        "POST",
+                        self.path,
+                        self.headers.get("Authorization"),
+                        json.loads(body) if body else None,
+                    )
+                self._send(status, "application/json", json.dumps(payload))
+
+        return _Handler
+
+
+@dataclass(frozen=True)
+class SeededCalendar:
+    """Ids of the events ``seed_calendar`` created."""
+
+    single_ids: list[str]
+    series_ids: list[str]
+    instance_ids: list[str]
+    exception_ids: list[str]
+    cancelled_ids: list[str]
+
+
+def seed_calendar(
+    server: FakeGoogleCalendarServer,
+    calendar_id: str,
+    *,
+    events: int,
+    series: int,
+    occurrences: int = 10,
+    exceptions: int = 0,
+    cancellations: int = 0,
+    start: datetime | None = None,
+) -> SeededCalendar:
+    """Fill a calendar with ``events`` singles and ``series`` weekly series.
+
+    Each series gets a master plus ``occurrences`` expanded instances.
+    ``exceptions`` instances are moved by an hour and ``cancellations`` are
+    cancelled, spread round-robin across the series. Singles are spread
+    over the next 180 days so they stay inside the sync lookahead.
+    """
+    if start is None:
+        start = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+    seeded = SeededCalendar([], [], [], [], [])
+
+    for index in range(events):
+        event_start = start + timedelta(days=index % 180, minutes=15 * (index // 180))
+        event_id = f"single{index}"
+        server.add_event(
+            calendar_id, _fake_event(event_id, f"Event {index}", event_start)
+        )
+        seeded.single_ids.append(event_id)
+
+    instances: list[list[str]] = []
+    for index in range(series):
+        series_id = f"series{index}"
+        series_start = start + timedelta(days=index % 7, hours=index % 8)
+        server.add_event(
+            calendar_id,
+            _fake_event(
+                series_id,
+                f"Series {index}",
+                series_start,
+                recurrence=[f"RRULE:FREQ=WEEKLY;COUNT={occurrences}"],
+                iCalUID=f"{series_id}@google.com",
+            ),
+        )
+        seeded.series_ids.append(series_id)
+        series_instances: list[str] = []
+        for week in range(occurrences):
+            instance_start = series_start + timedelta(weeks=week)
+            instance_id = f"{series_id}_{instance_start:%Y%m%dT%H%M%SZ}"
+            server.add_event(
+                calendar_id,
+                _fake_event(
+                    instance_id,
+                    f"Series {index}",
+                    instance_start,
+                    recurringEventId=series_id,
+                    originalStartTime={"dateTime": _fake_time(instance_start)},
+                    iCalUID=f"{series_id}@google.com",
+                ),
+            )
+            series_instances.append(instance_id)
+        instances.append(series_instances)
+        seeded.instance_ids.extend(series_instances)
+
+    if series:
+        for index in range(min(exceptions, series * occurrences)):
+            instance_id = instances[index % series][index // series]
+            event = server.events[calendar_id][instance_id]
+            moved = datetime.fromisoformat(event["start"]["dateTime"]) + timedelta(
+                hours=1
+            )
+            server.update_event(
+                calendar_id,
+                instance_id,
+                summary=f"{event['summary']} (moved)",
+                start={"dateTime": _fake_time(moved)},
+                end={"dateTime": _fake_time(moved + timedelta(hours=1))},
+            )
+            seeded.exception_ids.append(instance_id)
+        for index in range(min(cancellations, series * occurrences)):
+            instance_id = instances[index % series][-1 - index // series]
+            server.cancel_event(calendar_id, instance_id)
+            seeded.cancelled_ids.append(instance_id)
+    return seeded
+
+
+def _fake_time(value: datetime) -> str:
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _fake_event(
+    event_id: str, summary: str, event_start: datetime, **fields: Any
+) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "summary": summary,
+        "status": "confirmed",
+        "start": {"dateTime": _fake_time(event_start)},
+        "end": {"dateTime": _fake_time(event_start + timedelta(hours=1))},
+        "created": "2026-01-01T00:00:00Z",
+        "updated": "2026-01-01T00:00:00Z",
+        **fields,
+    }
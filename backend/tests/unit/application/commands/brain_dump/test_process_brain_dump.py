@@ -21,7 +21,11 @@ from lykke.application.commands.task import (
 from lykke.application.gateways.llm_gateway_factory_protocol import (
     LLMGatewayFactoryProtocol,
 )
-from lykke.application.gateways.llm_protocol import LLMTool, LLMToolRunResult
+from lykke.application.gateways.llm_protocol import (
+    LLMPreparedRequest,
+    LLMTool,
+    LLMToolRunResult,
+)
 from lykke.domain import value_objects
 from lykke.domain.entities import (
     BrainDumpEntity,
@@ -72,6 +76,34 @@ class _LLMGateway:
             "request_model_params": {},
         }
 
+    async def prepare_usecase(
+        self,
+        system_prompt: str,
+        ask_prompt: str,
+        tools: list[LLMTool],
+        metadata: dict[str, Any] | None = None,
+    ) -> LLMPreparedRequest:
+        return LLMPreparedRequest(
+            system_prompt=system_prompt,
+            ask_prompt=ask_prompt,
+            tools=tools,
+            tool_specs=[],
+            payload=await self.preview_usecase(
+                system_prompt, ask_prompt, tools, metadata
+            ),
+            metadata=metadata,
+        )
+
+    async def run_prepared(
+        self, request: LLMPreparedRequest
+    ) -> LLMToolRunResult | None:
+        return await self.run_usecase(
+            request.system_prompt,
+            request.ask_prompt,
+            list(request.tools),
+            metadata=request.metadata,
+        )
+
 
 class _LLMGatewayFactory:
     def create_gateway(self, provider: value_objects.LLMProvider) -> _LLMGateway:
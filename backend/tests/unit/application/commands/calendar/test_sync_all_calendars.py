@@ -0,0 +1,127 @@
+"""Unit tests for concurrent calendar syncs."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from lykke.application.commands.calendar import (
+    SyncAllCalendarsCommand,
+    SyncAllCalendarsHandler,
+    SyncCalendarHandler,
+)
+from lykke.core.config import settings
+from lykke.core.exceptions import TokenExpiredError
+from lykke.domain.entities import CalendarEntity, UserEntity
+from tests.support.dobles import (
+    create_calendar_repo_double,
+    create_read_only_repos_double,
+    create_uow_double,
+    create_uow_factory_double,
+)
+
+
+class _RepositoryFactory:
+    def __init__(self, ro_repos: object) -> None:
+        self._ro_repos = ro_repos
+
+    def create(self, user: object) -> object:
+        _ = user
+        return self._ro_repos
+
+
+def _build_calendar(
+    user_id: object, name: str, platform: str = "google"
+) -> CalendarEntity:
+    return CalendarEntity(
+        user_id=user_id,
+        name=name,
+        auth_token_id=uuid4(),
+        platform_id=f"{name}-id",
+        platform=platform,
+    )
+
+
+def _build_handlers(
+    calendars: list[CalendarEntity],
+) -> tuple[SyncAllCalendarsHandler, SyncCalendarHandler]:
+    user = UserEntity(id=uuid4(), email="test@example.com", hashed_password="!")
+    calendar_repo = create_calendar_repo_double()
+
+    async def all_calendars() -> list[CalendarEntity]:
+        return calendars
+
+    calendar_repo.all = all_calendars
+    ro_repos = create_read_only_repos_double(calendar_repo=calendar_repo)
+    uow_factory = create_uow_factory_double(create_uow_double())
+
+    sync_handler = SyncCalendarHandler(
+        user=user,
+        uow_factory=uow_factory,
+        repository_factory=_RepositoryFactory(ro_repos),
+    )
+    handler = SyncAllCalendarsHandler(
+        user=user,
+        uow_factory=uow_factory,
+        repository_factory=_RepositoryFactory(ro_repos),
+    )
+    handler.sync_calendar_handler = sync_handler
+    return handler, sync_handler
+
+
+@pytest.mark.asyncio
+async def test_sync_all_calendars_runs_bounded_concurrent_syncs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "CALENDAR_SYNC_USER_CONCURRENCY", 2)
+    user_id = uuid4()
+    calendars = [_build_calendar(user_id, f"cal-{i}") for i in range(5)]
+    lykke_calendar = _build_calendar(user_id, "lykke", platform="lykke")
+    handler, sync_handler = _build_handlers([*calendars, lykke_calendar])
+
+    in_flight = 0
+    max_in_flight = 0
+    synced: list[str] = []
+
+    async def sync_calendar_entity(calendar: CalendarEntity) -> CalendarEntity:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        synced.append(calendar.name)
+        return calendar
+
+    sync_handler.sync_calendar_entity = sync_calendar_entity  # type: ignore[method-assign]
+
+    await handler.handle(SyncAllCalendarsCommand())
+
+    assert sorted(synced) == sorted(calendar.name for calendar in calendars)
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_calendars_isolates_failures_per_calendar() -> None:
+    user_id = uuid4()
+    expired, broken, healthy = (
+        _build_calendar(user_id, name) for name in ("expired", "broken", "healthy")
+    )
+    handler, sync_handler = _build_handlers([expired, broken, healthy])
+
+    async def sync_calendar_entity(calendar: CalendarEntity) -> CalendarEntity:
+        if calendar is expired:
+            raise TokenExpiredError("User needs to re-authenticate")
+        if calendar is broken:
+            raise RuntimeError("boom")
+        return calendar
+
+    sync_handler.sync_calendar_entity = sync_calendar_entity  # type: ignore[method-assign]
+
+    results = await sync_handler.sync_calendars([expired, broken, healthy])
+
+    assert isinstance(results[0], TokenExpiredError)
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] is healthy
+    await handler.handle(SyncAllCalendarsCommand())
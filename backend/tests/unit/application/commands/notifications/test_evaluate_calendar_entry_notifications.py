@@ -112,10 +112,12 @@ def _allow_calendar_entry_search(
     calendar_entry_repo: object, today: dt_date, entry: CalendarEntryEntity
 ) -> None:
     allow(calendar_entry_repo).search.with_args(
-        value_objects.CalendarEntryQuery(date=today)
+        value_objects.CalendarEntryQuery(date=today, expand_series=True)
     ).and_return([entry])
     allow(calendar_entry_repo).search.with_args(
-        value_objects.CalendarEntryQuery(date=today + timedelta(days=1))
+        value_objects.CalendarEntryQuery(
+            date=today + timedelta(days=1), expand_series=True
+        )
     ).and_return([])
 
 
@@ -15,7 +15,11 @@ from lykke.application.commands.notifications import (
     SmartNotificationHandler,
     evaluate_smart_notification as smart_module,
 )
-from lykke.application.gateways.llm_protocol import LLMTool, LLMToolRunResult
+from lykke.application.gateways.llm_protocol import (
+    LLMPreparedRequest,
+    LLMTool,
+    LLMToolRunResult,
+)
 from lykke.application.llm.mixin import LLMRunSnapshotContext
 from lykke.application.llm.prompt_rendering import render_context_prompt
 from lykke.application.repositories import PushNotificationRepositoryReadOnlyProtocol
@@ -31,6 +35,7 @@ from lykke.domain.entities import (
     TaskEntity,
     UserEntity,
 )
+from lykke.infrastructure.gateways import StubLLMRunFingerprintGateway
 from tests.support.dobles import (
     create_push_subscription_repo_double,
     create_read_only_repos_double,
@@ -82,6 +87,34 @@ class _LLMGateway:
             "request_model_params": {},
         }
 
+    async def prepare_usecase(
+        self,
+        system_prompt: str,
+        ask_prompt: str,
+        tools: list[LLMTool],
+        metadata: dict[str, Any] | None = None,
+    ) -> LLMPreparedRequest:
+        return LLMPreparedRequest(
+            system_prompt=system_prompt,
+            ask_prompt=ask_prompt,
+            tools=tools,
+            tool_specs=[],
+            payload=await self.preview_usecase(
+                system_prompt, ask_prompt, tools, metadata
+            ),
+            metadata=metadata,
+        )
+
+    async def run_prepared(
+        self, request: LLMPreparedRequest
+    ) -> LLMToolRunResult | None:
+        return await self.run_usecase(
+            request.system_prompt,
+            request.ask_prompt,
+            list(request.tools),
+            metadata=request.metadata,
+        )
+
 
 class _LLMGatewayFactory:
     def create_gateway(self, provider: value_objects.LLMProvider) -> _LLMGateway:
@@ -864,6 +897,64 @@ async def test_run_llm_injects_usecase_config_ro_repo(
     assert called["system"] == 2
 
 
+@pytest.mark.asyncio
+async def test_run_llm_skips_unchanged_context_within_time_bucket(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _CountingLLMGateway(_LLMGateway):
+        runs = 0
+
+        async def run_usecase(self, *args: Any, **kwargs: Any) -> None:
+            _ = (args, kwargs)
+            _CountingLLMGateway.runs += 1
+
+    class _CountingLLMGatewayFactory:
+        def create_gateway(self, provider: Any) -> _CountingLLMGateway:
+            _ = provider
+            return _CountingLLMGateway()
+
+    user_id = uuid4()
+    handler = SmartNotificationHandler(
+        user=_build_user_with_llm(user_id),
+        uow_factory=create_uow_factory_double(create_uow_double()),
+        repository_factory=_RepositoryFactory(create_read_only_repos_double()),
+    )
+    handler.llm_gateway_factory = _CountingLLMGatewayFactory()
+    handler.llm_run_fingerprint_gateway = StubLLMRunFingerprintGateway()
+    handler.get_llm_prompt_context_handler = _PromptContextHandler(
+        prompt_context=_build_prompt_context(user_id)
+    )
+    handler.send_push_notification_handler = _Recorder(commands=[])
+
+    from lykke.application.llm import mixin as llm_mixin
+
+    async def fake_render_system_prompt(**_: object) -> str:
+        return "system"
+
+    def fake_render_context_prompt(*, current_time: datetime, **_: object) -> str:
+        return f"context at {current_time:%H:%M}"
+
+    now = {"value": datetime(2025, 11, 27, 10, 1, tzinfo=UTC)}
+    monkeypatch.setattr(settings, "LLM_FINGERPRINT_TIME_BUCKET_MINUTES", 30)
+    monkeypatch.setattr(llm_mixin, "render_system_prompt", fake_render_system_prompt)
+    monkeypatch.setattr(llm_mixin, "render_context_prompt", fake_render_context_prompt)
+    monkeypatch.setattr(llm_mixin, "render_ask_prompt", lambda **_: "ask")
+    monkeypatch.setattr(
+        llm_mixin, "get_current_datetime_in_timezone", lambda _: now["value"]
+    )
+
+    await handler.run_llm()
+    now["value"] = datetime(2025, 11, 27, 10, 19, tzinfo=UTC)
+    await handler.run_llm()
+    now["value"] = datetime(2025, 11, 27, 10, 31, tzinfo=UTC)
+    await handler.run_llm()
+
+    assert _CountingLLMGateway.runs == 2
+    assert await handler.llm_run_fingerprint_gateway.hit_counts() == {
+        "notification": (1, 2)
+    }
+
+
 @pytest.mark.asyncio
 async def test_run_llm_logs_not_found_context_as_debug(
     monkeypatch: pytest.MonkeyPatch,
@@ -0,0 +1,298 @@
+"""Unit tests for EvaluateTimingStatusBatchHandler."""
+
+from collections.abc import Mapping
+from dataclasses import replace
+from datetime import UTC, date as dt_date, datetime, time
+from uuid import UUID, uuid4
+
+import pytest
+from dobles import allow
+
+from lykke.application.commands.timing_status import (
+    EvaluateTimingStatusBatchCommand,
+    EvaluateTimingStatusBatchHandler,
+    EvaluateTimingStatusCommand,
+    EvaluateTimingStatusHandler,
+)
+from lykke.application.commands.timing_status import (
+    evaluate_timing_status as evaluate_module,
+    evaluate_timing_status_batch as batch_module,
+)
+from lykke.domain import value_objects
+from lykke.domain.entities import RoutineEntity, TaskEntity, UserEntity
+from tests.support.dobles import (
+    create_read_only_repos_double,
+    create_routine_repo_double,
+    create_task_repo_double,
+    create_uow_double,
+    create_uow_factory_double,
+)
+from tests.unit.presentation.worker_task_helpers import create_identity_access
+
+NOW = datetime(2025, 1, 1, 10, 0, 30, tzinfo=UTC)
+
+
+class _RepositoryFactory:
+    def __init__(self, ro_repos: object) -> None:
+        self._ro_repos = ro_repos
+
+    def create(self, user: object) -> object:
+        _ = user
+        return self._ro_repos
+
+
+class _TimingStatusStore:
+    def __init__(self, tasks: list[TaskEntity], routines: list[RoutineEntity]) -> None:
+        self._tasks = tasks
+        self._routines = routines
+        self.calls: list[str] = []
+        self.refreshed_dates: dict[UUID, dt_date] = {}
+        self.refreshed: dict[UUID, datetime | None] = {}
+
+    async def list_tasks_by_user(
+        self, dates_by_user: Mapping[UUID, dt_date]
+    ) -> dict[UUID, list[TaskEntity]]:
+        self.calls.append("tasks")
+        return {
+            user_id: [
+                t
+                for t in self._tasks
+                if t.user_id == user_id and t.scheduled_date == day
+            ]
+            for user_id, day in dates_by_user.items()
+        }
+
+    async def list_routines_by_user(
+        self, dates_by_user: Mapping[UUID, dt_date]
+    ) -> dict[UUID, list[RoutineEntity]]:
+        self.calls.append("routines")
+        return {
+            user_id: [
+                r for r in self._routines if r.user_id == user_id and r.date == day
+            ]
+            for user_id, day in dates_by_user.items()
+        }
+
+    async def list_user_ids_with_transitions_before(
+        self, until: datetime
+    ) -> list[UUID]:
+        raise NotImplementedError
+
+    async def refresh_next_transitions(
+        self,
+        dates_by_user: Mapping[UUID, dt_date],
+        *,
+        tasks: Mapping[UUID, datetime | None],
+        routines: Mapping[UUID, datetime | None],
+    ) -> None:
+        self.calls.append("refresh")
+        self.refreshed_dates = dict(dates_by_user)
+        self.refreshed = {**tasks, **routines}
+
+
+@pytest.fixture(autouse=True)
+def _freeze_now(monkeypatch: pytest.MonkeyPatch) -> None:
+    for module in (evaluate_module, batch_module):
+        monkeypatch.setattr(
+            module, "get_current_datetime_in_timezone", lambda timezone: NOW
+        )
+        monkeypatch.setattr(module, "get_current_date", lambda timezone: NOW.date())
+
+
+def _build_user(user_id: UUID) -> UserEntity:
+    return UserEntity(
+        id=user_id,
+        email=f"{user_id}@example.com",
+        hashed_password="hash",
+        settings=value_objects.UserSetting(timezone="UTC"),
+    )
+
+
+def _build_day(
+    user_id: UUID,
+) -> tuple[list[TaskEntity], list[RoutineEntity]]:
+    routine_definition_id = uuid4()
+    starting_now = TaskEntity(
+        user_id=user_id,
+        scheduled_date=NOW.date(),
+        name="Starting now",
+        status=value_objects.TaskStatus.NOT_STARTED,
+        type=value_objects.TaskType.WORK,
+        category=value_objects.TaskCategory.WORK,
+        frequency=value_objects.TaskFrequency.ONCE,
+        time_window=value_objects.TimeWindow(
+            start_time=time(10, 0), end_time=time(11, 0)
+        ),
+        routine_definition_id=routine_definition_id,
+    )
+    later = TaskEntity(
+        user_id=user_id,
+        scheduled_date=NOW.date(),
+        name="Later",
+        status=value_objects.TaskStatus.NOT_STARTED,
+        type=value_objects.TaskType.WORK,
+        category=value_objects.TaskCategory.WORK,
+        frequency=value_objects.TaskFrequency.ONCE,
+        time_window=value_objects.TimeWindow(
+            start_time=time(15, 0), end_time=time(16, 0)
+        ),
+    )
+    routine = RoutineEntity(
+        user_id=user_id,
+        date=NOW.date(),
+        routine_definition_id=routine_definition_id,
+        name="Morning",
+        category=value_objects.TaskCategory.WORK,
+    )
+    return [starting_now, later], [routine]
+
+
+def _event_summary(entities: list[object]) -> list[tuple[object, ...]]:
+    return [
+        (
+            type(event).__name__,
+            event.entity_id,
+            event.old_timing_status,
+            event.new_timing_status,
+        )
+        for entity in entities
+        for event in entity.collect_events()  # type: ignore[attr-defined]
+    ]
+
+
+async def _run_per_user_handler(
+    user: UserEntity, tasks: list[TaskEntity], routines: list[RoutineEntity]
+) -> tuple[list[object], datetime | None]:
+    task_repo = create_task_repo_double()
+    allow(task_repo).search.and_return(tasks)
+    routine_repo = create_routine_repo_double()
+    allow(routine_repo).search.and_return(routines)
+    uow = create_uow_double()
+    handler = EvaluateTimingStatusHandler(
+        user=user,
+        uow_factory=create_uow_factory_double(uow),
+        repository_factory=_RepositoryFactory(
+            create_read_only_repos_double(
+                task_repo=task_repo, routine_repo=routine_repo
+            )
+        ),
+    )
+    next_due = await handler.handle(EvaluateTimingStatusCommand())
+    return list(uow.added), next_due
+
+
+@pytest.mark.asyncio
+async def test_batch_handler_matches_per_user_handler() -> None:
+    user = _build_user(uuid4())
+    tasks, routines = _build_day(user.id)
+
+    per_user_added, per_user_next_due = await _run_per_user_handler(
+        user, [replace(t) for t in tasks], [replace(r) for r in routines]
+    )
+
+    uow = create_uow_double()
+    store = _TimingStatusStore(tasks, routines)
+    handler = EvaluateTimingStatusBatchHandler(
+        timing_status_store=store,
+        identity_access=create_identity_access([user]),
+        uow_factory=create_uow_factory_double(uow),
+    )
+    result = await handler.handle(
+        EvaluateTimingStatusBatchCommand(
+            users=(value_objects.EligibleUser(id=user.id, timezone="UTC"),)
+        )
+    )
+
+    batch_events = _event_summary(uow.added)
+    assert [e.id for e in uow.added] == [e.id for e in per_user_added]
+    assert batch_events
+    assert batch_events == _event_summary(per_user_added)
+    assert result == {user.id: per_user_next_due}
+
+
+@pytest.mark.asyncio
+async def test_batch_handler_reads_once_and_skips_unchanged_users() -> None:
+    changed_user = _build_user(uuid4())
+    idle_user = _build_user(uuid4())
+    tasks, routines = _build_day(changed_user.id)
+
+    uow = create_uow_double()
+    uow_factory = create_uow_factory_double(uow)
+    store = _TimingStatusStore(tasks, routines)
+    handler = EvaluateTimingStatusBatchHandler(
+        timing_status_store=store,
+        identity_access=create_identity_access([changed_user, idle_user]),
+        uow_factory=uow_factory,
+    )
+
+    result = await handler.handle(
+        EvaluateTimingStatusBatchCommand(
+            users=(
+                value_objects.EligibleUser(id=changed_user.id, timezone="UTC"),
+                value_objects.EligibleUser(id=idle_user.id, timezone="UTC"),
+            )
+        )
+    )
+
+    assert store.calls == ["tasks", "routines", "refresh"]
+    assert {entity.user_id for entity in uow.added} == {changed_user.id}
+    assert result[idle_user.id] is None
+    assert result[changed_user.id] is not None
+
+
+@pytest.mark.asyncio
+async def test_batch_handler_advances_persisted_transitions() -> None:
+    user = _build_user(uuid4())
+    tasks, routines = _build_day(user.id)
+    starting_now, later = tasks
+    store = _TimingStatusStore(tasks, routines)
+    handler = EvaluateTimingStatusBatchHandler(
+        timing_status_store=store,
+        identity_access=create_identity_access([user]),
+        uow_factory=create_uow_factory_double(create_uow_double()),
+    )
+
+    await handler.handle(
+        EvaluateTimingStatusBatchCommand(
+            users=(value_objects.EligibleUser(id=user.id, timezone="UTC"),)
+        )
+    )
+
+    assert store.refreshed_dates == {user.id: NOW.date()}
+    assert set(store.refreshed) == {starting_now.id, later.id, routines[0].id}
+    assert all(value is None or value > NOW for value in store.refreshed.values())
+    assert store.refreshed[later.id] == datetime(2025, 1, 1, 14, 30, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_batch_handler_compares_from_due_instant_when_dispatch_lags() -> None:
+    user = _build_user(uuid4())
+    tasks, routines = _build_day(user.id)
+    users = (value_objects.EligibleUser(id=user.id, timezone="UTC"),)
+
+    async def changed_ids(command: EvaluateTimingStatusBatchCommand) -> set[UUID]:
+        uow = create_uow_double()
+        handler = EvaluateTimingStatusBatchHandler(
+            timing_status_store=_TimingStatusStore(
+                [replace(t) for t in tasks], [replace(r) for r in routines]
+            ),
+            identity_access=create_identity_access([user]),
+            uow_factory=create_uow_factory_double(uow),
+        )
+        await handler.handle(command)
+        return {entity.id for entity in uow.added}
+
+    # The 10:00 transition is older than the poll interval by the time it runs.
+    lagging = await changed_ids(
+        EvaluateTimingStatusBatchCommand(users=users, poll_interval_seconds=10)
+    )
+    scheduled = await changed_ids(
+        EvaluateTimingStatusBatchCommand(
+            users=users,
+            poll_interval_seconds=10,
+            due_at={user.id: datetime(2025, 1, 1, 10, 0, tzinfo=UTC)},
+        )
+    )
+
+    assert lagging == set()
+    assert scheduled == {tasks[0].id, routines[0].id}
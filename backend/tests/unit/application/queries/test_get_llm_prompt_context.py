@@ -0,0 +1,184 @@
+"""Unit tests for GetLLMPromptContextHandler's incremental prompt context cache."""
+
+from collections import Counter
+from collections.abc import Iterator
+from datetime import date as dt_date
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from lykke.application.queries.get_llm_prompt_context import (
+    GetLLMPromptContextHandler,
+    PromptContextCache,
+)
+from lykke.core.utils.strings import entity_type_from_class_name
+from lykke.domain import value_objects
+from lykke.domain.entities import (
+    CalendarEntrySeriesEntity,
+    DayEntity,
+    DayTemplateEntity,
+    TaskEntity,
+    UserEntity,
+)
+
+DATE = dt_date(2025, 11, 27)
+
+
+class _Repo:
+    def __init__(self, name: str, calls: Counter[str], result: Any) -> None:
+        self._name = name
+        self._calls = calls
+        self.result = result
+
+    async def get(self, _: UUID) -> Any:
+        self._calls[f"{self._name}.get"] += 1
+        return self.result
+
+    async def search(self, _: object) -> Any:
+        self._calls[f"{self._name}.search"] += 1
+        return self.result
+
+    async def all(self) -> Any:
+        self._calls[f"{self._name}.all"] += 1
+        return self.result
+
+
+class _Repositories:
+    def __init__(self, day: DayEntity, tasks: list[TaskEntity]) -> None:
+        self.calls: Counter[str] = Counter()
+        self.day_ro_repo = _Repo("day", self.calls, day)
+        self.task_ro_repo = _Repo("task", self.calls, tasks)
+        self.calendar_entry_ro_repo = _Repo("calendar_entry", self.calls, [])
+        self.brain_dump_ro_repo = _Repo("brain_dump", self.calls, [])
+        self.factoid_ro_repo = _Repo("factoid", self.calls, [])
+        self.message_ro_repo = _Repo("message", self.calls, [])
+        self.push_notification_ro_repo = _Repo("push_notification", self.calls, [])
+
+    def create(self, user: object) -> "_Repositories":
+        _ = user
+        return self
+
+
+class _ChangeStream:
+    def __init__(self) -> None:
+        self.entries: list[tuple[str, dict[str, Any]]] = [("1-0", {})]
+
+    def append(self, entity_type: str, entity_id: UUID, entity_date: dt_date) -> None:
+        self.entries.append(
+            (
+                f"{len(self.entries) + 1}-0",
+                {
+                    "change_type": "updated",
+                    "entity_type": entity_type,
+                    "entity_id": str(entity_id),
+                    "entity_date": entity_date.isoformat(),
+                },
+            )
+        )
+
+    async def get_latest_user_stream_entry(
+        self, user_id: UUID, stream_type: str
+    ) -> tuple[str, dict[str, Any]] | None:
+        _ = (user_id, stream_type)
+        return self.entries[-1]
+
+    async def read_user_stream(
+        self,
+        user_id: UUID,
+        stream_type: str,
+        last_id: str,
+        *,
+        count: int | None = None,
+        block_ms: int | None = None,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        _ = (user_id, stream_type, block_ms)
+        after = int(last_id.split("-")[0])
+        newer = [entry for entry in self.entries if int(entry[0].split("-")[0]) > after]
+        return newer[:count]
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    PromptContextCache.clear()
+    yield
+    PromptContextCache.clear()
+
+
+def _handler() -> tuple[GetLLMPromptContextHandler, _Repositories, _ChangeStream]:
+    user = UserEntity(id=uuid4(), email="test@example.com", hashed_password="!")
+    template = DayTemplateEntity(user_id=user.id, slug="default")
+    day = DayEntity.create_for_date(DATE, user.id, template)
+    task = TaskEntity(
+        user_id=user.id,
+        scheduled_date=DATE,
+        name="task",
+        status=value_objects.TaskStatus.READY,
+        type=value_objects.TaskType.WORK,
+        category=value_objects.TaskCategory.WORK,
+        frequency=value_objects.TaskFrequency.ONCE,
+    )
+    repos = _Repositories(day, [task])
+    stream = _ChangeStream()
+    handler = GetLLMPromptContextHandler(user=user, repository_factory=repos)
+    handler.pubsub_gateway = stream
+    return handler, repos, stream
+
+
+@pytest.mark.asyncio
+async def test_unchanged_day_parts_are_served_from_cache() -> None:
+    handler, repos, _ = _handler()
+
+    first = await handler.get_prompt_context(DATE)
+    second = await handler.get_prompt_context(DATE)
+
+    assert second.tasks == first.tasks
+    assert second.loaded_at == first.loaded_at is not None
+    assert repos.calls["day.get"] == 1
+    assert repos.calls["task.search"] == 1
+    assert repos.calls["calendar_entry.search"] == 1
+    # Parts without change events are read on every run.
+    assert repos.calls["brain_dump.search"] == 2
+    assert repos.calls["factoid.all"] == 2
+
+
+@pytest.mark.asyncio
+async def test_only_changed_parts_are_requeried() -> None:
+    handler, repos, stream = _handler()
+    first = await handler.get_prompt_context(DATE)
+
+    stream.append("task", first.tasks[0].id, DATE.replace(day=28))
+    stream.append("calendarentry", uuid4(), DATE.replace(day=28))
+    await handler.get_prompt_context(DATE)
+    await handler.get_prompt_context(DATE)
+
+    assert repos.calls["task.search"] == 2
+    assert repos.calls["calendar_entry.search"] == 1
+    assert repos.calls["day.get"] == 1
+
+
+@pytest.mark.asyncio
+async def test_series_change_requeries_calendar_entries_for_any_date() -> None:
+    handler, repos, stream = _handler()
+    await handler.get_prompt_context(DATE)
+
+    series_type = entity_type_from_class_name(CalendarEntrySeriesEntity.__name__)
+    stream.append(series_type, uuid4(), DATE.replace(day=1))
+    await handler.get_prompt_context(DATE)
+
+    assert repos.calls["calendar_entry.search"] == 2
+    assert repos.calls["task.search"] == 1
+    assert repos.calls["day.get"] == 1
+
+
+@pytest.mark.asyncio
+async def test_large_change_backlog_triggers_full_reload() -> None:
+    handler, repos, stream = _handler()
+    await handler.get_prompt_context(DATE)
+
+    for _ in range(201):
+        stream.append("task", uuid4(), DATE)
+    await handler.get_prompt_context(DATE)
+
+    assert repos.calls["day.get"] == 2
+    assert repos.calls["task.search"] == 2
@@ -104,3 +104,43 @@ async def test_verify_google_webhook_returns_false_for_missing_token():
     )
 
     assert result.should_sync is False
+
+
+@pytest.mark.asyncio
+async def test_verify_google_webhook_returns_false_for_stale_channel():
+    user_id = uuid4()
+    subscription = SyncSubscription(
+        subscription_id="current-channel",
+        resource_id="resource-id",
+        expiration=datetime.now(UTC),
+        provider="google",
+        client_state="secret",
+    )
+    calendar = CalendarEntity(
+        user_id=user_id,
+        name="Calendar",
+        auth_token_id=uuid4(),
+        platform="google",
+        platform_id="calendar-1",
+        sync_subscription=subscription,
+    )
+    calendar_repo = create_calendar_repo_double()
+    allow(calendar_repo).get.with_args(calendar.id).and_return(calendar)
+
+    ro_repos = create_read_only_repos_double(calendar_repo=calendar_repo)
+    user = UserEntity(id=user_id, email="test@example.com", hashed_password="!")
+    handler = VerifyGoogleWebhookHandler(
+        user=user,
+        repository_factory=_RepositoryFactory(ro_repos),
+    )
+
+    result = await handler.handle(
+        VerifyGoogleWebhookQuery(
+            calendar_id=calendar.id,
+            channel_token="secret",
+            resource_state="exists",
+            channel_id="previous-channel",
+        )
+    )
+
+    assert result.should_sync is False
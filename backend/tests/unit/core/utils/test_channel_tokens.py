@@ -0,0 +1,52 @@
+"""Unit tests for signed calendar channel tokens."""
+
+from uuid import uuid4
+
+import pytest
+
+from lykke.core.config import settings
+from lykke.core.exceptions import ServerError
+from lykke.core.utils.channel_tokens import sign_channel_token, verify_channel_token
+
+
+def test_signed_token_verifies_for_its_channel_only() -> None:
+    user_id, calendar_id = uuid4(), uuid4()
+    token = sign_channel_token(user_id, calendar_id, "channel-1")
+
+    assert verify_channel_token(
+        token, user_id=user_id, calendar_id=calendar_id, channel_id="channel-1"
+    )
+    assert not verify_channel_token(
+        token, user_id=user_id, calendar_id=uuid4(), channel_id="channel-1"
+    )
+    assert not verify_channel_token(
+        token, user_id=user_id, calendar_id=calendar_id, channel_id="channel-2"
+    )
+
+
+def test_unsigned_tokens_do_not_verify() -> None:
+    user_id, calendar_id = uuid4(), uuid4()
+
+    assert not verify_channel_token(
+        "random-legacy-token",
+        user_id=user_id,
+        calendar_id=calendar_id,
+        channel_id="channel-1",
+    )
+    assert not verify_channel_token(
+        None, user_id=user_id, calendar_id=calendar_id, channel_id="channel-1"
+    )
+
+
+def test_tokens_are_refused_without_a_session_secret(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    user_id, calendar_id = uuid4(), uuid4()
+    token = sign_channel_token(user_id, calendar_id, "channel-1")
+    monkeypatch.setattr(settings, "SESSION_SECRET", "")
+
+    with pytest.raises(ServerError):
+        sign_channel_token(user_id, calendar_id, "channel-1")
+    assert not verify_channel_token(
+        token, user_id=user_id, calendar_id=calendar_id, channel_id="channel-1"
+    )
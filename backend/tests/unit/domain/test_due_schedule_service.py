@@ -0,0 +1,152 @@
+from datetime import UTC, date, datetime, time
+from uuid import uuid4
+
+from lykke.domain.entities import (
+    CalendarEntryEntity,
+    DayEntity,
+    DayTemplateEntity,
+    UserEntity,
+)
+from lykke.domain.services import DueScheduleService
+from lykke.domain.value_objects import (
+    Alarm,
+    AlarmStatus,
+    CalendarEntryAttendanceStatus,
+    CalendarEntryNotificationChannel,
+    CalendarEntryNotificationRule,
+    CalendarEntryNotificationSettings,
+    DueJobKind,
+    TaskFrequency,
+    UserSetting,
+)
+
+
+def _build_alarm(hour: int, **kwargs: object) -> Alarm:
+    return Alarm(
+        name="Alarm",
+        time=time(hour, 0),
+        datetime=datetime(2025, 1, 1, hour, 0, tzinfo=UTC),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def _build_entry(
+    starts_at: datetime,
+    attendance_status: CalendarEntryAttendanceStatus | None = None,
+) -> CalendarEntryEntity:
+    return CalendarEntryEntity(
+        user_id=uuid4(),
+        name="Team Sync",
+        calendar_id=uuid4(),
+        platform_id="platform-1",
+        platform="google",
+        status="confirmed",
+        attendance_status=attendance_status,
+        starts_at=starts_at,
+        frequency=TaskFrequency.ONCE,
+    )
+
+
+def test_next_alarm_due_skips_finished_alarms() -> None:
+    now = datetime(2025, 1, 1, 7, 0, tzinfo=UTC)
+    alarms = [
+        _build_alarm(8, status=AlarmStatus.TRIGGERED),
+        _build_alarm(9, status=AlarmStatus.CANCELLED),
+        _build_alarm(10),
+    ]
+
+    assert DueScheduleService.next_alarm_due(alarms, now) == datetime(
+        2025, 1, 1, 10, 0, tzinfo=UTC
+    )
+
+
+def test_next_alarm_due_uses_snoozed_until() -> None:
+    now = datetime(2025, 1, 1, 8, 5, tzinfo=UTC)
+    snoozed_until = datetime(2025, 1, 1, 8, 15, tzinfo=UTC)
+    alarms = [_build_alarm(8, status=AlarmStatus.SNOOZED, snoozed_until=snoozed_until)]
+
+    assert DueScheduleService.next_alarm_due(alarms, now) == snoozed_until
+
+
+def test_pending_alarm_due_includes_overdue_alarms() -> None:
+    snoozed_until = datetime(2025, 1, 1, 9, 30, tzinfo=UTC)
+    alarms = [
+        _build_alarm(7, status=AlarmStatus.TRIGGERED),
+        _build_alarm(8, status=AlarmStatus.SNOOZED, snoozed_until=snoozed_until),
+        _build_alarm(10),
+    ]
+
+    assert DueScheduleService.pending_alarm_due(alarms) == snoozed_until
+    assert DueScheduleService.pending_alarm_due([]) is None
+
+
+def test_next_calendar_entry_reminder_uses_earliest_future_rule() -> None:
+    now = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+    entry = _build_entry(datetime(2025, 1, 1, 10, 0, tzinfo=UTC))
+    rules = [
+        CalendarEntryNotificationRule(
+            channel=CalendarEntryNotificationChannel.PUSH, minutes_before=90
+        ),
+        CalendarEntryNotificationRule(
+            channel=CalendarEntryNotificationChannel.PUSH, minutes_before=30
+        ),
+        CalendarEntryNotificationRule(
+            channel=CalendarEntryNotificationChannel.PUSH, minutes_before=5
+        ),
+    ]
+
+    assert DueScheduleService.next_calendar_entry_reminder(
+        entry, rules, now
+    ) == datetime(2025, 1, 1, 9, 30, tzinfo=UTC)
+
+
+def test_next_calendar_entry_reminder_skips_declined_entries() -> None:
+    now = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+    entry = _build_entry(
+        datetime(2025, 1, 1, 10, 0, tzinfo=UTC),
+        attendance_status=CalendarEntryAttendanceStatus.NOT_GOING,
+    )
+    rules = [
+        CalendarEntryNotificationRule(
+            channel=CalendarEntryNotificationChannel.PUSH, minutes_before=30
+        )
+    ]
+
+    assert DueScheduleService.next_calendar_entry_reminder(entry, rules, now) is None
+
+
+def test_entries_for_day_arms_alarms() -> None:
+    user = UserEntity(email="test@example.com", hashed_password="!")
+    template = DayTemplateEntity(
+        user_id=user.id, slug="default", routine_definition_ids=[], time_blocks=[]
+    )
+    day = DayEntity.create_for_date(date(2025, 1, 1), user.id, template)
+    day.add_alarm(_build_alarm(8))
+
+    entries = DueScheduleService.entries_for(
+        day, user=user, after=datetime(2025, 1, 1, 7, 0, tzinfo=UTC)
+    )
+
+    assert len(entries) == 1
+    assert entries[0].kind == DueJobKind.ALARMS
+    assert entries[0].user_id == user.id
+    assert entries[0].due_at == datetime(2025, 1, 1, 8, 0, tzinfo=UTC)
+
+
+def test_entries_for_calendar_entry_respects_disabled_settings() -> None:
+    user = UserEntity(
+        email="test@example.com",
+        hashed_password="!",
+        settings=UserSetting(
+            calendar_entry_notification_settings=CalendarEntryNotificationSettings(
+                enabled=False
+            )
+        ),
+    )
+    entry = _build_entry(datetime(2025, 1, 1, 10, 0, tzinfo=UTC))
+
+    entries = DueScheduleService.entries_for(
+        entry, user=user, after=datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+    )
+
+    assert entries == []
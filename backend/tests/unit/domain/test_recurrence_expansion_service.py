@@ -0,0 +1,162 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from lykke.domain.entities import CalendarEntryEntity, CalendarEntrySeriesEntity
+from lykke.domain.services import RecurrenceExpansionService
+from lykke.domain.value_objects import TaskFrequency
+
+CHICAGO = "America/Chicago"
+
+
+def _build_series(recurrence: list[str], **kwargs: object) -> CalendarEntrySeriesEntity:
+    return CalendarEntrySeriesEntity(
+        user_id=uuid4(),
+        calendar_id=uuid4(),
+        name="Standup",
+        platform_id="standup",
+        platform="google",
+        frequency=TaskFrequency.WEEKLY,
+        recurrence=recurrence,
+        # Monday 2026-03-02 09:00 in Chicago (CST)
+        starts_at=datetime(2026, 3, 2, 15, 0, tzinfo=UTC),
+        ends_at=datetime(2026, 3, 2, 15, 30, tzinfo=UTC),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_weekly_rule_keeps_local_time_across_dst() -> None:
+    series = _build_series(["RRULE:FREQ=WEEKLY;BYDAY=MO"])
+
+    starts = RecurrenceExpansionService.occurrences(
+        series,
+        datetime(2026, 3, 2, tzinfo=UTC),
+        datetime(2026, 3, 17, tzinfo=UTC),
+        timezone=CHICAGO,
+    )
+
+    # DST starts on 2026-03-08: 09:00 CDT is 14:00 UTC.
+    assert starts == [
+        datetime(2026, 3, 2, 15, 0, tzinfo=UTC),
+        datetime(2026, 3, 9, 14, 0, tzinfo=UTC),
+        datetime(2026, 3, 16, 14, 0, tzinfo=UTC),
+    ]
+
+
+def test_until_exdate_and_cancelled_occurrences_are_honoured() -> None:
+    series = _build_series(
+        [
+            "RRULE:FREQ=WEEKLY;BYDAY=MO;UNTIL=20260330T140000Z",
+            "EXDATE;TZID=America/Chicago:20260309T090000",
+        ],
+        cancelled_occurrences=[datetime(2026, 3, 16, 14, 0, tzinfo=UTC)],
+    )
+
+    starts = RecurrenceExpansionService.occurrences(
+        series,
+        datetime(2026, 3, 1, tzinfo=UTC),
+        datetime(2026, 5, 1, tzinfo=UTC),
+        timezone=CHICAGO,
+    )
+
+    assert starts == [
+        datetime(2026, 3, 2, 15, 0, tzinfo=UTC),
+        datetime(2026, 3, 23, 14, 0, tzinfo=UTC),
+        datetime(2026, 3, 30, 14, 0, tzinfo=UTC),
+    ]
+
+
+def test_merge_expands_only_past_horizon_and_skips_stored_exceptions() -> None:
+    series = _build_series(
+        ["RRULE:FREQ=DAILY"],
+        materialized_until=datetime(2026, 3, 3, 15, 0, tzinfo=UTC),
+    )
+    moved = CalendarEntryEntity(
+        user_id=series.user_id,
+        name="Standup (moved)",
+        calendar_id=series.calendar_id,
+        calendar_entry_series_id=series.id,
+        platform_id="standup_20260305T150000Z",
+        platform="google",
+        status="confirmed",
+        starts_at=datetime(2026, 3, 5, 17, 0, tzinfo=UTC),
+        frequency=TaskFrequency.WEEKLY,
+        original_starts_at=datetime(2026, 3, 5, 15, 0, tzinfo=UTC),
+    )
+    window_start = datetime(2026, 3, 3, 6, 0, tzinfo=UTC)
+
+    merged = RecurrenceExpansionService.merge_occurrences(
+        [moved],
+        [series, series.clone(id=uuid4(), deleted_at=window_start)],
+        window_start,
+        window_start + timedelta(days=4),
+        timezone=CHICAGO,
+    )
+
+    assert [(entry.platform_id, entry.starts_at) for entry in merged] == [
+        ("standup_20260305T150000Z", datetime(2026, 3, 5, 17, 0, tzinfo=UTC)),
+        ("standup_20260304T150000Z", datetime(2026, 3, 4, 15, 0, tzinfo=UTC)),
+        ("standup_20260306T150000Z", datetime(2026, 3, 6, 15, 0, tzinfo=UTC)),
+    ]
+    virtual = merged[1]
+    assert virtual.id == CalendarEntryEntity.id_from_platform(
+        "google", "standup_20260304T150000Z"
+    )
+    assert virtual.ends_at == datetime(2026, 3, 4, 15, 30, tzinfo=UTC)
+    assert virtual.date.isoformat() == "2026-03-04"
+
+
+def test_series_without_horizon_is_not_expanded() -> None:
+    series = _build_series(["RRULE:FREQ=DAILY"])
+
+    merged = RecurrenceExpansionService.merge_occurrences(
+        [],
+        [series],
+        datetime(2026, 3, 3, tzinfo=UTC),
+        datetime(2026, 3, 4, tzinfo=UTC),
+    )
+
+    assert merged == []
+
+
+def test_series_timezone_takes_precedence_over_user_timezone() -> None:
+    series = _build_series(["RRULE:FREQ=WEEKLY;BYDAY=MO"], timezone=CHICAGO)
+
+    starts = RecurrenceExpansionService.occurrences(
+        series,
+        datetime(2026, 3, 2, tzinfo=UTC),
+        datetime(2026, 3, 10, tzinfo=UTC),
+        timezone="Europe/London",
+    )
+
+    # 09:00 in Chicago across its DST change, whatever the user's zone.
+    assert starts == [
+        datetime(2026, 3, 2, 15, 0, tzinfo=UTC),
+        datetime(2026, 3, 9, 14, 0, tzinfo=UTC),
+    ]
+
+
+def test_all_day_occurrences_use_google_date_instance_ids() -> None:
+    series = _build_series(
+        ["RRULE:FREQ=DAILY"],
+        timezone=CHICAGO,
+        is_all_day=True,
+        materialized_until=datetime(2026, 3, 3, 6, 0, tzinfo=UTC),
+    ).clone(
+        # Midnight to midnight on 2026-03-02 in Chicago (CST)
+        starts_at=datetime(2026, 3, 2, 6, 0, tzinfo=UTC),
+        ends_at=datetime(2026, 3, 3, 6, 0, tzinfo=UTC),
+    )
+
+    merged = RecurrenceExpansionService.merge_occurrences(
+        [],
+        [series],
+        datetime(2026, 3, 3, 12, 0, tzinfo=UTC),
+        datetime(2026, 3, 6, tzinfo=UTC),
+        timezone="UTC",
+    )
+
+    assert [(entry.platform_id, entry.starts_at) for entry in merged] == [
+        ("standup_20260304", datetime(2026, 3, 4, 6, 0, tzinfo=UTC)),
+        ("standup_20260305", datetime(2026, 3, 5, 6, 0, tzinfo=UTC)),
+    ]
+    assert merged[0].timezone == CHICAGO
@@ -120,3 +120,93 @@ def test_routine_timing_status_inactive_when_task_upcoming() -> None:
     result = TimingStatusService.routine_status(routine, [task], now, timezone="UTC")
 
     assert result.status == TimingStatus.INACTIVE
+
+
+def test_next_task_transition_returns_upcoming_boundary() -> None:
+    now = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+    task = _build_task(
+        scheduled_date=now.date(),
+        time_window=TimeWindow(start_time=time(10, 0), end_time=time(11, 0)),
+    )
+
+    result = TimingStatusService.next_task_transition(task, now, timezone="UTC")
+
+    assert result == datetime(2025, 1, 1, 9, 30, tzinfo=UTC)
+
+
+def test_next_task_transition_during_window_is_needs_attention_start() -> None:
+    now = datetime(2025, 1, 1, 10, 30, tzinfo=UTC)
+    task = _build_task(
+        scheduled_date=now.date(),
+        time_window=TimeWindow(start_time=time(10, 0), end_time=time(11, 0)),
+    )
+
+    result = TimingStatusService.next_task_transition(task, now, timezone="UTC")
+
+    assert result == datetime(2025, 1, 1, 10, 45, tzinfo=UTC)
+
+
+def test_next_task_transition_none_after_all_boundaries() -> None:
+    now = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    task = _build_task(
+        scheduled_date=now.date(),
+        time_window=TimeWindow(start_time=time(10, 0), end_time=time(11, 0)),
+    )
+
+    assert TimingStatusService.next_task_transition(task, now, timezone="UTC") is None
+
+
+def test_next_transition_bound_for_routine_uses_routine_upcoming_window() -> None:
+    now = datetime(2025, 1, 1, 6, 0, tzinfo=UTC)
+    routine = RoutineEntity(
+        user_id=uuid4(),
+        date=now.date(),
+        routine_definition_id=uuid4(),
+        name="Morning",
+        category=TaskCategory.WORK,
+        time_window=TimeWindow(start_time=time(10, 0), end_time=time(11, 0)),
+    )
+
+    result = TimingStatusService.next_transition_bound(routine, now, timezone="UTC")
+
+    assert result == datetime(2025, 1, 1, 8, 0, tzinfo=UTC)
+
+
+def test_next_transition_bounds_never_miss_a_routine_transition() -> None:
+    now = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+    routine_definition_id = uuid4()
+    routine = RoutineEntity(
+        user_id=uuid4(),
+        date=now.date(),
+        routine_definition_id=routine_definition_id,
+        name="Morning",
+        category=TaskCategory.WORK,
+        time_window=TimeWindow(start_time=time(12, 0), end_time=time(13, 0)),
+    )
+    task = _build_task(
+        scheduled_date=now.date(),
+        time_window=TimeWindow(start_time=time(11, 30), end_time=time(14, 0)),
+    )
+    task.routine_definition_id = routine_definition_id
+
+    exact = TimingStatusService.next_routine_transition(
+        routine, [task], now, timezone="UTC"
+    )
+    bounds = [
+        TimingStatusService.next_transition_bound(entity, now, timezone="UTC")
+        for entity in (routine, task)
+    ]
+
+    assert exact is not None
+    assert min(value for value in bounds if value is not None) <= exact
+
+
+def test_next_transition_bound_is_none_for_completed_tasks() -> None:
+    now = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+    task = _build_task(
+        scheduled_date=now.date(),
+        time_window=TimeWindow(start_time=time(10, 0), end_time=time(11, 0)),
+    )
+    task.status = TaskStatus.COMPLETE
+
+    assert TimingStatusService.next_transition_bound(task, now) is None
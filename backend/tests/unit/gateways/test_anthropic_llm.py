@@ -1,5 +1,6 @@
 """Unit tests for Anthropic LLM gateway model-not-found fallback and error handling."""
 
+from collections.abc import Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,6 +9,14 @@ from lykke.infrastructure.gateways.anthropic_llm import (
     AnthropicLLMGateway,
     _is_model_not_found_error,
 )
+from lykke.infrastructure.gateways.llm_provider_pool import LLMProviderPool
+
+
+@pytest.fixture(autouse=True)
+def _reset_provider_pool() -> Iterator[None]:
+    LLMProviderPool.reset()
+    yield
+    LLMProviderPool.reset()
 
 
 def test_is_model_not_found_error_404() -> None:
@@ -174,3 +183,108 @@ async def test_run_usecase_no_retry_when_non_model_error() -> None:
 
     assert result is None
     assert mock_llm.bind_tools.return_value.ainvoke.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_run_usecase_routes_to_fallback_while_model_circuit_is_open() -> None:
+    """An open circuit on the configured model sends calls to the fallback."""
+
+    def echo_message(message: str) -> dict[str, str]:
+        return {"message": message}
+
+    response = MagicMock()
+    response.content = ""
+    response.tool_calls = [{"name": "echo_message", "args": {"message": "hi"}}]
+    response.additional_kwargs = {}
+    response.usage_metadata = {"input_tokens": 120, "output_tokens": 30}
+    clients: dict[str, MagicMock] = {}
+
+    def build_client(*, model_name: str, **_kwargs: object) -> MagicMock:
+        client = MagicMock()
+        client.bind_tools.return_value.ainvoke = AsyncMock(return_value=response)
+        clients[model_name] = client
+        return client
+
+    for _ in range(10):
+        LLMProviderPool.breaker("anthropic", "primary").record(False)
+
+    with (
+        patch(
+            "lykke.infrastructure.gateways.anthropic_llm.settings",
+            MagicMock(
+                ANTHROPIC_MODEL="primary",
+                ANTHROPIC_FALLBACK_MODEL="fallback",
+                ANTHROPIC_API_KEY="test-key",
+            ),
+        ),
+        patch(
+            "lykke.infrastructure.gateways.anthropic_llm.ChatAnthropic",
+            side_effect=build_client,
+        ),
+    ):
+        gateway = AnthropicLLMGateway()
+        result = await gateway.run_usecase(
+            system_prompt="Test.",
+            ask_prompt="Call echo_message.",
+            tools=[LLMTool(callback=echo_message)],
+            metadata={"usecase": "notification", "critical": False},
+        )
+
+    assert result is not None
+    clients["primary"].bind_tools.return_value.ainvoke.assert_not_awaited()
+    clients["fallback"].bind_tools.return_value.ainvoke.assert_awaited_once()
+    stats = LLMProviderPool.stats["notification"]
+    assert (stats.calls, stats.input_tokens, stats.output_tokens) == (1, 120, 30)
+
+
+@pytest.mark.asyncio
+async def test_prepared_request_is_reused_for_call_and_fallback_retry() -> None:
+    """Tool specs are built once and reused by the snapshot, call and retry."""
+
+    def echo_message(message: str) -> dict[str, str]:
+        """Echo a message."""
+        return {"message": message}
+
+    response = MagicMock()
+    response.content = ""
+    response.tool_calls = [{"name": "echo_message", "args": {"message": "hi"}}]
+    response.additional_kwargs = {}
+    mock_llm = MagicMock()
+    mock_llm.bind_tools.return_value.ainvoke = AsyncMock(
+        side_effect=[ValueError("Error code: 404 - not_found_error"), response]
+    )
+
+    with (
+        patch(
+            "lykke.infrastructure.gateways.anthropic_llm.settings",
+            MagicMock(
+                ANTHROPIC_MODEL="primary",
+                ANTHROPIC_FALLBACK_MODEL="fallback",
+                ANTHROPIC_API_KEY="test-key",
+            ),
+        ),
+        patch(
+            "lykke.infrastructure.gateways.anthropic_llm.ChatAnthropic",
+            return_value=mock_llm,
+        ),
+    ):
+        gateway = AnthropicLLMGateway()
+        request = await gateway.prepare_usecase(
+            system_prompt="Test.",
+            ask_prompt="Call echo_message.",
+            tools=[LLMTool(callback=echo_message)],
+        )
+        result = await gateway.run_prepared(request)
+
+    assert result is not None
+    assert result.request_payload is request.payload
+    assert request.payload["request_tools"] == [
+        {
+            "name": "echo_message",
+            "description": "Echo a message.",
+            "parameters": request.tools[0].args_model.model_json_schema(),
+        }
+    ]
+    bound_specs = [call.args[0] for call in mock_llm.bind_tools.call_args_list]
+    assert len(bound_specs) == 2
+    assert all(specs is request.tool_specs for specs in bound_specs)
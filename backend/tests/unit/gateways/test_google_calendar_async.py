@@ -0,0 +1,249 @@
+"""Tests for the native async Google Calendar gateway against a local fake API."""
+
+# pylint: disable=protected-access
+
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+import aiohttp
+import pytest
+from googleapiclient.errors import HttpError
+
+from lykke.core.exceptions import TokenExpiredError
+from lykke.domain.entities import AuthTokenEntity, CalendarEntity
+from lykke.domain.value_objects import TaskFrequency
+from lykke.infrastructure.gateways import google_async
+from lykke.infrastructure.gateways.google import GoogleCalendarGateway
+from lykke.infrastructure.gateways.google_async import AsyncGoogleCalendarGateway
+from tests.support.fake_google_calendar import FakeGoogleCalendarServer, seed_calendar
+
+CALENDAR_ID = "test@calendar.google.com"
+LOOKBACK = datetime(2026, 2, 1, tzinfo=UTC)
+
+
+class _FakeServerGateway(GoogleCalendarGateway):
+    def __init__(self, server: FakeGoogleCalendarServer) -> None:
+        self._server = server
+
+    def _build_calendar_service(self, token: AuthTokenEntity) -> Any:
+        _ = token
+        return self._server.build_service()
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(google_async, "BACKOFF_BASE_SECONDS", 0)
+    monkeypatch.setattr(google_async, "_access_tokens", {})
+
+
+def _calendar() -> CalendarEntity:
+    return CalendarEntity(
+        id=uuid4(),
+        user_id=uuid4(),
+        name="Test Calendar",
+        auth_token_id=uuid4(),
+        platform_id=CALENDAR_ID,
+        platform="google",
+    )
+
+
+def _token(server: FakeGoogleCalendarServer, **fields: Any) -> AuthTokenEntity:
+    return AuthTokenEntity(
+        user_id=uuid4(),
+        platform="google",
+        token="test-token",
+        refresh_token="test-refresh",
+        token_uri=server.token_uri,
+        **fields,
+    )
+
+
+def _event(event_id: str, **fields: Any) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "summary": f"Event {event_id}",
+        "status": "confirmed",
+        "start": {"dateTime": "2026-02-04T08:00:00Z"},
+        "end": {"dateTime": "2026-02-04T09:00:00Z"},
+        "created": "2026-02-01T00:00:00Z",
+        "updated": "2026-02-01T00:00:00Z",
+        **fields,
+    }
+
+
+def _add_series(server: FakeGoogleCalendarServer) -> None:
+    server.add_event(
+        CALENDAR_ID, _event("weekly", recurrence=["RRULE:FREQ=WEEKLY;BYDAY=WE"])
+    )
+    server.add_event(CALENDAR_ID, _event("gone", recurrence=["RRULE:FREQ=DAILY"]))
+    server.events[CALENDAR_ID]["gone"]["status"] = "cancelled"
+    for index in range(3):
+        server.add_event(
+            CALENDAR_ID,
+            _event(f"weekly_2026020{index + 4}T080000Z", recurringEventId="weekly"),
+        )
+    server.add_event(
+        CALENDAR_ID, _event("orphan_20260204T080000Z", recurringEventId="orphan")
+    )
+    server.add_event(CALENDAR_ID, _event("single"))
+
+
+@pytest.mark.asyncio
+async def test_streams_pages_and_matches_thread_gateway() -> None:
+    calendar = _calendar()
+    with FakeGoogleCalendarServer() as server:
+        _add_series(server)
+        server.page_size = 2
+        token = _token(server)
+
+        async with aiohttp.ClientSession() as session:
+            gateway = AsyncGoogleCalendarGateway(session, api_url=server.api_url)
+            native = await gateway.load_calendar_events(
+                calendar, LOOKBACK, token, user_timezone="UTC"
+            )
+        threaded = _FakeServerGateway(server)._load_calendar_events_sync(
+            calendar, LOOKBACK, token, "UTC", None
+        )
+
+    events, deleted, series, cancelled, sync_token = native
+    assert sync_token == server.next_sync_token
+    assert deleted == []
+    frequencies = {entry.platform_id: entry.frequency for entry in events}
+    assert frequencies["weekly_20260204T080000Z"] == TaskFrequency.WEEKLY
+    assert frequencies["orphan_20260204T080000Z"] == TaskFrequency.ONCE
+    assert frequencies["single"] == TaskFrequency.ONCE
+    assert {entry.platform_id for entry in events} == {
+        entry.platform_id for entry in threaded[0]
+    }
+    assert {s.platform_id for s in series} == {s.platform_id for s in threaded[2]}
+    assert set(cancelled) == set(threaded[3])
+
+
+@pytest.mark.asyncio
+async def test_sync_tokens_list_only_changes_since_they_were_issued() -> None:
+    calendar = _calendar()
+    with FakeGoogleCalendarServer() as server:
+        seeded = seed_calendar(
+            server,
+            CALENDAR_ID,
+            events=5,
+            series=2,
+            occurrences=3,
+            exceptions=1,
+            cancellations=1,
+            start=LOOKBACK,
+        )
+        gateway = AsyncGoogleCalendarGateway(api_url=server.api_url)
+        token = _token(server)
+
+        events, deleted, series, _, sync_token = await gateway.load_calendar_events(
+            calendar, LOOKBACK, token
+        )
+        server.update_event(CALENDAR_ID, seeded.single_ids[0], summary="Renamed")
+        server.cancel_event(CALENDAR_ID, seeded.instance_ids[0])
+        changed, removed, *_ = await gateway.load_calendar_events(
+            calendar, LOOKBACK, token, sync_token=sync_token
+        )
+        server.invalidate_sync_tokens()
+        with pytest.raises(HttpError) as exc_info:
+            await gateway.load_calendar_events(
+                calendar, LOOKBACK, token, sync_token=sync_token
+            )
+
+    assert len(events) == 5 + len(seeded.instance_ids) - 1
+    assert [entry.platform_id for entry in deleted] == seeded.cancelled_ids
+    assert len(series) == 2
+    assert [(entry.platform_id, entry.name) for entry in changed] == [
+        (seeded.single_ids[0], "Renamed")
+    ]
+    assert [entry.platform_id for entry in removed] == [seeded.instance_ids[0]]
+    assert exc_info.value.resp.status == 410
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors_and_refreshes_on_401() -> None:
+    calendar = _calendar()
+    with FakeGoogleCalendarServer() as server:
+        server.add_event(CALENDAR_ID, _event("single"))
+        server.access_token = "fresh-token"
+        server.refresh_tokens = {"test-refresh"}
+        server.failures = [503]
+        token = _token(server)
+
+        events, *_ = await AsyncGoogleCalendarGateway(
+            api_url=server.api_url
+        ).load_calendar_events(calendar, LOOKBACK, token)
+
+    assert [entry.platform_id for entry in events] == ["single"]
+    assert sum(r.startswith("POST /token") for r in server.requests) == 1
+    assert google_async._access_tokens[token.id][0] == "fresh-token"
+
+
+@pytest.mark.asyncio
+async def test_rejected_refresh_raises_token_expired() -> None:
+    with FakeGoogleCalendarServer() as server:
+        server.access_token = "fresh-token"
+        token = _token(server)
+
+        with pytest.raises(TokenExpiredError):
+            await AsyncGoogleCalendarGateway(
+                api_url=server.api_url
+            ).load_calendar_events(_calendar(), LOOKBACK, token)
+
+
+@pytest.mark.asyncio
+async def test_client_errors_surface_as_http_errors() -> None:
+    with FakeGoogleCalendarServer() as server:
+        server.failures = [410, 410]
+        gateway = AsyncGoogleCalendarGateway(api_url=server.api_url)
+
+        with pytest.raises(HttpError) as exc_info:
+            await gateway.load_calendar_events(
+                _calendar(), LOOKBACK, _token(server), sync_token="stale"
+            )
+
+    assert exc_info.value.resp.status == 410
+
+
+@pytest.mark.asyncio
+async def test_subscribe_and_unsubscribe_round_trip() -> None:
+    calendar = _calendar()
+    with FakeGoogleCalendarServer() as server:
+        gateway = AsyncGoogleCalendarGateway(api_url=server.api_url)
+        token = _token(server)
+
+        subscription = await gateway.subscribe_to_calendar(
+            calendar,
+            token,
+            webhook_url="https://example.com/hook",
+            channel_id="channel-1",
+            client_state="state",
+        )
+        await gateway.unsubscribe_from_calendar(
+            calendar, token, "channel-1", subscription.resource_id
+        )
+        # Stopping an already stopped channel is not an error.
+        await gateway.unsubscribe_from_calendar(
+            calendar, token, "channel-1", subscription.resource_id
+        )
+
+    assert subscription.channel_id == "channel-1"
+    assert subscription.expiration.year == 2030
+    assert server.channels == {}
+
+
+def test_access_token_cache_evicts_expired_and_oldest_entries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(google_async, "MAX_CACHED_ACCESS_TOKENS", 2)
+    monkeypatch.setattr(google_async.time, "time", lambda: 1000.0)
+    expired, oldest, newer, newest = (uuid4() for _ in range(4))
+
+    google_async._cache_access_token(expired, "expired", 900.0)
+    google_async._cache_access_token(oldest, "oldest", 2000.0)
+    google_async._cache_access_token(newer, "newer", 2000.0)
+    assert set(google_async._access_tokens) == {oldest, newer}
+
+    google_async._cache_access_token(newest, "newest", 2000.0)
+    assert set(google_async._access_tokens) == {newer, newest}
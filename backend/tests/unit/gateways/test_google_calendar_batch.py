@@ -0,0 +1,124 @@
+"""Tests for batched Google Calendar lookups against a local fake API."""
+
+# pylint: disable=protected-access
+
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+from lykke.domain.entities import (
+    AuthTokenEntity,
+    CalendarEntity,
+    CalendarEntrySeriesEntity,
+)
+from lykke.domain.value_objects import TaskFrequency
+from lykke.infrastructure.gateways import google as google_gateway
+from lykke.infrastructure.gateways.google import GoogleCalendarGateway
+from tests.support.fake_google_calendar import FakeGoogleCalendarServer
+
+CALENDAR_ID = "test@calendar.google.com"
+
+
+class _FakeServerGateway(GoogleCalendarGateway):
+    def __init__(self, server: FakeGoogleCalendarServer) -> None:
+        self._server = server
+
+    def _build_calendar_service(self, token: AuthTokenEntity) -> Any:
+        _ = token
+        return self._server.build_service()
+
+
+def _calendar() -> CalendarEntity:
+    return CalendarEntity(
+        id=uuid4(),
+        user_id=uuid4(),
+        name="Test Calendar",
+        auth_token_id=uuid4(),
+        platform_id=CALENDAR_ID,
+        platform="google",
+    )
+
+
+def _token(user_id: Any) -> AuthTokenEntity:
+    return AuthTokenEntity(
+        user_id=user_id,
+        platform="google",
+        token="test-token",
+        refresh_token="test-refresh",
+        expires_at=datetime(2099, 1, 1, tzinfo=UTC),
+    )
+
+
+def _event(event_id: str, **fields: Any) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "summary": f"Event {event_id}",
+        "status": "confirmed",
+        "start": {"dateTime": "2026-02-04T08:00:00Z"},
+        "end": {"dateTime": "2026-02-04T09:00:00Z"},
+        "created": "2026-02-01T00:00:00Z",
+        "updated": "2026-02-01T00:00:00Z",
+        **fields,
+    }
+
+
+def test_series_lookups_are_batched_with_per_item_404s(monkeypatch) -> None:
+    """Parent and master lookups share batches of at most BATCH_REQUEST_SIZE."""
+    monkeypatch.setattr(google_gateway, "BATCH_REQUEST_SIZE", 4)
+    calendar = _calendar()
+
+    with FakeGoogleCalendarServer() as server:
+        for index in range(6):
+            server.add_event(
+                CALENDAR_ID,
+                _event(f"series{index}", recurrence=["RRULE:FREQ=DAILY"]),
+            )
+        for index in range(7):
+            # series6 has no master, so its lookup returns 404.
+            server.add_event(
+                CALENDAR_ID,
+                _event(
+                    f"series{index}_20260204T080000Z",
+                    recurringEventId=f"series{index}",
+                ),
+            )
+
+        events, deleted, series, cancelled, sync_token = _FakeServerGateway(
+            server
+        )._load_calendar_events_sync(
+            calendar,
+            datetime(2026, 2, 1, tzinfo=UTC),
+            _token(calendar.user_id),
+            "UTC",
+            None,
+        )
+
+    batch_requests = [r for r in server.requests if r.startswith("POST")]
+    assert server.batch_sizes == [4, 3]
+    assert len(batch_requests) == 2
+    assert len(server.requests) == 4  # two batches plus the two event listings
+
+    assert deleted == []
+    assert sync_token == server.next_sync_token
+    frequencies = {entry.platform_id: entry.frequency for entry in events}
+    assert frequencies["series0_20260204T080000Z"] == TaskFrequency.DAILY
+    assert frequencies["series6_20260204T080000Z"] == TaskFrequency.ONCE
+    assert {s.platform_id for s in series} == {f"series{i}" for i in range(7)}
+    assert cancelled == [
+        CalendarEntrySeriesEntity.id_from_platform("google", "series6")
+    ]
+
+
+def test_batch_get_events_maps_missing_events_to_none() -> None:
+    with FakeGoogleCalendarServer() as server:
+        server.add_event(CALENDAR_ID, _event("present"))
+
+        fetched, errors = GoogleCalendarGateway._batch_get_events_sync(
+            server.build_service(), CALENDAR_ID, ["present", "missing", "present"]
+        )
+
+    assert fetched["present"] is not None
+    assert fetched["present"]["id"] == "present"
+    assert fetched["missing"] is None
+    assert errors == {}
+    assert server.batch_sizes == [2]
@@ -321,3 +321,46 @@ def test_is_instance_exception_false_when_no_series() -> None:
         user_timezone="UTC",
     )
     assert entry.is_instance_exception is False
+
+
+def test_master_event_to_series_entity_records_start_timezone() -> None:
+    """Series keep the zone Google expands their recurrence in."""
+    calendar = CalendarEntity(
+        id=uuid4(),
+        user_id=uuid4(),
+        name="Test Calendar",
+        auth_token_id=uuid4(),
+        platform_id="test@calendar.google.com",
+        platform="google",
+    )
+    gateway = GoogleCalendarGateway()
+
+    timed = gateway._master_event_to_series_entity(
+        calendar,
+        {
+            "id": "standup",
+            "recurrence": ["RRULE:FREQ=WEEKLY;BYDAY=MO"],
+            "start": {
+                "dateTime": "2026-03-02T09:00:00-06:00",
+                "timeZone": "America/Chicago",
+            },
+            "end": {
+                "dateTime": "2026-03-02T09:30:00-06:00",
+                "timeZone": "America/Chicago",
+            },
+        },
+    )
+    all_day = gateway._master_event_to_series_entity(
+        calendar,
+        {
+            "id": "birthday",
+            "recurrence": ["RRULE:FREQ=YEARLY"],
+            "start": {"date": "2026-03-02"},
+            "end": {"date": "2026-03-03"},
+        },
+    )
+
+    assert timed.timezone == "America/Chicago"
+    assert timed.is_all_day is False
+    assert all_day.timezone == "UTC"
+    assert all_day.is_all_day is True
@@ -1,8 +1,9 @@
 """Unit tests for Google Calendar sync logic."""
 
+from collections.abc import AsyncIterator, Collection
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from dobles import allow
@@ -11,8 +12,11 @@ from lykke.application.commands.calendar.sync_calendar import (
     SyncCalendarCommand,
     SyncCalendarHandler,
 )
-from lykke.application.gateways.google_protocol import GoogleCalendarGatewayProtocol
-from lykke.core.exceptions import NotFoundError
+from lykke.application.gateways.google_protocol import (
+    CalendarEventPage,
+    GoogleCalendarGatewayProtocol,
+)
+from lykke.core.config import settings
 from lykke.domain import value_objects
 from lykke.domain.entities import (
     AuthTokenEntity,
@@ -64,6 +68,22 @@ class _GatewayFactory:
         return self._google_gateway
 
 
+async def _single_page(
+    entries: list[CalendarEntryEntity],
+    deleted_entries: list[CalendarEntryEntity],
+    series: list[CalendarEntrySeriesEntity],
+    cancelled_series_ids: list[UUID],
+    next_sync_token: str | None,
+) -> AsyncIterator[CalendarEventPage]:
+    yield CalendarEventPage(
+        entries=entries,
+        deleted_entries=deleted_entries,
+        series=series,
+        cancelled_series_ids=cancelled_series_ids,
+        next_sync_token=next_sync_token,
+    )
+
+
 @pytest.fixture
 def test_calendar_id():
     """Test calendar UUID."""
@@ -158,6 +178,8 @@ def mock_uow(
     allow(mock_calendar_repo).get.and_return(test_calendar)
     allow(mock_auth_token_repo).get.and_return(test_auth_token)
     allow(mock_calendar_entry_repo).search_one_or_none.and_return(None)
+    allow(mock_calendar_entry_repo).unchanged_platform_ids.and_return(set())
+    allow(mock_calendar_entry_series_repo).unchanged_ids.and_return(set())
 
     return create_uow_double(
         calendar_repo=mock_calendar_repo,
@@ -214,8 +236,8 @@ def test_sync_calendar_changes_with_new_events(
         frequency=TaskFrequency.ONCE,
     )
 
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([new_event], [], [], [], "new-sync-token")
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([new_event], [], [], [], "new-sync-token")
     )
     allow(mock_calendar_entry_repo).search_one_or_none.and_return(None)
 
@@ -270,8 +292,8 @@ def test_sync_calendar_changes_with_updated_events(
         frequency=TaskFrequency.ONCE,
     )
 
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([updated_event], [], [], [], "new-sync-token")
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([updated_event], [], [], [], "new-sync-token")
     )
     allow(mock_calendar_entry_repo).search_one_or_none.and_return(existing_event)
 
@@ -315,8 +337,8 @@ def test_sync_calendar_changes_with_deleted_events(
         frequency=TaskFrequency.ONCE,
     )
 
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([cancelled_event], [], [], [], "new-sync-token")
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([cancelled_event], [], [], [], "new-sync-token")
     )
     allow(mock_calendar_entry_repo).search_one_or_none.and_return(existing_event)
 
@@ -346,8 +368,8 @@ def test_sync_calendar_changes_filters_far_future_events(
         frequency=TaskFrequency.ONCE,
     )
 
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([far_future_event], [], [], [], "new-sync-token")
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([far_future_event], [], [], [], "new-sync-token")
     )
 
 
@@ -376,8 +398,8 @@ def test_sync_calendar_changes_handles_missing_deleted_events(
         frequency=TaskFrequency.ONCE,
     )
 
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([cancelled_event], [], [], [], "new-sync-token")
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([cancelled_event], [], [], [], "new-sync-token")
     )
     allow(mock_calendar_entry_repo).search_one_or_none.and_return(None)
 
@@ -393,8 +415,8 @@ def test_sync_calendar_changes_updates_sync_token(
     mock_calendar_entry_repo,
 ):
     """Test that sync updates the calendar's sync token."""
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([], [], [], [], "brand-new-sync-token")
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([], [], [], [], "brand-new-sync-token")
     )
 
 
@@ -434,7 +456,8 @@ def test_google_event_conversion_includes_series(test_user_id):
     assert entry.calendar_entry_series_id == series.id
     assert series.recurrence == ["RRULE:FREQ=WEEKLY;BYDAY=MO"]
     assert entry.category == value_objects.EventCategory.WORK
-    assert not hasattr(series, "timezone")
+    assert series.timezone == "UTC"
+    assert series.is_all_day is False
 
 
 @pytest.mark.asyncio
@@ -504,18 +527,27 @@ async def test_sync_calendar_series_updates_cascade_entries_once(
         category=value_objects.EventCategory.WORK,
     )
 
-    allow(mock_calendar_entry_series_repo).get.and_return(existing_series)
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([], [], [updated_series], [], "new-sync-token")
+    allow(mock_calendar_entry_series_repo).search.and_return([existing_series])
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([], [], [updated_series], [], "new-sync-token")
     )
 
-    async def search_entries(query: object) -> list[CalendarEntryEntity]:
-        if getattr(query, "calendar_entry_series_id", None) == series_id:
-            return [entry_one, entry_two]
-        return []
+    cascaded_series: list[CalendarEntrySeriesEntity] = []
 
-    mock_calendar_entry_repo.search = search_entries
-    mock_uow.calendar_entry_ro_repo.search = search_entries
+    async def cascade(
+        series: list[CalendarEntrySeriesEntity],
+    ) -> list[CalendarEntryEntity]:
+        cascaded_series.extend(series)
+        return [
+            entry.clone(
+                name=series[0].name,
+                category=series[0].event_category,
+                frequency=series[0].frequency,
+            )
+            for entry in (entry_two, entry_one)
+        ]
+
+    mock_uow.cascade_calendar_entry_series = cascade
 
     handler = SyncCalendarHandler(
         user=test_user,
@@ -526,6 +558,7 @@ async def test_sync_calendar_series_updates_cascade_entries_once(
 
     await handler.handle(SyncCalendarCommand(calendar_id=test_calendar.id))
 
+    assert [series.name for series in cascaded_series] == ["New Series"]
     updated_entries = [
         entity for entity in mock_uow.added if isinstance(entity, CalendarEntryEntity)
     ]
@@ -619,17 +652,15 @@ async def test_sync_calendar_series_deletion_cascades_entries_once(
         frequency=TaskFrequency.DAILY,
     )
 
-    allow(mock_calendar_entry_series_repo).get.and_return(existing_series)
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([], [deleted_stub_one, deleted_stub_two], [], [], "new-sync-token")
+    allow(mock_calendar_entry_series_repo).search.and_return([existing_series])
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([], [deleted_stub_one, deleted_stub_two], [], [], "new-sync-token")
     )
 
     async def search_entries(query: object) -> list[CalendarEntryEntity]:
         platform_ids = getattr(query, "platform_ids", None)
         if platform_ids:
             return [entry_one, entry_two]
-        if getattr(query, "calendar_entry_series_id", None) == series_id:
-            return [entry_one, entry_two]
         return []
 
     mock_calendar_entry_repo.search = search_entries
@@ -718,18 +749,31 @@ async def test_sync_calendar_series_cancelled_master_ends_series(
         frequency=TaskFrequency.DAILY,
     )
 
-    allow(mock_calendar_entry_series_repo).get.and_return(existing_series)
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([], [], [], [series_id], "new-sync-token")
+    allow(mock_calendar_entry_series_repo).search.and_return([existing_series])
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([], [], [], [series_id], "new-sync-token")
     )
 
-    async def search_entries(query: object) -> list[CalendarEntryEntity]:
-        if getattr(query, "calendar_entry_series_id", None) == series_id:
-            return [past_entry, future_entry]
+    async def search_entries(_: object) -> list[CalendarEntryEntity]:
         return []
 
+    async def delete_series_entries_from(
+        series_ids: Collection[UUID],
+        starts_at: datetime,
+        *,
+        exclude_platform_ids: Collection[str] = (),
+    ) -> list[CalendarEntryEntity]:
+        return [
+            entry
+            for entry in (past_entry, future_entry)
+            if entry.calendar_entry_series_id in series_ids
+            and entry.starts_at >= starts_at
+            and entry.platform_id not in exclude_platform_ids
+        ]
+
     mock_calendar_entry_repo.search = search_entries
     mock_uow.calendar_entry_ro_repo.search = search_entries
+    mock_uow.delete_calendar_series_entries_from = delete_series_entries_from
 
     handler = SyncCalendarHandler(
         user=test_user,
@@ -743,7 +787,11 @@ async def test_sync_calendar_series_cancelled_master_ends_series(
     deleted_entries = [
         entity for entity in mock_uow.added if isinstance(entity, CalendarEntryEntity)
     ]
-    assert any(entry.platform_id == "entry-21" for entry in deleted_entries)
+    assert [entry.platform_id for entry in deleted_entries] == ["entry-21"]
+    assert any(
+        isinstance(event, CalendarEntryDeletedEvent)
+        for event in deleted_entries[0].collect_events()
+    )
 
     updated_series = [
         entity
@@ -803,9 +851,9 @@ async def test_sync_calendar_series_creation_emits_single_notification(
         frequency=TaskFrequency.DAILY,
     )
 
-    allow(mock_calendar_entry_series_repo).get.and_raise(NotFoundError("missing"))
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([entry_one, entry_two], [], [new_series], [], "new-sync-token")
+    allow(mock_calendar_entry_series_repo).search.and_return([])
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([entry_one, entry_two], [], [new_series], [], "new-sync-token")
     )
 
     async def search_entries(_: object) -> list[CalendarEntryEntity]:
@@ -889,9 +937,11 @@ async def test_sync_calendar_recurring_instances_with_original_start_time_emit_s
         recurring_platform_id="series-os",
     )
 
-    allow(mock_calendar_entry_series_repo).get.and_raise(NotFoundError("missing"))
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([instance_one, instance_two], [], [new_series], [], "new-sync-token")
+    allow(mock_calendar_entry_series_repo).search.and_return([])
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page(
+            [instance_one, instance_two], [], [new_series], [], "new-sync-token"
+        )
     )
 
     async def search_entries(_: object) -> list[CalendarEntryEntity]:
@@ -973,9 +1023,9 @@ async def test_sync_calendar_single_to_series_attaches_existing_entry(
         ical_uid="same-ical@google.com",
     )
 
-    allow(mock_calendar_entry_series_repo).get.and_raise(NotFoundError("missing"))
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([instance_entry], [], [new_series], [], "new-sync-token")
+    allow(mock_calendar_entry_series_repo).search.and_return([])
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([instance_entry], [], [new_series], [], "new-sync-token")
     )
 
     async def search_entries(query: object) -> list[CalendarEntryEntity]:
@@ -1070,9 +1120,11 @@ async def test_sync_calendar_instance_exceptions_emit_per_entry_notification(
         original_starts_at=datetime(2025, 4, 8, 13, 0, tzinfo=UTC),
     )
 
-    allow(mock_calendar_entry_series_repo).get.and_raise(NotFoundError("missing"))
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([exception_one, exception_two], [], [new_series], [], "new-sync-token")
+    allow(mock_calendar_entry_series_repo).search.and_return([])
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page(
+            [exception_one, exception_two], [], [new_series], [], "new-sync-token"
+        )
     )
 
     async def search_entries(_: object) -> list[CalendarEntryEntity]:
@@ -1138,9 +1190,9 @@ async def test_sync_calendar_instance_level_single_entry_emits_notification(
         frequency=TaskFrequency.WEEKLY,
     )
 
-    allow(mock_calendar_entry_series_repo).get.and_raise(NotFoundError("missing"))
-    allow(mock_google_gateway).load_calendar_events.and_return(
-        ([single_entry], [], [new_series], [], "new-sync-token")
+    allow(mock_calendar_entry_series_repo).search.and_return([])
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([single_entry], [], [new_series], [], "new-sync-token")
     )
 
     async def search_entries(_: object) -> list[CalendarEntryEntity]:
@@ -1168,3 +1220,341 @@ async def test_sync_calendar_instance_level_single_entry_emits_notification(
         if isinstance(event, CalendarEntryCreatedEvent)
     )
     assert created_event_count == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_calendar_skips_entries_and_series_with_unchanged_content(
+    test_user_id,
+    test_user,
+    test_calendar,
+    mock_ro_repos,
+    mock_uow_factory,
+    mock_uow,
+    mock_google_gateway,
+    mock_calendar_entry_series_repo,
+    mock_calendar_entry_repo,
+):
+    """Entries and series whose stored content hash matches are not loaded or written."""
+    series_id = CalendarEntrySeriesEntity.id_from_platform("google", "series-same")
+    series = CalendarEntrySeriesEntity(
+        id=series_id,
+        user_id=test_user_id,
+        calendar_id=test_calendar.id,
+        name="Standup",
+        platform_id="series-same",
+        platform="google",
+        frequency=TaskFrequency.DAILY,
+        recurrence=["RRULE:FREQ=DAILY"],
+    )
+    unchanged_entry = CalendarEntryEntity(
+        user_id=test_user_id,
+        name="Standup",
+        calendar_id=test_calendar.id,
+        calendar_entry_series_id=series_id,
+        platform_id="entry-same",
+        platform="google",
+        status="confirmed",
+        starts_at=datetime(2025, 5, 1, 9, 0, tzinfo=UTC),
+        ends_at=datetime(2025, 5, 1, 9, 15, tzinfo=UTC),
+        frequency=TaskFrequency.DAILY,
+    )
+    new_entry = CalendarEntryEntity(
+        user_id=test_user_id,
+        name="Lunch",
+        calendar_id=test_calendar.id,
+        platform_id="entry-new",
+        platform="google",
+        status="confirmed",
+        starts_at=datetime(2025, 5, 1, 12, 0, tzinfo=UTC),
+        ends_at=datetime(2025, 5, 1, 13, 0, tzinfo=UTC),
+        frequency=TaskFrequency.ONCE,
+    )
+
+    allow(mock_calendar_entry_series_repo).unchanged_ids.and_return({series_id})
+    allow(mock_calendar_entry_repo).unchanged_platform_ids.and_return({"entry-same"})
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([unchanged_entry, new_entry], [], [series], [], "new-sync-token")
+    )
+
+    searched_platform_ids: list[list[str]] = []
+
+    async def search_entries(query: object) -> list[CalendarEntryEntity]:
+        searched_platform_ids.append(list(getattr(query, "platform_ids", None) or []))
+        return []
+
+    mock_calendar_entry_repo.search = search_entries
+
+    handler = SyncCalendarHandler(
+        user=test_user,
+        uow_factory=mock_uow_factory,
+        repository_factory=_RepositoryFactory(mock_ro_repos),
+        gateway_factory=_GatewayFactory(mock_google_gateway),
+    )
+
+    await handler.handle(SyncCalendarCommand(calendar_id=test_calendar.id))
+
+    assert searched_platform_ids == [["entry-new"]]
+    written = [
+        entity
+        for entity in mock_uow.added
+        if isinstance(entity, (CalendarEntryEntity, CalendarEntrySeriesEntity))
+    ]
+    assert [entity.platform_id for entity in written] == ["entry-new"]
+
+
+@pytest.mark.asyncio
+async def test_sync_calendar_checkpoints_each_page_and_clears_on_last_page(
+    test_user_id,
+    test_user,
+    test_calendar,
+    mock_ro_repos,
+    mock_uow,
+    mock_google_gateway,
+    mock_calendar_entry_repo,
+):
+    """Each page commits with a checkpoint; the last one stores the sync token."""
+    entries = [
+        CalendarEntryEntity(
+            user_id=test_user_id,
+            calendar_id=test_calendar.id,
+            platform_id=f"entry-{index}",
+            platform="google",
+            status="confirmed",
+            name=f"Meeting {index}",
+            starts_at=datetime(2025, 1, 15 + index, 10, 0, tzinfo=UTC),
+            ends_at=datetime(2025, 1, 15 + index, 11, 0, tzinfo=UTC),
+            frequency=TaskFrequency.ONCE,
+        )
+        for index in range(2)
+    ]
+    listings: list[dict[str, object]] = []
+
+    async def iter_pages(
+        calendar: CalendarEntity, lookback: datetime, token: AuthTokenEntity, **kwargs
+    ) -> AsyncIterator[CalendarEventPage]:
+        listings.append(kwargs)
+        yield CalendarEventPage(
+            entries=[entries[0]],
+            deleted_entries=[],
+            series=[],
+            cancelled_series_ids=[],
+            next_page_token="page-2",
+        )
+        yield CalendarEventPage(
+            entries=[entries[1]],
+            deleted_entries=[],
+            series=[],
+            cancelled_series_ids=[],
+            next_sync_token="new-sync-token",
+        )
+
+    async def search_entries(query: object) -> list[CalendarEntryEntity]:
+        return []
+
+    mock_google_gateway.iter_calendar_event_pages = iter_pages
+    mock_calendar_entry_repo.search = search_entries
+    # Entries already written whenever a unit of work is opened
+    written_before_uow: list[list[str]] = []
+
+    class _UnitOfWorkFactory:
+        def create(self, user: object) -> object:
+            _ = user
+            written_before_uow.append(
+                [
+                    entity.platform_id
+                    for entity in mock_uow.added
+                    if isinstance(entity, CalendarEntryEntity)
+                ]
+            )
+            return mock_uow
+
+    handler = SyncCalendarHandler(
+        user=test_user,
+        uow_factory=_UnitOfWorkFactory(),
+        repository_factory=_RepositoryFactory(mock_ro_repos),
+        gateway_factory=_GatewayFactory(mock_google_gateway),
+    )
+
+    result = await handler.handle(SyncCalendarCommand(calendar_id=test_calendar.id))
+
+    assert listings == [
+        {
+            "user_timezone": test_user.settings.timezone,
+            "sync_token": "old-sync-token",
+            "page_token": None,
+        }
+    ]
+    calendars = [
+        entity for entity in mock_uow.added if isinstance(entity, CalendarEntity)
+    ]
+    assert len(calendars) == 2
+    checkpoint = calendars[0].sync_checkpoint
+    assert checkpoint is not None
+    assert checkpoint.page_token == "page-2"
+    assert checkpoint.sync_token == "old-sync-token"
+    assert checkpoint.pages_synced == 1
+    assert result.sync_checkpoint is None
+    assert result.sync_subscription is not None
+    assert result.sync_subscription.sync_token == "new-sync-token"
+    assert written_before_uow == [[], ["entry-0"]]
+
+
+@pytest.mark.asyncio
+async def test_sync_calendar_resumes_from_checkpoint(
+    test_user,
+    test_calendar,
+    mock_ro_repos,
+    mock_uow_factory,
+    mock_uow,
+    mock_google_gateway,
+    mock_calendar_repo,
+):
+    """A checkpointed calendar resumes the interrupted listing."""
+    lookback = datetime(2024, 12, 1, tzinfo=UTC)
+    checkpointed = test_calendar.clone(
+        sync_checkpoint=value_objects.CalendarSyncCheckpoint(
+            page_token="page-7",
+            sync_token=None,
+            lookback=lookback,
+            started_at=datetime(2025, 1, 1, tzinfo=UTC),
+            pages_synced=6,
+        )
+    )
+    allow(mock_calendar_repo).get.and_return(checkpointed)
+    listings: list[tuple[datetime, dict[str, object]]] = []
+
+    async def iter_pages(
+        calendar: CalendarEntity, lookback: datetime, token: AuthTokenEntity, **kwargs
+    ) -> AsyncIterator[CalendarEventPage]:
+        listings.append((lookback, kwargs))
+        yield CalendarEventPage(
+            entries=[],
+            deleted_entries=[],
+            series=[],
+            cancelled_series_ids=[],
+            next_page_token="page-8",
+        )
+        raise TimeoutError
+
+    mock_google_gateway.iter_calendar_event_pages = iter_pages
+
+    handler = SyncCalendarHandler(
+        user=test_user,
+        uow_factory=mock_uow_factory,
+        repository_factory=_RepositoryFactory(mock_ro_repos),
+        gateway_factory=_GatewayFactory(mock_google_gateway),
+    )
+
+    with pytest.raises(TimeoutError):
+        await handler.handle(SyncCalendarCommand(calendar_id=test_calendar.id))
+
+    assert listings == [
+        (
+            lookback,
+            {
+                "user_timezone": test_user.settings.timezone,
+                "sync_token": None,
+                "page_token": "page-7",
+            },
+        )
+    ]
+    [calendar] = [
+        entity for entity in mock_uow.added if isinstance(entity, CalendarEntity)
+    ]
+    assert calendar.sync_checkpoint == value_objects.CalendarSyncCheckpoint(
+        page_token="page-8",
+        sync_token=None,
+        lookback=lookback,
+        started_at=datetime(2025, 1, 1, tzinfo=UTC),
+        pages_synced=7,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_calendar_leaves_series_instances_past_horizon_to_expansion(
+    monkeypatch,
+    test_user_id,
+    test_user,
+    test_calendar,
+    mock_ro_repos,
+    mock_uow_factory,
+    mock_uow,
+    mock_google_gateway,
+    mock_calendar_entry_series_repo,
+    mock_calendar_entry_repo,
+):
+    """Plain instances past the horizon are skipped and cancellations recorded."""
+    monkeypatch.setattr(settings, "CALENDAR_SERIES_MATERIALIZE_DAYS", 30)
+    now = datetime.now(UTC).replace(microsecond=0)
+    series_id = CalendarEntrySeriesEntity.id_from_platform("google", "daily")
+    series = CalendarEntrySeriesEntity(
+        id=series_id,
+        user_id=test_user_id,
+        calendar_id=test_calendar.id,
+        name="Daily",
+        platform_id="daily",
+        platform="google",
+        frequency=TaskFrequency.DAILY,
+        recurrence=["RRULE:FREQ=DAILY"],
+        starts_at=now + timedelta(days=1),
+    )
+
+    def instance(days: int, is_instance_exception: bool = False) -> CalendarEntryEntity:
+        starts_at = now + timedelta(days=days)
+        return CalendarEntryEntity(
+            user_id=test_user_id,
+            name="Daily",
+            calendar_id=test_calendar.id,
+            calendar_entry_series_id=series_id,
+            platform_id=f"daily_{starts_at:%Y%m%dT%H%M%SZ}",
+            platform="google",
+            status="confirmed",
+            starts_at=starts_at,
+            frequency=TaskFrequency.DAILY,
+            original_starts_at=starts_at,
+            is_instance_exception=is_instance_exception,
+        )
+
+    near = instance(1)
+    far = instance(60)
+    moved = instance(61, is_instance_exception=True)
+    cancelled = instance(62).clone(status="cancelled")
+
+    allow(mock_calendar_entry_series_repo).search.and_return([])
+    allow(mock_google_gateway).iter_calendar_event_pages.and_return(
+        _single_page([near, far, moved, cancelled], [], [series], [], "new-sync-token")
+    )
+
+    async def search_entries(_: object) -> list[CalendarEntryEntity]:
+        return []
+
+    mock_calendar_entry_repo.search = search_entries
+    mock_uow.calendar_entry_ro_repo.search = search_entries
+
+    handler = SyncCalendarHandler(
+        user=test_user,
+        uow_factory=mock_uow_factory,
+        repository_factory=_RepositoryFactory(mock_ro_repos),
+        gateway_factory=_GatewayFactory(mock_google_gateway),
+    )
+
+    await handler.handle(SyncCalendarCommand(calendar_id=test_calendar.id))
+
+    written_entries = [
+        entity.platform_id
+        for entity in mock_uow.added
+        if isinstance(entity, CalendarEntryEntity)
+    ]
+    assert written_entries == [near.platform_id, moved.platform_id]
+    (written_series,) = [
+        entity
+        for entity in mock_uow.added
+        if isinstance(entity, CalendarEntrySeriesEntity)
+    ]
+    assert written_series.materialized_until is not None
+    assert (
+        timedelta(days=29)
+        < written_series.materialized_until - now
+        < timedelta(days=31)
+    )
+    assert written_series.cancelled_occurrences == [cancelled.starts_at]
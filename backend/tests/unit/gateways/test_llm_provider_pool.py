@@ -0,0 +1,90 @@
+"""Unit tests for the shared LLM provider pool and its circuit breakers."""
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+from lykke.infrastructure.gateways.llm_provider_pool import (
+    CircuitBreaker,
+    LLMProviderPool,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_provider_pool() -> Iterator[None]:
+    LLMProviderPool.reset()
+    yield
+    LLMProviderPool.reset()
+
+
+def test_circuit_opens_on_error_rate_and_closes_after_successful_trial() -> None:
+    now = [0.0]
+    breaker = CircuitBreaker(
+        "anthropic/model",
+        window=4,
+        min_calls=4,
+        error_rate=0.5,
+        cooldown_seconds=30,
+        clock=lambda: now[0],
+    )
+
+    for success in (True, False, True):
+        breaker.record(success)
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.is_open
+    assert not breaker.allow()
+
+    now[0] = 31
+    assert breaker.allow()
+    # Only one trial call is let through at a time.
+    assert not breaker.allow()
+    breaker.record(False)
+    assert not breaker.allow()
+
+    now[0] = 62
+    assert breaker.allow()
+    breaker.record(True)
+    assert not breaker.is_open
+    assert breaker.allow()
+
+
+def test_route_skips_non_critical_use_cases_when_all_circuits_are_open() -> None:
+    for model in ("primary", "fallback"):
+        for _ in range(10):
+            LLMProviderPool.breaker("anthropic", model).record(False)
+
+    models = ["primary", "fallback"]
+    assert LLMProviderPool.route("anthropic", models, critical=False) is None
+    assert LLMProviderPool.route("anthropic", models, critical=True) == "primary"
+
+
+@pytest.mark.asyncio
+async def test_invoke_limits_concurrent_calls_per_provider(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "lykke.infrastructure.gateways.llm_provider_pool.settings.LLM_PROVIDER_CONCURRENCY",
+        2,
+    )
+    in_flight = 0
+    peak = 0
+
+    async def call() -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "ok"
+
+    results = await asyncio.gather(
+        *(
+            LLMProviderPool.invoke("openai", "model", "notification", call)
+            for _ in range(5)
+        )
+    )
+
+    assert results == ["ok"] * 5
+    assert peak == 2
+    assert LLMProviderPool.stats["notification"].calls == 5
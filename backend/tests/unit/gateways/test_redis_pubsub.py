@@ -24,6 +24,29 @@ async def test_publish_to_user_channel() -> None:
     await gateway.close()
 
 
+@pytest.mark.asyncio
+async def test_publish_many_to_user_channels() -> None:
+    """Test publishing to several user channels in one pipeline."""
+    gateway = RedisPubSubGateway()
+    first, second = uuid4(), uuid4()
+
+    async with gateway.subscribe_to_user_channel(
+        user_id=second, channel_type="domain-events"
+    ) as subscription:
+        await asyncio.sleep(0.1)
+        await gateway.publish_many_to_user_channels(
+            "domain-events",
+            [(first, {"event": "first"}), (second, {"event": "second"})],
+        )
+
+        received = await subscription.get_message(timeout=2.0)
+
+        assert received is not None
+        assert received["event"] == "second"
+
+    await gateway.close()
+
+
 @pytest.mark.asyncio
 async def test_subscribe_and_receive_message() -> None:
     """Test subscribing to a channel and receiving a message."""
@@ -217,6 +240,30 @@ async def test_append_and_read_user_stream() -> None:
     await gateway.close()
 
 
+@pytest.mark.asyncio
+async def test_append_many_to_user_stream_preserves_order() -> None:
+    """Test appending a batch of messages in one round trip."""
+    gateway = RedisPubSubGateway()
+    user_id = uuid4()
+    messages = [{"event": f"change-{index}"} for index in range(3)]
+
+    stream_ids = await gateway.append_many_to_user_stream(
+        user_id=user_id, stream_type="entity-changes", messages=messages
+    )
+    entries = await gateway.read_user_stream(
+        user_id=user_id,
+        stream_type="entity-changes",
+        last_id="0-0",
+        count=10,
+        block_ms=100,
+    )
+
+    assert [entry_id for entry_id, _ in entries] == stream_ids
+    assert [payload for _, payload in entries] == messages
+
+    await gateway.close()
+
+
 @pytest.mark.asyncio
 async def test_get_latest_user_stream_entry() -> None:
     """Test retrieving the latest stream entry."""
@@ -0,0 +1,92 @@
+"""Unit tests for calendar entry and series content hashes."""
+
+import hashlib
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from lykke.domain.entities import CalendarEntryEntity, CalendarEntrySeriesEntity
+from lykke.domain.value_objects import EventCategory, TaskFrequency
+from lykke.infrastructure.database.content_hash import content_hash_sql
+from lykke.infrastructure.repositories import (
+    CalendarEntryRepository,
+    CalendarEntrySeriesRepository,
+)
+
+
+def _entry(**fields: object) -> CalendarEntryEntity:
+    return CalendarEntryEntity(
+        user_id=uuid4(),
+        name="Standup",
+        calendar_id=uuid4(),
+        platform_id="entry-1",
+        platform="google",
+        status="confirmed",
+        starts_at=datetime(2025, 5, 1, 9, 0, 0, 250, tzinfo=UTC),
+        frequency=TaskFrequency.ONCE,
+        **fields,
+    )
+
+
+def test_entry_hash_survives_round_trip_and_tracks_mapped_fields():
+    entry = _entry(category=EventCategory.WORK)
+    stored = CalendarEntryRepository.row_to_entity(
+        {
+            **CalendarEntryRepository.entity_to_row(entry),
+            "starts_at": entry.starts_at.replace(tzinfo=None),
+            "content_hash": "ignored",
+        }
+    )
+
+    assert CalendarEntryRepository.compute_content_hash(
+        stored
+    ) == CalendarEntryRepository.compute_content_hash(entry)
+    assert CalendarEntryRepository.compute_content_hash(
+        entry.clone(name="Retro")
+    ) != CalendarEntryRepository.compute_content_hash(entry)
+    # Local-only fields do not affect the fingerprint.
+    assert CalendarEntryRepository.compute_content_hash(
+        entry.clone(actions=[])
+    ) == CalendarEntryRepository.compute_content_hash(entry)
+
+
+def test_series_hash_matches_sql_canonical_text():
+    series = CalendarEntrySeriesEntity(
+        user_id=uuid4(),
+        calendar_id=uuid4(),
+        name="Standup",
+        platform_id="series-1",
+        platform="google",
+        frequency=TaskFrequency.DAILY,
+        recurrence=["RRULE:FREQ=DAILY"],
+        starts_at=datetime(1970, 1, 1, 0, 0, 1, tzinfo=UTC),
+    )
+    canonical = "\x1f".join(
+        [
+            "Standup",
+            "\x1e",
+            "DAILY",
+            '["RRULE:FREQ=DAILY"]',
+            "1000000",
+            "\x1e",
+            "\x1e",
+            "\x1e",
+            "false",
+        ]
+    )
+
+    assert (
+        CalendarEntrySeriesRepository.compute_content_hash(series)
+        == hashlib.md5(canonical.encode()).hexdigest()
+    )
+    assert CalendarEntrySeriesRepository.compute_content_hash(
+        series.clone(recurrence=[])
+    ) != CalendarEntrySeriesRepository.compute_content_hash(series)
+    assert CalendarEntrySeriesRepository.compute_content_hash(
+        series.clone(timezone="America/Chicago")
+    ) != CalendarEntrySeriesRepository.compute_content_hash(series)
+    assert content_hash_sql([("is_all_day", "boolean")]) == (
+        "md5(coalesce(is_all_day::text, chr(30)))"
+    )
+    assert content_hash_sql([("recurrence", "jsonb")]) == (
+        "md5(coalesce(recurrence::text, 'null'))"
+    )
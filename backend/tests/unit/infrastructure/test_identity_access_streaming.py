@@ -0,0 +1,113 @@
+"""Unit tests for the streamed eligible-user query in UnauthenticatedIdentityAccess."""
+
+from collections.abc import AsyncIterator
+from datetime import time
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from lykke.domain import value_objects
+from lykke.infrastructure.unauthenticated import identity_access as identity_module
+
+
+class _FakeStreamResult:
+    def __init__(self, rows: list[SimpleNamespace]) -> None:
+        self._rows = rows
+        self.partition_sizes: list[int] = []
+
+    async def partitions(self, size: int) -> AsyncIterator[list[SimpleNamespace]]:
+        self.partition_sizes.append(size)
+        for start in range(0, len(self._rows), size):
+            yield self._rows[start : start + size]
+
+
+class _FakeConnection:
+    def __init__(self, engine: "_FakeEngine") -> None:
+        self._engine = engine
+
+    async def __aenter__(self) -> "_FakeConnection":
+        self._engine.open_connections += 1
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self._engine.open_connections -= 1
+
+    async def stream(self, stmt: Any) -> _FakeStreamResult:
+        self._engine.statements.append(stmt)
+        return self._engine.result
+
+
+class _FakeEngine:
+    def __init__(self, rows: list[SimpleNamespace]) -> None:
+        self.result = _FakeStreamResult(rows)
+        self.statements: list[Any] = []
+        self.open_connections = 0
+
+    def connect(self) -> _FakeConnection:
+        return _FakeConnection(self)
+
+
+def _row(
+    user_id: UUID, timezone: str | None = "UTC", overview: str | None = None
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=user_id, timezone=timezone, morning_overview_time=overview
+    )
+
+
+@pytest.fixture
+def engine(monkeypatch: pytest.MonkeyPatch) -> _FakeEngine:
+    fake = _FakeEngine(
+        [
+            _row(uuid4(), overview="07:30:00"),
+            _row(uuid4(), timezone=None, overview="not-a-time"),
+            _row(uuid4(), timezone="America/Chicago"),
+            _row(uuid4()),
+            _row(uuid4()),
+        ]
+    )
+    monkeypatch.setattr(identity_module, "get_engine", lambda: fake)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_iter_eligible_users_streams_rows_in_batches(engine: _FakeEngine) -> None:
+    access = identity_module.UnauthenticatedIdentityAccess()
+
+    batches = [
+        batch
+        async for batch in access.iter_eligible_users(
+            value_objects.UserEligibility.LLM_PROVIDER, batch_size=2
+        )
+    ]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert engine.result.partition_sizes == [2]
+    (stmt,) = engine.statements
+    assert stmt.get_execution_options()["yield_per"] == 2
+    assert stmt.whereclause is not None
+    first, second = batches[0]
+    assert first.morning_overview_time == time(7, 30)
+    assert second.timezone is None
+    assert second.morning_overview_time is None
+    assert engine.open_connections == 0
+
+
+@pytest.mark.asyncio
+async def test_iter_eligible_users_releases_connection_when_consumer_stops(
+    engine: _FakeEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(identity_module.settings, "WORKER_FANOUT_CHUNK_SIZE", 3)
+    access = identity_module.UnauthenticatedIdentityAccess()
+
+    stream = access.iter_eligible_users()
+    first = await anext(stream)
+    assert engine.open_connections == 1
+    await stream.aclose()
+
+    assert len(first) == 3
+    assert engine.result.partition_sizes == [3]
+    assert engine.statements[0].whereclause is None
+    assert engine.open_connections == 0
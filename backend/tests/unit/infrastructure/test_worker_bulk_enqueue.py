@@ -0,0 +1,142 @@
+"""Unit tests for bulk worker enqueue helpers."""
+
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from taskiq.message import BrokerMessage
+
+from lykke.infrastructure.workers import bulk as bulk_module
+from lykke.infrastructure.workers.bulk import PipelinedListQueueBroker, kiq_many
+from tests.unit.presentation.worker_task_helpers import create_task_recorder
+
+
+class _RecordingBroker(PipelinedListQueueBroker):
+    def __init__(self) -> None:
+        super().__init__(url="redis://localhost:6379")
+        self.batches: list[list[BrokerMessage]] = []
+
+    async def kick_many(self, messages: list[BrokerMessage]) -> None:  # type: ignore[override]
+        self.batches.append(list(messages))
+
+
+@pytest.mark.asyncio
+async def test_kiq_many_sends_chunked_batches() -> None:
+    broker = _RecordingBroker()
+
+    @broker.task
+    async def per_user_task(user_id: str) -> None:
+        _ = user_id
+
+    user_ids = [str(uuid4()) for _ in range(5)]
+
+    count = await kiq_many(
+        per_user_task,
+        ({"user_id": user_id} for user_id in user_ids),
+        chunk_size=2,
+    )
+
+    assert count == 5
+    assert [len(batch) for batch in broker.batches] == [2, 2, 1]
+    sent = [
+        broker.formatter.loads(message.message).kwargs["user_id"]
+        for batch in broker.batches
+        for message in batch
+    ]
+    assert sent == user_ids
+    assert all(
+        message.task_name == per_user_task.task_name
+        for batch in broker.batches
+        for message in batch
+    )
+
+
+@pytest.mark.asyncio
+async def test_kiq_many_builds_the_same_message_as_kiq() -> None:
+    # kiq_many relies on taskiq's private AsyncKicker._prepare_message; this
+    # fails if a taskiq upgrade changes how that builds messages.
+    broker = _RecordingBroker()
+
+    @broker.task(queue_name="fanout", retry_on_error=True)
+    async def per_user_task(user_id: str, day: str | None = None) -> None:
+        _ = (user_id, day)
+
+    await per_user_task.kiq(user_id="user-1", day="2026-01-01")
+    await kiq_many(per_user_task, [{"user_id": "user-1", "day": "2026-01-01"}])
+
+    (kiq_sent,), (bulk_sent,) = broker.batches
+    kiq_message = broker.formatter.loads(kiq_sent.message)
+    bulk_message = broker.formatter.loads(bulk_sent.message)
+    assert bulk_message.model_dump(exclude={"task_id"}) == kiq_message.model_dump(
+        exclude={"task_id"}
+    )
+    assert bulk_sent.labels == kiq_sent.labels
+    assert bulk_sent.task_name == kiq_sent.task_name
+
+
+@pytest.mark.asyncio
+async def test_kiq_many_falls_back_to_kiq_for_plain_tasks() -> None:
+    task, calls = create_task_recorder()
+
+    count = await kiq_many(task, [{"user_id": 1}, {"user_id": 2}])
+
+    assert count == 2
+    assert calls == [{"user_id": 1}, {"user_id": 2}]
+
+
+@pytest.mark.asyncio
+async def test_kiq_many_with_no_items_does_nothing() -> None:
+    broker = _RecordingBroker()
+
+    @broker.task
+    async def per_user_task(user_id: str) -> None:
+        _ = user_id
+
+    assert await kiq_many(per_user_task, []) == 0
+    assert broker.batches == []
+
+
+@pytest.mark.asyncio
+async def test_listen_backs_off_on_connection_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    outcomes: list[object] = [
+        RedisConnectionError("down"),
+        RedisConnectionError("down"),
+        (b"queue", b"message"),
+    ]
+    delays: list[float] = []
+
+    class _FakeRedis:
+        def __init__(self, **kwargs: object) -> None:
+            _ = kwargs
+
+        async def __aenter__(self) -> "_FakeRedis":
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
+
+        async def brpop(self, keys: list[str]) -> object:
+            _ = keys
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(bulk_module.aioredis, "Redis", _FakeRedis)
+    monkeypatch.setattr(bulk_module.asyncio, "sleep", fake_sleep)
+    broker = PipelinedListQueueBroker(url="redis://localhost:6379")
+
+    stream = broker.listen()
+    message = await anext(stream)
+    await stream.aclose()
+
+    assert message == b"message"
+    assert delays == [
+        bulk_module.LISTEN_BACKOFF_BASE_SECONDS,
+        bulk_module.LISTEN_BACKOFF_BASE_SECONDS * 2,
+    ]
@@ -0,0 +1,114 @@
+"""Unit tests for debounced job triggers."""
+
+from typing import Any, cast
+
+import pytest
+from redis.asyncio import Redis
+
+from lykke.infrastructure.workers.debounce import (
+    claim,
+    debounce_key,
+    note_trigger,
+    quiet_at,
+)
+
+KEY = debounce_key("calendar-sync", "user", "calendar")
+TTL = 900
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def record(*args: Any, **kwargs: Any) -> None:
+            self._ops.append((name, args, kwargs))
+
+        return record
+
+    async def execute(self) -> list[Any]:
+        results = []
+        for name, args, kwargs in self._ops:
+            results.append(await getattr(self._redis, name)(*args, **kwargs))
+        return results
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        _ = transaction
+        return _FakePipeline(self)
+
+    async def hsetnx(self, key: str, field: str, value: str) -> int:
+        fields = self.hashes.setdefault(key, {})
+        if field in fields:
+            return 0
+        fields[field] = value
+        return 1
+
+    async def hset(
+        self,
+        key: str,
+        field: str | None = None,
+        value: str | None = None,
+        mapping: dict[str, str] | None = None,
+    ) -> int:
+        fields = self.hashes.setdefault(key, {})
+        if field is not None and value is not None:
+            fields[field] = value
+        fields.update(mapping or {})
+        return 1
+
+    async def hget(self, key: str, field: str) -> str | None:
+        return self.hashes.get(key, {}).get(field)
+
+    async def hmget(self, key: str, fields: list[str]) -> list[str | None]:
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        _ = seconds
+        return key in self.hashes
+
+    async def delete(self, key: str) -> int:
+        return 1 if self.hashes.pop(key, None) is not None else 0
+
+
+@pytest.mark.asyncio
+async def test_burst_settles_after_quiet_period_and_is_claimed_once() -> None:
+    redis = cast(Redis, _FakeRedis())
+
+    started = [
+        await note_trigger(redis, KEY, ttl_seconds=TTL, now=at)
+        for at in (1000.0, 1002.0, 1004.0)
+    ]
+    settles_at = await quiet_at(redis, KEY, quiet_seconds=10, max_delay_seconds=60)
+
+    assert started == [True, False, False]
+    assert settles_at == 1014.0
+    assert await claim(redis, KEY)
+    # The burst is gone; a second caller has nothing to claim.
+    assert not await claim(redis, KEY)
+    assert await quiet_at(redis, KEY, quiet_seconds=10, max_delay_seconds=60) is None
+
+
+@pytest.mark.asyncio
+async def test_continuous_triggers_are_bounded_by_max_delay() -> None:
+    redis = cast(Redis, _FakeRedis())
+    for at in range(1000, 1030, 5):
+        await note_trigger(redis, KEY, ttl_seconds=TTL, now=float(at))
+
+    settles_at = await quiet_at(redis, KEY, quiet_seconds=10, max_delay_seconds=25)
+
+    assert settles_at == 1025.0
+
+
+@pytest.mark.asyncio
+async def test_lost_burst_is_restarted_after_ttl() -> None:
+    redis = cast(Redis, _FakeRedis())
+
+    assert await note_trigger(redis, KEY, ttl_seconds=TTL, now=1000.0)
+    assert not await note_trigger(redis, KEY, ttl_seconds=TTL, now=1000.0 + TTL)
+    assert await note_trigger(redis, KEY, ttl_seconds=TTL, now=1001.0 + TTL)
@@ -0,0 +1,135 @@
+"""Unit tests for enqueue-time job deduplication."""
+
+from typing import Any, cast
+from uuid import uuid4
+
+import pytest
+from redis.asyncio import Redis
+from taskiq.message import BrokerMessage
+
+from lykke.infrastructure.workers.bulk import PipelinedListQueueBroker
+from lykke.infrastructure.workers.dedup import (
+    COALESCED_COUNTER_KEY,
+    DEDUP_KEY_LABEL,
+    JobDedupMiddleware,
+    claim_dedup_keys,
+    dedup_key_for,
+)
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    def set(self, key: str, value: str, *, nx: bool, ex: int) -> None:
+        _ = (nx, ex)
+        self._ops.append(("set", (key, value)))
+
+    def hincrby(self, key: str, field: str, amount: int) -> None:
+        self._ops.append(("hincrby", (key, field, amount)))
+
+    async def execute(self) -> list[Any]:
+        results: list[Any] = []
+        for op, args in self._ops:
+            if op == "set":
+                key, value = args
+                if key in self._redis.values:
+                    results.append(None)
+                else:
+                    self._redis.values[key] = value
+                    results.append(True)
+            else:
+                key, field, amount = args
+                counters = self._redis.hashes.setdefault(key, {})
+                counters[field] = counters.get(field, 0) + amount
+                results.append(counters[field])
+        return results
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, int]] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        _ = transaction
+        return _FakePipeline(self)
+
+
+def _prepare(task: Any, **kwargs: Any) -> BrokerMessage:
+    broker = task.broker
+    message = task.kicker()._prepare_message(**kwargs)
+    for middleware in broker.middlewares:
+        message = middleware.pre_send(message)
+    return broker.formatter.dumps(message)
+
+
+def _broker() -> PipelinedListQueueBroker:
+    return PipelinedListQueueBroker(url="redis://localhost:6379").with_middlewares(
+        JobDedupMiddleware()
+    )
+
+
+def test_dedup_key_uses_declared_kwargs() -> None:
+    broker = _broker()
+
+    @broker.task(dedup_by="user_id,calendar_id")
+    async def sync_task(user_id: str, calendar_id: str) -> None:
+        _ = (user_id, calendar_id)
+
+    user_id, calendar_id = uuid4(), uuid4()
+    message = sync_task.kicker()._prepare_message(
+        user_id=user_id, calendar_id=calendar_id
+    )
+
+    assert dedup_key_for(message) == (
+        f"job-dedup:{sync_task.task_name}:{user_id}:{calendar_id}"
+    )
+
+
+def test_tasks_without_dedup_label_get_no_key() -> None:
+    broker = _broker()
+
+    @broker.task
+    async def plain_task(user_id: str) -> None:
+        _ = user_id
+
+    message = _prepare(plain_task, user_id=str(uuid4()))
+
+    assert DEDUP_KEY_LABEL not in message.labels
+
+
+@pytest.mark.asyncio
+async def test_claim_dedup_keys_drops_pending_jobs_and_counts_them() -> None:
+    broker = _broker()
+
+    @broker.task(dedup_by="user_id")
+    async def per_user_task(user_id: str) -> None:
+        _ = user_id
+
+    @broker.task
+    async def plain_task(user_id: str) -> None:
+        _ = user_id
+
+    redis = _FakeRedis()
+    first, second = str(uuid4()), str(uuid4())
+    messages = [
+        _prepare(per_user_task, user_id=first),
+        _prepare(per_user_task, user_id=first),
+        _prepare(plain_task, user_id=first),
+        _prepare(plain_task, user_id=first),
+        _prepare(per_user_task, user_id=second),
+    ]
+
+    kept = await claim_dedup_keys(cast("Redis", redis), messages)
+
+    assert kept == [messages[0], messages[2], messages[3], messages[4]]
+    assert redis.hashes[COALESCED_COUNTER_KEY] == {per_user_task.task_name: 1}
+
+    kept_again = await claim_dedup_keys(
+        cast("Redis", redis), [_prepare(per_user_task, user_id=second)]
+    )
+
+    assert kept_again == []
+    assert redis.hashes[COALESCED_COUNTER_KEY] == {per_user_task.task_name: 2}
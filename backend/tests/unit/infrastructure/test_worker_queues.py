@@ -0,0 +1,69 @@
+"""Unit tests for priority worker queues."""
+
+import pytest
+from taskiq.message import BrokerMessage
+
+from lykke.infrastructure.workers.bulk import PipelinedListQueueBroker, kiq_many
+from lykke.infrastructure.workers.queues import (
+    ENQUEUED_AT_LABEL,
+    QueueClass,
+    QueueLagMiddleware,
+    worker_queue_names,
+)
+from lykke.presentation.workers.tasks import (
+    alarms as alarm_tasks,
+    brain_dump as brain_dump_tasks,
+)
+
+
+class _RecordingBroker(PipelinedListQueueBroker):
+    def __init__(self) -> None:
+        super().__init__(url="redis://localhost:6379")
+        self.batches: list[list[BrokerMessage]] = []
+
+    async def kick_many(self, messages: list[BrokerMessage]) -> None:  # type: ignore[override]
+        self.batches.append(list(messages))
+
+
+def test_worker_queue_names_are_ordered_by_priority() -> None:
+    assert worker_queue_names("heavy, critical") == [
+        QueueClass.CRITICAL.queue_name,
+        QueueClass.HEAVY.queue_name,
+    ]
+    assert worker_queue_names("default") == ["taskiq"]
+
+
+def test_worker_queue_names_rejects_unknown_classes() -> None:
+    with pytest.raises(ValueError):
+        worker_queue_names("urgent")
+
+
+def test_queue_class_from_queue_name_defaults_to_default() -> None:
+    assert QueueClass.from_queue_name("taskiq:critical") is QueueClass.CRITICAL
+    assert QueueClass.from_queue_name(None) is QueueClass.DEFAULT
+
+
+def test_tasks_declare_their_queue_class() -> None:
+    assert (
+        alarm_tasks.trigger_alarms_for_user_task.labels["queue_name"]
+        == QueueClass.CRITICAL.queue_name
+    )
+    assert (
+        brain_dump_tasks.process_brain_dump_item_task.labels["queue_name"]
+        == QueueClass.HEAVY.queue_name
+    )
+
+
+@pytest.mark.asyncio
+async def test_messages_carry_queue_name_and_enqueue_time() -> None:
+    broker = _RecordingBroker().with_middlewares(QueueLagMiddleware())
+
+    @broker.task(queue_name=QueueClass.CRITICAL.queue_name)
+    async def critical_task(user_id: str) -> None:
+        _ = user_id
+
+    await kiq_many(critical_task, [{"user_id": "a"}])
+
+    [message] = broker.batches[0]
+    assert message.labels["queue_name"] == QueueClass.CRITICAL.queue_name
+    assert float(message.labels[ENQUEUED_AT_LABEL]) > 0
@@ -1,7 +1,7 @@
 """Unit tests for alarm worker tasks."""
 
-from datetime import UTC, date as dt_date, datetime, time
-from uuid import uuid4
+from datetime import UTC, date as dt_date, datetime, time, timedelta
+from uuid import UUID, uuid4
 
 import pytest
 from dobles import InstanceDouble, allow
@@ -25,18 +25,32 @@ from tests.unit.presentation.worker_task_helpers import (
 )
 
 
+class _AlarmStore:
+    def __init__(self, user_ids: list[UUID]) -> None:
+        self._user_ids = user_ids
+        self.until: datetime | None = None
+
+    async def list_user_ids_with_alarms_due_before(self, until: datetime) -> list[UUID]:
+        self.until = until
+        return self._user_ids
+
+
 @pytest.mark.asyncio
-async def test_trigger_alarms_for_all_users_task_enqueues() -> None:
-    users = [build_user(uuid4()), build_user(uuid4())]
+async def test_trigger_alarms_for_all_users_task_enqueues_users_with_alarms_due() -> (
+    None
+):
+    user_ids = [uuid4(), uuid4()]
     task, calls = create_task_recorder()
-    identity_access = create_identity_access(users)
+    store = _AlarmStore(user_ids)
 
     await alarm_tasks.trigger_alarms_for_all_users_task(
-        identity_access=identity_access,
+        alarm_store=store,
         enqueue_task=task,
     )
 
-    assert len(calls) == 2
+    assert calls == [{"user_id": user_id} for user_id in user_ids]
+    assert store.until is not None
+    assert store.until > datetime.now(UTC) + timedelta(hours=1)
 
 
 @pytest.mark.asyncio
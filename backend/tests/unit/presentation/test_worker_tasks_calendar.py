@@ -1,12 +1,17 @@
 """Unit tests for calendar worker tasks."""
 
+from datetime import UTC, datetime, timedelta
+from typing import Any, cast
 from uuid import uuid4
 
 import pytest
 from dobles import InstanceDouble, allow
 
 from lykke.application.unit_of_work import ReadOnlyRepositoryFactory
+from lykke.core.config import settings
+from lykke.domain import value_objects
 from lykke.domain.entities import CalendarEntity
+from lykke.infrastructure.gateways import StubDueScheduleGateway
 from lykke.presentation.workers.tasks import calendar as calendar_tasks
 from tests.support.dobles import create_read_only_repos_double
 from tests.unit.presentation.worker_task_helpers import (
@@ -75,3 +80,186 @@ async def test_resubscribe_calendar_task_uses_calendar_repo() -> None:
 
     assert handler_calls
     assert gateway_state["closed"] is True
+
+
+class _FakeRedis:
+    """Hashes and sets, enough for the calendar sync debounce."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.sets: dict[str, set[str]] = {}
+
+    async def hmget(self, key: str, fields: list[str]) -> list[str | None]:
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    async def delete(self, key: str) -> int:
+        removed = (self.hashes.pop(key, None), self.sets.pop(key, None))
+        return sum(value is not None for value in removed)
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        return key in self.sets
+
+    async def sadd(self, key: str, member: str) -> int:
+        self.sets.setdefault(key, set()).add(member)
+        return 1
+
+    async def smembers(self, key: str) -> set[str]:
+        return set(self.sets.get(key, set()))
+
+    async def srem(self, key: str, member: str) -> int:
+        self.sets.get(key, set()).discard(member)
+        return 1
+
+
+@pytest.mark.asyncio
+async def test_request_calendar_sync_arms_check_once_per_burst(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    bursts = iter([True, False])
+    now = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+
+    async def note_trigger(*_: object, **__: object) -> bool:
+        return next(bursts)
+
+    monkeypatch.setattr(calendar_tasks, "note_trigger", note_trigger)
+    monkeypatch.setattr(calendar_tasks, "get_current_datetime", lambda: now)
+    monkeypatch.setattr(settings, "GOOGLE_WEBHOOK_QUIET_SECONDS", 10.0)
+    user_id, calendar_id = uuid4(), uuid4()
+    redis_conn = _FakeRedis()
+    due_schedule_gateway = StubDueScheduleGateway()
+
+    for channel_id in ("channel-old", "channel-new"):
+        await calendar_tasks.request_calendar_sync(
+            user_id,
+            calendar_id,
+            channel_id=channel_id,
+            redis_conn=cast("Any", redis_conn),
+            due_schedule_gateway=due_schedule_gateway,
+        )
+
+    assert redis_conn.sets == {
+        calendar_tasks._pending_calendar_syncs_key(user_id): {str(calendar_id)},
+        calendar_tasks._burst_channels_key(user_id, calendar_id): {
+            "channel-old",
+            "channel-new",
+        },
+    }
+    assert due_schedule_gateway.due == {
+        (user_id, value_objects.DueJobKind.CALENDAR_SYNC): now + timedelta(seconds=10)
+    }
+
+
+@pytest.mark.asyncio
+async def test_debounced_calendar_sync_task_syncs_settled_calendars_only(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+    user_id = uuid4()
+    settled, busy, claimed = uuid4(), uuid4(), uuid4()
+    redis_conn = _FakeRedis()
+    for calendar_id, last in ((settled, -30), (busy, -5)):
+        redis_conn.hashes[
+            calendar_tasks._calendar_sync_debounce_key(user_id, calendar_id)
+        ] = {
+            "first": repr(now.timestamp() - 40),
+            "last": repr(now.timestamp() + last),
+        }
+    redis_conn.sets[calendar_tasks._pending_calendar_syncs_key(user_id)] = {
+        str(settled),
+        str(busy),
+        str(claimed),
+    }
+    enqueued: list[dict[str, object]] = []
+
+    async def kiq(**kwargs: object) -> None:
+        enqueued.append(kwargs)
+
+    monkeypatch.setattr(calendar_tasks.sync_single_calendar_task, "kiq", kiq)
+    monkeypatch.setattr(calendar_tasks, "get_current_datetime", lambda: now)
+    monkeypatch.setattr(settings, "GOOGLE_WEBHOOK_QUIET_SECONDS", 10.0)
+    monkeypatch.setattr(settings, "GOOGLE_WEBHOOK_MAX_DELAY_SECONDS", 60.0)
+    due_schedule_gateway = StubDueScheduleGateway()
+
+    await calendar_tasks.debounced_calendar_sync_task(
+        user_id=user_id,
+        redis_conn=cast("Any", redis_conn),
+        due_schedule_gateway=due_schedule_gateway,
+    )
+
+    assert enqueued == [{"user_id": user_id, "calendar_id": settled}]
+    assert redis_conn.sets[calendar_tasks._pending_calendar_syncs_key(user_id)] == {
+        str(busy)
+    }
+    assert due_schedule_gateway.due == {
+        (user_id, value_objects.DueJobKind.CALENDAR_SYNC): now + timedelta(seconds=5)
+    }
+
+
+@pytest.mark.asyncio
+async def test_debounced_calendar_sync_task_drops_bursts_from_stale_channels(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    now = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+    user_id = uuid4()
+    current, stale = uuid4(), uuid4()
+    redis_conn = _FakeRedis()
+    for calendar_id in (current, stale):
+        redis_conn.hashes[
+            calendar_tasks._calendar_sync_debounce_key(user_id, calendar_id)
+        ] = {
+            "first": repr(now.timestamp() - 40),
+            "last": repr(now.timestamp() - 30),
+        }
+        redis_conn.sets[calendar_tasks._burst_channels_key(user_id, calendar_id)] = {
+            "channel-old"
+        }
+    redis_conn.sets[calendar_tasks._burst_channels_key(user_id, current)].add(
+        "channel-new"
+    )
+    redis_conn.sets[calendar_tasks._pending_calendar_syncs_key(user_id)] = {
+        str(current),
+        str(stale),
+    }
+    calendar = CalendarEntity(
+        user_id=user_id,
+        name="Work",
+        auth_token_id=uuid4(),
+        platform_id="cal-1",
+        platform="google",
+        sync_subscription=value_objects.SyncSubscription(
+            subscription_id="channel-new",
+            expiration=now + timedelta(days=7),
+            provider="google",
+        ),
+    )
+    ro_repos = create_read_only_repos_double()
+    allow(ro_repos.calendar_ro_repo).get.and_return(calendar)
+    ro_factory = InstanceDouble(
+        f"{ReadOnlyRepositoryFactory.__module__}.{ReadOnlyRepositoryFactory.__name__}"
+    )
+    allow(ro_factory).create.and_return(ro_repos)
+    enqueued: list[dict[str, object]] = []
+
+    async def kiq(**kwargs: object) -> None:
+        enqueued.append(kwargs)
+
+    async def load_user(_: object) -> object:
+        return object()
+
+    monkeypatch.setattr(calendar_tasks.sync_single_calendar_task, "kiq", kiq)
+    monkeypatch.setattr(calendar_tasks, "load_user", load_user)
+    monkeypatch.setattr(calendar_tasks, "get_current_datetime", lambda: now)
+    monkeypatch.setattr(settings, "GOOGLE_WEBHOOK_QUIET_SECONDS", 10.0)
+    monkeypatch.setattr(settings, "GOOGLE_WEBHOOK_MAX_DELAY_SECONDS", 60.0)
+
+    await calendar_tasks.debounced_calendar_sync_task(
+        user_id=user_id,
+        redis_conn=cast("Any", redis_conn),
+        ro_repo_factory=ro_factory,
+        due_schedule_gateway=StubDueScheduleGateway(),
+    )
+
+    assert enqueued == [{"user_id": user_id, "calendar_id": current}]
+    assert redis_conn.sets == {
+        calendar_tasks._pending_calendar_syncs_key(user_id): set()
+    }
@@ -1,11 +1,29 @@
 """Unit tests for worker task helpers."""
 
-from lykke.infrastructure.gateways import GoogleCalendarGateway
+from types import SimpleNamespace
+from typing import Any, cast
+from uuid import uuid4
+
+from taskiq import Context, TaskiqState
+
+from lykke.application.gateways import (
+    EmailProviderGatewayProtocol,
+    SMSProviderProtocol,
+    WebPushGatewayProtocol,
+)
+from lykke.core.config import settings
+from lykke.infrastructure.gateways import (
+    AsyncGoogleCalendarGateway,
+    GoogleCalendarGateway,
+    SendGridGateway,
+)
 from lykke.infrastructure.unauthenticated import UnauthenticatedIdentityAccess
+from lykke.infrastructure.workers.runtime import WorkerRuntime, get_worker_runtime
 from lykke.presentation.workers.tasks import (
     common as worker_common,
     registration as worker_registration,
 )
+from tests.unit.presentation.worker_task_helpers import build_user
 
 
 def test_register_worker_event_handlers() -> None:
@@ -34,8 +52,25 @@ def test_get_google_gateway_returns_concrete_gateway() -> None:
     assert isinstance(worker_common.get_google_gateway(), GoogleCalendarGateway)
 
 
+def test_get_google_gateway_shares_runtime_session(monkeypatch) -> None:
+    session = object()
+    runtime = cast("WorkerRuntime", SimpleNamespace(http_session=session))
+
+    gateway = worker_common.get_google_gateway(runtime)
+
+    assert isinstance(gateway, AsyncGoogleCalendarGateway)
+    assert gateway._session is session  # pylint: disable=protected-access
+
+    monkeypatch.setattr(settings, "GOOGLE_CALENDAR_NATIVE_CLIENT", False)
+    assert not isinstance(
+        worker_common.get_google_gateway(runtime), AsyncGoogleCalendarGateway
+    )
+
+
 def test_get_identity_access_returns_concrete_access() -> None:
-    assert isinstance(worker_common.get_identity_access(), UnauthenticatedIdentityAccess)
+    assert isinstance(
+        worker_common.get_identity_access(), UnauthenticatedIdentityAccess
+    )
 
 
 def test_register_worker_event_handlers_logs() -> None:
@@ -58,3 +93,58 @@ def test_register_worker_event_handlers_logs() -> None:
     )
 
     assert calls
+
+
+def _runtime() -> WorkerRuntime:
+    return WorkerRuntime(
+        redis_pool=cast("Any", "pool"),
+        http_session=cast("Any", "session"),
+        engine=cast("Any", "engine"),
+        due_schedule_gateway=cast("Any", "due-gateway"),
+        llm_gateway_factory=cast("Any", "llm-factory"),
+        llm_run_fingerprint_gateway=cast("Any", "fingerprint-gateway"),
+        ro_repo_factory=cast("Any", "ro-factory"),
+    )
+
+
+def test_worker_helpers_reuse_runtime_resources() -> None:
+    runtime = _runtime()
+
+    pubsub_gateway = worker_common.get_pubsub_gateway(runtime)
+
+    assert pubsub_gateway._redis_pool == "pool"
+    assert worker_common.get_due_schedule_gateway(runtime) == "due-gateway"
+    assert worker_common.get_read_only_repository_factory(runtime) == "ro-factory"
+
+
+def test_command_handler_factory_shares_runtime_session_with_http_gateways() -> None:
+    runtime = _runtime()
+    ro_repo_factory = SimpleNamespace(create=lambda user: "ro-repos")
+
+    factory = worker_common.create_command_handler_factory(
+        build_user(uuid4()),
+        cast("Any", "uow-factory"),
+        cast("Any", ro_repo_factory),
+        runtime=runtime,
+    )
+
+    email_gateway = factory.create(EmailProviderGatewayProtocol)
+    assert isinstance(email_gateway, SendGridGateway)
+    for gateway in (
+        email_gateway,
+        factory.create(SMSProviderProtocol),
+        factory.create(WebPushGatewayProtocol),
+    ):
+        assert gateway._session == "session"  # type: ignore[attr-defined]
+
+
+def test_get_worker_runtime_reads_broker_state() -> None:
+    runtime = _runtime()
+    state = TaskiqState()
+    context = Context(cast("Any", None), cast("Any", SimpleNamespace(state=state)))
+
+    assert get_worker_runtime(context) is None
+
+    state.runtime = runtime
+
+    assert get_worker_runtime(context) is runtime
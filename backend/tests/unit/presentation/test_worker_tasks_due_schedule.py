@@ -0,0 +1,157 @@
+"""Unit tests for the due-schedule dispatcher worker task."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from lykke.core.config import settings
+from lykke.domain import value_objects
+from lykke.infrastructure.gateways import StubDueScheduleGateway
+from lykke.presentation.workers.tasks import due_schedule as due_schedule_tasks
+from lykke.presentation.workers.tasks import timing_status as timing_status_tasks
+from tests.unit.presentation.worker_task_helpers import (
+    create_gateway_recorder,
+    create_task_recorder,
+)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_due_jobs_task_enqueues_only_due_users() -> None:
+    due_user_id = uuid4()
+    later_user_id = uuid4()
+    now = datetime.now(UTC)
+    gateway = StubDueScheduleGateway()
+    await gateway.arm_many(
+        [
+            value_objects.DueScheduleEntry(
+                user_id=due_user_id,
+                kind=value_objects.DueJobKind.ALARMS,
+                due_at=now - timedelta(seconds=5),
+            ),
+            value_objects.DueScheduleEntry(
+                user_id=due_user_id,
+                kind=value_objects.DueJobKind.CALENDAR_ENTRY_NOTIFICATIONS,
+                due_at=now - timedelta(seconds=5),
+            ),
+            value_objects.DueScheduleEntry(
+                user_id=later_user_id,
+                kind=value_objects.DueJobKind.ALARMS,
+                due_at=now + timedelta(hours=1),
+            ),
+        ]
+    )
+    alarm_task, alarm_calls = create_task_recorder()
+    calendar_task, calendar_calls = create_task_recorder()
+    timing_task, timing_calls = create_task_recorder()
+
+    await due_schedule_tasks.dispatch_due_jobs_task(
+        due_schedule_gateway=gateway,
+        enqueue_tasks={
+            value_objects.DueJobKind.ALARMS: alarm_task,
+            value_objects.DueJobKind.CALENDAR_ENTRY_NOTIFICATIONS: calendar_task,
+            value_objects.DueJobKind.TIMING_STATUS: timing_task,
+        },
+    )
+
+    assert alarm_calls == [{"user_id": due_user_id}]
+    assert calendar_calls == [{"user_id": due_user_id, "triggered_by": "scheduled"}]
+    assert timing_calls == []
+    assert list(gateway.due) == [(later_user_id, value_objects.DueJobKind.ALARMS)]
+    assert gateway.claimed == []
+
+
+@pytest.mark.asyncio
+async def test_dispatch_due_jobs_task_releases_entries_when_enqueue_fails() -> None:
+    user_id = uuid4()
+    due_at = datetime.now(UTC) - timedelta(seconds=5)
+    gateway = StubDueScheduleGateway()
+    await gateway.arm_many(
+        [
+            value_objects.DueScheduleEntry(
+                user_id=user_id, kind=value_objects.DueJobKind.ALARMS, due_at=due_at
+            ),
+            value_objects.DueScheduleEntry(
+                user_id=user_id,
+                kind=value_objects.DueJobKind.CALENDAR_ENTRY_NOTIFICATIONS,
+                due_at=due_at,
+            ),
+        ]
+    )
+    calendar_task, calendar_calls = create_task_recorder()
+    failing_task, _ = create_task_recorder()
+
+    async def kiq(**kwargs: object) -> None:
+        raise ConnectionError("redis down")
+
+    failing_task.kiq = kiq
+
+    await due_schedule_tasks.dispatch_due_jobs_task(
+        due_schedule_gateway=gateway,
+        enqueue_tasks={
+            value_objects.DueJobKind.ALARMS: failing_task,
+            value_objects.DueJobKind.CALENDAR_ENTRY_NOTIFICATIONS: calendar_task,
+        },
+    )
+
+    assert calendar_calls == [{"user_id": user_id, "triggered_by": "scheduled"}]
+    assert gateway.due == {(user_id, value_objects.DueJobKind.ALARMS): due_at}
+    assert gateway.claimed == []
+
+
+@pytest.mark.asyncio
+async def test_dispatch_due_jobs_task_shards_timing_status_users(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    user_ids = [uuid4() for _ in range(3)]
+    due_at = datetime.now(UTC) - timedelta(seconds=5)
+    gateway = StubDueScheduleGateway()
+    await gateway.arm_many(
+        [
+            value_objects.DueScheduleEntry(
+                user_id=user_id,
+                kind=value_objects.DueJobKind.TIMING_STATUS,
+                due_at=due_at,
+            )
+            for user_id in user_ids
+        ]
+    )
+    timing_task, timing_calls = create_task_recorder()
+    monkeypatch.setattr(settings, "TIMING_STATUS_SHARD_SIZE", 2)
+
+    await due_schedule_tasks.dispatch_due_jobs_task(
+        due_schedule_gateway=gateway,
+        enqueue_tasks={value_objects.DueJobKind.TIMING_STATUS: timing_task},
+    )
+
+    assert [len(call["user_ids"]) for call in timing_calls] == [2, 1]
+    assert {user_id for call in timing_calls for user_id in call["user_ids"]} == set(
+        user_ids
+    )
+    assert [call["due_at"] for call in timing_calls] == [
+        {user_id: due_at for user_id in call["user_ids"]} for call in timing_calls
+    ]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_timing_status_for_user_task_arms_next_transition() -> None:
+    user_id = uuid4()
+    next_transition = datetime(2025, 1, 1, 9, 30, tzinfo=UTC)
+    pubsub_gateway, _ = create_gateway_recorder()
+    due_schedule_gateway = StubDueScheduleGateway()
+
+    class _Handler:
+        async def handle(self, command: object) -> datetime | None:
+            _ = command
+            return next_transition
+
+    await timing_status_tasks.evaluate_timing_status_for_user_task(
+        user_id=user_id,
+        handler=_Handler(),
+        pubsub_gateway=pubsub_gateway,
+        due_schedule_gateway=due_schedule_gateway,
+    )
+
+    assert due_schedule_gateway.due == {
+        (user_id, value_objects.DueJobKind.TIMING_STATUS): next_transition
+    }
@@ -1,7 +1,8 @@
 """Unit tests for new-day event worker tasks."""
 
-from datetime import date as dt_date
-from uuid import uuid4
+from datetime import UTC, date as dt_date, datetime
+from typing import Any
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -15,17 +16,57 @@ from tests.unit.presentation.worker_task_helpers import (
 
 
 @pytest.mark.asyncio
-async def test_emit_new_day_event_for_all_users_task_enqueues() -> None:
-    users = [build_user(uuid4()), build_user(uuid4())]
+async def test_emit_new_day_event_for_all_users_task_publishes_bucket() -> None:
+    chicago = build_user(uuid4(), timezone="America/Chicago")
+    paris = build_user(uuid4(), timezone="Europe/Paris")
+    identity_access = create_identity_access([chicago, paris])
+    gateway, gateway_state = create_gateway_recorder()
+    task, calls = create_task_recorder()
+
+    batches: list[tuple[str, list[tuple[UUID, dict[str, Any]]]]] = []
+
+    async def publish_many_to_user_channels(
+        channel_type: str, messages: list[tuple[UUID, dict[str, Any]]]
+    ) -> None:
+        batches.append((channel_type, list(messages)))
+
+    gateway.publish_many_to_user_channels = publish_many_to_user_channels
+
+    # 06:07 UTC is 00:07 in Chicago and the run is bucketed to the 06:00 slot.
+    await new_day_tasks.emit_new_day_event_for_all_users_task(
+        identity_access=identity_access,
+        pubsub_gateway=gateway,
+        schedule_task=task,
+        current_datetime_provider=lambda: datetime(2025, 11, 27, 6, 7, tzinfo=UTC),
+    )
+
+    assert gateway_state["closed"] is True
+    [(channel_type, messages)] = batches
+    assert channel_type == "domain-events"
+    [(user_id, message)] = messages
+    assert user_id == chicago.id
+    assert message["event_type"].endswith(".NewDayEvent")
+    assert message["event_data"]["date"] == "2025-11-27"
+    assert calls == [{"user_id": chicago.id}]
+
+
+@pytest.mark.asyncio
+async def test_emit_new_day_event_for_all_users_task_skips_quiet_slots() -> None:
+    identity_access = create_identity_access(
+        [build_user(uuid4(), timezone="America/Chicago")]
+    )
+    gateway, gateway_state = create_gateway_recorder()
     task, calls = create_task_recorder()
-    identity_access = create_identity_access(users)
 
     await new_day_tasks.emit_new_day_event_for_all_users_task(
         identity_access=identity_access,
-        enqueue_task=task,
+        pubsub_gateway=gateway,
+        schedule_task=task,
+        current_datetime_provider=lambda: datetime(2025, 11, 27, 6, 15, tzinfo=UTC),
     )
 
-    assert len(calls) == 2
+    assert calls == []
+    assert gateway_state["closed"] is False
 
 
 @pytest.mark.asyncio
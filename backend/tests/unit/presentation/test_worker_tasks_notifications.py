@@ -36,6 +36,23 @@ async def test_evaluate_smart_notifications_for_all_users_task() -> None:
     assert len(calls) == 1
 
 
+@pytest.mark.asyncio
+async def test_evaluate_calendar_entry_notifications_for_all_users_task() -> None:
+    eligible_user = build_user(uuid4())
+    eligible_user.settings.calendar_entry_notification_settings.enabled = True
+    disabled_user = build_user(uuid4())
+    disabled_user.settings.calendar_entry_notification_settings.enabled = False
+    task, calls = create_task_recorder()
+    identity_access = create_identity_access([eligible_user, disabled_user])
+
+    await notification_tasks.evaluate_calendar_entry_notifications_for_all_users_task(
+        identity_access=identity_access,
+        enqueue_task=task,
+    )
+
+    assert calls == [{"user_id": eligible_user.id, "triggered_by": "scheduled"}]
+
+
 @pytest.mark.asyncio
 async def test_evaluate_smart_notification_task_calls_handler() -> None:
     gateway, gateway_state = create_gateway_recorder()
@@ -1,10 +1,16 @@
 """Unit tests for timing-status worker tasks."""
 
-from uuid import uuid4
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
 
 import pytest
 
-from lykke.application.commands.timing_status import EvaluateTimingStatusCommand
+from lykke.application.commands.timing_status import (
+    EvaluateTimingStatusBatchCommand,
+    EvaluateTimingStatusCommand,
+)
+from lykke.domain import value_objects
+from lykke.infrastructure.gateways import StubDueScheduleGateway
 from lykke.presentation.workers.tasks import timing_status as timing_status_tasks
 from tests.unit.presentation.worker_task_helpers import (
     build_user,
@@ -15,18 +21,64 @@ from tests.unit.presentation.worker_task_helpers import (
 )
 
 
+class _TimingStatusStore:
+    def __init__(self, user_ids: list[UUID]) -> None:
+        self._user_ids = user_ids
+        self.until: datetime | None = None
+
+    async def list_user_ids_with_transitions_before(
+        self, until: datetime
+    ) -> list[UUID]:
+        self.until = until
+        return self._user_ids
+
+
 @pytest.mark.asyncio
-async def test_evaluate_timing_status_for_all_users_task_enqueues() -> None:
-    users = [build_user(uuid4()), build_user(uuid4())]
+async def test_evaluate_timing_status_for_all_users_task_enqueues_due_users() -> None:
+    user_ids = [uuid4(), uuid4()]
     task, calls = create_task_recorder()
-    identity_access = create_identity_access(users)
+    store = _TimingStatusStore(user_ids)
 
     await timing_status_tasks.evaluate_timing_status_for_all_users_task(
-        identity_access=identity_access,
+        timing_status_store=store,
         enqueue_task=task,
     )
 
-    assert len(calls) == 2
+    assert calls == [{"user_ids": user_ids}]
+    assert store.until is not None
+    assert store.until > datetime.now(UTC) + timedelta(hours=1)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_timing_status_for_users_task_arms_each_user() -> None:
+    users = [build_user(uuid4(), timezone="UTC"), build_user(uuid4())]
+    next_transition = datetime(2025, 1, 1, 9, 30, tzinfo=UTC)
+    gateway, gateway_state = create_gateway_recorder()
+    due_schedule_gateway = StubDueScheduleGateway()
+    commands: list[EvaluateTimingStatusBatchCommand] = []
+
+    class _Handler:
+        async def handle(
+            self, command: EvaluateTimingStatusBatchCommand
+        ) -> dict[UUID, datetime | None]:
+            commands.append(command)
+            return {users[0].id: next_transition, users[1].id: None}
+
+    await timing_status_tasks.evaluate_timing_status_for_users_task(
+        user_ids=[user.id for user in users],
+        handler=_Handler(),
+        identity_access=create_identity_access(users),
+        pubsub_gateway=gateway,
+        due_schedule_gateway=due_schedule_gateway,
+    )
+
+    [command] = commands
+    assert [user.id for user in command.users] == [user.id for user in users]
+    assert command.users[0].timezone == "UTC"
+    assert due_schedule_gateway.due == {
+        (users[0].id, value_objects.DueJobKind.TIMING_STATUS): next_transition
+    }
+    assert gateway_state["closed"] is True
 
 
 @pytest.mark.asyncio
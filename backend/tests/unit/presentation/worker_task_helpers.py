@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Collection
 from datetime import time
 from typing import Any, Protocol
 from uuid import UUID, uuid4
@@ -84,10 +85,56 @@ def create_gateway_recorder() -> tuple[InstanceDouble, dict[str, bool]]:
     return gateway, state
 
 
+def _is_eligible(user: UserEntity, eligibility: value_objects.UserEligibility) -> bool:
+    settings = user.settings
+    match eligibility:
+        case value_objects.UserEligibility.ALL:
+            return True
+        case value_objects.UserEligibility.LLM_PROVIDER:
+            return settings.llm_provider is not None
+        case value_objects.UserEligibility.CALENDAR_ENTRY_NOTIFICATIONS:
+            calendar_settings = settings.calendar_entry_notification_settings
+            return calendar_settings.enabled and bool(calendar_settings.rules)
+        case value_objects.UserEligibility.MORNING_OVERVIEW:
+            return (
+                settings.llm_provider is not None
+                and settings.morning_overview_time is not None
+            )
+
+
 def create_identity_access(users: list[UserEntity]) -> InstanceDouble:
     access = InstanceDouble(_protocol_path(UnauthenticatedIdentityAccessProtocol))
     allow(access).list_all_users.and_return(users)
 
+    async def iter_eligible_users(
+        eligibility: value_objects.UserEligibility = value_objects.UserEligibility.ALL,
+        *,
+        batch_size: int | None = None,
+        user_ids: Collection[UUID] | None = None,
+        timezones: Collection[str | None] | None = None,
+    ) -> AsyncIterator[list[value_objects.EligibleUser]]:
+        eligible = [
+            value_objects.EligibleUser(
+                id=user.id,
+                timezone=user.settings.timezone,
+                morning_overview_time=user.settings.morning_overview_time,
+            )
+            for user in users
+            if _is_eligible(user, eligibility)
+            and (user_ids is None or user.id in user_ids)
+            and (timezones is None or user.settings.timezone in timezones)
+        ]
+        size = batch_size or len(eligible) or 1
+        for start in range(0, len(eligible), size):
+            yield eligible[start : start + size]
+
+    access.iter_eligible_users = iter_eligible_users
+
+    async def list_user_timezones() -> list[str | None]:
+        return list(dict.fromkeys(user.settings.timezone for user in users))
+
+    access.list_user_timezones = list_user_timezones
+
     async def get_user_by_id(user_id: UUID) -> UserEntity | None:
         for user in users:
             if user.id == user_id:
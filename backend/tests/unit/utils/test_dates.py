@@ -13,6 +13,7 @@ from lykke.core.utils.dates import (
     get_current_time,
     get_time_between,
     get_tomorrows_date,
+    timezones_starting_day,
 )
 
 USER_TIMEZONE = "America/Chicago"
@@ -130,3 +131,25 @@ def test_get_time_between_mixed_time_datetime(test_date: datetime.date) -> None:
         # Should be approximately 2 hours (accounting for timezone conversion)
         # t1 is converted to UTC from local timezone, so there may be offset
         assert abs(result.total_seconds()) < 86400  # Within 24 hours (reasonable range)
+
+
+def test_timezones_starting_day_selects_zones_at_local_midnight() -> None:
+    """Only zones whose local time is within the window after midnight match."""
+    at = datetime.datetime(2025, 11, 27, 6, 0, tzinfo=UTC)
+    timezones = [USER_TIMEZONE, "Asia/Kathmandu", "Europe/Paris", None, "Not/AZone"]
+
+    assert timezones_starting_day(
+        timezones, at=at, window=datetime.timedelta(minutes=15)
+    ) == [USER_TIMEZONE]
+
+    # Kathmandu is UTC+5:45, so its day starts at 18:15 UTC.
+    at = datetime.datetime(2025, 11, 27, 18, 15, tzinfo=UTC)
+    assert timezones_starting_day(
+        timezones, at=at, window=datetime.timedelta(minutes=15)
+    ) == ["Asia/Kathmandu"]
+
+    # Missing and unknown zones start their day at UTC midnight.
+    at = datetime.datetime(2025, 11, 27, 0, 0, tzinfo=UTC)
+    assert timezones_starting_day(
+        timezones, at=at, window=datetime.timedelta(minutes=15)
+    ) == [None, "Not/AZone"]
@@ -4,7 +4,9 @@ from datetime import UTC, date, datetime
 
 import pytest
 
-from lykke.core.utils.templates import fmt_date, fmt_datetime
+from lykke.core.utils.templates import TemplateRegistry, fmt_date, fmt_datetime
+
+BASE_PERSONALITY_TEMPLATE = "base_personalities/default.j2"
 
 
 @pytest.mark.parametrize(
@@ -46,3 +48,25 @@ def test_fmt_datetime_without_current_time() -> None:
     value = datetime(2026, 2, 7, 10, 22, tzinfo=UTC)
     result = fmt_datetime({}, value)
     assert result == "2026-02-07 at 10:22am"
+
+
+def test_template_registry_compiles_once_and_records_timings(tmp_path) -> None:
+    registry = TemplateRegistry(auto_reload=False, bytecode_cache_dir=str(tmp_path))
+
+    compiled = registry.warm()
+    template = registry.get_template(BASE_PERSONALITY_TEMPLATE)
+    registry.render(BASE_PERSONALITY_TEMPLATE)
+    registry.render(BASE_PERSONALITY_TEMPLATE)
+
+    assert compiled == len(registry.environment.list_templates(extensions=["j2"]))
+    assert registry.get_template(BASE_PERSONALITY_TEMPLATE) is template
+    assert registry.stats[BASE_PERSONALITY_TEMPLATE].count == 2
+    assert list(tmp_path.iterdir())
+
+
+def test_template_registry_loads_from_bytecode_cache(tmp_path) -> None:
+    TemplateRegistry(auto_reload=False, bytecode_cache_dir=str(tmp_path)).warm()
+    cold = TemplateRegistry(auto_reload=False, bytecode_cache_dir=str(tmp_path))
+    cold.environment.compile = None  # type: ignore[method-assign]
+
+    assert cold.render(BASE_PERSONALITY_TEMPLATE)
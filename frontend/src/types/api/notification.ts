@@ -7,6 +7,7 @@ export type LLMRunResultSnapshot = {
   tools?: Record<string, unknown>[];
   tool_choice?: unknown;
   model_params?: Record<string, unknown>;
+  prompt_context_age_seconds?: number | null;
 };
 
 export type ReferencedEntity = { entity_type: string; entity_id: string };